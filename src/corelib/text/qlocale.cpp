@@ -63,7 +63,10 @@
 #include "qvariant.h"
 #include "qstringbuilder.h"
 #include "private/qnumeric_p.h"
+#include <algorithm>
 #include <cmath>
+#include <cstring>
+#include <tuple>
 #ifndef QT_NO_SYSTEMLOCALE
 #   include "qmutex.h"
 #endif
@@ -98,6 +101,23 @@ QT_BEGIN_INCLUDE_NAMESPACE
 #include "qlocale_data_p.h"
 QT_END_INCLUDE_NAMESPACE
 
+// Binary search for a code in a *_code_list, via its *_code_order (the
+// list's indices, sorted by code); returns the code's index in the list,
+// or -1 if not found. Where codes are repeated, the first is found.
+template <std::size_t N>
+static int findCode(const unsigned char *list, const quint16 (&order)[N],
+                    const unsigned char *code, std::size_t width) noexcept
+{
+    const auto less = [list, width](quint16 entry, const unsigned char *key) {
+        return std::memcmp(list + width * entry, key, width) < 0;
+    };
+    const quint16 *const end = order + N;
+    const quint16 *const it = std::lower_bound(order, end, code, less);
+    if (it != end && std::memcmp(list + width * *it, code, width) == 0)
+        return *it;
+    return -1;
+}
+
 QLocale::Language QLocalePrivate::codeToLanguage(QStringView code) noexcept
 {
     const auto len = code.size();
@@ -107,10 +127,11 @@ QLocale::Language QLocalePrivate::codeToLanguage(QStringView code) noexcept
     ushort uc2 = code[1].toLower().unicode();
     ushort uc3 = len > 2 ? code[2].toLower().unicode() : 0;
 
-    const unsigned char *c = language_code_list;
-    for (; *c != 0; c += 3) {
-        if (uc1 == c[0] && uc2 == c[1] && uc3 == c[2])
-            return QLocale::Language((c - language_code_list)/3);
+    if (uc1 <= 0xff && uc2 <= 0xff && uc3 <= 0xff) {
+        const unsigned char key[3] = { uchar(uc1), uchar(uc2), uchar(uc3) };
+        const int index = findCode(language_code_list, language_code_order, key, 3);
+        if (index >= 0)
+            return QLocale::Language(index);
     }
 
     if (uc3 == 0) {
@@ -154,12 +175,9 @@ QLocale::Script QLocalePrivate::codeToScript(QStringView code) noexcept
     unsigned char c2 = code[2].toLower().toLatin1();
     unsigned char c3 = code[3].toLower().toLatin1();
 
-    const unsigned char *c = script_code_list;
-    for (int i = 0; i < QLocale::LastScript; ++i, c += 4) {
-        if (c0 == c[0] && c1 == c[1] && c2 == c[2] && c3 == c[3])
-            return QLocale::Script(i);
-    }
-    return QLocale::AnyScript;
+    const unsigned char key[4] = { c0, c1, c2, c3 };
+    const int index = findCode(script_code_list, script_code_order, key, 4);
+    return index >= 0 ? QLocale::Script(index) : QLocale::AnyScript;
 }
 
 QLocale::Country QLocalePrivate::codeToCountry(QStringView code) noexcept
@@ -172,10 +190,11 @@ QLocale::Country QLocalePrivate::codeToCountry(QStringView code) noexcept
     ushort uc2 = code[1].toUpper().unicode();
     ushort uc3 = len > 2 ? code[2].toUpper().unicode() : 0;
 
-    const unsigned char *c = country_code_list;
-    for (; *c != 0; c += 3) {
-        if (uc1 == c[0] && uc2 == c[1] && uc3 == c[2])
-            return QLocale::Country((c - country_code_list)/3);
+    if (uc1 <= 0xff && uc2 <= 0xff && uc3 <= 0xff) {
+        const unsigned char key[3] = { uchar(uc1), uchar(uc2), uchar(uc3) };
+        const int index = findCode(country_code_list, country_code_order, key, 3);
+        if (index >= 0)
+            return QLocale::Country(index);
     }
 
     return QLocale::AnyCountry;
@@ -215,15 +234,24 @@ QLatin1String QLocalePrivate::countryToCode(QLocale::Country country)
 // http://www.unicode.org/reports/tr35/#Likely_Subtags
 static bool addLikelySubtags(QLocaleId &localeId)
 {
-    // ### optimize with bsearch
-    const int likely_subtags_count = sizeof(likely_subtags) / sizeof(likely_subtags[0]);
-    const QLocaleId *p = likely_subtags;
-    const QLocaleId *const e = p + likely_subtags_count;
-    for ( ; p < e; p += 2) {
-        if (localeId == p[0]) {
-            localeId = p[1];
-            return true;
-        }
+    // likely_subtags is a sequence of (from, to) pairs, sorted by from (see
+    // qlocalexml2cpp.py); binary search for the first pair from localeId.
+    const auto less = [](const QLocaleId &lhs, const QLocaleId &rhs) {
+        return std::tie(lhs.language_id, lhs.script_id, lhs.country_id)
+             < std::tie(rhs.language_id, rhs.script_id, rhs.country_id);
+    };
+    const std::size_t count = sizeof(likely_subtags) / sizeof(likely_subtags[0]) / 2;
+    std::size_t lo = 0, hi = count;
+    while (lo < hi) {
+        const std::size_t mid = (lo + hi) / 2;
+        if (less(likely_subtags[2 * mid], localeId))
+            lo = mid + 1;
+        else
+            hi = mid;
+    }
+    if (lo < count && likely_subtags[2 * lo] == localeId) {
+        localeId = likely_subtags[2 * lo + 1];
+        return true;
     }
     return false;
 }
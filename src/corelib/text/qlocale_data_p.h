@@ -88,672 +88,216 @@ static const int ImperialMeasurementSystemsCount =
 */
 
 static const QLocaleId likely_subtags[] = {
-    {   4,   0,   0 }, {   4,   7,  69 }, // aa -> aa_Latn_ET
-    {   2,   0,   0 }, {   2,   2,  81 }, // ab -> ab_Cyrl_GE
-    { 255,   0,   0 }, { 255,  36, 102 }, // ae -> ae_Avst_IR
-    {   5,   0,   0 }, {   5,   7, 195 }, // af -> af_Latn_ZA
-    { 237,   0,   0 }, { 237,   7,  37 }, // agq -> agq_Latn_CM
-    { 340,   0,   0 }, { 340, 128, 100 }, // aho -> aho_Ahom_IN
-    { 146,   0,   0 }, { 146,   7,  83 }, // ak -> ak_Latn_GH
-    { 262,   0,   0 }, { 262,  94, 103 }, // akk -> akk_Xsux_IQ
-    {   7,   0,   0 }, {   7,  14,  69 }, // am -> am_Ethi_ET
-    { 261,   0,   0 }, { 261,   7, 197 }, // an -> an_Latn_ES
-    {   8,   0,   0 }, {   8,   1,  64 }, // ar -> ar_Arab_EG
-    { 265,   0,   0 }, { 265,  57, 102 }, // arc -> arc_Armi_IR
-    { 265, 119,   0 }, { 265, 119, 109 }, // arc_Nbat -> arc_Nbat_JO
-    { 265, 120,   0 }, { 265, 120, 207 }, // arc_Palm -> arc_Palm_SY
-    { 315,   0,   0 }, { 315,   7,  43 }, // arn -> arn_Latn_CL
-    {  10,   0,   0 }, {  10,  11, 100 }, // as -> as_Beng_IN
-    { 205,   0,   0 }, { 205,   7, 210 }, // asa -> asa_Latn_TZ
-    { 341,   0,   0 }, { 341, 133, 225 }, // ase -> ase_Sgnw_US
-    { 256,   0,   0 }, { 256,   7, 197 }, // ast -> ast_Latn_ES
-    { 216,   0,   0 }, { 216,   2, 178 }, // av -> av_Cyrl_RU
-    {  11,   0,   0 }, {  11,   7,  26 }, // ay -> ay_Latn_BO
-    {  12,   0,   0 }, {  12,   7,  15 }, // az -> az_Latn_AZ
-    {  12,   0, 103 }, {  12,   1, 103 }, // az_IQ -> az_Arab_IQ
-    {  12,   0, 102 }, {  12,   1, 102 }, // az_IR -> az_Arab_IR
-    {  12,   0, 178 }, {  12,   2, 178 }, // az_RU -> az_Cyrl_RU
-    {  12,   1,   0 }, {  12,   1, 102 }, // az_Arab -> az_Arab_IR
-    {  13,   0,   0 }, {  13,   2, 178 }, // ba -> ba_Cyrl_RU
-    { 266,   0,   0 }, { 266,   7, 101 }, // ban -> ban_Latn_ID
-    { 238,   0,   0 }, { 238,   7,  37 }, // bas -> bas_Latn_CM
-    { 267,   0,   0 }, { 267,  38,  37 }, // bax -> bax_Bamu_CM
-    { 268,   0,   0 }, { 268,   7, 101 }, // bbc -> bbc_Latn_ID
-    {  22,   0,   0 }, {  22,   2,  20 }, // be -> be_Cyrl_BY
-    { 195,   0,   0 }, { 195,   7, 239 }, // bem -> bem_Latn_ZM
-    { 186,   0,   0 }, { 186,   7, 210 }, // bez -> bez_Latn_TZ
-    {  20,   0,   0 }, {  20,   2,  33 }, // bg -> bg_Cyrl_BG
-    { 364,   0,   0 }, { 364,   1, 163 }, // bgn -> bgn_Arab_PK
-    { 343,   0,   0 }, { 343,  13, 100 }, // bho -> bho_Deva_IN
-    {  18,   0,   0 }, {  18,   7, 229 }, // bi -> bi_Latn_VU
-    { 270,   0,   0 }, { 270,   7, 170 }, // bku -> bku_Latn_PH
-    { 309,   0,   0 }, { 309, 100, 232 }, // blt -> blt_Tavt_VN
-    { 188,   0,   0 }, { 188,   7, 132 }, // bm -> bm_Latn_ML
-    {  15,   0,   0 }, {  15,  11,  18 }, // bn -> bn_Beng_BD
-    { 121,   0,   0 }, { 121,  31,  44 }, // bo -> bo_Tibt_CN
-    {  19,   0,   0 }, {  19,   7,  74 }, // br -> br_Latn_FR
-    { 215,   0,   0 }, { 215,  13, 100 }, // brx -> brx_Deva_IN
-    { 142,   0,   0 }, { 142,   7,  27 }, // bs -> bs_Latn_BA
-    { 336,   0,   0 }, { 336, 106, 121 }, // bsq -> bsq_Bass_LR
-    { 312,   0,   0 }, { 312,   7,  37 }, // bss -> bss_Latn_CM
-    { 269,   0,   0 }, { 269,   7, 101 }, // bug -> bug_Latn_ID
-    { 152,   0,   0 }, { 152,  14,  67 }, // byn -> byn_Ethi_ER
-    {  24,   0,   0 }, {  24,   7, 197 }, // ca -> ca_Latn_ES
-    { 156,   0,   0 }, { 156,   7, 157 }, // cch -> cch_Latn_NG
-    { 272,   0,   0 }, { 272,  46,  18 }, // ccp -> ccp_Cakm_BD
-    { 218,   0,   0 }, { 218,   2, 178 }, // ce -> ce_Cyrl_RU
-    { 365,   0,   0 }, { 365,   7, 170 }, // ceb -> ceb_Latn_PH
-    { 211,   0,   0 }, { 211,   7, 221 }, // cgg -> cgg_Latn_UG
-    { 217,   0,   0 }, { 217,   7,  89 }, // ch -> ch_Latn_GU
-    { 190,   0,   0 }, { 190,  12, 225 }, // chr -> chr_Cher_US
-    { 367,   0,   0 }, { 367,   7, 225 }, // cic -> cic_Latn_US
-    { 276,   0,   0 }, { 276,  47, 232 }, // cjm -> cjm_Cham_VN
-    { 316,   0,   0 }, { 316,   1, 103 }, // ckb -> ckb_Arab_IQ
-    {  26,   0,   0 }, {  26,   7,  74 }, // co -> co_Latn_FR
-    { 274,   0,   0 }, { 274,  48,  64 }, // cop -> cop_Copt_EG
-    { 221,   0,   0 }, { 221,  44,  38 }, // cr -> cr_Cans_CA
-    {  28,   0,   0 }, {  28,   7,  57 }, // cs -> cs_Latn_CZ
-    { 338,   0,   0 }, { 338, 121, 147 }, // ctd -> ctd_Pauc_MM
-    { 219,   0,   0 }, { 219,   2, 178 }, // cu -> cu_Cyrl_RU
-    { 219,  52,   0 }, { 219,  52,  33 }, // cu_Glag -> cu_Glag_BG
-    { 220,   0,   0 }, { 220,   2, 178 }, // cv -> cv_Cyrl_RU
-    { 134,   0,   0 }, { 134,   7, 224 }, // cy -> cy_Latn_GB
-    {  29,   0,   0 }, {  29,   7,  58 }, // da -> da_Latn_DK
-    { 176,   0,   0 }, { 176,   7, 111 }, // dav -> dav_Latn_KE
-    {  42,   0,   0 }, {  42,   7,  82 }, // de -> de_Latn_DE
-    { 239,   0,   0 }, { 239,   7, 156 }, // dje -> dje_Latn_NE
-    { 275,   0,   0 }, { 275,   1, 100 }, // doi -> doi_Arab_IN
-    { 317,   0,   0 }, { 317,   7,  82 }, // dsb -> dsb_Latn_DE
-    { 240,   0,   0 }, { 240,   7,  37 }, // dua -> dua_Latn_CM
-    { 143,   0,   0 }, { 143,  29, 131 }, // dv -> dv_Thaa_MV
-    { 241,   0,   0 }, { 241,   7, 187 }, // dyo -> dyo_Latn_SN
-    {  16,   0,   0 }, {  16,  31,  25 }, // dz -> dz_Tibt_BT
-    { 189,   0,   0 }, { 189,   7, 111 }, // ebu -> ebu_Latn_KE
-    { 161,   0,   0 }, { 161,   7,  83 }, // ee -> ee_Latn_GH
-    { 263,   0,   0 }, { 263,  50,  64 }, // egy -> egy_Egyp_EG
-    { 277,   0,   0 }, { 277,  63, 147 }, // eky -> eky_Kali_MM
-    {  43,   0,   0 }, {  43,  16,  85 }, // el -> el_Grek_GR
-    {  31,   0,   0 }, {  31,   7, 225 }, // en -> en_Latn_US
-    {  31,  92,   0 }, {  31,  92, 224 }, // en_Shaw -> en_Shaw_GB
-    {  32,   0,   0 }, {  32,   7, 260 }, // eo -> eo_Latn_001
-    { 111,   0,   0 }, { 111,   7, 197 }, // es -> es_Latn_ES
-    {  33,   0,   0 }, {  33,   7,  68 }, // et -> et_Latn_EE
-    { 278,   0,   0 }, { 278,  79, 106 }, // ett -> ett_Ital_IT
-    {  14,   0,   0 }, {  14,   7, 197 }, // eu -> eu_Latn_ES
-    { 242,   0,   0 }, { 242,   7,  37 }, // ewo -> ewo_Latn_CM
-    {  89,   0,   0 }, {  89,   1, 102 }, // fa -> fa_Arab_IR
-    { 177,   0,   0 }, { 177,   7, 187 }, // ff -> ff_Latn_SN
-    { 177, 134,   0 }, { 177, 134,  91 }, // ff_Adlm -> ff_Adlm_GN
-    {  36,   0,   0 }, {  36,   7,  73 }, // fi -> fi_Latn_FI
-    { 166,   0,   0 }, { 166,   7, 170 }, // fil -> fil_Latn_PH
-    {  35,   0,   0 }, {  35,   7,  72 }, // fj -> fj_Latn_FJ
-    {  34,   0,   0 }, {  34,   7,  71 }, // fo -> fo_Latn_FO
-    {  37,   0,   0 }, {  37,   7,  74 }, // fr -> fr_Latn_FR
-    { 159,   0,   0 }, { 159,   7, 106 }, // fur -> fur_Latn_IT
-    {  38,   0,   0 }, {  38,   7, 151 }, // fy -> fy_Latn_NL
-    {  57,   0,   0 }, {  57,   7, 104 }, // ga -> ga_Latn_IE
-    { 148,   0,   0 }, { 148,   7,  83 }, // gaa -> gaa_Latn_GH
-    {  39,   0,   0 }, {  39,   7, 224 }, // gd -> gd_Latn_GB
-    { 153,   0,   0 }, { 153,  14,  69 }, // gez -> gez_Ethi_ET
-    {  40,   0,   0 }, {  40,   7, 197 }, // gl -> gl_Latn_ES
-    {  45,   0,   0 }, {  45,   7, 168 }, // gn -> gn_Latn_PY
-    { 279,   0,   0 }, { 279,  53, 222 }, // got -> got_Goth_UA
-    { 264,   0,   0 }, { 264,  49,  56 }, // grc -> grc_Cprt_CY
-    { 264,  68,   0 }, { 264,  68,  85 }, // grc_Linb -> grc_Linb_GR
-    { 167,   0,   0 }, { 167,   7, 206 }, // gsw -> gsw_Latn_CH
-    {  46,   0,   0 }, {  46,  17, 100 }, // gu -> gu_Gujr_IN
-    { 175,   0,   0 }, { 175,   7, 111 }, // guz -> guz_Latn_KE
-    { 144,   0,   0 }, { 144,   7, 251 }, // gv -> gv_Latn_IM
-    {  47,   0,   0 }, {  47,   7, 157 }, // ha -> ha_Latn_NG
-    {  47,   0,  37 }, {  47,   1,  37 }, // ha_CM -> ha_Arab_CM
-    {  47,   0, 201 }, {  47,   1, 201 }, // ha_SD -> ha_Arab_SD
-    { 163,   0,   0 }, { 163,   7, 225 }, // haw -> haw_Latn_US
-    {  48,   0,   0 }, {  48,  18, 105 }, // he -> he_Hebr_IL
-    {  49,   0,   0 }, {  49,  13, 100 }, // hi -> hi_Deva_IN
-    { 344,   0,   0 }, { 344, 129, 217 }, // hlu -> hlu_Hluw_TR
-    { 282,   0,   0 }, { 282,  86,  44 }, // hmd -> hmd_Plrd_CN
-    { 333,   0,   0 }, { 333, 110, 117 }, // hnj -> hnj_Hmng_LA
-    { 280,   0,   0 }, { 280,   7, 170 }, // hnn -> hnn_Latn_PH
-    { 224,   0,   0 }, { 224,   7, 167 }, // ho -> ho_Latn_PG
-    { 334,   0,   0 }, { 334,  13, 100 }, // hoc -> hoc_Deva_IN
-    {  27,   0,   0 }, {  27,   7,  54 }, // hr -> hr_Latn_HR
-    { 318,   0,   0 }, { 318,   7,  82 }, // hsb -> hsb_Latn_DE
-    { 222,   0,   0 }, { 222,   7,  94 }, // ht -> ht_Latn_HT
-    {  50,   0,   0 }, {  50,   7,  98 }, // hu -> hu_Latn_HU
-    {   9,   0,   0 }, {   9,  10,  11 }, // hy -> hy_Armn_AM
-    { 223,   0,   0 }, { 223,   7, 148 }, // hz -> hz_Latn_NA
-    {  53,   0,   0 }, {  53,   7, 260 }, // ia -> ia_Latn_001
-    {  52,   0,   0 }, {  52,   7, 101 }, // id -> id_Latn_ID
-    { 149,   0,   0 }, { 149,   7, 157 }, // ig -> ig_Latn_NG
-    { 168,   0,   0 }, { 168,  34,  44 }, // ii -> ii_Yiii_CN
-    {  56,   0,   0 }, {  56,   7, 225 }, // ik -> ik_Latn_US
-    { 281,   0,   0 }, { 281,   2, 178 }, // inh -> inh_Cyrl_RU
-    { 360,   0,   0 }, { 360,   7, 260 }, // io -> io_Latn_001
-    {  51,   0,   0 }, {  51,   7,  99 }, // is -> is_Latn_IS
-    {  58,   0,   0 }, {  58,   7, 106 }, // it -> it_Latn_IT
-    {  55,   0,   0 }, {  55,  44,  38 }, // iu -> iu_Cans_CA
-    {  59,   0,   0 }, {  59,  19, 108 }, // ja -> ja_Jpan_JP
-    { 361,   0,   0 }, { 361,   7, 260 }, // jbo -> jbo_Latn_001
-    { 257,   0,   0 }, { 257,   7,  37 }, // jgo -> jgo_Latn_CM
-    { 200,   0,   0 }, { 200,   7, 210 }, // jmc -> jmc_Latn_TZ
-    {  60,   0,   0 }, {  60,   7, 101 }, // jv -> jv_Latn_ID
-    {  41,   0,   0 }, {  41,  15,  81 }, // ka -> ka_Geor_GE
-    { 184,   0,   0 }, { 184,   7,   3 }, // kab -> kab_Latn_DZ
-    { 158,   0,   0 }, { 158,   7, 157 }, // kaj -> kaj_Latn_NG
-    { 150,   0,   0 }, { 150,   7, 111 }, // kam -> kam_Latn_KE
-    { 164,   0,   0 }, { 164,   7, 157 }, // kcg -> kcg_Latn_NG
-    { 192,   0,   0 }, { 192,   7, 210 }, // kde -> kde_Latn_TZ
-    { 196,   0,   0 }, { 196,   7,  39 }, // kea -> kea_Latn_CV
-    { 319,   0,   0 }, { 319,   7,  37 }, // ken -> ken_Latn_CM
-    { 154,   0,   0 }, { 154,   7,  53 }, // kfo -> kfo_Latn_CI
-    { 227,   0,   0 }, { 227,   7,  49 }, // kg -> kg_Latn_CD
-    { 286,   0,   0 }, { 286,  76,  44 }, // khb -> khb_Talu_CN
-    { 208,   0,   0 }, { 208,   7, 132 }, // khq -> khq_Latn_ML
-    { 178,   0,   0 }, { 178,   7, 111 }, // ki -> ki_Latn_KE
-    { 228,   0,   0 }, { 228,   7, 148 }, // kj -> kj_Latn_NA
-    {  63,   0,   0 }, {  63,   2, 110 }, // kk -> kk_Cyrl_KZ
-    {  63,   0,   1 }, {  63,   1,   1 }, // kk_AF -> kk_Arab_AF
-    {  63,   0,  44 }, {  63,   1,  44 }, // kk_CN -> kk_Arab_CN
-    {  63,   0, 102 }, {  63,   1, 102 }, // kk_IR -> kk_Arab_IR
-    {  63,   0, 143 }, {  63,   1, 143 }, // kk_MN -> kk_Arab_MN
-    {  63,   1,   0 }, {  63,   1,  44 }, // kk_Arab -> kk_Arab_CN
-    { 258,   0,   0 }, { 258,   7,  37 }, // kkj -> kkj_Latn_CM
-    {  44,   0,   0 }, {  44,   7,  86 }, // kl -> kl_Latn_GL
-    { 198,   0,   0 }, { 198,   7, 111 }, // kln -> kln_Latn_KE
-    {  23,   0,   0 }, {  23,  20,  36 }, // km -> km_Khmr_KH
-    {  61,   0,   0 }, {  61,  21, 100 }, // kn -> kn_Knda_IN
-    {  66,   0,   0 }, {  66,  22, 114 }, // ko -> ko_Kore_KR
-    { 147,   0,   0 }, { 147,  13, 100 }, // kok -> kok_Deva_IN
-    { 169,   0,   0 }, { 169,   7, 121 }, // kpe -> kpe_Latn_LR
-    { 225,   0,   0 }, { 225,   7,   0 }, // kr -> kr_Latn
-    {  62,   0,   0 }, {  62,   1, 100 }, // ks -> ks_Arab_IN
-    { 214,   0,   0 }, { 214,   7, 210 }, // ksb -> ksb_Latn_TZ
-    { 243,   0,   0 }, { 243,   7,  37 }, // ksf -> ksf_Latn_CM
-    { 201,   0,   0 }, { 201,   7,  82 }, // ksh -> ksh_Latn_DE
-    {  67,   0,   0 }, {  67,   7, 217 }, // ku -> ku_Latn_TR
-    {  67,   0, 119 }, {  67,   1, 119 }, // ku_LB -> ku_Arab_LB
-    {  67,   1,   0 }, {  67,   1, 103 }, // ku_Arab -> ku_Arab_IQ
-    { 226,   0,   0 }, { 226,   2, 178 }, // kv -> kv_Cyrl_RU
-    { 145,   0,   0 }, { 145,   7, 224 }, // kw -> kw_Latn_GB
-    {  65,   0,   0 }, {  65,   2, 116 }, // ky -> ky_Cyrl_KG
-    {  65,   0,  44 }, {  65,   1,  44 }, // ky_CN -> ky_Arab_CN
-    {  65,   0, 217 }, {  65,   7, 217 }, // ky_TR -> ky_Latn_TR
-    {  65,   1,   0 }, {  65,   1,  44 }, // ky_Arab -> ky_Arab_CN
-    {  65,   7,   0 }, {  65,   7, 217 }, // ky_Latn -> ky_Latn_TR
-    {  70,   0,   0 }, {  70,   7, 230 }, // la -> la_Latn_VA
-    { 332,   0,   0 }, { 332, 112,  85 }, // lab -> lab_Lina_GR
-    { 193,   0,   0 }, { 193,   7, 210 }, // lag -> lag_Latn_TZ
-    { 231,   0,   0 }, { 231,   7, 125 }, // lb -> lb_Latn_LU
-    { 283,   0,   0 }, { 283,  66, 100 }, // lep -> lep_Lepc_IN
-    { 335,   0,   0 }, { 335,   2, 178 }, // lez -> lez_Cyrl_RU
-    { 194,   0,   0 }, { 194,   7, 221 }, // lg -> lg_Latn_UG
-    { 229,   0,   0 }, { 229,   7, 151 }, // li -> li_Latn_NL
-    { 284,   0,   0 }, { 284,  13, 150 }, // lif -> lif_Deva_NP
-    { 284,  67,   0 }, { 284,  67, 100 }, // lif_Limb -> lif_Limb_IN
-    { 285,   0,   0 }, { 285,  51,  44 }, // lis -> lis_Lisu_CN
-    { 313,   0,   0 }, { 313,   7, 225 }, // lkt -> lkt_Latn_US
-    {  72,   0,   0 }, {  72,   7,  49 }, // ln -> ln_Latn_CD
-    {  69,   0,   0 }, {  69,  23, 117 }, // lo -> lo_Laoo_LA
-    { 349,   0,   0 }, { 349,   1, 102 }, // lrc -> lrc_Arab_IR
-    {  73,   0,   0 }, {  73,   7, 124 }, // lt -> lt_Latn_LT
-    { 230,   0,   0 }, { 230,   7,  49 }, // lu -> lu_Latn_CD
-    { 210,   0,   0 }, { 210,   7, 111 }, // luo -> luo_Latn_KE
-    { 204,   0,   0 }, { 204,   7, 111 }, // luy -> luy_Latn_KE
-    {  71,   0,   0 }, {  71,   7, 118 }, // lv -> lv_Latn_LV
-    { 345,   0,   0 }, { 345,   5,  44 }, // lzh -> lzh_Hans_CN
-    { 339,   0,   0 }, { 339,  13, 100 }, // mai -> mai_Deva_IN
-    { 289,   0,   0 }, { 289,   7,  80 }, // man -> man_Latn_GM
-    { 289,   0,  91 }, { 289,  75,  91 }, // man_GN -> man_Nkoo_GN
-    { 289,  75,   0 }, { 289,  75,  91 }, // man_Nkoo -> man_Nkoo_GN
-    { 202,   0,   0 }, { 202,   7, 111 }, // mas -> mas_Latn_KE
-    { 330,   0,   0 }, { 330,   7, 189 }, // men -> men_Latn_SL
-    { 197,   0,   0 }, { 197,   7, 111 }, // mer -> mer_Latn_KE
-    { 191,   0,   0 }, { 191,   7, 137 }, // mfe -> mfe_Latn_MU
-    {  75,   0,   0 }, {  75,   7, 128 }, // mg -> mg_Latn_MG
-    { 244,   0,   0 }, { 244,   7, 146 }, // mgh -> mgh_Latn_MZ
-    { 259,   0,   0 }, { 259,   7,  37 }, // mgo -> mgo_Latn_CM
-    {  81,   0,   0 }, {  81,   7, 134 }, // mh -> mh_Latn_MH
-    {  79,   0,   0 }, {  79,   7, 154 }, // mi -> mi_Latn_NZ
-    { 356,   0,   0 }, { 356, 130, 103 }, // mis -> mis_Hatr_IQ
-    {  74,   0,   0 }, {  74,   2, 127 }, // mk -> mk_Cyrl_MK
-    {  77,   0,   0 }, {  77,  24, 100 }, // ml -> ml_Mlym_IN
-    {  82,   0,   0 }, {  82,   2, 143 }, // mn -> mn_Cyrl_MN
-    {  82,   0,  44 }, {  82,   8,  44 }, // mn_CN -> mn_Mong_CN
-    {  82,   8,   0 }, {  82,   8,  44 }, // mn_Mong -> mn_Mong_CN
-    { 290,   0,   0 }, { 290,  11, 100 }, // mni -> mni_Beng_IN
-    { 320,   0,   0 }, { 320,   7,  38 }, // moh -> moh_Latn_CA
-    {  80,   0,   0 }, {  80,  13, 100 }, // mr -> mr_Deva_IN
-    { 347,   0,   0 }, { 347, 117,  18 }, // mro -> mro_Mroo_BD
-    {  76,   0,   0 }, {  76,   7, 130 }, // ms -> ms_Latn_MY
-    {  76,   0,  46 }, {  76,   1,  46 }, // ms_CC -> ms_Arab_CC
-    {  76,   0, 101 }, {  76,   1, 101 }, // ms_ID -> ms_Arab_ID
-    {  78,   0,   0 }, {  78,   7, 133 }, // mt -> mt_Latn_MT
-    { 245,   0,   0 }, { 245,   7,  37 }, // mua -> mua_Latn_CM
-    { 368,   0,   0 }, { 368,   7, 225 }, // mus -> mus_Latn_US
-    {  21,   0,   0 }, {  21,  25, 147 }, // my -> my_Mymr_MM
-    { 366,   0,   0 }, { 366,   2, 178 }, // myv -> myv_Cyrl_RU
-    { 273,   0,   0 }, { 273,  71, 102 }, // myz -> myz_Mand_IR
-    { 346,   0,   0 }, { 346,   1, 102 }, // mzn -> mzn_Arab_IR
-    {  83,   0,   0 }, {  83,   7, 149 }, // na -> na_Latn_NR
-    { 199,   0,   0 }, { 199,   7, 148 }, // naq -> naq_Latn_NA
-    {  85,   0,   0 }, {  85,   7, 161 }, // nb -> nb_Latn_NO
-    { 181,   0,   0 }, { 181,   7, 240 }, // nd -> nd_Latn_ZW
-    { 170,   0,   0 }, { 170,   7,  82 }, // nds -> nds_Latn_DE
-    {  84,   0,   0 }, {  84,  13, 150 }, // ne -> ne_Deva_NP
-    { 348,   0,   0 }, { 348,  13, 150 }, // new -> new_Deva_NP
-    { 233,   0,   0 }, { 233,   7, 148 }, // ng -> ng_Latn_NA
-    {  30,   0,   0 }, {  30,   7, 151 }, // nl -> nl_Latn_NL
-    { 246,   0,   0 }, { 246,   7,  37 }, // nmg -> nmg_Latn_CM
-    { 141,   0,   0 }, { 141,   7, 161 }, // nn -> nn_Latn_NO
-    { 260,   0,   0 }, { 260,   7,  37 }, // nnh -> nnh_Latn_CM
-    { 292,   0,   0 }, { 292,  65, 211 }, // nod -> nod_Lana_TH
-    { 294,   0,   0 }, { 294,  88, 205 }, // non -> non_Runr_SE
-    { 321,   0,   0 }, { 321,  75,  91 }, // nqo -> nqo_Nkoo_GN
-    { 171,   0,   0 }, { 171,   7, 195 }, // nr -> nr_Latn_ZA
-    { 172,   0,   0 }, { 172,   7, 195 }, // nso -> nso_Latn_ZA
-    { 247,   0,   0 }, { 247,   7, 254 }, // nus -> nus_Latn_SS
-    { 232,   0,   0 }, { 232,   7, 225 }, // nv -> nv_Latn_US
-    { 165,   0,   0 }, { 165,   7, 129 }, // ny -> ny_Latn_MW
-    { 185,   0,   0 }, { 185,   7, 221 }, // nyn -> nyn_Latn_UG
-    {  86,   0,   0 }, {  86,   7,  74 }, // oc -> oc_Latn_FR
-    {   3,   0,   0 }, {   3,   7,  69 }, // om -> om_Latn_ET
-    {  87,   0,   0 }, {  87,  26, 100 }, // or -> or_Orya_IN
-    { 101,   0,   0 }, { 101,   2,  81 }, // os -> os_Cyrl_GE
-    { 358,   0,   0 }, { 358, 138, 225 }, // osa -> osa_Osge_US
-    { 296,   0,   0 }, { 296,  82, 143 }, // otk -> otk_Orkh_MN
-    {  92,   0,   0 }, {  92,   4, 100 }, // pa -> pa_Guru_IN
-    {  92,   0, 163 }, {  92,   1, 163 }, // pa_PK -> pa_Arab_PK
-    {  92,   1,   0 }, {  92,   1, 163 }, // pa_Arab -> pa_Arab_PK
-    { 297,   0,   0 }, { 297,  58, 102 }, // pal -> pal_Phli_IR
-    { 297, 123,   0 }, { 297, 123,  44 }, // pal_Phlp -> pal_Phlp_CN
-    { 351,   0,   0 }, { 351,   7,  12 }, // pap -> pap_Latn_AW
-    { 350,   0,   0 }, { 350,   7, 164 }, // pau -> pau_Latn_PW
-    { 295,   0,   0 }, { 295,  80, 102 }, // peo -> peo_Xpeo_IR
-    { 299,   0,   0 }, { 299,  85, 119 }, // phn -> phn_Phnx_LB
-    { 342,   0,   0 }, { 342,  41, 100 }, // pka -> pka_Brah_IN
-    {  90,   0,   0 }, {  90,   7, 172 }, // pl -> pl_Latn_PL
-    { 300,   0,   0 }, { 300,  64, 163 }, // pra -> pra_Khar_PK
-    { 322,   0,   0 }, { 322,   7, 260 }, // prg -> prg_Latn_001
-    {  88,   0,   0 }, {  88,   1,   1 }, // ps -> ps_Arab_AF
-    {  91,   0,   0 }, {  91,   7,  30 }, // pt -> pt_Latn_BR
-    {  93,   0,   0 }, {  93,   7, 169 }, // qu -> qu_Latn_PE
-    { 323,   0,   0 }, { 323,   7,  90 }, // quc -> quc_Latn_GT
-    { 301,   0,   0 }, { 301,   7, 101 }, // rej -> rej_Latn_ID
-    {  94,   0,   0 }, {  94,   7, 206 }, // rm -> rm_Latn_CH
-    {  68,   0,   0 }, {  68,   7,  35 }, // rn -> rn_Latn_BI
-    {  95,   0,   0 }, {  95,   7, 177 }, // ro -> ro_Latn_RO
-    { 182,   0,   0 }, { 182,   7, 210 }, // rof -> rof_Latn_TZ
-    {  96,   0,   0 }, {  96,   2, 178 }, // ru -> ru_Cyrl_RU
-    {  64,   0,   0 }, {  64,   7, 179 }, // rw -> rw_Latn_RW
-    { 209,   0,   0 }, { 209,   7, 210 }, // rwk -> rwk_Latn_TZ
-    {  99,   0,   0 }, {  99,  13, 100 }, // sa -> sa_Deva_IN
-    { 248,   0,   0 }, { 248,   2, 178 }, // sah -> sah_Cyrl_RU
-    { 179,   0,   0 }, { 179,   7, 111 }, // saq -> saq_Latn_KE
-    { 304,   0,   0 }, { 304,   7, 100 }, // sat -> sat_Latn_IN
-    { 305,   0,   0 }, { 305,  90, 100 }, // saz -> saz_Saur_IN
-    { 249,   0,   0 }, { 249,   7, 210 }, // sbp -> sbp_Latn_TZ
-    { 115,   0,   0 }, { 115,   7, 106 }, // sc -> sc_Latn_IT
-    { 362,   0,   0 }, { 362,   7, 106 }, // scn -> scn_Latn_IT
-    { 105,   0,   0 }, { 105,   1, 163 }, // sd -> sd_Arab_PK
-    { 105,  13,   0 }, { 105,  13, 100 }, // sd_Deva -> sd_Deva_IN
-    { 105, 111,   0 }, { 105, 111, 100 }, // sd_Khoj -> sd_Khoj_IN
-    { 105, 125,   0 }, { 105, 125, 100 }, // sd_Sind -> sd_Sind_IN
-    { 363,   0,   0 }, { 363,   1, 102 }, // sdh -> sdh_Arab_IR
-    { 173,   0,   0 }, { 173,   7, 161 }, // se -> se_Latn_NO
-    { 180,   0,   0 }, { 180,   7, 146 }, // seh -> seh_Latn_MZ
-    { 213,   0,   0 }, { 213,   7, 132 }, // ses -> ses_Latn_ML
-    {  98,   0,   0 }, {  98,   7,  41 }, // sg -> sg_Latn_CF
-    { 293,   0,   0 }, { 293,  77, 104 }, // sga -> sga_Ogam_IE
-    { 183,   0,   0 }, { 183,   9, 145 }, // shi -> shi_Tfng_MA
-    { 106,   0,   0 }, { 106,  32, 198 }, // si -> si_Sinh_LK
-    { 155,   0,   0 }, { 155,   7,  69 }, // sid -> sid_Latn_ET
-    { 108,   0,   0 }, { 108,   7, 191 }, // sk -> sk_Latn_SK
-    { 352,   0,   0 }, { 352,   1, 163 }, // skr -> skr_Arab_PK
-    { 109,   0,   0 }, { 109,   7, 192 }, // sl -> sl_Latn_SI
-    {  97,   0,   0 }, {  97,   7, 183 }, // sm -> sm_Latn_WS
-    { 324,   0,   0 }, { 324,   7, 205 }, // sma -> sma_Latn_SE
-    { 325,   0,   0 }, { 325,   7, 205 }, // smj -> smj_Latn_SE
-    { 326,   0,   0 }, { 326,   7,  73 }, // smn -> smn_Latn_FI
-    { 303,   0,   0 }, { 303,  89, 105 }, // smp -> smp_Samr_IL
-    { 327,   0,   0 }, { 327,   7,  73 }, // sms -> sms_Latn_FI
-    { 104,   0,   0 }, { 104,   7, 240 }, // sn -> sn_Latn_ZW
-    { 110,   0,   0 }, { 110,   7, 194 }, // so -> so_Latn_SO
-    {   6,   0,   0 }, {   6,   7,   2 }, // sq -> sq_Latn_AL
-    { 100,   0,   0 }, { 100,   2, 243 }, // sr -> sr_Cyrl_RS
-    { 100,   0, 242 }, { 100,   7, 242 }, // sr_ME -> sr_Latn_ME
-    { 100,   0, 177 }, { 100,   7, 177 }, // sr_RO -> sr_Latn_RO
-    { 100,   0, 178 }, { 100,   7, 178 }, // sr_RU -> sr_Latn_RU
-    { 100,   0, 217 }, { 100,   7, 217 }, // sr_TR -> sr_Latn_TR
-    { 306,   0,   0 }, { 306,  93, 100 }, // srb -> srb_Sora_IN
-    { 107,   0,   0 }, { 107,   7, 195 }, // ss -> ss_Latn_ZA
-    { 207,   0,   0 }, { 207,   7,  67 }, // ssy -> ssy_Latn_ER
-    { 102,   0,   0 }, { 102,   7, 195 }, // st -> st_Latn_ZA
-    { 112,   0,   0 }, { 112,   7, 101 }, // su -> su_Latn_ID
-    { 114,   0,   0 }, { 114,   7, 205 }, // sv -> sv_Latn_SE
-    { 113,   0,   0 }, { 113,   7, 210 }, // sw -> sw_Latn_TZ
-    { 250,   0,   0 }, { 250,   7,  49 }, // swc -> swc_Latn_CD
-    { 307,   0,   0 }, { 307,  11,  18 }, // syl -> syl_Beng_BD
-    { 151,   0,   0 }, { 151,  33, 103 }, // syr -> syr_Syrc_IQ
-    { 369,   0,   0 }, { 369,   7, 172 }, // szl -> szl_Latn_PL
-    { 117,   0,   0 }, { 117,  27, 100 }, // ta -> ta_Taml_IN
-    { 308,   0,   0 }, { 308,   7, 170 }, // tbw -> tbw_Latn_PH
-    { 310,   0,   0 }, { 310,  99,  44 }, // tdd -> tdd_Tale_CN
-    { 119,   0,   0 }, { 119,  28, 100 }, // te -> te_Telu_IN
-    { 206,   0,   0 }, { 206,   7, 221 }, // teo -> teo_Latn_UG
-    { 116,   0,   0 }, { 116,   2, 209 }, // tg -> tg_Cyrl_TJ
-    { 116,   0, 163 }, { 116,   1, 163 }, // tg_PK -> tg_Arab_PK
-    { 116,   1,   0 }, { 116,   1, 163 }, // tg_Arab -> tg_Arab_PK
-    { 120,   0,   0 }, { 120,  30, 211 }, // th -> th_Thai_TH
-    { 122,   0,   0 }, { 122,  14,  69 }, // ti -> ti_Ethi_ET
-    { 157,   0,   0 }, { 157,  14,  67 }, // tig -> tig_Ethi_ER
-    { 126,   0,   0 }, { 126,   7, 218 }, // tk -> tk_Latn_TM
-    { 353,   0,   0 }, { 353,   7, 213 }, // tkl -> tkl_Latn_TK
-    { 103,   0,   0 }, { 103,   7, 195 }, // tn -> tn_Latn_ZA
-    { 123,   0,   0 }, { 123,   7, 214 }, // to -> to_Latn_TO
-    { 354,   0,   0 }, { 354,   7, 167 }, // tpi -> tpi_Latn_PG
-    { 125,   0,   0 }, { 125,   7, 217 }, // tr -> tr_Latn_TR
-    { 174,   0,   0 }, { 174,   7, 208 }, // trv -> trv_Latn_TW
-    { 124,   0,   0 }, { 124,   7, 195 }, // ts -> ts_Latn_ZA
-    { 118,   0,   0 }, { 118,   2, 178 }, // tt -> tt_Cyrl_RU
-    { 355,   0,   0 }, { 355,   7, 220 }, // tvl -> tvl_Latn_TV
-    { 251,   0,   0 }, { 251,   7, 156 }, // twq -> twq_Latn_NE
-    { 359,   0,   0 }, { 359, 139,  44 }, // txg -> txg_Tang_CN
-    { 127,   0,   0 }, { 127,   7,  77 }, // ty -> ty_Latn_PF
-    { 212,   0,   0 }, { 212,   7, 145 }, // tzm -> tzm_Latn_MA
-    { 128,   0,   0 }, { 128,   1,  44 }, // ug -> ug_Arab_CN
-    { 128,   0, 110 }, { 128,   2, 110 }, // ug_KZ -> ug_Cyrl_KZ
-    { 128,   0, 143 }, { 128,   2, 143 }, // ug_MN -> ug_Cyrl_MN
-    { 128,   2,   0 }, { 128,   2, 110 }, // ug_Cyrl -> ug_Cyrl_KZ
-    { 311,   0,   0 }, { 311, 102, 207 }, // uga -> uga_Ugar_SY
-    { 129,   0,   0 }, { 129,   2, 222 }, // uk -> uk_Cyrl_UA
-    { 130,   0,   0 }, { 130,   1, 163 }, // ur -> ur_Arab_PK
-    { 131,   0,   0 }, { 131,   7, 228 }, // uz -> uz_Latn_UZ
-    { 131,   0,   1 }, { 131,   1,   1 }, // uz_AF -> uz_Arab_AF
-    { 131,   0,  44 }, { 131,   2,  44 }, // uz_CN -> uz_Cyrl_CN
-    { 131,   1,   0 }, { 131,   1,   1 }, // uz_Arab -> uz_Arab_AF
-    { 252,   0,   0 }, { 252,  35, 121 }, // vai -> vai_Vaii_LR
-    { 160,   0,   0 }, { 160,   7, 195 }, // ve -> ve_Latn_ZA
-    { 132,   0,   0 }, { 132,   7, 232 }, // vi -> vi_Latn_VN
-    { 133,   0,   0 }, { 133,   7, 260 }, // vo -> vo_Latn_001
-    { 187,   0,   0 }, { 187,   7, 210 }, // vun -> vun_Latn_TZ
-    { 236,   0,   0 }, { 236,   7,  21 }, // wa -> wa_Latn_BE
-    { 253,   0,   0 }, { 253,   7, 206 }, // wae -> wae_Latn_CH
-    { 162,   0,   0 }, { 162,  14,  69 }, // wal -> wal_Ethi_ET
-    { 328,   0,   0 }, { 328,   7,  13 }, // wbp -> wbp_Latn_AU
-    { 135,   0,   0 }, { 135,   7, 187 }, // wo -> wo_Latn_SN
-    { 271,   0,   0 }, { 271,  45, 217 }, // xcr -> xcr_Cari_TR
-    { 136,   0,   0 }, { 136,   7, 195 }, // xh -> xh_Latn_ZA
-    { 287,   0,   0 }, { 287,  69, 217 }, // xlc -> xlc_Lyci_TR
-    { 288,   0,   0 }, { 288,  70, 217 }, // xld -> xld_Lydi_TR
-    { 329,   0,   0 }, { 329, 114,  44 }, // xmn -> xmn_Mani_CN
-    { 291,   0,   0 }, { 291,  74, 201 }, // xmr -> xmr_Merc_SD
-    { 331,   0,   0 }, { 331, 118, 186 }, // xna -> xna_Narb_SA
-    { 203,   0,   0 }, { 203,   7, 221 }, // xog -> xog_Latn_UG
-    { 298,   0,   0 }, { 298,  59, 102 }, // xpr -> xpr_Prti_IR
-    { 302,   0,   0 }, { 302,  81, 237 }, // xsa -> xsa_Sarb_YE
-    { 254,   0,   0 }, { 254,   7,  37 }, // yav -> yav_Latn_CM
-    { 137,   0,   0 }, { 137,  18, 260 }, // yi -> yi_Hebr_001
-    { 138,   0,   0 }, { 138,   7, 157 }, // yo -> yo_Latn_NG
-    { 357,   0,   0 }, { 357,   6,  97 }, // yue -> yue_Hant_HK
-    { 357,   0,  44 }, { 357,   5,  44 }, // yue_CN -> yue_Hans_CN
-    { 357,   5,   0 }, { 357,   5,  44 }, // yue_Hans -> yue_Hans_CN
-    { 139,   0,   0 }, { 139,   7,  44 }, // za -> za_Latn_CN
-    { 314,   0,   0 }, { 314,   9, 145 }, // zgh -> zgh_Tfng_MA
-    {  25,   0,   0 }, {  25,   5,  44 }, // zh -> zh_Hans_CN
-    {  25,   0,  13 }, {  25,   6,  13 }, // zh_AU -> zh_Hant_AU
-    {  25,   0,  32 }, {  25,   6,  32 }, // zh_BN -> zh_Hant_BN
-    {  25,   0, 224 }, {  25,   6, 224 }, // zh_GB -> zh_Hant_GB
-    {  25,   0,  76 }, {  25,   6,  76 }, // zh_GF -> zh_Hant_GF
-    {  25,   0,  97 }, {  25,   6,  97 }, // zh_HK -> zh_Hant_HK
-    {  25,   0, 101 }, {  25,   6, 101 }, // zh_ID -> zh_Hant_ID
-    {  25,   0, 126 }, {  25,   6, 126 }, // zh_MO -> zh_Hant_MO
-    {  25,   0, 130 }, {  25,   6, 130 }, // zh_MY -> zh_Hant_MY
-    {  25,   0, 166 }, {  25,   6, 166 }, // zh_PA -> zh_Hant_PA
-    {  25,   0,  77 }, {  25,   6,  77 }, // zh_PF -> zh_Hant_PF
-    {  25,   0, 170 }, {  25,   6, 170 }, // zh_PH -> zh_Hant_PH
-    {  25,   0, 202 }, {  25,   6, 202 }, // zh_SR -> zh_Hant_SR
-    {  25,   0, 211 }, {  25,   6, 211 }, // zh_TH -> zh_Hant_TH
-    {  25,   0, 208 }, {  25,   6, 208 }, // zh_TW -> zh_Hant_TW
-    {  25,   0, 225 }, {  25,   6, 225 }, // zh_US -> zh_Hant_US
-    {  25,   0, 232 }, {  25,   6, 232 }, // zh_VN -> zh_Hant_VN
-    {  25,  40,   0 }, {  25,  40, 208 }, // zh_Bopo -> zh_Bopo_TW
-    {  25, 140,   0 }, {  25, 140, 208 }, // zh_Hanb -> zh_Hanb_TW
-    {  25,   6,   0 }, {  25,   6, 208 }, // zh_Hant -> zh_Hant_TW
-    { 140,   0,   0 }, { 140,   7, 195 }, // zu -> zu_Latn_ZA
-    {   0,   0, 261 }, {  96,   2, 178 }, // und_150 -> ru_Cyrl_RU
-    {   0,   0, 246 }, { 111,   7, 246 }, // und_419 -> es_Latn_419
-    {   0,   0,   5 }, {  24,   7,   5 }, // und_AD -> ca_Latn_AD
-    {   0,   0, 223 }, {   8,   1, 223 }, // und_AE -> ar_Arab_AE
     {   0,   0,   1 }, {  89,   1,   1 }, // und_AF -> fa_Arab_AF
     {   0,   0,   2 }, {   6,   7,   2 }, // und_AL -> sq_Latn_AL
-    {   0,   0,  11 }, {   9,  10,  11 }, // und_AM -> hy_Armn_AM
+    {   0,   0,   3 }, {   8,   1,   3 }, // und_DZ -> ar_Arab_DZ
+    {   0,   0,   4 }, {  97,   7,   4 }, // und_AS -> sm_Latn_AS
+    {   0,   0,   5 }, {  24,   7,   5 }, // und_AD -> ca_Latn_AD
     {   0,   0,   6 }, {  91,   7,   6 }, // und_AO -> pt_Latn_AO
     {   0,   0,   8 }, {   0,   7,   8 }, // und_AQ -> und_Latn_AQ
     {   0,   0,  10 }, { 111,   7,  10 }, // und_AR -> es_Latn_AR
-    {   0,   0,   4 }, {  97,   7,   4 }, // und_AS -> sm_Latn_AS
-    {   0,   0,  14 }, {  42,   7,  14 }, // und_AT -> de_Latn_AT
+    {   0,   0,  11 }, {   9,  10,  11 }, // und_AM -> hy_Armn_AM
     {   0,   0,  12 }, {  30,   7,  12 }, // und_AW -> nl_Latn_AW
-    {   0,   0, 248 }, { 114,   7, 248 }, // und_AX -> sv_Latn_AX
+    {   0,   0,  14 }, {  42,   7,  14 }, // und_AT -> de_Latn_AT
     {   0,   0,  15 }, {  12,   7,  15 }, // und_AZ -> az_Latn_AZ
-    {   0,   0,  27 }, { 142,   7,  27 }, // und_BA -> bs_Latn_BA
+    {   0,   0,  17 }, {   8,   1,  17 }, // und_BH -> ar_Arab_BH
     {   0,   0,  18 }, {  15,  11,  18 }, // und_BD -> bn_Beng_BD
+    {   0,   0,  20 }, {  22,   2,  20 }, // und_BY -> be_Cyrl_BY
     {   0,   0,  21 }, {  30,   7,  21 }, // und_BE -> nl_Latn_BE
-    {   0,   0,  34 }, {  37,   7,  34 }, // und_BF -> fr_Latn_BF
-    {   0,   0,  33 }, {  20,   2,  33 }, // und_BG -> bg_Cyrl_BG
-    {   0,   0,  17 }, {   8,   1,  17 }, // und_BH -> ar_Arab_BH
-    {   0,   0,  35 }, {  68,   7,  35 }, // und_BI -> rn_Latn_BI
     {   0,   0,  23 }, {  37,   7,  23 }, // und_BJ -> fr_Latn_BJ
-    {   0,   0, 244 }, {  37,   7, 244 }, // und_BL -> fr_Latn_BL
-    {   0,   0,  32 }, {  76,   7,  32 }, // und_BN -> ms_Latn_BN
-    {   0,   0,  26 }, { 111,   7,  26 }, // und_BO -> es_Latn_BO
-    {   0,   0, 255 }, { 351,   7, 255 }, // und_BQ -> pap_Latn_BQ
-    {   0,   0,  30 }, {  91,   7,  30 }, // und_BR -> pt_Latn_BR
     {   0,   0,  25 }, {  16,  31,  25 }, // und_BT -> dz_Tibt_BT
+    {   0,   0,  26 }, { 111,   7,  26 }, // und_BO -> es_Latn_BO
+    {   0,   0,  27 }, { 142,   7,  27 }, // und_BA -> bs_Latn_BA
     {   0,   0,  29 }, {   0,   7,  29 }, // und_BV -> und_Latn_BV
-    {   0,   0,  20 }, {  22,   2,  20 }, // und_BY -> be_Cyrl_BY
-    {   0,   0,  49 }, { 113,   7,  49 }, // und_CD -> sw_Latn_CD
+    {   0,   0,  30 }, {  91,   7,  30 }, // und_BR -> pt_Latn_BR
+    {   0,   0,  32 }, {  76,   7,  32 }, // und_BN -> ms_Latn_BN
+    {   0,   0,  33 }, {  20,   2,  33 }, // und_BG -> bg_Cyrl_BG
+    {   0,   0,  34 }, {  37,   7,  34 }, // und_BF -> fr_Latn_BF
+    {   0,   0,  35 }, {  68,   7,  35 }, // und_BI -> rn_Latn_BI
+    {   0,   0,  36 }, {  23,  20,  36 }, // und_KH -> km_Khmr_KH
+    {   0,   0,  37 }, {  37,   7,  37 }, // und_CM -> fr_Latn_CM
+    {   0,   0,  39 }, {  91,   7,  39 }, // und_CV -> pt_Latn_CV
     {   0,   0,  41 }, {  37,   7,  41 }, // und_CF -> fr_Latn_CF
-    {   0,   0,  50 }, {  37,   7,  50 }, // und_CG -> fr_Latn_CG
-    {   0,   0, 206 }, {  42,   7, 206 }, // und_CH -> de_Latn_CH
-    {   0,   0,  53 }, {  37,   7,  53 }, // und_CI -> fr_Latn_CI
+    {   0,   0,  42 }, {  37,   7,  42 }, // und_TD -> fr_Latn_TD
     {   0,   0,  43 }, { 111,   7,  43 }, // und_CL -> es_Latn_CL
-    {   0,   0,  37 }, {  37,   7,  37 }, // und_CM -> fr_Latn_CM
     {   0,   0,  44 }, {  25,   5,  44 }, // und_CN -> zh_Hans_CN
     {   0,   0,  47 }, { 111,   7,  47 }, // und_CO -> es_Latn_CO
-    {   0,   0, 241 }, {   0,   7, 241 }, // und_CP -> und_Latn_CP
+    {   0,   0,  48 }, {   8,   1,  48 }, // und_KM -> ar_Arab_KM
+    {   0,   0,  49 }, { 113,   7,  49 }, // und_CD -> sw_Latn_CD
+    {   0,   0,  50 }, {  37,   7,  50 }, // und_CG -> fr_Latn_CG
     {   0,   0,  52 }, { 111,   7,  52 }, // und_CR -> es_Latn_CR
+    {   0,   0,  53 }, {  37,   7,  53 }, // und_CI -> fr_Latn_CI
+    {   0,   0,  54 }, {  27,   7,  54 }, // und_HR -> hr_Latn_HR
     {   0,   0,  55 }, { 111,   7,  55 }, // und_CU -> es_Latn_CU
-    {   0,   0,  39 }, {  91,   7,  39 }, // und_CV -> pt_Latn_CV
-    {   0,   0, 152 }, { 351,   7, 152 }, // und_CW -> pap_Latn_CW
     {   0,   0,  56 }, {  43,  16,  56 }, // und_CY -> el_Grek_CY
     {   0,   0,  57 }, {  28,   7,  57 }, // und_CZ -> cs_Latn_CZ
-    {   0,   0,  82 }, {  42,   7,  82 }, // und_DE -> de_Latn_DE
-    {   0,   0,  59 }, {   4,   7,  59 }, // und_DJ -> aa_Latn_DJ
     {   0,   0,  58 }, {  29,   7,  58 }, // und_DK -> da_Latn_DK
+    {   0,   0,  59 }, {   4,   7,  59 }, // und_DJ -> aa_Latn_DJ
     {   0,   0,  61 }, { 111,   7,  61 }, // und_DO -> es_Latn_DO
-    {   0,   0,   3 }, {   8,   1,   3 }, // und_DZ -> ar_Arab_DZ
-    {   0,   0, 250 }, { 111,   7, 250 }, // und_EA -> es_Latn_EA
+    {   0,   0,  62 }, {  91,   7,  62 }, // und_TL -> pt_Latn_TL
     {   0,   0,  63 }, { 111,   7,  63 }, // und_EC -> es_Latn_EC
-    {   0,   0,  68 }, {  33,   7,  68 }, // und_EE -> et_Latn_EE
     {   0,   0,  64 }, {   8,   1,  64 }, // und_EG -> ar_Arab_EG
-    {   0,   0, 236 }, {   8,   1, 236 }, // und_EH -> ar_Arab_EH
+    {   0,   0,  65 }, { 111,   7,  65 }, // und_SV -> es_Latn_SV
+    {   0,   0,  66 }, { 111,   7,  66 }, // und_GQ -> es_Latn_GQ
     {   0,   0,  67 }, { 122,  14,  67 }, // und_ER -> ti_Ethi_ER
-    {   0,   0, 197 }, { 111,   7, 197 }, // und_ES -> es_Latn_ES
+    {   0,   0,  68 }, {  33,   7,  68 }, // und_EE -> et_Latn_EE
     {   0,   0,  69 }, {   7,  14,  69 }, // und_ET -> am_Ethi_ET
-    {   0,   0, 258 }, {  31,   7, 224 }, // und_EU -> en_Latn_GB
-    {   0,   0,  73 }, {  36,   7,  73 }, // und_FI -> fi_Latn_FI
     {   0,   0,  71 }, {  34,   7,  71 }, // und_FO -> fo_Latn_FO
+    {   0,   0,  73 }, {  36,   7,  73 }, // und_FI -> fi_Latn_FI
     {   0,   0,  74 }, {  37,   7,  74 }, // und_FR -> fr_Latn_FR
+    {   0,   0,  76 }, {  37,   7,  76 }, // und_GF -> fr_Latn_GF
+    {   0,   0,  77 }, {  37,   7,  77 }, // und_PF -> fr_Latn_PF
+    {   0,   0,  78 }, {  37,   7,  78 }, // und_TF -> fr_Latn_TF
     {   0,   0,  79 }, {  37,   7,  79 }, // und_GA -> fr_Latn_GA
     {   0,   0,  81 }, {  41,  15,  81 }, // und_GE -> ka_Geor_GE
-    {   0,   0,  76 }, {  37,   7,  76 }, // und_GF -> fr_Latn_GF
+    {   0,   0,  82 }, {  42,   7,  82 }, // und_DE -> de_Latn_DE
     {   0,   0,  83 }, { 146,   7,  83 }, // und_GH -> ak_Latn_GH
+    {   0,   0,  85 }, {  43,  16,  85 }, // und_GR -> el_Grek_GR
     {   0,   0,  86 }, {  44,   7,  86 }, // und_GL -> kl_Latn_GL
-    {   0,   0,  91 }, {  37,   7,  91 }, // und_GN -> fr_Latn_GN
     {   0,   0,  88 }, {  37,   7,  88 }, // und_GP -> fr_Latn_GP
-    {   0,   0,  66 }, { 111,   7,  66 }, // und_GQ -> es_Latn_GQ
-    {   0,   0,  85 }, {  43,  16,  85 }, // und_GR -> el_Grek_GR
-    {   0,   0, 196 }, {   0,   7, 196 }, // und_GS -> und_Latn_GS
     {   0,   0,  90 }, { 111,   7,  90 }, // und_GT -> es_Latn_GT
+    {   0,   0,  91 }, {  37,   7,  91 }, // und_GN -> fr_Latn_GN
     {   0,   0,  92 }, {  91,   7,  92 }, // und_GW -> pt_Latn_GW
-    {   0,   0,  97 }, {  25,   6,  97 }, // und_HK -> zh_Hant_HK
+    {   0,   0,  94 }, { 222,   7,  94 }, // und_HT -> ht_Latn_HT
     {   0,   0,  95 }, {   0,   7,  95 }, // und_HM -> und_Latn_HM
     {   0,   0,  96 }, { 111,   7,  96 }, // und_HN -> es_Latn_HN
-    {   0,   0,  54 }, {  27,   7,  54 }, // und_HR -> hr_Latn_HR
-    {   0,   0,  94 }, { 222,   7,  94 }, // und_HT -> ht_Latn_HT
+    {   0,   0,  97 }, {  25,   6,  97 }, // und_HK -> zh_Hant_HK
     {   0,   0,  98 }, {  50,   7,  98 }, // und_HU -> hu_Latn_HU
-    {   0,   0, 238 }, { 111,   7, 238 }, // und_IC -> es_Latn_IC
-    {   0,   0, 101 }, {  52,   7, 101 }, // und_ID -> id_Latn_ID
-    {   0,   0, 105 }, {  48,  18, 105 }, // und_IL -> he_Hebr_IL
+    {   0,   0,  99 }, {  51,   7,  99 }, // und_IS -> is_Latn_IS
     {   0,   0, 100 }, {  49,  13, 100 }, // und_IN -> hi_Deva_IN
-    {   0,   0, 103 }, {   8,   1, 103 }, // und_IQ -> ar_Arab_IQ
+    {   0,   0, 101 }, {  52,   7, 101 }, // und_ID -> id_Latn_ID
     {   0,   0, 102 }, {  89,   1, 102 }, // und_IR -> fa_Arab_IR
-    {   0,   0,  99 }, {  51,   7,  99 }, // und_IS -> is_Latn_IS
+    {   0,   0, 103 }, {   8,   1, 103 }, // und_IQ -> ar_Arab_IQ
+    {   0,   0, 105 }, {  48,  18, 105 }, // und_IL -> he_Hebr_IL
     {   0,   0, 106 }, {  58,   7, 106 }, // und_IT -> it_Latn_IT
-    {   0,   0, 109 }, {   8,   1, 109 }, // und_JO -> ar_Arab_JO
     {   0,   0, 108 }, {  59,  19, 108 }, // und_JP -> ja_Jpan_JP
+    {   0,   0, 109 }, {   8,   1, 109 }, // und_JO -> ar_Arab_JO
+    {   0,   0, 110 }, {  96,   2, 110 }, // und_KZ -> ru_Cyrl_KZ
     {   0,   0, 111 }, { 113,   7, 111 }, // und_KE -> sw_Latn_KE
-    {   0,   0, 116 }, {  65,   2, 116 }, // und_KG -> ky_Cyrl_KG
-    {   0,   0,  36 }, {  23,  20,  36 }, // und_KH -> km_Khmr_KH
-    {   0,   0,  48 }, {   8,   1,  48 }, // und_KM -> ar_Arab_KM
     {   0,   0, 113 }, {  66,  22, 113 }, // und_KP -> ko_Kore_KP
     {   0,   0, 114 }, {  66,  22, 114 }, // und_KR -> ko_Kore_KR
     {   0,   0, 115 }, {   8,   1, 115 }, // und_KW -> ar_Arab_KW
-    {   0,   0, 110 }, {  96,   2, 110 }, // und_KZ -> ru_Cyrl_KZ
+    {   0,   0, 116 }, {  65,   2, 116 }, // und_KG -> ky_Cyrl_KG
     {   0,   0, 117 }, {  69,  23, 117 }, // und_LA -> lo_Laoo_LA
+    {   0,   0, 118 }, {  71,   7, 118 }, // und_LV -> lv_Latn_LV
     {   0,   0, 119 }, {   8,   1, 119 }, // und_LB -> ar_Arab_LB
-    {   0,   0, 123 }, {  42,   7, 123 }, // und_LI -> de_Latn_LI
-    {   0,   0, 198 }, { 106,  32, 198 }, // und_LK -> si_Sinh_LK
     {   0,   0, 120 }, { 102,   7, 120 }, // und_LS -> st_Latn_LS
+    {   0,   0, 122 }, {   8,   1, 122 }, // und_LY -> ar_Arab_LY
+    {   0,   0, 123 }, {  42,   7, 123 }, // und_LI -> de_Latn_LI
     {   0,   0, 124 }, {  73,   7, 124 }, // und_LT -> lt_Latn_LT
     {   0,   0, 125 }, {  37,   7, 125 }, // und_LU -> fr_Latn_LU
-    {   0,   0, 118 }, {  71,   7, 118 }, // und_LV -> lv_Latn_LV
-    {   0,   0, 122 }, {   8,   1, 122 }, // und_LY -> ar_Arab_LY
-    {   0,   0, 145 }, {   8,   1, 145 }, // und_MA -> ar_Arab_MA
-    {   0,   0, 142 }, {  37,   7, 142 }, // und_MC -> fr_Latn_MC
-    {   0,   0, 141 }, {  95,   7, 141 }, // und_MD -> ro_Latn_MD
-    {   0,   0, 242 }, { 100,   7, 242 }, // und_ME -> sr_Latn_ME
-    {   0,   0, 245 }, {  37,   7, 245 }, // und_MF -> fr_Latn_MF
-    {   0,   0, 128 }, {  75,   7, 128 }, // und_MG -> mg_Latn_MG
+    {   0,   0, 126 }, {  25,   6, 126 }, // und_MO -> zh_Hant_MO
     {   0,   0, 127 }, {  74,   2, 127 }, // und_MK -> mk_Cyrl_MK
+    {   0,   0, 128 }, {  75,   7, 128 }, // und_MG -> mg_Latn_MG
+    {   0,   0, 130 }, {  76,   7, 130 }, // und_MY -> ms_Latn_MY
+    {   0,   0, 131 }, { 143,  29, 131 }, // und_MV -> dv_Thaa_MV
     {   0,   0, 132 }, { 188,   7, 132 }, // und_ML -> bm_Latn_ML
-    {   0,   0, 147 }, {  21,  25, 147 }, // und_MM -> my_Mymr_MM
-    {   0,   0, 143 }, {  82,   2, 143 }, // und_MN -> mn_Cyrl_MN
-    {   0,   0, 126 }, {  25,   6, 126 }, // und_MO -> zh_Hant_MO
+    {   0,   0, 133 }, {  78,   7, 133 }, // und_MT -> mt_Latn_MT
     {   0,   0, 135 }, {  37,   7, 135 }, // und_MQ -> fr_Latn_MQ
     {   0,   0, 136 }, {   8,   1, 136 }, // und_MR -> ar_Arab_MR
-    {   0,   0, 133 }, {  78,   7, 133 }, // und_MT -> mt_Latn_MT
     {   0,   0, 137 }, { 191,   7, 137 }, // und_MU -> mfe_Latn_MU
-    {   0,   0, 131 }, { 143,  29, 131 }, // und_MV -> dv_Thaa_MV
+    {   0,   0, 138 }, {  37,   7, 138 }, // und_YT -> fr_Latn_YT
     {   0,   0, 139 }, { 111,   7, 139 }, // und_MX -> es_Latn_MX
-    {   0,   0, 130 }, {  76,   7, 130 }, // und_MY -> ms_Latn_MY
+    {   0,   0, 141 }, {  95,   7, 141 }, // und_MD -> ro_Latn_MD
+    {   0,   0, 142 }, {  37,   7, 142 }, // und_MC -> fr_Latn_MC
+    {   0,   0, 143 }, {  82,   2, 143 }, // und_MN -> mn_Cyrl_MN
+    {   0,   0, 145 }, {   8,   1, 145 }, // und_MA -> ar_Arab_MA
     {   0,   0, 146 }, {  91,   7, 146 }, // und_MZ -> pt_Latn_MZ
+    {   0,   0, 147 }, {  21,  25, 147 }, // und_MM -> my_Mymr_MM
     {   0,   0, 148 }, {   5,   7, 148 }, // und_NA -> af_Latn_NA
+    {   0,   0, 150 }, {  84,  13, 150 }, // und_NP -> ne_Deva_NP
+    {   0,   0, 151 }, {  30,   7, 151 }, // und_NL -> nl_Latn_NL
+    {   0,   0, 152 }, { 351,   7, 152 }, // und_CW -> pap_Latn_CW
     {   0,   0, 153 }, {  37,   7, 153 }, // und_NC -> fr_Latn_NC
-    {   0,   0, 156 }, {  47,   7, 156 }, // und_NE -> ha_Latn_NE
     {   0,   0, 155 }, { 111,   7, 155 }, // und_NI -> es_Latn_NI
-    {   0,   0, 151 }, {  30,   7, 151 }, // und_NL -> nl_Latn_NL
+    {   0,   0, 156 }, {  47,   7, 156 }, // und_NE -> ha_Latn_NE
     {   0,   0, 161 }, {  85,   7, 161 }, // und_NO -> nb_Latn_NO
-    {   0,   0, 150 }, {  84,  13, 150 }, // und_NP -> ne_Deva_NP
     {   0,   0, 162 }, {   8,   1, 162 }, // und_OM -> ar_Arab_OM
+    {   0,   0, 163 }, { 130,   1, 163 }, // und_PK -> ur_Arab_PK
+    {   0,   0, 164 }, { 350,   7, 164 }, // und_PW -> pau_Latn_PW
+    {   0,   0, 165 }, {   8,   1, 165 }, // und_PS -> ar_Arab_PS
     {   0,   0, 166 }, { 111,   7, 166 }, // und_PA -> es_Latn_PA
-    {   0,   0, 169 }, { 111,   7, 169 }, // und_PE -> es_Latn_PE
-    {   0,   0,  77 }, {  37,   7,  77 }, // und_PF -> fr_Latn_PF
     {   0,   0, 167 }, { 354,   7, 167 }, // und_PG -> tpi_Latn_PG
+    {   0,   0, 168 }, {  45,   7, 168 }, // und_PY -> gn_Latn_PY
+    {   0,   0, 169 }, { 111,   7, 169 }, // und_PE -> es_Latn_PE
     {   0,   0, 170 }, { 166,   7, 170 }, // und_PH -> fil_Latn_PH
-    {   0,   0, 163 }, { 130,   1, 163 }, // und_PK -> ur_Arab_PK
     {   0,   0, 172 }, {  90,   7, 172 }, // und_PL -> pl_Latn_PL
-    {   0,   0, 200 }, {  37,   7, 200 }, // und_PM -> fr_Latn_PM
-    {   0,   0, 174 }, { 111,   7, 174 }, // und_PR -> es_Latn_PR
-    {   0,   0, 165 }, {   8,   1, 165 }, // und_PS -> ar_Arab_PS
     {   0,   0, 173 }, {  91,   7, 173 }, // und_PT -> pt_Latn_PT
-    {   0,   0, 164 }, { 350,   7, 164 }, // und_PW -> pau_Latn_PW
-    {   0,   0, 168 }, {  45,   7, 168 }, // und_PY -> gn_Latn_PY
+    {   0,   0, 174 }, { 111,   7, 174 }, // und_PR -> es_Latn_PR
     {   0,   0, 175 }, {   8,   1, 175 }, // und_QA -> ar_Arab_QA
-    {   0,   0, 259 }, {  31,   7, 249 }, // und_QO -> en_Latn_DG
     {   0,   0, 176 }, {  37,   7, 176 }, // und_RE -> fr_Latn_RE
     {   0,   0, 177 }, {  95,   7, 177 }, // und_RO -> ro_Latn_RO
-    {   0,   0, 243 }, { 100,   2, 243 }, // und_RS -> sr_Cyrl_RS
     {   0,   0, 178 }, {  96,   2, 178 }, // und_RU -> ru_Cyrl_RU
     {   0,   0, 179 }, {  64,   7, 179 }, // und_RW -> rw_Latn_RW
+    {   0,   0, 183 }, {  97,   7, 183 }, // und_WS -> sm_Latn_WS
+    {   0,   0, 184 }, {  58,   7, 184 }, // und_SM -> it_Latn_SM
+    {   0,   0, 185 }, {  91,   7, 185 }, // und_ST -> pt_Latn_ST
     {   0,   0, 186 }, {   8,   1, 186 }, // und_SA -> ar_Arab_SA
+    {   0,   0, 187 }, {  37,   7, 187 }, // und_SN -> fr_Latn_SN
     {   0,   0, 188 }, {  37,   7, 188 }, // und_SC -> fr_Latn_SC
-    {   0,   0, 201 }, {   8,   1, 201 }, // und_SD -> ar_Arab_SD
-    {   0,   0, 205 }, { 114,   7, 205 }, // und_SE -> sv_Latn_SE
-    {   0,   0, 192 }, { 109,   7, 192 }, // und_SI -> sl_Latn_SI
-    {   0,   0, 203 }, {  85,   7, 203 }, // und_SJ -> nb_Latn_SJ
     {   0,   0, 191 }, { 108,   7, 191 }, // und_SK -> sk_Latn_SK
-    {   0,   0, 184 }, {  58,   7, 184 }, // und_SM -> it_Latn_SM
-    {   0,   0, 187 }, {  37,   7, 187 }, // und_SN -> fr_Latn_SN
+    {   0,   0, 192 }, { 109,   7, 192 }, // und_SI -> sl_Latn_SI
     {   0,   0, 194 }, { 110,   7, 194 }, // und_SO -> so_Latn_SO
+    {   0,   0, 196 }, {   0,   7, 196 }, // und_GS -> und_Latn_GS
+    {   0,   0, 197 }, { 111,   7, 197 }, // und_ES -> es_Latn_ES
+    {   0,   0, 198 }, { 106,  32, 198 }, // und_LK -> si_Sinh_LK
+    {   0,   0, 200 }, {  37,   7, 200 }, // und_PM -> fr_Latn_PM
+    {   0,   0, 201 }, {   8,   1, 201 }, // und_SD -> ar_Arab_SD
     {   0,   0, 202 }, {  30,   7, 202 }, // und_SR -> nl_Latn_SR
-    {   0,   0, 185 }, {  91,   7, 185 }, // und_ST -> pt_Latn_ST
-    {   0,   0,  65 }, { 111,   7,  65 }, // und_SV -> es_Latn_SV
+    {   0,   0, 203 }, {  85,   7, 203 }, // und_SJ -> nb_Latn_SJ
+    {   0,   0, 205 }, { 114,   7, 205 }, // und_SE -> sv_Latn_SE
+    {   0,   0, 206 }, {  42,   7, 206 }, // und_CH -> de_Latn_CH
     {   0,   0, 207 }, {   8,   1, 207 }, // und_SY -> ar_Arab_SY
-    {   0,   0,  42 }, {  37,   7,  42 }, // und_TD -> fr_Latn_TD
-    {   0,   0,  78 }, {  37,   7,  78 }, // und_TF -> fr_Latn_TF
-    {   0,   0, 212 }, {  37,   7, 212 }, // und_TG -> fr_Latn_TG
-    {   0,   0, 211 }, { 120,  30, 211 }, // und_TH -> th_Thai_TH
+    {   0,   0, 208 }, {  25,   6, 208 }, // und_TW -> zh_Hant_TW
     {   0,   0, 209 }, { 116,   2, 209 }, // und_TJ -> tg_Cyrl_TJ
+    {   0,   0, 210 }, { 113,   7, 210 }, // und_TZ -> sw_Latn_TZ
+    {   0,   0, 211 }, { 120,  30, 211 }, // und_TH -> th_Thai_TH
+    {   0,   0, 212 }, {  37,   7, 212 }, // und_TG -> fr_Latn_TG
     {   0,   0, 213 }, { 353,   7, 213 }, // und_TK -> tkl_Latn_TK
-    {   0,   0,  62 }, {  91,   7,  62 }, // und_TL -> pt_Latn_TL
-    {   0,   0, 218 }, { 126,   7, 218 }, // und_TM -> tk_Latn_TM
-    {   0,   0, 216 }, {   8,   1, 216 }, // und_TN -> ar_Arab_TN
     {   0,   0, 214 }, { 123,   7, 214 }, // und_TO -> to_Latn_TO
+    {   0,   0, 216 }, {   8,   1, 216 }, // und_TN -> ar_Arab_TN
     {   0,   0, 217 }, { 125,   7, 217 }, // und_TR -> tr_Latn_TR
+    {   0,   0, 218 }, { 126,   7, 218 }, // und_TM -> tk_Latn_TM
     {   0,   0, 220 }, { 355,   7, 220 }, // und_TV -> tvl_Latn_TV
-    {   0,   0, 208 }, {  25,   6, 208 }, // und_TW -> zh_Hant_TW
-    {   0,   0, 210 }, { 113,   7, 210 }, // und_TZ -> sw_Latn_TZ
-    {   0,   0, 222 }, { 129,   2, 222 }, // und_UA -> uk_Cyrl_UA
     {   0,   0, 221 }, { 113,   7, 221 }, // und_UG -> sw_Latn_UG
+    {   0,   0, 222 }, { 129,   2, 222 }, // und_UA -> uk_Cyrl_UA
+    {   0,   0, 223 }, {   8,   1, 223 }, // und_AE -> ar_Arab_AE
     {   0,   0, 227 }, { 111,   7, 227 }, // und_UY -> es_Latn_UY
     {   0,   0, 228 }, { 131,   7, 228 }, // und_UZ -> uz_Latn_UZ
+    {   0,   0, 229 }, {  18,   7, 229 }, // und_VU -> bi_Latn_VU
     {   0,   0, 230 }, {  58,   7, 230 }, // und_VA -> it_Latn_VA
     {   0,   0, 231 }, { 111,   7, 231 }, // und_VE -> es_Latn_VE
     {   0,   0, 232 }, { 132,   7, 232 }, // und_VN -> vi_Latn_VN
-    {   0,   0, 229 }, {  18,   7, 229 }, // und_VU -> bi_Latn_VU
     {   0,   0, 235 }, {  37,   7, 235 }, // und_WF -> fr_Latn_WF
-    {   0,   0, 183 }, {  97,   7, 183 }, // und_WS -> sm_Latn_WS
-    {   0,   0, 257 }, {   6,   7, 257 }, // und_XK -> sq_Latn_XK
+    {   0,   0, 236 }, {   8,   1, 236 }, // und_EH -> ar_Arab_EH
     {   0,   0, 237 }, {   8,   1, 237 }, // und_YE -> ar_Arab_YE
-    {   0,   0, 138 }, {  37,   7, 138 }, // und_YT -> fr_Latn_YT
+    {   0,   0, 238 }, { 111,   7, 238 }, // und_IC -> es_Latn_IC
     {   0,   0, 240 }, { 104,   7, 240 }, // und_ZW -> sn_Latn_ZW
-    {   0, 134,   0 }, { 177, 134,  91 }, // und_Adlm -> ff_Adlm_GN
-    {   0, 105,   0 }, { 335, 105, 178 }, // und_Aghb -> lez_Aghb_RU
-    {   0, 128,   0 }, { 340, 128, 100 }, // und_Ahom -> aho_Ahom_IN
+    {   0,   0, 241 }, {   0,   7, 241 }, // und_CP -> und_Latn_CP
+    {   0,   0, 242 }, { 100,   7, 242 }, // und_ME -> sr_Latn_ME
+    {   0,   0, 243 }, { 100,   2, 243 }, // und_RS -> sr_Cyrl_RS
+    {   0,   0, 244 }, {  37,   7, 244 }, // und_BL -> fr_Latn_BL
+    {   0,   0, 245 }, {  37,   7, 245 }, // und_MF -> fr_Latn_MF
+    {   0,   0, 246 }, { 111,   7, 246 }, // und_419 -> es_Latn_419
+    {   0,   0, 248 }, { 114,   7, 248 }, // und_AX -> sv_Latn_AX
+    {   0,   0, 250 }, { 111,   7, 250 }, // und_EA -> es_Latn_EA
+    {   0,   0, 255 }, { 351,   7, 255 }, // und_BQ -> pap_Latn_BQ
+    {   0,   0, 257 }, {   6,   7, 257 }, // und_XK -> sq_Latn_XK
+    {   0,   0, 258 }, {  31,   7, 224 }, // und_EU -> en_Latn_GB
+    {   0,   0, 259 }, {  31,   7, 249 }, // und_QO -> en_Latn_DG
+    {   0,   0, 261 }, {  96,   2, 178 }, // und_150 -> ru_Cyrl_RU
     {   0,   1,   0 }, {   8,   1,  64 }, // und_Arab -> ar_Arab_EG
-    {   0,   1,  46 }, {  76,   1,  46 }, // und_Arab_CC -> ms_Arab_CC
     {   0,   1,  44 }, { 128,   1,  44 }, // und_Arab_CN -> ug_Arab_CN
-    {   0,   1, 224 }, {  62,   1, 224 }, // und_Arab_GB -> ks_Arab_GB
-    {   0,   1, 101 }, {  76,   1, 101 }, // und_Arab_ID -> ms_Arab_ID
+    {   0,   1,  46 }, {  76,   1,  46 }, // und_Arab_CC -> ms_Arab_CC
     {   0,   1, 100 }, { 130,   1, 100 }, // und_Arab_IN -> ur_Arab_IN
-    {   0,   1, 143 }, {  63,   1, 143 }, // und_Arab_MN -> kk_Arab_MN
+    {   0,   1, 101 }, {  76,   1, 101 }, // und_Arab_ID -> ms_Arab_ID
     {   0,   1, 137 }, { 130,   1, 137 }, // und_Arab_MU -> ur_Arab_MU
+    {   0,   1, 143 }, {  63,   1, 143 }, // und_Arab_MN -> kk_Arab_MN
     {   0,   1, 157 }, {  47,   1, 157 }, // und_Arab_NG -> ha_Arab_NG
     {   0,   1, 163 }, { 130,   1, 163 }, // und_Arab_PK -> ur_Arab_PK
     {   0,   1, 209 }, {  89,   1, 209 }, // und_Arab_TJ -> fa_Arab_TJ
     {   0,   1, 217 }, {  12,   1, 217 }, // und_Arab_TR -> az_Arab_TR
-    {   0,  57,   0 }, { 265,  57, 102 }, // und_Armi -> arc_Armi_IR
-    {   0,  10,   0 }, {   9,  10,  11 }, // und_Armn -> hy_Armn_AM
-    {   0,  36,   0 }, { 255,  36, 102 }, // und_Avst -> ae_Avst_IR
-    {   0,  37,   0 }, { 266,  37, 101 }, // und_Bali -> ban_Bali_ID
-    {   0,  38,   0 }, { 267,  38,  37 }, // und_Bamu -> bax_Bamu_CM
-    {   0, 106,   0 }, { 336, 106, 121 }, // und_Bass -> bsq_Bass_LR
-    {   0,  39,   0 }, { 268,  39, 101 }, // und_Batk -> bbc_Batk_ID
-    {   0,  11,   0 }, {  15,  11,  18 }, // und_Beng -> bn_Beng_BD
-    {   0, 135,   0 }, {  99, 135, 100 }, // und_Bhks -> sa_Bhks_IN
-    {   0,  40,   0 }, {  25,  40, 208 }, // und_Bopo -> zh_Bopo_TW
-    {   0,  41,   0 }, { 342,  41, 100 }, // und_Brah -> pka_Brah_IN
-    {   0, 103,   0 }, {  37, 103,  74 }, // und_Brai -> fr_Brai_FR
-    {   0,  42,   0 }, { 269,  42, 101 }, // und_Bugi -> bug_Bugi_ID
-    {   0,  43,   0 }, { 270,  43, 170 }, // und_Buhd -> bku_Buhd_PH
-    {   0,  46,   0 }, { 272,  46,  18 }, // und_Cakm -> ccp_Cakm_BD
-    {   0,  44,   0 }, { 221,  44,  38 }, // und_Cans -> cr_Cans_CA
-    {   0,  45,   0 }, { 271,  45, 217 }, // und_Cari -> xcr_Cari_TR
-    {   0,  47,   0 }, { 276,  47, 232 }, // und_Cham -> cjm_Cham_VN
-    {   0,  12,   0 }, { 190,  12, 225 }, // und_Cher -> chr_Cher_US
-    {   0,  48,   0 }, { 274,  48,  64 }, // und_Copt -> cop_Copt_EG
-    {   0,  49,   0 }, { 264,  49,  56 }, // und_Cprt -> grc_Cprt_CY
+    {   0,   1, 224 }, {  62,   1, 224 }, // und_Arab_GB -> ks_Arab_GB
     {   0,   2,   0 }, {  96,   2, 178 }, // und_Cyrl -> ru_Cyrl_RU
     {   0,   2,   2 }, {  74,   2,   2 }, // und_Cyrl_AL -> mk_Cyrl_AL
     {   0,   2,  27 }, { 100,   2,  27 }, // und_Cyrl_BA -> sr_Cyrl_BA
@@ -763,143 +307,599 @@ static const QLocaleId likely_subtags[] = {
     {   0,   2, 177 }, {  20,   2, 177 }, // und_Cyrl_RO -> bg_Cyrl_RO
     {   0,   2, 191 }, { 129,   2, 191 }, // und_Cyrl_SK -> uk_Cyrl_SK
     {   0,   2, 257 }, { 100,   2, 257 }, // und_Cyrl_XK -> sr_Cyrl_XK
+    {   0,   4,   0 }, {  92,   4, 100 }, // und_Guru -> pa_Guru_IN
+    {   0,   5,   0 }, {  25,   5,  44 }, // und_Hans -> zh_Hans_CN
+    {   0,   6,   0 }, {  25,   6, 208 }, // und_Hant -> zh_Hant_TW
+    {   0,   7,   1 }, { 126,   7,   1 }, // und_Latn_AF -> tk_Latn_AF
+    {   0,   7,   3 }, {  37,   7,   3 }, // und_Latn_DZ -> fr_Latn_DZ
+    {   0,   7,  11 }, {  67,   7,  11 }, // und_Latn_AM -> ku_Latn_AM
+    {   0,   7,  44 }, { 139,   7,  44 }, // und_Latn_CN -> za_Latn_CN
+    {   0,   7,  48 }, {  37,   7,  48 }, // und_Latn_KM -> fr_Latn_KM
+    {   0,   7,  56 }, { 125,   7,  56 }, // und_Latn_CY -> tr_Latn_CY
+    {   0,   7,  69 }, {  31,   7,  69 }, // und_Latn_ET -> en_Latn_ET
+    {   0,   7,  81 }, {  67,   7,  81 }, // und_Latn_GE -> ku_Latn_GE
+    {   0,   7, 102 }, { 126,   7, 102 }, // und_Latn_IR -> tk_Latn_IR
+    {   0,   7, 126 }, {  91,   7, 126 }, // und_Latn_MO -> pt_Latn_MO
+    {   0,   7, 127 }, {   6,   7, 127 }, // und_Latn_MK -> sq_Latn_MK
+    {   0,   7, 136 }, {  37,   7, 136 }, // und_Latn_MR -> fr_Latn_MR
+    {   0,   7, 145 }, {  37,   7, 145 }, // und_Latn_MA -> fr_Latn_MA
+    {   0,   7, 207 }, {  37,   7, 207 }, // und_Latn_SY -> fr_Latn_SY
+    {   0,   7, 208 }, { 174,   7, 208 }, // und_Latn_TW -> trv_Latn_TW
+    {   0,   7, 216 }, {  37,   7, 216 }, // und_Latn_TN -> fr_Latn_TN
+    {   0,   7, 222 }, {  90,   7, 222 }, // und_Latn_UA -> pl_Latn_UA
+    {   0,   8,   0 }, {  82,   8,  44 }, // und_Mong -> mn_Mong_CN
+    {   0,   9,   0 }, { 314,   9, 145 }, // und_Tfng -> zgh_Tfng_MA
+    {   0,  10,   0 }, {   9,  10,  11 }, // und_Armn -> hy_Armn_AM
+    {   0,  11,   0 }, {  15,  11,  18 }, // und_Beng -> bn_Beng_BD
+    {   0,  12,   0 }, { 190,  12, 225 }, // und_Cher -> chr_Cher_US
     {   0,  13,   0 }, {  49,  13, 100 }, // und_Deva -> hi_Deva_IN
     {   0,  13,  25 }, {  84,  13,  25 }, // und_Deva_BT -> ne_Deva_BT
     {   0,  13, 137 }, { 343,  13, 137 }, // und_Deva_MU -> bho_Deva_MU
-    {   0, 107,   0 }, {  37, 107,  74 }, // und_Dupl -> fr_Dupl_FR
-    {   0,  50,   0 }, { 263,  50,  64 }, // und_Egyp -> egy_Egyp_EG
-    {   0, 108,   0 }, {   6, 108,   2 }, // und_Elba -> sq_Elba_AL
     {   0,  14,   0 }, {   7,  14,  69 }, // und_Ethi -> am_Ethi_ET
     {   0,  15,   0 }, {  41,  15,  81 }, // und_Geor -> ka_Geor_GE
-    {   0,  52,   0 }, { 219,  52,  33 }, // und_Glag -> cu_Glag_BG
-    {   0,  53,   0 }, { 279,  53, 222 }, // und_Goth -> got_Goth_UA
-    {   0, 109,   0 }, {  99, 109, 100 }, // und_Gran -> sa_Gran_IN
     {   0,  16,   0 }, {  43,  16,  85 }, // und_Grek -> el_Grek_GR
     {   0,  17,   0 }, {  46,  17, 100 }, // und_Gujr -> gu_Gujr_IN
-    {   0,   4,   0 }, {  92,   4, 100 }, // und_Guru -> pa_Guru_IN
-    {   0, 140,   0 }, {  25, 140, 208 }, // und_Hanb -> zh_Hanb_TW
-    {   0,  55,   0 }, {  66,  55, 114 }, // und_Hang -> ko_Hang_KR
-    {   0,  54,   0 }, {  25,  54,  44 }, // und_Hani -> zh_Hani_CN
-    {   0,  56,   0 }, { 280,  56, 170 }, // und_Hano -> hnn_Hano_PH
-    {   0,   5,   0 }, {  25,   5,  44 }, // und_Hans -> zh_Hans_CN
-    {   0,   6,   0 }, {  25,   6, 208 }, // und_Hant -> zh_Hant_TW
-    {   0, 130,   0 }, { 356, 130, 103 }, // und_Hatr -> mis_Hatr_IQ
     {   0,  18,   0 }, {  48,  18, 105 }, // und_Hebr -> he_Hebr_IL
     {   0,  18,  38 }, { 137,  18,  38 }, // und_Hebr_CA -> yi_Hebr_CA
-    {   0,  18, 224 }, { 137,  18, 224 }, // und_Hebr_GB -> yi_Hebr_GB
     {   0,  18, 205 }, { 137,  18, 205 }, // und_Hebr_SE -> yi_Hebr_SE
     {   0,  18, 222 }, { 137,  18, 222 }, // und_Hebr_UA -> yi_Hebr_UA
+    {   0,  18, 224 }, { 137,  18, 224 }, // und_Hebr_GB -> yi_Hebr_GB
     {   0,  18, 225 }, { 137,  18, 225 }, // und_Hebr_US -> yi_Hebr_US
-    {   0, 104,   0 }, {  59, 104, 108 }, // und_Hira -> ja_Hira_JP
-    {   0, 129,   0 }, { 344, 129, 217 }, // und_Hluw -> hlu_Hluw_TR
-    {   0, 110,   0 }, { 333, 110, 117 }, // und_Hmng -> hnj_Hmng_LA
-    {   0, 132,   0 }, {  50, 132,  98 }, // und_Hung -> hu_Hung_HU
-    {   0,  79,   0 }, { 278,  79, 106 }, // und_Ital -> ett_Ital_IT
-    {   0, 141,   0 }, {  66, 141, 114 }, // und_Jamo -> ko_Jamo_KR
-    {   0,  60,   0 }, {  60,  60, 101 }, // und_Java -> jv_Java_ID
     {   0,  19,   0 }, {  59,  19, 108 }, // und_Jpan -> ja_Jpan_JP
-    {   0,  63,   0 }, { 277,  63, 147 }, // und_Kali -> eky_Kali_MM
-    {   0,  62,   0 }, {  59,  62, 108 }, // und_Kana -> ja_Kana_JP
-    {   0,  64,   0 }, { 300,  64, 163 }, // und_Khar -> pra_Khar_PK
     {   0,  20,   0 }, {  23,  20,  36 }, // und_Khmr -> km_Khmr_KH
-    {   0, 111,   0 }, { 105, 111, 100 }, // und_Khoj -> sd_Khoj_IN
     {   0,  21,   0 }, {  61,  21, 100 }, // und_Knda -> kn_Knda_IN
     {   0,  22,   0 }, {  66,  22, 114 }, // und_Kore -> ko_Kore_KR
+    {   0,  23,   0 }, {  69,  23, 117 }, // und_Laoo -> lo_Laoo_LA
+    {   0,  24,   0 }, {  77,  24, 100 }, // und_Mlym -> ml_Mlym_IN
+    {   0,  25,   0 }, {  21,  25, 147 }, // und_Mymr -> my_Mymr_MM
+    {   0,  26,   0 }, {  87,  26, 100 }, // und_Orya -> or_Orya_IN
+    {   0,  27,   0 }, { 117,  27, 100 }, // und_Taml -> ta_Taml_IN
+    {   0,  28,   0 }, { 119,  28, 100 }, // und_Telu -> te_Telu_IN
+    {   0,  29,   0 }, { 143,  29, 131 }, // und_Thaa -> dv_Thaa_MV
+    {   0,  30,   0 }, { 120,  30, 211 }, // und_Thai -> th_Thai_TH
+    {   0,  31,   0 }, { 121,  31,  44 }, // und_Tibt -> bo_Tibt_CN
+    {   0,  32,   0 }, { 106,  32, 198 }, // und_Sinh -> si_Sinh_LK
+    {   0,  33,   0 }, { 151,  33, 103 }, // und_Syrc -> syr_Syrc_IQ
+    {   0,  34,   0 }, { 168,  34,  44 }, // und_Yiii -> ii_Yiii_CN
+    {   0,  35,   0 }, { 252,  35, 121 }, // und_Vaii -> vai_Vaii_LR
+    {   0,  36,   0 }, { 255,  36, 102 }, // und_Avst -> ae_Avst_IR
+    {   0,  37,   0 }, { 266,  37, 101 }, // und_Bali -> ban_Bali_ID
+    {   0,  38,   0 }, { 267,  38,  37 }, // und_Bamu -> bax_Bamu_CM
+    {   0,  39,   0 }, { 268,  39, 101 }, // und_Batk -> bbc_Batk_ID
+    {   0,  40,   0 }, {  25,  40, 208 }, // und_Bopo -> zh_Bopo_TW
+    {   0,  41,   0 }, { 342,  41, 100 }, // und_Brah -> pka_Brah_IN
+    {   0,  42,   0 }, { 269,  42, 101 }, // und_Bugi -> bug_Bugi_ID
+    {   0,  43,   0 }, { 270,  43, 170 }, // und_Buhd -> bku_Buhd_PH
+    {   0,  44,   0 }, { 221,  44,  38 }, // und_Cans -> cr_Cans_CA
+    {   0,  45,   0 }, { 271,  45, 217 }, // und_Cari -> xcr_Cari_TR
+    {   0,  46,   0 }, { 272,  46,  18 }, // und_Cakm -> ccp_Cakm_BD
+    {   0,  47,   0 }, { 276,  47, 232 }, // und_Cham -> cjm_Cham_VN
+    {   0,  48,   0 }, { 274,  48,  64 }, // und_Copt -> cop_Copt_EG
+    {   0,  49,   0 }, { 264,  49,  56 }, // und_Cprt -> grc_Cprt_CY
+    {   0,  50,   0 }, { 263,  50,  64 }, // und_Egyp -> egy_Egyp_EG
+    {   0,  51,   0 }, { 285,  51,  44 }, // und_Lisu -> lis_Lisu_CN
+    {   0,  52,   0 }, { 219,  52,  33 }, // und_Glag -> cu_Glag_BG
+    {   0,  53,   0 }, { 279,  53, 222 }, // und_Goth -> got_Goth_UA
+    {   0,  54,   0 }, {  25,  54,  44 }, // und_Hani -> zh_Hani_CN
+    {   0,  55,   0 }, {  66,  55, 114 }, // und_Hang -> ko_Hang_KR
+    {   0,  56,   0 }, { 280,  56, 170 }, // und_Hano -> hnn_Hano_PH
+    {   0,  57,   0 }, { 265,  57, 102 }, // und_Armi -> arc_Armi_IR
+    {   0,  58,   0 }, { 297,  58, 102 }, // und_Phli -> pal_Phli_IR
+    {   0,  59,   0 }, { 298,  59, 102 }, // und_Prti -> xpr_Prti_IR
+    {   0,  60,   0 }, {  60,  60, 101 }, // und_Java -> jv_Java_ID
     {   0,  61,   0 }, { 343,  61, 100 }, // und_Kthi -> bho_Kthi_IN
+    {   0,  62,   0 }, {  59,  62, 108 }, // und_Kana -> ja_Kana_JP
+    {   0,  63,   0 }, { 277,  63, 147 }, // und_Kali -> eky_Kali_MM
+    {   0,  64,   0 }, { 300,  64, 163 }, // und_Khar -> pra_Khar_PK
     {   0,  65,   0 }, { 292,  65, 211 }, // und_Lana -> nod_Lana_TH
-    {   0,  23,   0 }, {  69,  23, 117 }, // und_Laoo -> lo_Laoo_LA
-    {   0,   7,   1 }, { 126,   7,   1 }, // und_Latn_AF -> tk_Latn_AF
-    {   0,   7,  11 }, {  67,   7,  11 }, // und_Latn_AM -> ku_Latn_AM
-    {   0,   7,  44 }, { 139,   7,  44 }, // und_Latn_CN -> za_Latn_CN
-    {   0,   7,  56 }, { 125,   7,  56 }, // und_Latn_CY -> tr_Latn_CY
-    {   0,   7,   3 }, {  37,   7,   3 }, // und_Latn_DZ -> fr_Latn_DZ
-    {   0,   7,  69 }, {  31,   7,  69 }, // und_Latn_ET -> en_Latn_ET
-    {   0,   7,  81 }, {  67,   7,  81 }, // und_Latn_GE -> ku_Latn_GE
-    {   0,   7, 102 }, { 126,   7, 102 }, // und_Latn_IR -> tk_Latn_IR
-    {   0,   7,  48 }, {  37,   7,  48 }, // und_Latn_KM -> fr_Latn_KM
-    {   0,   7, 145 }, {  37,   7, 145 }, // und_Latn_MA -> fr_Latn_MA
-    {   0,   7, 127 }, {   6,   7, 127 }, // und_Latn_MK -> sq_Latn_MK
-    {   0,   7, 126 }, {  91,   7, 126 }, // und_Latn_MO -> pt_Latn_MO
-    {   0,   7, 136 }, {  37,   7, 136 }, // und_Latn_MR -> fr_Latn_MR
-    {   0,   7, 207 }, {  37,   7, 207 }, // und_Latn_SY -> fr_Latn_SY
-    {   0,   7, 216 }, {  37,   7, 216 }, // und_Latn_TN -> fr_Latn_TN
-    {   0,   7, 208 }, { 174,   7, 208 }, // und_Latn_TW -> trv_Latn_TW
-    {   0,   7, 222 }, {  90,   7, 222 }, // und_Latn_UA -> pl_Latn_UA
     {   0,  66,   0 }, { 283,  66, 100 }, // und_Lepc -> lep_Lepc_IN
     {   0,  67,   0 }, { 284,  67, 100 }, // und_Limb -> lif_Limb_IN
-    {   0, 112,   0 }, { 332, 112,  85 }, // und_Lina -> lab_Lina_GR
     {   0,  68,   0 }, { 264,  68,  85 }, // und_Linb -> grc_Linb_GR
-    {   0,  51,   0 }, { 285,  51,  44 }, // und_Lisu -> lis_Lisu_CN
     {   0,  69,   0 }, { 287,  69, 217 }, // und_Lyci -> xlc_Lyci_TR
     {   0,  70,   0 }, { 288,  70, 217 }, // und_Lydi -> xld_Lydi_TR
-    {   0, 113,   0 }, {  49, 113, 100 }, // und_Mahj -> hi_Mahj_IN
     {   0,  71,   0 }, { 273,  71, 102 }, // und_Mand -> myz_Mand_IR
-    {   0, 114,   0 }, { 329, 114,  44 }, // und_Mani -> xmn_Mani_CN
-    {   0, 136,   0 }, { 121, 136,  44 }, // und_Marc -> bo_Marc_CN
-    {   0, 115,   0 }, { 330, 115, 189 }, // und_Mend -> men_Mend_SL
-    {   0,  74,   0 }, { 291,  74, 201 }, // und_Merc -> xmr_Merc_SD
-    {   0,  73,   0 }, { 291,  73, 201 }, // und_Mero -> xmr_Mero_SD
-    {   0,  24,   0 }, {  77,  24, 100 }, // und_Mlym -> ml_Mlym_IN
-    {   0, 116,   0 }, {  80, 116, 100 }, // und_Modi -> mr_Modi_IN
-    {   0,   8,   0 }, {  82,   8,  44 }, // und_Mong -> mn_Mong_CN
-    {   0, 117,   0 }, { 347, 117,  18 }, // und_Mroo -> mro_Mroo_BD
     {   0,  72,   0 }, { 290,  72, 100 }, // und_Mtei -> mni_Mtei_IN
-    {   0, 131,   0 }, { 352, 131, 163 }, // und_Mult -> skr_Mult_PK
-    {   0,  25,   0 }, {  21,  25, 147 }, // und_Mymr -> my_Mymr_MM
-    {   0, 118,   0 }, { 331, 118, 186 }, // und_Narb -> xna_Narb_SA
-    {   0, 119,   0 }, { 265, 119, 109 }, // und_Nbat -> arc_Nbat_JO
-    {   0, 137,   0 }, { 348, 137, 150 }, // und_Newa -> new_Newa_NP
+    {   0,  73,   0 }, { 291,  73, 201 }, // und_Mero -> xmr_Mero_SD
+    {   0,  74,   0 }, { 291,  74, 201 }, // und_Merc -> xmr_Merc_SD
     {   0,  75,   0 }, { 289,  75,  91 }, // und_Nkoo -> man_Nkoo_GN
+    {   0,  76,   0 }, { 286,  76,  44 }, // und_Talu -> khb_Talu_CN
     {   0,  77,   0 }, { 293,  77, 104 }, // und_Ogam -> sga_Ogam_IE
     {   0,  78,   0 }, { 304,  78, 100 }, // und_Olck -> sat_Olck_IN
-    {   0,  82,   0 }, { 296,  82, 143 }, // und_Orkh -> otk_Orkh_MN
-    {   0,  26,   0 }, {  87,  26, 100 }, // und_Orya -> or_Orya_IN
-    {   0, 138,   0 }, { 358, 138, 225 }, // und_Osge -> osa_Osge_US
+    {   0,  79,   0 }, { 278,  79, 106 }, // und_Ital -> ett_Ital_IT
+    {   0,  80,   0 }, { 295,  80, 102 }, // und_Xpeo -> peo_Xpeo_IR
+    {   0,  81,   0 }, { 302,  81, 237 }, // und_Sarb -> xsa_Sarb_YE
+    {   0,  82,   0 }, { 296,  82, 143 }, // und_Orkh -> otk_Orkh_MN
     {   0,  83,   0 }, { 110,  83, 194 }, // und_Osma -> so_Osma_SO
-    {   0, 120,   0 }, { 265, 120, 207 }, // und_Palm -> arc_Palm_SY
-    {   0, 121,   0 }, { 338, 121, 147 }, // und_Pauc -> ctd_Pauc_MM
-    {   0, 122,   0 }, { 226, 122, 178 }, // und_Perm -> kv_Perm_RU
     {   0,  84,   0 }, { 345,  84,  44 }, // und_Phag -> lzh_Phag_CN
-    {   0,  58,   0 }, { 297,  58, 102 }, // und_Phli -> pal_Phli_IR
-    {   0, 123,   0 }, { 297, 123,  44 }, // und_Phlp -> pal_Phlp_CN
     {   0,  85,   0 }, { 299,  85, 119 }, // und_Phnx -> phn_Phnx_LB
     {   0,  86,   0 }, { 282,  86,  44 }, // und_Plrd -> hmd_Plrd_CN
-    {   0,  59,   0 }, { 298,  59, 102 }, // und_Prti -> xpr_Prti_IR
     {   0,  87,   0 }, { 301,  87, 101 }, // und_Rjng -> rej_Rjng_ID
     {   0,  88,   0 }, { 294,  88, 205 }, // und_Runr -> non_Runr_SE
     {   0,  89,   0 }, { 303,  89, 105 }, // und_Samr -> smp_Samr_IL
-    {   0,  81,   0 }, { 302,  81, 237 }, // und_Sarb -> xsa_Sarb_YE
     {   0,  90,   0 }, { 305,  90, 100 }, // und_Saur -> saz_Saur_IN
-    {   0, 133,   0 }, { 341, 133, 225 }, // und_Sgnw -> ase_Sgnw_US
-    {   0,  92,   0 }, {  31,  92, 224 }, // und_Shaw -> en_Shaw_GB
     {   0,  91,   0 }, {  99,  91, 100 }, // und_Shrd -> sa_Shrd_IN
-    {   0, 124,   0 }, {  99, 124, 100 }, // und_Sidd -> sa_Sidd_IN
-    {   0, 125,   0 }, { 105, 125, 100 }, // und_Sind -> sd_Sind_IN
-    {   0,  32,   0 }, { 106,  32, 198 }, // und_Sinh -> si_Sinh_LK
+    {   0,  92,   0 }, {  31,  92, 224 }, // und_Shaw -> en_Shaw_GB
     {   0,  93,   0 }, { 306,  93, 100 }, // und_Sora -> srb_Sora_IN
+    {   0,  94,   0 }, { 262,  94, 103 }, // und_Xsux -> akk_Xsux_IQ
     {   0,  95,   0 }, { 112,  95, 101 }, // und_Sund -> su_Sund_ID
     {   0,  96,   0 }, { 307,  96,  18 }, // und_Sylo -> syl_Sylo_BD
-    {   0,  33,   0 }, { 151,  33, 103 }, // und_Syrc -> syr_Syrc_IQ
+    {   0,  97,   0 }, { 166,  97, 170 }, // und_Tglg -> fil_Tglg_PH
     {   0,  98,   0 }, { 308,  98, 170 }, // und_Tagb -> tbw_Tagb_PH
-    {   0, 101,   0 }, { 275, 101, 100 }, // und_Takr -> doi_Takr_IN
     {   0,  99,   0 }, { 310,  99,  44 }, // und_Tale -> tdd_Tale_CN
-    {   0,  76,   0 }, { 286,  76,  44 }, // und_Talu -> khb_Talu_CN
-    {   0,  27,   0 }, { 117,  27, 100 }, // und_Taml -> ta_Taml_IN
-    {   0, 139,   0 }, { 359, 139,  44 }, // und_Tang -> txg_Tang_CN
     {   0, 100,   0 }, { 309, 100, 232 }, // und_Tavt -> blt_Tavt_VN
-    {   0,  28,   0 }, { 119,  28, 100 }, // und_Telu -> te_Telu_IN
-    {   0,   9,   0 }, { 314,   9, 145 }, // und_Tfng -> zgh_Tfng_MA
-    {   0,  97,   0 }, { 166,  97, 170 }, // und_Tglg -> fil_Tglg_PH
-    {   0,  29,   0 }, { 143,  29, 131 }, // und_Thaa -> dv_Thaa_MV
-    {   0,  30,   0 }, { 120,  30, 211 }, // und_Thai -> th_Thai_TH
-    {   0,  31,   0 }, { 121,  31,  44 }, // und_Tibt -> bo_Tibt_CN
-    {   0, 126,   0 }, { 339, 126, 100 }, // und_Tirh -> mai_Tirh_IN
+    {   0, 101,   0 }, { 275, 101, 100 }, // und_Takr -> doi_Takr_IN
     {   0, 102,   0 }, { 311, 102, 207 }, // und_Ugar -> uga_Ugar_SY
-    {   0,  35,   0 }, { 252,  35, 121 }, // und_Vaii -> vai_Vaii_LR
+    {   0, 103,   0 }, {  37, 103,  74 }, // und_Brai -> fr_Brai_FR
+    {   0, 104,   0 }, {  59, 104, 108 }, // und_Hira -> ja_Hira_JP
+    {   0, 105,   0 }, { 335, 105, 178 }, // und_Aghb -> lez_Aghb_RU
+    {   0, 106,   0 }, { 336, 106, 121 }, // und_Bass -> bsq_Bass_LR
+    {   0, 107,   0 }, {  37, 107,  74 }, // und_Dupl -> fr_Dupl_FR
+    {   0, 108,   0 }, {   6, 108,   2 }, // und_Elba -> sq_Elba_AL
+    {   0, 109,   0 }, {  99, 109, 100 }, // und_Gran -> sa_Gran_IN
+    {   0, 110,   0 }, { 333, 110, 117 }, // und_Hmng -> hnj_Hmng_LA
+    {   0, 111,   0 }, { 105, 111, 100 }, // und_Khoj -> sd_Khoj_IN
+    {   0, 112,   0 }, { 332, 112,  85 }, // und_Lina -> lab_Lina_GR
+    {   0, 113,   0 }, {  49, 113, 100 }, // und_Mahj -> hi_Mahj_IN
+    {   0, 114,   0 }, { 329, 114,  44 }, // und_Mani -> xmn_Mani_CN
+    {   0, 115,   0 }, { 330, 115, 189 }, // und_Mend -> men_Mend_SL
+    {   0, 116,   0 }, {  80, 116, 100 }, // und_Modi -> mr_Modi_IN
+    {   0, 117,   0 }, { 347, 117,  18 }, // und_Mroo -> mro_Mroo_BD
+    {   0, 118,   0 }, { 331, 118, 186 }, // und_Narb -> xna_Narb_SA
+    {   0, 119,   0 }, { 265, 119, 109 }, // und_Nbat -> arc_Nbat_JO
+    {   0, 120,   0 }, { 265, 120, 207 }, // und_Palm -> arc_Palm_SY
+    {   0, 121,   0 }, { 338, 121, 147 }, // und_Pauc -> ctd_Pauc_MM
+    {   0, 122,   0 }, { 226, 122, 178 }, // und_Perm -> kv_Perm_RU
+    {   0, 123,   0 }, { 297, 123,  44 }, // und_Phlp -> pal_Phlp_CN
+    {   0, 124,   0 }, {  99, 124, 100 }, // und_Sidd -> sa_Sidd_IN
+    {   0, 125,   0 }, { 105, 125, 100 }, // und_Sind -> sd_Sind_IN
+    {   0, 126,   0 }, { 339, 126, 100 }, // und_Tirh -> mai_Tirh_IN
     {   0, 127,   0 }, { 334, 127, 100 }, // und_Wara -> hoc_Wara_IN
-    {   0,  80,   0 }, { 295,  80, 102 }, // und_Xpeo -> peo_Xpeo_IR
-    {   0,  94,   0 }, { 262,  94, 103 }, // und_Xsux -> akk_Xsux_IQ
-    {   0,  34,   0 }, { 168,  34,  44 }  // und_Yiii -> ii_Yiii_CN
+    {   0, 128,   0 }, { 340, 128, 100 }, // und_Ahom -> aho_Ahom_IN
+    {   0, 129,   0 }, { 344, 129, 217 }, // und_Hluw -> hlu_Hluw_TR
+    {   0, 130,   0 }, { 356, 130, 103 }, // und_Hatr -> mis_Hatr_IQ
+    {   0, 131,   0 }, { 352, 131, 163 }, // und_Mult -> skr_Mult_PK
+    {   0, 132,   0 }, {  50, 132,  98 }, // und_Hung -> hu_Hung_HU
+    {   0, 133,   0 }, { 341, 133, 225 }, // und_Sgnw -> ase_Sgnw_US
+    {   0, 134,   0 }, { 177, 134,  91 }, // und_Adlm -> ff_Adlm_GN
+    {   0, 135,   0 }, {  99, 135, 100 }, // und_Bhks -> sa_Bhks_IN
+    {   0, 136,   0 }, { 121, 136,  44 }, // und_Marc -> bo_Marc_CN
+    {   0, 137,   0 }, { 348, 137, 150 }, // und_Newa -> new_Newa_NP
+    {   0, 138,   0 }, { 358, 138, 225 }, // und_Osge -> osa_Osge_US
+    {   0, 139,   0 }, { 359, 139,  44 }, // und_Tang -> txg_Tang_CN
+    {   0, 140,   0 }, {  25, 140, 208 }, // und_Hanb -> zh_Hanb_TW
+    {   0, 141,   0 }, {  66, 141, 114 }, // und_Jamo -> ko_Jamo_KR
+    {   2,   0,   0 }, {   2,   2,  81 }, // ab -> ab_Cyrl_GE
+    {   3,   0,   0 }, {   3,   7,  69 }, // om -> om_Latn_ET
+    {   4,   0,   0 }, {   4,   7,  69 }, // aa -> aa_Latn_ET
+    {   5,   0,   0 }, {   5,   7, 195 }, // af -> af_Latn_ZA
+    {   6,   0,   0 }, {   6,   7,   2 }, // sq -> sq_Latn_AL
+    {   7,   0,   0 }, {   7,  14,  69 }, // am -> am_Ethi_ET
+    {   8,   0,   0 }, {   8,   1,  64 }, // ar -> ar_Arab_EG
+    {   9,   0,   0 }, {   9,  10,  11 }, // hy -> hy_Armn_AM
+    {  10,   0,   0 }, {  10,  11, 100 }, // as -> as_Beng_IN
+    {  11,   0,   0 }, {  11,   7,  26 }, // ay -> ay_Latn_BO
+    {  12,   0,   0 }, {  12,   7,  15 }, // az -> az_Latn_AZ
+    {  12,   0, 102 }, {  12,   1, 102 }, // az_IR -> az_Arab_IR
+    {  12,   0, 103 }, {  12,   1, 103 }, // az_IQ -> az_Arab_IQ
+    {  12,   0, 178 }, {  12,   2, 178 }, // az_RU -> az_Cyrl_RU
+    {  12,   1,   0 }, {  12,   1, 102 }, // az_Arab -> az_Arab_IR
+    {  13,   0,   0 }, {  13,   2, 178 }, // ba -> ba_Cyrl_RU
+    {  14,   0,   0 }, {  14,   7, 197 }, // eu -> eu_Latn_ES
+    {  15,   0,   0 }, {  15,  11,  18 }, // bn -> bn_Beng_BD
+    {  16,   0,   0 }, {  16,  31,  25 }, // dz -> dz_Tibt_BT
+    {  18,   0,   0 }, {  18,   7, 229 }, // bi -> bi_Latn_VU
+    {  19,   0,   0 }, {  19,   7,  74 }, // br -> br_Latn_FR
+    {  20,   0,   0 }, {  20,   2,  33 }, // bg -> bg_Cyrl_BG
+    {  21,   0,   0 }, {  21,  25, 147 }, // my -> my_Mymr_MM
+    {  22,   0,   0 }, {  22,   2,  20 }, // be -> be_Cyrl_BY
+    {  23,   0,   0 }, {  23,  20,  36 }, // km -> km_Khmr_KH
+    {  24,   0,   0 }, {  24,   7, 197 }, // ca -> ca_Latn_ES
+    {  25,   0,   0 }, {  25,   5,  44 }, // zh -> zh_Hans_CN
+    {  25,   0,  13 }, {  25,   6,  13 }, // zh_AU -> zh_Hant_AU
+    {  25,   0,  32 }, {  25,   6,  32 }, // zh_BN -> zh_Hant_BN
+    {  25,   0,  76 }, {  25,   6,  76 }, // zh_GF -> zh_Hant_GF
+    {  25,   0,  77 }, {  25,   6,  77 }, // zh_PF -> zh_Hant_PF
+    {  25,   0,  97 }, {  25,   6,  97 }, // zh_HK -> zh_Hant_HK
+    {  25,   0, 101 }, {  25,   6, 101 }, // zh_ID -> zh_Hant_ID
+    {  25,   0, 126 }, {  25,   6, 126 }, // zh_MO -> zh_Hant_MO
+    {  25,   0, 130 }, {  25,   6, 130 }, // zh_MY -> zh_Hant_MY
+    {  25,   0, 166 }, {  25,   6, 166 }, // zh_PA -> zh_Hant_PA
+    {  25,   0, 170 }, {  25,   6, 170 }, // zh_PH -> zh_Hant_PH
+    {  25,   0, 202 }, {  25,   6, 202 }, // zh_SR -> zh_Hant_SR
+    {  25,   0, 208 }, {  25,   6, 208 }, // zh_TW -> zh_Hant_TW
+    {  25,   0, 211 }, {  25,   6, 211 }, // zh_TH -> zh_Hant_TH
+    {  25,   0, 224 }, {  25,   6, 224 }, // zh_GB -> zh_Hant_GB
+    {  25,   0, 225 }, {  25,   6, 225 }, // zh_US -> zh_Hant_US
+    {  25,   0, 232 }, {  25,   6, 232 }, // zh_VN -> zh_Hant_VN
+    {  25,   6,   0 }, {  25,   6, 208 }, // zh_Hant -> zh_Hant_TW
+    {  25,  40,   0 }, {  25,  40, 208 }, // zh_Bopo -> zh_Bopo_TW
+    {  25, 140,   0 }, {  25, 140, 208 }, // zh_Hanb -> zh_Hanb_TW
+    {  26,   0,   0 }, {  26,   7,  74 }, // co -> co_Latn_FR
+    {  27,   0,   0 }, {  27,   7,  54 }, // hr -> hr_Latn_HR
+    {  28,   0,   0 }, {  28,   7,  57 }, // cs -> cs_Latn_CZ
+    {  29,   0,   0 }, {  29,   7,  58 }, // da -> da_Latn_DK
+    {  30,   0,   0 }, {  30,   7, 151 }, // nl -> nl_Latn_NL
+    {  31,   0,   0 }, {  31,   7, 225 }, // en -> en_Latn_US
+    {  31,  92,   0 }, {  31,  92, 224 }, // en_Shaw -> en_Shaw_GB
+    {  32,   0,   0 }, {  32,   7, 260 }, // eo -> eo_Latn_001
+    {  33,   0,   0 }, {  33,   7,  68 }, // et -> et_Latn_EE
+    {  34,   0,   0 }, {  34,   7,  71 }, // fo -> fo_Latn_FO
+    {  35,   0,   0 }, {  35,   7,  72 }, // fj -> fj_Latn_FJ
+    {  36,   0,   0 }, {  36,   7,  73 }, // fi -> fi_Latn_FI
+    {  37,   0,   0 }, {  37,   7,  74 }, // fr -> fr_Latn_FR
+    {  38,   0,   0 }, {  38,   7, 151 }, // fy -> fy_Latn_NL
+    {  39,   0,   0 }, {  39,   7, 224 }, // gd -> gd_Latn_GB
+    {  40,   0,   0 }, {  40,   7, 197 }, // gl -> gl_Latn_ES
+    {  41,   0,   0 }, {  41,  15,  81 }, // ka -> ka_Geor_GE
+    {  42,   0,   0 }, {  42,   7,  82 }, // de -> de_Latn_DE
+    {  43,   0,   0 }, {  43,  16,  85 }, // el -> el_Grek_GR
+    {  44,   0,   0 }, {  44,   7,  86 }, // kl -> kl_Latn_GL
+    {  45,   0,   0 }, {  45,   7, 168 }, // gn -> gn_Latn_PY
+    {  46,   0,   0 }, {  46,  17, 100 }, // gu -> gu_Gujr_IN
+    {  47,   0,   0 }, {  47,   7, 157 }, // ha -> ha_Latn_NG
+    {  47,   0,  37 }, {  47,   1,  37 }, // ha_CM -> ha_Arab_CM
+    {  47,   0, 201 }, {  47,   1, 201 }, // ha_SD -> ha_Arab_SD
+    {  48,   0,   0 }, {  48,  18, 105 }, // he -> he_Hebr_IL
+    {  49,   0,   0 }, {  49,  13, 100 }, // hi -> hi_Deva_IN
+    {  50,   0,   0 }, {  50,   7,  98 }, // hu -> hu_Latn_HU
+    {  51,   0,   0 }, {  51,   7,  99 }, // is -> is_Latn_IS
+    {  52,   0,   0 }, {  52,   7, 101 }, // id -> id_Latn_ID
+    {  53,   0,   0 }, {  53,   7, 260 }, // ia -> ia_Latn_001
+    {  55,   0,   0 }, {  55,  44,  38 }, // iu -> iu_Cans_CA
+    {  56,   0,   0 }, {  56,   7, 225 }, // ik -> ik_Latn_US
+    {  57,   0,   0 }, {  57,   7, 104 }, // ga -> ga_Latn_IE
+    {  58,   0,   0 }, {  58,   7, 106 }, // it -> it_Latn_IT
+    {  59,   0,   0 }, {  59,  19, 108 }, // ja -> ja_Jpan_JP
+    {  60,   0,   0 }, {  60,   7, 101 }, // jv -> jv_Latn_ID
+    {  61,   0,   0 }, {  61,  21, 100 }, // kn -> kn_Knda_IN
+    {  62,   0,   0 }, {  62,   1, 100 }, // ks -> ks_Arab_IN
+    {  63,   0,   0 }, {  63,   2, 110 }, // kk -> kk_Cyrl_KZ
+    {  63,   0,   1 }, {  63,   1,   1 }, // kk_AF -> kk_Arab_AF
+    {  63,   0,  44 }, {  63,   1,  44 }, // kk_CN -> kk_Arab_CN
+    {  63,   0, 102 }, {  63,   1, 102 }, // kk_IR -> kk_Arab_IR
+    {  63,   0, 143 }, {  63,   1, 143 }, // kk_MN -> kk_Arab_MN
+    {  63,   1,   0 }, {  63,   1,  44 }, // kk_Arab -> kk_Arab_CN
+    {  64,   0,   0 }, {  64,   7, 179 }, // rw -> rw_Latn_RW
+    {  65,   0,   0 }, {  65,   2, 116 }, // ky -> ky_Cyrl_KG
+    {  65,   0,  44 }, {  65,   1,  44 }, // ky_CN -> ky_Arab_CN
+    {  65,   0, 217 }, {  65,   7, 217 }, // ky_TR -> ky_Latn_TR
+    {  65,   1,   0 }, {  65,   1,  44 }, // ky_Arab -> ky_Arab_CN
+    {  65,   7,   0 }, {  65,   7, 217 }, // ky_Latn -> ky_Latn_TR
+    {  66,   0,   0 }, {  66,  22, 114 }, // ko -> ko_Kore_KR
+    {  67,   0,   0 }, {  67,   7, 217 }, // ku -> ku_Latn_TR
+    {  67,   0, 119 }, {  67,   1, 119 }, // ku_LB -> ku_Arab_LB
+    {  67,   1,   0 }, {  67,   1, 103 }, // ku_Arab -> ku_Arab_IQ
+    {  68,   0,   0 }, {  68,   7,  35 }, // rn -> rn_Latn_BI
+    {  69,   0,   0 }, {  69,  23, 117 }, // lo -> lo_Laoo_LA
+    {  70,   0,   0 }, {  70,   7, 230 }, // la -> la_Latn_VA
+    {  71,   0,   0 }, {  71,   7, 118 }, // lv -> lv_Latn_LV
+    {  72,   0,   0 }, {  72,   7,  49 }, // ln -> ln_Latn_CD
+    {  73,   0,   0 }, {  73,   7, 124 }, // lt -> lt_Latn_LT
+    {  74,   0,   0 }, {  74,   2, 127 }, // mk -> mk_Cyrl_MK
+    {  75,   0,   0 }, {  75,   7, 128 }, // mg -> mg_Latn_MG
+    {  76,   0,   0 }, {  76,   7, 130 }, // ms -> ms_Latn_MY
+    {  76,   0,  46 }, {  76,   1,  46 }, // ms_CC -> ms_Arab_CC
+    {  76,   0, 101 }, {  76,   1, 101 }, // ms_ID -> ms_Arab_ID
+    {  77,   0,   0 }, {  77,  24, 100 }, // ml -> ml_Mlym_IN
+    {  78,   0,   0 }, {  78,   7, 133 }, // mt -> mt_Latn_MT
+    {  79,   0,   0 }, {  79,   7, 154 }, // mi -> mi_Latn_NZ
+    {  80,   0,   0 }, {  80,  13, 100 }, // mr -> mr_Deva_IN
+    {  81,   0,   0 }, {  81,   7, 134 }, // mh -> mh_Latn_MH
+    {  82,   0,   0 }, {  82,   2, 143 }, // mn -> mn_Cyrl_MN
+    {  82,   0,  44 }, {  82,   8,  44 }, // mn_CN -> mn_Mong_CN
+    {  82,   8,   0 }, {  82,   8,  44 }, // mn_Mong -> mn_Mong_CN
+    {  83,   0,   0 }, {  83,   7, 149 }, // na -> na_Latn_NR
+    {  84,   0,   0 }, {  84,  13, 150 }, // ne -> ne_Deva_NP
+    {  85,   0,   0 }, {  85,   7, 161 }, // nb -> nb_Latn_NO
+    {  86,   0,   0 }, {  86,   7,  74 }, // oc -> oc_Latn_FR
+    {  87,   0,   0 }, {  87,  26, 100 }, // or -> or_Orya_IN
+    {  88,   0,   0 }, {  88,   1,   1 }, // ps -> ps_Arab_AF
+    {  89,   0,   0 }, {  89,   1, 102 }, // fa -> fa_Arab_IR
+    {  90,   0,   0 }, {  90,   7, 172 }, // pl -> pl_Latn_PL
+    {  91,   0,   0 }, {  91,   7,  30 }, // pt -> pt_Latn_BR
+    {  92,   0,   0 }, {  92,   4, 100 }, // pa -> pa_Guru_IN
+    {  92,   0, 163 }, {  92,   1, 163 }, // pa_PK -> pa_Arab_PK
+    {  92,   1,   0 }, {  92,   1, 163 }, // pa_Arab -> pa_Arab_PK
+    {  93,   0,   0 }, {  93,   7, 169 }, // qu -> qu_Latn_PE
+    {  94,   0,   0 }, {  94,   7, 206 }, // rm -> rm_Latn_CH
+    {  95,   0,   0 }, {  95,   7, 177 }, // ro -> ro_Latn_RO
+    {  96,   0,   0 }, {  96,   2, 178 }, // ru -> ru_Cyrl_RU
+    {  97,   0,   0 }, {  97,   7, 183 }, // sm -> sm_Latn_WS
+    {  98,   0,   0 }, {  98,   7,  41 }, // sg -> sg_Latn_CF
+    {  99,   0,   0 }, {  99,  13, 100 }, // sa -> sa_Deva_IN
+    { 100,   0,   0 }, { 100,   2, 243 }, // sr -> sr_Cyrl_RS
+    { 100,   0, 177 }, { 100,   7, 177 }, // sr_RO -> sr_Latn_RO
+    { 100,   0, 178 }, { 100,   7, 178 }, // sr_RU -> sr_Latn_RU
+    { 100,   0, 217 }, { 100,   7, 217 }, // sr_TR -> sr_Latn_TR
+    { 100,   0, 242 }, { 100,   7, 242 }, // sr_ME -> sr_Latn_ME
+    { 101,   0,   0 }, { 101,   2,  81 }, // os -> os_Cyrl_GE
+    { 102,   0,   0 }, { 102,   7, 195 }, // st -> st_Latn_ZA
+    { 103,   0,   0 }, { 103,   7, 195 }, // tn -> tn_Latn_ZA
+    { 104,   0,   0 }, { 104,   7, 240 }, // sn -> sn_Latn_ZW
+    { 105,   0,   0 }, { 105,   1, 163 }, // sd -> sd_Arab_PK
+    { 105,  13,   0 }, { 105,  13, 100 }, // sd_Deva -> sd_Deva_IN
+    { 105, 111,   0 }, { 105, 111, 100 }, // sd_Khoj -> sd_Khoj_IN
+    { 105, 125,   0 }, { 105, 125, 100 }, // sd_Sind -> sd_Sind_IN
+    { 106,   0,   0 }, { 106,  32, 198 }, // si -> si_Sinh_LK
+    { 107,   0,   0 }, { 107,   7, 195 }, // ss -> ss_Latn_ZA
+    { 108,   0,   0 }, { 108,   7, 191 }, // sk -> sk_Latn_SK
+    { 109,   0,   0 }, { 109,   7, 192 }, // sl -> sl_Latn_SI
+    { 110,   0,   0 }, { 110,   7, 194 }, // so -> so_Latn_SO
+    { 111,   0,   0 }, { 111,   7, 197 }, // es -> es_Latn_ES
+    { 112,   0,   0 }, { 112,   7, 101 }, // su -> su_Latn_ID
+    { 113,   0,   0 }, { 113,   7, 210 }, // sw -> sw_Latn_TZ
+    { 114,   0,   0 }, { 114,   7, 205 }, // sv -> sv_Latn_SE
+    { 115,   0,   0 }, { 115,   7, 106 }, // sc -> sc_Latn_IT
+    { 116,   0,   0 }, { 116,   2, 209 }, // tg -> tg_Cyrl_TJ
+    { 116,   0, 163 }, { 116,   1, 163 }, // tg_PK -> tg_Arab_PK
+    { 116,   1,   0 }, { 116,   1, 163 }, // tg_Arab -> tg_Arab_PK
+    { 117,   0,   0 }, { 117,  27, 100 }, // ta -> ta_Taml_IN
+    { 118,   0,   0 }, { 118,   2, 178 }, // tt -> tt_Cyrl_RU
+    { 119,   0,   0 }, { 119,  28, 100 }, // te -> te_Telu_IN
+    { 120,   0,   0 }, { 120,  30, 211 }, // th -> th_Thai_TH
+    { 121,   0,   0 }, { 121,  31,  44 }, // bo -> bo_Tibt_CN
+    { 122,   0,   0 }, { 122,  14,  69 }, // ti -> ti_Ethi_ET
+    { 123,   0,   0 }, { 123,   7, 214 }, // to -> to_Latn_TO
+    { 124,   0,   0 }, { 124,   7, 195 }, // ts -> ts_Latn_ZA
+    { 125,   0,   0 }, { 125,   7, 217 }, // tr -> tr_Latn_TR
+    { 126,   0,   0 }, { 126,   7, 218 }, // tk -> tk_Latn_TM
+    { 127,   0,   0 }, { 127,   7,  77 }, // ty -> ty_Latn_PF
+    { 128,   0,   0 }, { 128,   1,  44 }, // ug -> ug_Arab_CN
+    { 128,   0, 110 }, { 128,   2, 110 }, // ug_KZ -> ug_Cyrl_KZ
+    { 128,   0, 143 }, { 128,   2, 143 }, // ug_MN -> ug_Cyrl_MN
+    { 128,   2,   0 }, { 128,   2, 110 }, // ug_Cyrl -> ug_Cyrl_KZ
+    { 129,   0,   0 }, { 129,   2, 222 }, // uk -> uk_Cyrl_UA
+    { 130,   0,   0 }, { 130,   1, 163 }, // ur -> ur_Arab_PK
+    { 131,   0,   0 }, { 131,   7, 228 }, // uz -> uz_Latn_UZ
+    { 131,   0,   1 }, { 131,   1,   1 }, // uz_AF -> uz_Arab_AF
+    { 131,   0,  44 }, { 131,   2,  44 }, // uz_CN -> uz_Cyrl_CN
+    { 131,   1,   0 }, { 131,   1,   1 }, // uz_Arab -> uz_Arab_AF
+    { 132,   0,   0 }, { 132,   7, 232 }, // vi -> vi_Latn_VN
+    { 133,   0,   0 }, { 133,   7, 260 }, // vo -> vo_Latn_001
+    { 134,   0,   0 }, { 134,   7, 224 }, // cy -> cy_Latn_GB
+    { 135,   0,   0 }, { 135,   7, 187 }, // wo -> wo_Latn_SN
+    { 136,   0,   0 }, { 136,   7, 195 }, // xh -> xh_Latn_ZA
+    { 137,   0,   0 }, { 137,  18, 260 }, // yi -> yi_Hebr_001
+    { 138,   0,   0 }, { 138,   7, 157 }, // yo -> yo_Latn_NG
+    { 139,   0,   0 }, { 139,   7,  44 }, // za -> za_Latn_CN
+    { 140,   0,   0 }, { 140,   7, 195 }, // zu -> zu_Latn_ZA
+    { 141,   0,   0 }, { 141,   7, 161 }, // nn -> nn_Latn_NO
+    { 142,   0,   0 }, { 142,   7,  27 }, // bs -> bs_Latn_BA
+    { 143,   0,   0 }, { 143,  29, 131 }, // dv -> dv_Thaa_MV
+    { 144,   0,   0 }, { 144,   7, 251 }, // gv -> gv_Latn_IM
+    { 145,   0,   0 }, { 145,   7, 224 }, // kw -> kw_Latn_GB
+    { 146,   0,   0 }, { 146,   7,  83 }, // ak -> ak_Latn_GH
+    { 147,   0,   0 }, { 147,  13, 100 }, // kok -> kok_Deva_IN
+    { 148,   0,   0 }, { 148,   7,  83 }, // gaa -> gaa_Latn_GH
+    { 149,   0,   0 }, { 149,   7, 157 }, // ig -> ig_Latn_NG
+    { 150,   0,   0 }, { 150,   7, 111 }, // kam -> kam_Latn_KE
+    { 151,   0,   0 }, { 151,  33, 103 }, // syr -> syr_Syrc_IQ
+    { 152,   0,   0 }, { 152,  14,  67 }, // byn -> byn_Ethi_ER
+    { 153,   0,   0 }, { 153,  14,  69 }, // gez -> gez_Ethi_ET
+    { 154,   0,   0 }, { 154,   7,  53 }, // kfo -> kfo_Latn_CI
+    { 155,   0,   0 }, { 155,   7,  69 }, // sid -> sid_Latn_ET
+    { 156,   0,   0 }, { 156,   7, 157 }, // cch -> cch_Latn_NG
+    { 157,   0,   0 }, { 157,  14,  67 }, // tig -> tig_Ethi_ER
+    { 158,   0,   0 }, { 158,   7, 157 }, // kaj -> kaj_Latn_NG
+    { 159,   0,   0 }, { 159,   7, 106 }, // fur -> fur_Latn_IT
+    { 160,   0,   0 }, { 160,   7, 195 }, // ve -> ve_Latn_ZA
+    { 161,   0,   0 }, { 161,   7,  83 }, // ee -> ee_Latn_GH
+    { 162,   0,   0 }, { 162,  14,  69 }, // wal -> wal_Ethi_ET
+    { 163,   0,   0 }, { 163,   7, 225 }, // haw -> haw_Latn_US
+    { 164,   0,   0 }, { 164,   7, 157 }, // kcg -> kcg_Latn_NG
+    { 165,   0,   0 }, { 165,   7, 129 }, // ny -> ny_Latn_MW
+    { 166,   0,   0 }, { 166,   7, 170 }, // fil -> fil_Latn_PH
+    { 167,   0,   0 }, { 167,   7, 206 }, // gsw -> gsw_Latn_CH
+    { 168,   0,   0 }, { 168,  34,  44 }, // ii -> ii_Yiii_CN
+    { 169,   0,   0 }, { 169,   7, 121 }, // kpe -> kpe_Latn_LR
+    { 170,   0,   0 }, { 170,   7,  82 }, // nds -> nds_Latn_DE
+    { 171,   0,   0 }, { 171,   7, 195 }, // nr -> nr_Latn_ZA
+    { 172,   0,   0 }, { 172,   7, 195 }, // nso -> nso_Latn_ZA
+    { 173,   0,   0 }, { 173,   7, 161 }, // se -> se_Latn_NO
+    { 174,   0,   0 }, { 174,   7, 208 }, // trv -> trv_Latn_TW
+    { 175,   0,   0 }, { 175,   7, 111 }, // guz -> guz_Latn_KE
+    { 176,   0,   0 }, { 176,   7, 111 }, // dav -> dav_Latn_KE
+    { 177,   0,   0 }, { 177,   7, 187 }, // ff -> ff_Latn_SN
+    { 177, 134,   0 }, { 177, 134,  91 }, // ff_Adlm -> ff_Adlm_GN
+    { 178,   0,   0 }, { 178,   7, 111 }, // ki -> ki_Latn_KE
+    { 179,   0,   0 }, { 179,   7, 111 }, // saq -> saq_Latn_KE
+    { 180,   0,   0 }, { 180,   7, 146 }, // seh -> seh_Latn_MZ
+    { 181,   0,   0 }, { 181,   7, 240 }, // nd -> nd_Latn_ZW
+    { 182,   0,   0 }, { 182,   7, 210 }, // rof -> rof_Latn_TZ
+    { 183,   0,   0 }, { 183,   9, 145 }, // shi -> shi_Tfng_MA
+    { 184,   0,   0 }, { 184,   7,   3 }, // kab -> kab_Latn_DZ
+    { 185,   0,   0 }, { 185,   7, 221 }, // nyn -> nyn_Latn_UG
+    { 186,   0,   0 }, { 186,   7, 210 }, // bez -> bez_Latn_TZ
+    { 187,   0,   0 }, { 187,   7, 210 }, // vun -> vun_Latn_TZ
+    { 188,   0,   0 }, { 188,   7, 132 }, // bm -> bm_Latn_ML
+    { 189,   0,   0 }, { 189,   7, 111 }, // ebu -> ebu_Latn_KE
+    { 190,   0,   0 }, { 190,  12, 225 }, // chr -> chr_Cher_US
+    { 191,   0,   0 }, { 191,   7, 137 }, // mfe -> mfe_Latn_MU
+    { 192,   0,   0 }, { 192,   7, 210 }, // kde -> kde_Latn_TZ
+    { 193,   0,   0 }, { 193,   7, 210 }, // lag -> lag_Latn_TZ
+    { 194,   0,   0 }, { 194,   7, 221 }, // lg -> lg_Latn_UG
+    { 195,   0,   0 }, { 195,   7, 239 }, // bem -> bem_Latn_ZM
+    { 196,   0,   0 }, { 196,   7,  39 }, // kea -> kea_Latn_CV
+    { 197,   0,   0 }, { 197,   7, 111 }, // mer -> mer_Latn_KE
+    { 198,   0,   0 }, { 198,   7, 111 }, // kln -> kln_Latn_KE
+    { 199,   0,   0 }, { 199,   7, 148 }, // naq -> naq_Latn_NA
+    { 200,   0,   0 }, { 200,   7, 210 }, // jmc -> jmc_Latn_TZ
+    { 201,   0,   0 }, { 201,   7,  82 }, // ksh -> ksh_Latn_DE
+    { 202,   0,   0 }, { 202,   7, 111 }, // mas -> mas_Latn_KE
+    { 203,   0,   0 }, { 203,   7, 221 }, // xog -> xog_Latn_UG
+    { 204,   0,   0 }, { 204,   7, 111 }, // luy -> luy_Latn_KE
+    { 205,   0,   0 }, { 205,   7, 210 }, // asa -> asa_Latn_TZ
+    { 206,   0,   0 }, { 206,   7, 221 }, // teo -> teo_Latn_UG
+    { 207,   0,   0 }, { 207,   7,  67 }, // ssy -> ssy_Latn_ER
+    { 208,   0,   0 }, { 208,   7, 132 }, // khq -> khq_Latn_ML
+    { 209,   0,   0 }, { 209,   7, 210 }, // rwk -> rwk_Latn_TZ
+    { 210,   0,   0 }, { 210,   7, 111 }, // luo -> luo_Latn_KE
+    { 211,   0,   0 }, { 211,   7, 221 }, // cgg -> cgg_Latn_UG
+    { 212,   0,   0 }, { 212,   7, 145 }, // tzm -> tzm_Latn_MA
+    { 213,   0,   0 }, { 213,   7, 132 }, // ses -> ses_Latn_ML
+    { 214,   0,   0 }, { 214,   7, 210 }, // ksb -> ksb_Latn_TZ
+    { 215,   0,   0 }, { 215,  13, 100 }, // brx -> brx_Deva_IN
+    { 216,   0,   0 }, { 216,   2, 178 }, // av -> av_Cyrl_RU
+    { 217,   0,   0 }, { 217,   7,  89 }, // ch -> ch_Latn_GU
+    { 218,   0,   0 }, { 218,   2, 178 }, // ce -> ce_Cyrl_RU
+    { 219,   0,   0 }, { 219,   2, 178 }, // cu -> cu_Cyrl_RU
+    { 219,  52,   0 }, { 219,  52,  33 }, // cu_Glag -> cu_Glag_BG
+    { 220,   0,   0 }, { 220,   2, 178 }, // cv -> cv_Cyrl_RU
+    { 221,   0,   0 }, { 221,  44,  38 }, // cr -> cr_Cans_CA
+    { 222,   0,   0 }, { 222,   7,  94 }, // ht -> ht_Latn_HT
+    { 223,   0,   0 }, { 223,   7, 148 }, // hz -> hz_Latn_NA
+    { 224,   0,   0 }, { 224,   7, 167 }, // ho -> ho_Latn_PG
+    { 225,   0,   0 }, { 225,   7,   0 }, // kr -> kr_Latn
+    { 226,   0,   0 }, { 226,   2, 178 }, // kv -> kv_Cyrl_RU
+    { 227,   0,   0 }, { 227,   7,  49 }, // kg -> kg_Latn_CD
+    { 228,   0,   0 }, { 228,   7, 148 }, // kj -> kj_Latn_NA
+    { 229,   0,   0 }, { 229,   7, 151 }, // li -> li_Latn_NL
+    { 230,   0,   0 }, { 230,   7,  49 }, // lu -> lu_Latn_CD
+    { 231,   0,   0 }, { 231,   7, 125 }, // lb -> lb_Latn_LU
+    { 232,   0,   0 }, { 232,   7, 225 }, // nv -> nv_Latn_US
+    { 233,   0,   0 }, { 233,   7, 148 }, // ng -> ng_Latn_NA
+    { 236,   0,   0 }, { 236,   7,  21 }, // wa -> wa_Latn_BE
+    { 237,   0,   0 }, { 237,   7,  37 }, // agq -> agq_Latn_CM
+    { 238,   0,   0 }, { 238,   7,  37 }, // bas -> bas_Latn_CM
+    { 239,   0,   0 }, { 239,   7, 156 }, // dje -> dje_Latn_NE
+    { 240,   0,   0 }, { 240,   7,  37 }, // dua -> dua_Latn_CM
+    { 241,   0,   0 }, { 241,   7, 187 }, // dyo -> dyo_Latn_SN
+    { 242,   0,   0 }, { 242,   7,  37 }, // ewo -> ewo_Latn_CM
+    { 243,   0,   0 }, { 243,   7,  37 }, // ksf -> ksf_Latn_CM
+    { 244,   0,   0 }, { 244,   7, 146 }, // mgh -> mgh_Latn_MZ
+    { 245,   0,   0 }, { 245,   7,  37 }, // mua -> mua_Latn_CM
+    { 246,   0,   0 }, { 246,   7,  37 }, // nmg -> nmg_Latn_CM
+    { 247,   0,   0 }, { 247,   7, 254 }, // nus -> nus_Latn_SS
+    { 248,   0,   0 }, { 248,   2, 178 }, // sah -> sah_Cyrl_RU
+    { 249,   0,   0 }, { 249,   7, 210 }, // sbp -> sbp_Latn_TZ
+    { 250,   0,   0 }, { 250,   7,  49 }, // swc -> swc_Latn_CD
+    { 251,   0,   0 }, { 251,   7, 156 }, // twq -> twq_Latn_NE
+    { 252,   0,   0 }, { 252,  35, 121 }, // vai -> vai_Vaii_LR
+    { 253,   0,   0 }, { 253,   7, 206 }, // wae -> wae_Latn_CH
+    { 254,   0,   0 }, { 254,   7,  37 }, // yav -> yav_Latn_CM
+    { 255,   0,   0 }, { 255,  36, 102 }, // ae -> ae_Avst_IR
+    { 256,   0,   0 }, { 256,   7, 197 }, // ast -> ast_Latn_ES
+    { 257,   0,   0 }, { 257,   7,  37 }, // jgo -> jgo_Latn_CM
+    { 258,   0,   0 }, { 258,   7,  37 }, // kkj -> kkj_Latn_CM
+    { 259,   0,   0 }, { 259,   7,  37 }, // mgo -> mgo_Latn_CM
+    { 260,   0,   0 }, { 260,   7,  37 }, // nnh -> nnh_Latn_CM
+    { 261,   0,   0 }, { 261,   7, 197 }, // an -> an_Latn_ES
+    { 262,   0,   0 }, { 262,  94, 103 }, // akk -> akk_Xsux_IQ
+    { 263,   0,   0 }, { 263,  50,  64 }, // egy -> egy_Egyp_EG
+    { 264,   0,   0 }, { 264,  49,  56 }, // grc -> grc_Cprt_CY
+    { 264,  68,   0 }, { 264,  68,  85 }, // grc_Linb -> grc_Linb_GR
+    { 265,   0,   0 }, { 265,  57, 102 }, // arc -> arc_Armi_IR
+    { 265, 119,   0 }, { 265, 119, 109 }, // arc_Nbat -> arc_Nbat_JO
+    { 265, 120,   0 }, { 265, 120, 207 }, // arc_Palm -> arc_Palm_SY
+    { 266,   0,   0 }, { 266,   7, 101 }, // ban -> ban_Latn_ID
+    { 267,   0,   0 }, { 267,  38,  37 }, // bax -> bax_Bamu_CM
+    { 268,   0,   0 }, { 268,   7, 101 }, // bbc -> bbc_Latn_ID
+    { 269,   0,   0 }, { 269,   7, 101 }, // bug -> bug_Latn_ID
+    { 270,   0,   0 }, { 270,   7, 170 }, // bku -> bku_Latn_PH
+    { 271,   0,   0 }, { 271,  45, 217 }, // xcr -> xcr_Cari_TR
+    { 272,   0,   0 }, { 272,  46,  18 }, // ccp -> ccp_Cakm_BD
+    { 273,   0,   0 }, { 273,  71, 102 }, // myz -> myz_Mand_IR
+    { 274,   0,   0 }, { 274,  48,  64 }, // cop -> cop_Copt_EG
+    { 275,   0,   0 }, { 275,   1, 100 }, // doi -> doi_Arab_IN
+    { 276,   0,   0 }, { 276,  47, 232 }, // cjm -> cjm_Cham_VN
+    { 277,   0,   0 }, { 277,  63, 147 }, // eky -> eky_Kali_MM
+    { 278,   0,   0 }, { 278,  79, 106 }, // ett -> ett_Ital_IT
+    { 279,   0,   0 }, { 279,  53, 222 }, // got -> got_Goth_UA
+    { 280,   0,   0 }, { 280,   7, 170 }, // hnn -> hnn_Latn_PH
+    { 281,   0,   0 }, { 281,   2, 178 }, // inh -> inh_Cyrl_RU
+    { 282,   0,   0 }, { 282,  86,  44 }, // hmd -> hmd_Plrd_CN
+    { 283,   0,   0 }, { 283,  66, 100 }, // lep -> lep_Lepc_IN
+    { 284,   0,   0 }, { 284,  13, 150 }, // lif -> lif_Deva_NP
+    { 284,  67,   0 }, { 284,  67, 100 }, // lif_Limb -> lif_Limb_IN
+    { 285,   0,   0 }, { 285,  51,  44 }, // lis -> lis_Lisu_CN
+    { 286,   0,   0 }, { 286,  76,  44 }, // khb -> khb_Talu_CN
+    { 287,   0,   0 }, { 287,  69, 217 }, // xlc -> xlc_Lyci_TR
+    { 288,   0,   0 }, { 288,  70, 217 }, // xld -> xld_Lydi_TR
+    { 289,   0,   0 }, { 289,   7,  80 }, // man -> man_Latn_GM
+    { 289,   0,  91 }, { 289,  75,  91 }, // man_GN -> man_Nkoo_GN
+    { 289,  75,   0 }, { 289,  75,  91 }, // man_Nkoo -> man_Nkoo_GN
+    { 290,   0,   0 }, { 290,  11, 100 }, // mni -> mni_Beng_IN
+    { 291,   0,   0 }, { 291,  74, 201 }, // xmr -> xmr_Merc_SD
+    { 292,   0,   0 }, { 292,  65, 211 }, // nod -> nod_Lana_TH
+    { 293,   0,   0 }, { 293,  77, 104 }, // sga -> sga_Ogam_IE
+    { 294,   0,   0 }, { 294,  88, 205 }, // non -> non_Runr_SE
+    { 295,   0,   0 }, { 295,  80, 102 }, // peo -> peo_Xpeo_IR
+    { 296,   0,   0 }, { 296,  82, 143 }, // otk -> otk_Orkh_MN
+    { 297,   0,   0 }, { 297,  58, 102 }, // pal -> pal_Phli_IR
+    { 297, 123,   0 }, { 297, 123,  44 }, // pal_Phlp -> pal_Phlp_CN
+    { 298,   0,   0 }, { 298,  59, 102 }, // xpr -> xpr_Prti_IR
+    { 299,   0,   0 }, { 299,  85, 119 }, // phn -> phn_Phnx_LB
+    { 300,   0,   0 }, { 300,  64, 163 }, // pra -> pra_Khar_PK
+    { 301,   0,   0 }, { 301,   7, 101 }, // rej -> rej_Latn_ID
+    { 302,   0,   0 }, { 302,  81, 237 }, // xsa -> xsa_Sarb_YE
+    { 303,   0,   0 }, { 303,  89, 105 }, // smp -> smp_Samr_IL
+    { 304,   0,   0 }, { 304,   7, 100 }, // sat -> sat_Latn_IN
+    { 305,   0,   0 }, { 305,  90, 100 }, // saz -> saz_Saur_IN
+    { 306,   0,   0 }, { 306,  93, 100 }, // srb -> srb_Sora_IN
+    { 307,   0,   0 }, { 307,  11,  18 }, // syl -> syl_Beng_BD
+    { 308,   0,   0 }, { 308,   7, 170 }, // tbw -> tbw_Latn_PH
+    { 309,   0,   0 }, { 309, 100, 232 }, // blt -> blt_Tavt_VN
+    { 310,   0,   0 }, { 310,  99,  44 }, // tdd -> tdd_Tale_CN
+    { 311,   0,   0 }, { 311, 102, 207 }, // uga -> uga_Ugar_SY
+    { 312,   0,   0 }, { 312,   7,  37 }, // bss -> bss_Latn_CM
+    { 313,   0,   0 }, { 313,   7, 225 }, // lkt -> lkt_Latn_US
+    { 314,   0,   0 }, { 314,   9, 145 }, // zgh -> zgh_Tfng_MA
+    { 315,   0,   0 }, { 315,   7,  43 }, // arn -> arn_Latn_CL
+    { 316,   0,   0 }, { 316,   1, 103 }, // ckb -> ckb_Arab_IQ
+    { 317,   0,   0 }, { 317,   7,  82 }, // dsb -> dsb_Latn_DE
+    { 318,   0,   0 }, { 318,   7,  82 }, // hsb -> hsb_Latn_DE
+    { 319,   0,   0 }, { 319,   7,  37 }, // ken -> ken_Latn_CM
+    { 320,   0,   0 }, { 320,   7,  38 }, // moh -> moh_Latn_CA
+    { 321,   0,   0 }, { 321,  75,  91 }, // nqo -> nqo_Nkoo_GN
+    { 322,   0,   0 }, { 322,   7, 260 }, // prg -> prg_Latn_001
+    { 323,   0,   0 }, { 323,   7,  90 }, // quc -> quc_Latn_GT
+    { 324,   0,   0 }, { 324,   7, 205 }, // sma -> sma_Latn_SE
+    { 325,   0,   0 }, { 325,   7, 205 }, // smj -> smj_Latn_SE
+    { 326,   0,   0 }, { 326,   7,  73 }, // smn -> smn_Latn_FI
+    { 327,   0,   0 }, { 327,   7,  73 }, // sms -> sms_Latn_FI
+    { 328,   0,   0 }, { 328,   7,  13 }, // wbp -> wbp_Latn_AU
+    { 329,   0,   0 }, { 329, 114,  44 }, // xmn -> xmn_Mani_CN
+    { 330,   0,   0 }, { 330,   7, 189 }, // men -> men_Latn_SL
+    { 331,   0,   0 }, { 331, 118, 186 }, // xna -> xna_Narb_SA
+    { 332,   0,   0 }, { 332, 112,  85 }, // lab -> lab_Lina_GR
+    { 333,   0,   0 }, { 333, 110, 117 }, // hnj -> hnj_Hmng_LA
+    { 334,   0,   0 }, { 334,  13, 100 }, // hoc -> hoc_Deva_IN
+    { 335,   0,   0 }, { 335,   2, 178 }, // lez -> lez_Cyrl_RU
+    { 336,   0,   0 }, { 336, 106, 121 }, // bsq -> bsq_Bass_LR
+    { 338,   0,   0 }, { 338, 121, 147 }, // ctd -> ctd_Pauc_MM
+    { 339,   0,   0 }, { 339,  13, 100 }, // mai -> mai_Deva_IN
+    { 340,   0,   0 }, { 340, 128, 100 }, // aho -> aho_Ahom_IN
+    { 341,   0,   0 }, { 341, 133, 225 }, // ase -> ase_Sgnw_US
+    { 342,   0,   0 }, { 342,  41, 100 }, // pka -> pka_Brah_IN
+    { 343,   0,   0 }, { 343,  13, 100 }, // bho -> bho_Deva_IN
+    { 344,   0,   0 }, { 344, 129, 217 }, // hlu -> hlu_Hluw_TR
+    { 345,   0,   0 }, { 345,   5,  44 }, // lzh -> lzh_Hans_CN
+    { 346,   0,   0 }, { 346,   1, 102 }, // mzn -> mzn_Arab_IR
+    { 347,   0,   0 }, { 347, 117,  18 }, // mro -> mro_Mroo_BD
+    { 348,   0,   0 }, { 348,  13, 150 }, // new -> new_Deva_NP
+    { 349,   0,   0 }, { 349,   1, 102 }, // lrc -> lrc_Arab_IR
+    { 350,   0,   0 }, { 350,   7, 164 }, // pau -> pau_Latn_PW
+    { 351,   0,   0 }, { 351,   7,  12 }, // pap -> pap_Latn_AW
+    { 352,   0,   0 }, { 352,   1, 163 }, // skr -> skr_Arab_PK
+    { 353,   0,   0 }, { 353,   7, 213 }, // tkl -> tkl_Latn_TK
+    { 354,   0,   0 }, { 354,   7, 167 }, // tpi -> tpi_Latn_PG
+    { 355,   0,   0 }, { 355,   7, 220 }, // tvl -> tvl_Latn_TV
+    { 356,   0,   0 }, { 356, 130, 103 }, // mis -> mis_Hatr_IQ
+    { 357,   0,   0 }, { 357,   6,  97 }, // yue -> yue_Hant_HK
+    { 357,   0,  44 }, { 357,   5,  44 }, // yue_CN -> yue_Hans_CN
+    { 357,   5,   0 }, { 357,   5,  44 }, // yue_Hans -> yue_Hans_CN
+    { 358,   0,   0 }, { 358, 138, 225 }, // osa -> osa_Osge_US
+    { 359,   0,   0 }, { 359, 139,  44 }, // txg -> txg_Tang_CN
+    { 360,   0,   0 }, { 360,   7, 260 }, // io -> io_Latn_001
+    { 361,   0,   0 }, { 361,   7, 260 }, // jbo -> jbo_Latn_001
+    { 362,   0,   0 }, { 362,   7, 106 }, // scn -> scn_Latn_IT
+    { 363,   0,   0 }, { 363,   1, 102 }, // sdh -> sdh_Arab_IR
+    { 364,   0,   0 }, { 364,   1, 163 }, // bgn -> bgn_Arab_PK
+    { 365,   0,   0 }, { 365,   7, 170 }, // ceb -> ceb_Latn_PH
+    { 366,   0,   0 }, { 366,   2, 178 }, // myv -> myv_Cyrl_RU
+    { 367,   0,   0 }, { 367,   7, 225 }, // cic -> cic_Latn_US
+    { 368,   0,   0 }, { 368,   7, 225 }, // mus -> mus_Latn_US
+    { 369,   0,   0 }, { 369,   7, 172 }  // szl -> szl_Latn_PL
 };
 
 static const quint16 locale_index[] = {
@@ -6393,6 +6393,379 @@ static const unsigned char language_code_list[] =
 "szl" // Silesian
 ;
 
+static const quint16 language_code_order[] = {
+     0, // AnyLanguage
+     1, // C
+     4, // Afar
+     2, // Abkhazian
+   255, // Avestan
+     5, // Afrikaans
+   237, // Aghem
+   340, // Ahom
+   146, // Akan
+   262, // Akkadian
+     7, // Amharic
+   261, // Aragonese
+     8, // Arabic
+   265, // Aramaic
+   315, // Mapuche
+    10, // Assamese
+   205, // Asu
+   341, // American Sign Language
+   256, // Asturian
+   216, // Avaric
+    11, // Aymara
+    12, // Azerbaijani
+    13, // Bashkir
+   266, // Balinese
+   238, // Basaa
+   267, // Bamun
+   268, // Batak Toba
+    22, // Belarusian
+   195, // Bemba
+   186, // Bena
+    20, // Bulgarian
+   364, // Western Balochi
+    17, // Bihari
+   343, // Bhojpuri
+    18, // Bislama
+   270, // Buhid
+   309, // Tai Dam
+   188, // Bambara
+    15, // Bengali
+   121, // Tibetan
+    19, // Breton
+   215, // Bodo
+   142, // Bosnian
+   336, // Bassa
+   312, // Akoose
+   269, // Buginese
+   152, // Blin
+    24, // Catalan
+   156, // Atsam
+   272, // Chakma
+   218, // Chechen
+   365, // Cebuano
+   211, // Chiga
+   217, // Chamorro
+   190, // Cherokee
+   367, // Chickasaw
+   276, // Eastern Cham
+   316, // Central Kurdish
+    26, // Corsican
+   274, // Coptic
+   221, // Cree
+    28, // Czech
+   338, // Tedim Chin
+   219, // Church
+   220, // Chuvash
+   134, // Welsh
+    29, // Danish
+   176, // Taita
+    42, // German
+   239, // Zarma
+   275, // Dogri
+   317, // Lower Sorbian
+   240, // Duala
+   143, // Divehi
+   241, // Jola Fonyi
+    16, // Dzongkha
+   189, // Embu
+   161, // Ewe
+   263, // Ancient Egyptian
+   277, // Eastern Kayah
+    43, // Greek
+    31, // English
+    32, // Esperanto
+   111, // Spanish
+    33, // Estonian
+   278, // Etruscan
+    14, // Basque
+   242, // Ewondo
+    89, // Persian
+   177, // Fulah
+    36, // Finnish
+   166, // Filipino
+    35, // Fijian
+    34, // Faroese
+    37, // French
+   159, // Friulian
+    38, // Western Frisian
+    57, // Irish
+   148, // Ga
+    39, // Gaelic
+   153, // Geez
+    40, // Galician
+    45, // Guarani
+   279, // Gothic
+   264, // Ancient Greek
+   167, // Swiss German
+    46, // Gujarati
+   175, // Gusii
+   144, // Manx
+    47, // Hausa
+   163, // Hawaiian
+    48, // Hebrew
+    49, // Hindi
+   344, // Hieroglyphic Luwian
+   282, // Large Flowery Miao
+   333, // Hmong Njua
+   280, // Hanunoo
+   224, // Hiri Motu
+   334, // Ho
+    27, // Croatian
+   318, // Upper Sorbian
+   222, // Haitian
+    50, // Hungarian
+     9, // Armenian
+   223, // Herero
+    53, // Interlingua
+    52, // Indonesian
+    54, // Interlingue
+   149, // Igbo
+   168, // Sichuan Yi
+    56, // Inupiak
+   281, // Ingush
+   360, // Ido
+    51, // Icelandic
+    58, // Italian
+    55, // Inuktitut
+    59, // Japanese
+   361, // Lojban
+   257, // Ngomba
+   200, // Machame
+    60, // Javanese
+    41, // Georgian
+   184, // Kabyle
+   158, // Jju
+   150, // Kamba
+   164, // Tyap
+   192, // Makonde
+   196, // Kabuverdianu
+   319, // Kenyang
+   154, // Koro
+   227, // Kongo
+   286, // Lu
+   208, // Koyra Chiini
+   178, // Kikuyu
+   228, // Kwanyama
+    63, // Kazakh
+   258, // Kako
+    44, // Greenlandic
+   198, // Kalenjin
+    23, // Khmer
+    61, // Kannada
+    66, // Korean
+   147, // Konkani
+   169, // Kpelle
+   225, // Kanuri
+    62, // Kashmiri
+   214, // Shambala
+   243, // Bafia
+   201, // Colognian
+    67, // Kurdish
+   226, // Komi
+   145, // Cornish
+    65, // Kirghiz
+    70, // Latin
+   332, // Linear A
+   193, // Langi
+   231, // Luxembourgish
+   283, // Lepcha
+   335, // Lezghian
+   194, // Ganda
+   229, // Limburgish
+   284, // Limbu
+   285, // Lisu
+   313, // Lakota
+    72, // Lingala
+    69, // Lao
+   349, // Northern Luri
+    73, // Lithuanian
+   230, // Luba Katanga
+   210, // Luo
+   204, // Luyia
+    71, // Latvian
+   345, // Literary Chinese
+   339, // Maithili
+   289, // Mandingo
+   202, // Masai
+   330, // Mende
+   197, // Meru
+   191, // Morisyen
+    75, // Malagasy
+   244, // Makhuwa Meetto
+   259, // Meta
+    81, // Marshallese
+    79, // Maori
+   356, // Uncoded Languages
+    74, // Macedonian
+    77, // Malayalam
+    82, // Mongolian
+   290, // Manipuri
+   320, // Mohawk
+    80, // Marathi
+   347, // Mru
+   337, // Mono
+    76, // Malay
+    78, // Maltese
+   245, // Mundang
+   368, // Muscogee
+    21, // Burmese
+   366, // Erzya
+   273, // Classical Mandaic
+   346, // Mazanderani
+    83, // Nauru
+   199, // Nama
+    85, // Norwegian Bokmal
+   181, // North Ndebele
+   170, // Low German
+    84, // Nepali
+   348, // Newari
+   233, // Ndonga
+    30, // Dutch
+   246, // Kwasio
+   141, // Norwegian Nynorsk
+   260, // Ngiemboon
+   292, // Northern Thai
+   294, // Old Norse
+   321, // Nko
+   171, // South Ndebele
+   172, // Northern Sotho
+   247, // Nuer
+   232, // Navaho
+   165, // Nyanja
+   185, // Nyankole
+    86, // Occitan
+   234, // Ojibwa
+     3, // Oromo
+    87, // Oriya
+   101, // Ossetic
+   358, // Osage
+   296, // Old Turkish
+    92, // Punjabi
+   297, // Pahlavi
+   351, // Papiamento
+   350, // Palauan
+   295, // Old Persian
+   299, // Phoenician
+   235, // Pali
+   342, // Ardhamagadhi Prakrit
+    90, // Polish
+   300, // Prakrit Language
+   322, // Prussian
+    88, // Pashto
+    91, // Portuguese
+    93, // Quechua
+   323, // Kiche
+   301, // Rejang
+    94, // Romansh
+    68, // Rundi
+    95, // Romanian
+   182, // Rombo
+    96, // Russian
+    64, // Kinyarwanda
+   209, // Rwa
+    99, // Sanskrit
+   248, // Sakha
+   179, // Samburu
+   304, // Santali
+   305, // Saurashtra
+   249, // Sangu
+   115, // Sardinian
+   362, // Sicilian
+   105, // Sindhi
+   363, // Southern Kurdish
+   173, // Northern Sami
+   180, // Sena
+   213, // Koyraboro Senni
+    98, // Sango
+   293, // Old Irish
+   183, // Tachelhit
+   106, // Sinhala
+   155, // Sidamo
+   108, // Slovak
+   352, // Saraiki
+   109, // Slovenian
+    97, // Samoan
+   324, // Southern Sami
+   325, // Lule Sami
+   326, // Inari Sami
+   303, // Samaritan
+   327, // Skolt Sami
+   104, // Shona
+   110, // Somali
+     6, // Albanian
+   100, // Serbian
+   306, // Sora
+   107, // Swati
+   207, // Saho
+   102, // Southern Sotho
+   112, // Sundanese
+   114, // Swedish
+   113, // Swahili
+   250, // Congo Swahili
+   307, // Sylheti
+   151, // Syriac
+   369, // Silesian
+   117, // Tamil
+   308, // Tagbanwa
+   310, // Tai Nua
+   119, // Telugu
+   206, // Teso
+   116, // Tajik
+   120, // Thai
+   122, // Tigrinya
+   157, // Tigre
+   126, // Turkmen
+   353, // Tokelau
+   103, // Tswana
+   123, // Tongan
+   354, // Tok Pisin
+   125, // Turkish
+   174, // Taroko
+   124, // Tsonga
+   118, // Tatar
+   355, // Tuvalu
+   251, // Tasawaq
+   359, // Tangut
+   127, // Tahitian
+   212, // Central Morocco Tamazight
+   128, // Uighur
+   311, // Ugaritic
+   129, // Ukrainian
+   130, // Urdu
+   131, // Uzbek
+   252, // Vai
+   160, // Venda
+   132, // Vietnamese
+   133, // Volapuk
+   187, // Vunjo
+   236, // Walloon
+   253, // Walser
+   162, // Walamo
+   328, // Warlpiri
+   135, // Wolof
+   271, // Carian
+   136, // Xhosa
+   287, // Lycian
+   288, // Lydian
+   329, // Manichaean Middle Persian
+   291, // Meroitic
+   331, // Ancient North Arabian
+   203, // Soga
+   298, // Parthian
+   302, // Sabaean
+   254, // Yangben
+   137, // Yiddish
+   138, // Yoruba
+   357, // Cantonese
+   139, // Zhuang
+   314, // Standard Moroccan Tamazight
+    25, // Chinese
+   140, // Zulu
+};
+
 static const unsigned char script_code_list[] =
 "Zzzz" // AnyScript
 "Arab" // Arabic
@@ -6538,6 +6911,151 @@ static const unsigned char script_code_list[] =
 "Jamo" // Jamo
 ;
 
+static const quint16 script_code_order[] = {
+   134, // Adlam
+   105, // Caucasian Albanian
+   128, // Ahom
+     1, // Arabic
+    57, // Imperial Aramaic
+    10, // Armenian
+    36, // Avestan
+    37, // Balinese
+    38, // Bamum
+   106, // Bassa Vah
+    39, // Batak
+    11, // Bengali
+   135, // Bhaiksuki
+    40, // Bopomofo
+    41, // Brahmi
+   103, // Braille
+    42, // Buginese
+    43, // Buhid
+    46, // Chakma
+    44, // Canadian Aboriginal
+    45, // Carian
+    47, // Cham
+    12, // Cherokee
+    48, // Coptic
+    49, // Cypriot
+     2, // Cyrillic
+    13, // Devanagari
+     3, // Deseret
+   107, // Duployan
+    50, // Egyptian Hieroglyphs
+   108, // Elbasan
+    14, // Ethiopic
+    15, // Georgian
+    52, // Glagolitic
+    53, // Gothic
+   109, // Grantha
+    16, // Greek
+    17, // Gujarati
+     4, // Gurmukhi
+   140, // Han with Bopomofo
+    55, // Hangul
+    54, // Han
+    56, // Hanunoo
+     5, // Simplified Han
+     6, // Traditional Han
+   130, // Hatran
+    18, // Hebrew
+   104, // Hiragana
+   129, // Anatolian Hieroglyphs
+   110, // Pahawh Hmong
+   132, // Old Hungarian
+    79, // Old Italic
+   141, // Jamo
+    60, // Javanese
+    19, // Japanese
+    63, // Kayah Li
+    62, // Katakana
+    64, // Kharoshthi
+    20, // Khmer
+   111, // Khojki
+    21, // Kannada
+    22, // Korean
+    61, // Kaithi
+    65, // Lanna
+    23, // Lao
+     7, // Latin
+    66, // Lepcha
+    67, // Limbu
+   112, // Linear A
+    68, // Linear B
+    51, // Fraser
+    69, // Lycian
+    70, // Lydian
+   113, // Mahajani
+    71, // Mandaean
+   114, // Manichaean
+   136, // Marchen
+   115, // Mende Kikakui
+    74, // Meroitic Cursive
+    73, // Meroitic
+    24, // Malayalam
+   116, // Modi
+     8, // Mongolian
+   117, // Mro
+    72, // Meitei Mayek
+   131, // Multani
+    25, // Myanmar
+   118, // Old North Arabian
+   119, // Nabataean
+   137, // Newa
+    75, // Nko
+    77, // Ogham
+    78, // Ol Chiki
+    82, // Orkhon
+    26, // Oriya
+   138, // Osage
+    83, // Osmanya
+   120, // Palmyrene
+   121, // Pau Cin Hau
+   122, // Old Permic
+    84, // Phags Pa
+    58, // Inscriptional Pahlavi
+   123, // Psalter Pahlavi
+    85, // Phoenician
+    86, // Pollard Phonetic
+    59, // Inscriptional Parthian
+    87, // Rejang
+    88, // Runic
+    89, // Samaritan
+    81, // Old South Arabian
+    90, // Saurashtra
+   133, // Sign Writing
+    92, // Shavian
+    91, // Sharada
+   124, // Siddham
+   125, // Khudawadi
+    32, // Sinhala
+    93, // Sora Sompeng
+    95, // Sundanese
+    96, // Syloti Nagri
+    33, // Syriac
+    98, // Tagbanwa
+   101, // Takri
+    99, // Tai Le
+    76, // New Tai Lue
+    27, // Tamil
+   139, // Tangut
+   100, // Tai Viet
+    28, // Telugu
+     9, // Tifinagh
+    97, // Tagalog
+    29, // Thaana
+    30, // Thai
+    31, // Tibetan
+   126, // Tirhuta
+   102, // Ugaritic
+    35, // Vai
+   127, // Varang Kshiti
+    80, // Old Persian
+    94, // Cuneiform
+    34, // Yi
+     0, // AnyScript
+};
+
 static const unsigned char country_code_list[] =
 "ZZ\0" // AnyCountry
 "AF\0" // Afghanistan
@@ -6803,6 +7321,271 @@ static const unsigned char country_code_list[] =
 "150" // Europe
 ;
 
+static const quint16 country_code_order[] = {
+   260, // World
+   261, // Europe
+   246, // Latin America
+   247, // Ascension Island
+     5, // Andorra
+   223, // United Arab Emirates
+     1, // Afghanistan
+     9, // Antigua And Barbuda
+     7, // Anguilla
+     2, // Albania
+    11, // Armenia
+     6, // Angola
+     8, // Antarctica
+    10, // Argentina
+     4, // American Samoa
+    14, // Austria
+    13, // Australia
+    12, // Aruba
+   248, // Aland Islands
+    15, // Azerbaijan
+    27, // Bosnia And Herzegowina
+    19, // Barbados
+    18, // Bangladesh
+    21, // Belgium
+    34, // Burkina Faso
+    33, // Bulgaria
+    17, // Bahrain
+    35, // Burundi
+    23, // Benin
+   244, // Saint Barthelemy
+    24, // Bermuda
+    32, // Brunei
+    26, // Bolivia
+   255, // Bonaire
+    30, // Brazil
+    16, // Bahamas
+    25, // Bhutan
+    29, // Bouvet Island
+    28, // Botswana
+    20, // Belarus
+    22, // Belize
+    38, // Canada
+    46, // Cocos Islands
+    49, // Congo Kinshasa
+    41, // Central African Republic
+    50, // Congo Brazzaville
+   206, // Switzerland
+    53, // Ivory Coast
+    51, // Cook Islands
+    43, // Chile
+    37, // Cameroon
+    44, // China
+    47, // Colombia
+   241, // Clipperton Island
+    52, // Costa Rica
+    55, // Cuba
+    39, // Cape Verde
+   152, // Cura Sao
+    45, // Christmas Island
+    56, // Cyprus
+    57, // Czech Republic
+    82, // Germany
+   249, // Diego Garcia
+    59, // Djibouti
+    58, // Denmark
+    60, // Dominica
+    61, // Dominican Republic
+     3, // Algeria
+   250, // Ceuta And Melilla
+    63, // Ecuador
+    68, // Estonia
+    64, // Egypt
+   236, // Western Sahara
+    67, // Eritrea
+   197, // Spain
+    69, // Ethiopia
+   258, // European Union
+    73, // Finland
+    72, // Fiji
+    70, // Falkland Islands
+   140, // Micronesia
+    71, // Faroe Islands
+    74, // France
+    79, // Gabon
+   224, // United Kingdom
+    87, // Grenada
+    81, // Georgia
+    76, // French Guiana
+    75, // Guernsey
+    83, // Ghana
+    84, // Gibraltar
+    86, // Greenland
+    80, // Gambia
+    91, // Guinea
+    88, // Guadeloupe
+    66, // Equatorial Guinea
+    85, // Greece
+   196, // South Georgia And The South Sandwich Islands
+    90, // Guatemala
+    89, // Guam
+    92, // Guinea Bissau
+    93, // Guyana
+    97, // Hong Kong
+    95, // Heard And McDonald Islands
+    96, // Honduras
+    54, // Croatia
+    94, // Haiti
+    98, // Hungary
+   238, // Canary Islands
+   101, // Indonesia
+   104, // Ireland
+   105, // Israel
+   251, // Isle Of Man
+   100, // India
+    31, // British Indian Ocean Territory
+   103, // Iraq
+   102, // Iran
+    99, // Iceland
+   106, // Italy
+   252, // Jersey
+   107, // Jamaica
+   109, // Jordan
+   108, // Japan
+   111, // Kenya
+   116, // Kyrgyzstan
+    36, // Cambodia
+   112, // Kiribati
+    48, // Comoros
+   180, // Saint Kitts And Nevis
+   113, // North Korea
+   114, // South Korea
+   115, // Kuwait
+    40, // Cayman Islands
+   110, // Kazakhstan
+   117, // Laos
+   119, // Lebanon
+   181, // Saint Lucia
+   123, // Liechtenstein
+   198, // Sri Lanka
+   121, // Liberia
+   120, // Lesotho
+   124, // Lithuania
+   125, // Luxembourg
+   118, // Latvia
+   122, // Libya
+   145, // Morocco
+   142, // Monaco
+   141, // Moldova
+   242, // Montenegro
+   245, // Saint Martin
+   128, // Madagascar
+   134, // Marshall Islands
+   127, // Macedonia
+   132, // Mali
+   147, // Myanmar
+   143, // Mongolia
+   126, // Macau
+   160, // Northern Mariana Islands
+   135, // Martinique
+   136, // Mauritania
+   144, // Montserrat
+   133, // Malta
+   137, // Mauritius
+   131, // Maldives
+   129, // Malawi
+   139, // Mexico
+   130, // Malaysia
+   146, // Mozambique
+   148, // Namibia
+   153, // New Caledonia
+   156, // Niger
+   159, // Norfolk Island
+   157, // Nigeria
+   155, // Nicaragua
+   151, // Netherlands
+   161, // Norway
+   150, // Nepal
+   149, // Nauru
+   158, // Niue
+   154, // New Zealand
+   162, // Oman
+   166, // Panama
+   169, // Peru
+    77, // French Polynesia
+   167, // Papua New Guinea
+   170, // Philippines
+   163, // Pakistan
+   172, // Poland
+   200, // Saint Pierre And Miquelon
+   171, // Pitcairn
+   174, // Puerto Rico
+   165, // Palestinian Territories
+   173, // Portugal
+   164, // Palau
+   168, // Paraguay
+   175, // Qatar
+   259, // Outlying Oceania
+   176, // Reunion
+   177, // Romania
+   243, // Serbia
+   178, // Russia
+   179, // Rwanda
+   186, // Saudi Arabia
+   193, // Solomon Islands
+   188, // Seychelles
+   201, // Sudan
+   205, // Sweden
+   190, // Singapore
+   199, // Saint Helena
+   192, // Slovenia
+   203, // Svalbard And Jan Mayen Islands
+   191, // Slovakia
+   189, // Sierra Leone
+   184, // San Marino
+   187, // Senegal
+   194, // Somalia
+   202, // Suriname
+   254, // South Sudan
+   185, // Sao Tome And Principe
+    65, // El Salvador
+   256, // Sint Maarten
+   207, // Syria
+   204, // Swaziland
+   253, // Tristan Da Cunha
+   219, // Turks And Caicos Islands
+    42, // Chad
+    78, // French Southern Territories
+   212, // Togo
+   211, // Thailand
+   209, // Tajikistan
+   213, // Tokelau
+    62, // East Timor
+   218, // Turkmenistan
+   216, // Tunisia
+   214, // Tonga
+   217, // Turkey
+   215, // Trinidad And Tobago
+   220, // Tuvalu
+   208, // Taiwan
+   210, // Tanzania
+   222, // Ukraine
+   221, // Uganda
+   226, // United States Minor Outlying Islands
+   225, // United States
+   227, // Uruguay
+   228, // Uzbekistan
+   230, // Vatican City State
+   182, // Saint Vincent And The Grenadines
+   231, // Venezuela
+   233, // British Virgin Islands
+   234, // United States Virgin Islands
+   232, // Vietnam
+   229, // Vanuatu
+   235, // Wallis And Futuna Islands
+   183, // Samoa
+   257, // Kosovo
+   237, // Yemen
+   138, // Mayotte
+   195, // South Africa
+   239, // Zambia
+   240, // Zimbabwe
+     0, // AnyCountry
+};
+
 // GENERATED PART ENDS HERE
 
 QT_END_NAMESPACE
@@ -152,6 +152,8 @@ private slots:
     void numberGroupingIndia();
     void numberFormatChakma();
 
+    void codeToEnum();
+
     // *** ORDER-DEPENDENCY *** (This Is Bad.)
     // Test order is determined by order of declaration here: *all* tests that
     // QLocale::setDefault() *must* appear *after* all other tests !
@@ -2321,6 +2323,29 @@ void tst_QLocale::testNames()
     }
 }
 
+void tst_QLocale::codeToEnum()
+{
+    // Each code must be found by binary search of its *_code_order table:
+    for (int i = QLocale::C + 1; i <= QLocale::LastLanguage; ++i) {
+        const auto language = QLocale::Language(i);
+        const QString code = QLocalePrivate::languageToCode(language);
+        QCOMPARE(QLocalePrivate::codeToLanguage(code), language);
+    }
+    for (int i = QLocale::AnyScript + 1; i <= QLocale::LastScript; ++i) {
+        const auto script = QLocale::Script(i);
+        const QString code = QLocalePrivate::scriptToCode(script);
+        QCOMPARE(QLocalePrivate::codeToScript(code), script);
+    }
+    for (int i = QLocale::AnyCountry + 1; i <= QLocale::LastCountry; ++i) {
+        const auto country = QLocale::Country(i);
+        const QString code = QLocalePrivate::countryToCode(country);
+        QCOMPARE(QLocalePrivate::codeToCountry(code), country);
+    }
+    QCOMPARE(QLocalePrivate::codeToLanguage(u"xx"), QLocale::C);
+    QCOMPARE(QLocalePrivate::codeToScript(u"Xxxx"), QLocale::AnyScript);
+    QCOMPARE(QLocalePrivate::codeToCountry(u"XX"), QLocale::AnyCountry);
+}
+
 void tst_QLocale::dayName_data()
 {
     QTest::addColumn<QString>("locale_name");
@@ -66,6 +66,7 @@ from typing import (
     FrozenSet,
     Tuple,
     Match,
+    Pattern,
     Type,
 )
 
@@ -393,18 +394,21 @@ def get_cmake_api_call(api_name: str, api_version: Optional[int] = None) -> str:
     return cmake_api_calls[api_version][api_name]
 
 
-def process_qrc_file(
-    target: str,
-    scope: Scope,
-    filepath: str,
-    base_dir: str = "",
-    project_file_path: str = "",
-    skip_qtquick_compiler: bool = False,
-    retain_qtquick_compiler: bool = False,
-    is_example: bool = False,
-) -> str:
-    assert target
+class QrcResource:
+    def __init__(self, lang: str, prefix: str, files: List[Tuple[str, str]]) -> None:
+        self.lang = lang
+        self.prefix = prefix
+        # List of (path, alias) tuples, in the order of the .qrc file.
+        self.files = files
+
+
+# Parsed .qrc files keyed by absolute path and modification time. Tests
+# and examples share .qrc files, so this avoids parsing them repeatedly
+# during one run.
+_qrc_file_cache: Dict[Tuple[str, float], List[QrcResource]] = {}
+
 
+def resolve_qrc_file_path(filepath: str, project_file_path: str = "") -> str:
     # Hack to handle QT_SOURCE_TREE. Assume currently that it's the same
     # as the qtbase source path.
     qt_source_tree_literal = "${QT_SOURCE_TREE}"
@@ -419,24 +423,20 @@ def process_qrc_file(
                 f"Warning, could not determine QT_SOURCE_TREE location while trying "
                 f"to find: {filepath}"
             )
+    return filepath
 
-    resource_name = os.path.splitext(os.path.basename(filepath))[0]
-    dir_name = os.path.dirname(filepath)
-    base_dir = posixpath.join("" if base_dir == "." else base_dir, dir_name)
 
-    # Small not very thorough check to see if this a shared qrc resource
-    # pattern is mostly used by the tests.
-    is_parent_path = dir_name.startswith("..")
-    if not os.path.isfile(filepath):
-        raise RuntimeError(f"Invalid file path given to process_qrc_file: {filepath}")
+def parse_qrc_file(filepath: str) -> List[QrcResource]:
+    cache_key = (os.path.abspath(filepath), os.path.getmtime(filepath))
+    resources = _qrc_file_cache.get(cache_key)
+    if resources is not None:
+        return resources
 
     tree = ET.parse(filepath)
     root = tree.getroot()
     assert root.tag == "RCC"
 
-    output = ""
-
-    resource_count = 0
+    resources = []
     for resource in root:
         assert resource.tag == "qresource"
         lang = resource.get("lang", "")
@@ -444,15 +444,48 @@ def process_qrc_file(
         if not prefix.startswith("/"):
             prefix = f"/{prefix}"
 
-        full_resource_name = resource_name + (str(resource_count) if resource_count > 0 else "")
-
-        files: Dict[str, str] = {}
+        files: List[Tuple[str, str]] = []
         for file in resource:
             path = file.text
             assert path
+            files.append((path, file.get("alias", "")))
+        resources.append(QrcResource(lang, prefix, files))
+
+    _qrc_file_cache[cache_key] = resources
+    return resources
 
-            # Get alias:
-            alias = file.get("alias", "")
+
+def process_qrc_file(
+    target: str,
+    scope: Scope,
+    filepath: str,
+    base_dir: str = "",
+    project_file_path: str = "",
+    skip_qtquick_compiler: bool = False,
+    retain_qtquick_compiler: bool = False,
+    is_example: bool = False,
+) -> str:
+    assert target
+
+    filepath = resolve_qrc_file_path(filepath, project_file_path)
+
+    resource_name = os.path.splitext(os.path.basename(filepath))[0]
+    dir_name = os.path.dirname(filepath)
+    base_dir = posixpath.join("" if base_dir == "." else base_dir, dir_name)
+
+    # Small not very thorough check to see if this a shared qrc resource
+    # pattern is mostly used by the tests.
+    is_parent_path = dir_name.startswith("..")
+    if not os.path.isfile(filepath):
+        raise RuntimeError(f"Invalid file path given to process_qrc_file: {filepath}")
+
+    output = []
+
+    for resource_count, resource in enumerate(parse_qrc_file(filepath)):
+        full_resource_name = resource_name + (str(resource_count) if resource_count > 0 else "")
+
+        files: Dict[str, str] = {}
+        for path, alias in resource.files:
             # In cases where examples use shared resources, we set the alias
             # too the same name of the file, or the applications won't be
             # be able to locate the resource
@@ -460,21 +493,22 @@ def process_qrc_file(
                 alias = path
             files[path] = alias
 
-        output += write_add_qt_resource_call(
-            target,
-            scope,
-            full_resource_name,
-            prefix,
-            base_dir,
-            lang,
-            files,
-            skip_qtquick_compiler,
-            retain_qtquick_compiler,
-            is_example,
+        output.append(
+            write_add_qt_resource_call(
+                target,
+                scope,
+                full_resource_name,
+                resource.prefix,
+                base_dir,
+                resource.lang,
+                files,
+                skip_qtquick_compiler,
+                retain_qtquick_compiler,
+                is_example,
+            )
         )
-        resource_count += 1
 
-    return output
+    return "".join(output)
 
 
 def write_add_qt_resource_call(
@@ -489,7 +523,7 @@ def write_add_qt_resource_call(
     retain_qtquick_compiler: bool,
     is_example: bool,
 ) -> str:
-    output = ""
+    output = []
 
     sorted_files = sorted(files.keys())
 
@@ -499,40 +533,26 @@ def write_add_qt_resource_call(
         alias = files[source]
         if alias:
             full_source = posixpath.join(base_dir, source)
-            output += dedent(
-                f"""\
-                set_source_files_properties("{full_source}"
-                    PROPERTIES QT_RESOURCE_ALIAS "{alias}"
-                )
-            """
+            output.append(
+                f'set_source_files_properties("{full_source}"\n'
+                f'    PROPERTIES QT_RESOURCE_ALIAS "{alias}"\n'
+                ")\n"
             )
 
     # Quote file paths in case there are spaces.
-    sorted_files_backup = sorted_files
-    sorted_files = []
-    for source in sorted_files_backup:
-        if source.startswith("${"):
-            sorted_files.append(source)
-        else:
-            sorted_files.append(f'"{source}"')
+    quoted_files = [source if source.startswith("${") else f'"{source}"' for source in sorted_files]
 
-    file_list = "\n            ".join(sorted_files)
-    output += dedent(
-        f"""\
-        set({resource_name}_resource_files
-            {file_list}
-        )\n
-        """
-    )
+    file_list = "\n    ".join(quoted_files)
+    output.append(f"set({resource_name}_resource_files\n    {file_list}\n)\n\n")
     file_list = f"${{{resource_name}_resource_files}}"
     if skip_qtquick_compiler:
-        output += (
+        output.append(
             f"set_source_files_properties(${{{resource_name}_resource_files}}"
             " PROPERTIES QT_SKIP_QUICKCOMPILER 1)\n\n"
         )
 
     if retain_qtquick_compiler:
-        output += (
+        output.append(
             f"set_source_files_properties(${{{resource_name}_resource_files}}"
             "PROPERTIES QT_RETAIN_QUICKCOMPILER 1)\n\n"
         )
@@ -554,12 +574,12 @@ def write_add_qt_resource_call(
         add_resource_command = "qt6_add_resources"
     else:
         add_resource_command = get_cmake_api_call("qt_add_resource")
-    output += (
+    output.append(
         f'{add_resource_command}({target} "{resource_name}"\n{params}{spaces(1)}FILES\n'
         f"{spaces(2)}{file_list}\n)\n"
     )
 
-    return output
+    return "".join(output)
 
 
 class QmlDirFileInfo:
@@ -730,12 +750,20 @@ def handle_vpath(source: str, base_dir: str, vpath: List[str]) -> str:
     return f"{source}-NOTFOUND"
 
 
+def _intern_value(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class Operation:
+    __slots__ = ("_value", "_line_no")
+
     def __init__(self, value: Union[List[str], str], line_no: int = -1) -> None:
+        # Values (mostly file names) repeat a lot across projects, so
+        # share the string objects.
         if isinstance(value, list):
-            self._value = value
+            self._value = [_intern_value(v) for v in value]
         else:
-            self._value = [str(value)]
+            self._value = [sys.intern(str(value))]
         self._line_no = line_no
 
     def process(
@@ -743,14 +771,30 @@ class Operation:
     ) -> List[str]:
         assert False
 
+    def remove_values(self, values: Set[str]) -> Set[str]:
+        """
+        Removes all occurrences of the given values from the operation in
+        a single pass, keeping the order of the remaining values.
+
+        Returns the subset of values that were found and removed.
+        """
+        assert not isinstance(self._value, tuple), "Cannot remove values from a frozen operation."
+        removed = values.intersection(self._value)
+        if removed:
+            self._value = [v for v in self._value if v not in removed]
+        return removed
+
     def __repr__(self):
         assert False
 
+    def freeze(self) -> None:
+        self._value = tuple(self._value)
+
     def _dump(self):
         if not self._value:
             return "<NOTHING>"
 
-        if not isinstance(self._value, list):
+        if not isinstance(self._value, (list, tuple)):
             return "<NOT A LIST>"
 
         result = []
@@ -763,22 +807,28 @@ class Operation:
 
 
 class AddOperation(Operation):
+    __slots__ = ()
+
     def process(
         self, key: str, sinput: List[str], transformer: Callable[[List[str]], List[str]]
     ) -> List[str]:
-        return sinput + transformer(self._value)
+        return sinput + list(transformer(self._value))
 
     def __repr__(self):
         return f"+({self._dump()})"
 
 
 class UniqueAddOperation(Operation):
+    __slots__ = ()
+
     def process(
         self, key: str, sinput: List[str], transformer: Callable[[List[str]], List[str]]
     ) -> List[str]:
         result = sinput
+        seen = set(result)
         for v in transformer(self._value):
-            if v not in result:
+            if v not in seen:
+                seen.add(v)
                 result.append(v)
         return result
 
@@ -787,6 +837,8 @@ class UniqueAddOperation(Operation):
 
 
 class ReplaceOperation(Operation):
+    __slots__ = ()
+
     def process(
         self, key: str, sinput: List[str], transformer: Callable[[List[str]], List[str]]
     ) -> List[str]:
@@ -820,6 +872,8 @@ class ReplaceOperation(Operation):
 
 
 class SetOperation(Operation):
+    __slots__ = ()
+
     def process(
         self, key: str, sinput: List[str], transformer: Callable[[List[str]], List[str]]
     ) -> List[str]:
@@ -840,6 +894,8 @@ class SetOperation(Operation):
 
 
 class RemoveOperation(Operation):
+    __slots__ = ()
+
     def process(
         self, key: str, sinput: List[str], transformer: Callable[[List[str]], List[str]]
     ) -> List[str]:
@@ -895,6 +951,27 @@ class Scope(object):
 
     SCOPE_ID: int = 1
 
+    # Many scopes are kept alive at once when analyzing a whole
+    # repository, so avoid a per-instance __dict__.
+    __slots__ = (
+        "_operations",
+        "_parent",
+        "_basedir",
+        "_currentdir",
+        "_scope_id",
+        "_file",
+        "_file_absolute_path",
+        "_condition",
+        "_children",
+        "_included_children",
+        "_visited_keys",
+        "_total_condition",
+        "_parent_include_line_no",
+        "_is_public_module",
+        "_has_private_module",
+        "_frozen",
+    )
+
     def __init__(
         self,
         *,
@@ -913,6 +990,7 @@ class Scope(object):
             }
 
         self._operations: Dict[str, List[Operation]] = copy.deepcopy(operations)
+        self._frozen = False
         if parent_scope:
             parent_scope._add_child(self)
         else:
@@ -922,17 +1000,17 @@ class Scope(object):
             if not base_dir:
                 self._operations["QT"] = [SetOperation(["core", "gui"])]
 
-        self._basedir = base_dir
+        self._basedir = sys.intern(base_dir)
         if qmake_file:
-            self._currentdir = os.path.dirname(qmake_file) or "."
+            self._currentdir = sys.intern(os.path.dirname(qmake_file) or ".")
         if not self._basedir:
             self._basedir = self._currentdir
 
         self._scope_id = Scope.SCOPE_ID
         Scope.SCOPE_ID += 1
-        self._file = qmake_file
-        self._file_absolute_path = os.path.abspath(qmake_file)
-        self._condition = map_condition(condition)
+        self._file = sys.intern(qmake_file)
+        self._file_absolute_path = sys.intern(os.path.abspath(qmake_file))
+        self._condition = sys.intern(map_condition(condition))
         self._children = []  # type: List[Scope]
         self._included_children = []  # type: List[Scope]
         self._visited_keys = set()  # type: Set[str]
@@ -952,8 +1030,33 @@ class Scope(object):
 
     def merge(self, other: "Scope") -> None:
         assert self != other
+        assert not self._frozen, "Cannot merge into a frozen scope."
         self._included_children.append(other)
 
+    def freeze(self) -> None:
+        """
+        Makes the scope tree read-only: operation values, operation lists
+        and child lists are turned into tuples, which need less memory.
+        The scope can still be evaluated, but not modified anymore.
+        """
+        if self._frozen:
+            return
+        self._frozen = True
+        for key, ops in self._operations.items():
+            for op in ops:
+                op.freeze()
+            self._operations[key] = tuple(ops)  # type: ignore
+        self._children = tuple(self._children)  # type: ignore
+        self._included_children = tuple(self._included_children)  # type: ignore
+        for c in self._children:
+            c.freeze()
+        for c in self._included_children:
+            c.freeze()
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
     @property
     def scope_debug(self) -> bool:
         merge = self.get_string("PRO2CMAKE_SCOPE_DEBUG").lower()
@@ -1101,6 +1204,8 @@ class Scope(object):
         return scope
 
     def _append_operation(self, key: str, op: Operation) -> None:
+        assert not self._frozen, "Cannot add operations to a frozen scope."
+        key = sys.intern(key)
         if key in self._operations:
             self._operations[key].append(op)
         else:
@@ -1137,6 +1242,7 @@ class Scope(object):
         self._total_condition = condition
 
     def _add_child(self, scope: "Scope") -> None:
+        assert not self._frozen, "Cannot add children to a frozen scope."
         scope._parent = self
         self._children.append(scope)
 
@@ -1443,6 +1549,11 @@ class Scope(object):
 # Given "if(a|b):c" returns "(a|b):c". Uses pyparsing to keep the parentheses
 # balanced.
 def unwrap_if(input_string):
+    # Running the grammar is comparatively expensive, skip it when there
+    # is nothing to unwrap.
+    if "if" not in input_string:
+        return input_string
+
     # Compute the grammar only once.
     if not hasattr(unwrap_if, "if_grammar"):
 
@@ -1467,130 +1578,159 @@ def unwrap_if(input_string):
     return output_string
 
 
-def map_condition(condition: str) -> str:
-    # Some hardcoded cases that are too bothersome to generalize.
-    condition = re.sub(
-        r"qtConfig\(opengles\.\)",
-        r"(QT_FEATURE_opengles2 OR QT_FEATURE_opengles3 OR QT_FEATURE_opengles31 OR QT_FEATURE_opengles32)",
-        condition,
-    )
-    condition = re.sub(
-        r"qtConfig\(opengl\(es1\|es2\)\?\)",
-        r"(QT_FEATURE_opengl OR QT_FEATURE_opengles2 OR QT_FEATURE_opengles3)",
-        condition,
-    )
-    condition = re.sub(r"qtConfig\(opengl\.\*\)", r"QT_FEATURE_opengl", condition)
-    condition = re.sub(r"^win\*$", r"win", condition)
-    condition = re.sub(r"^no-png$", r"NOT QT_FEATURE_png", condition)
-    condition = re.sub(r"contains\(CONFIG, static\)", r"NOT QT_BUILD_SHARED_LIBS", condition)
-    condition = re.sub(r"contains\(QT_CONFIG,\w*shared\)", r"QT_BUILD_SHARED_LIBS", condition)
-    condition = re.sub(r"CONFIG\(osx\)", r"MACOS", condition)
-
-    def gcc_version_handler(match_obj: Match):
-        operator = match_obj.group(1)
-        version_type = match_obj.group(2)
-        if operator == "equals":
-            operator = "STREQUAL"
-        elif operator == "greaterThan":
-            operator = "STRGREATER"
-        elif operator == "lessThan":
-            operator = "STRLESS"
-
-        version = match_obj.group(3)
-        return f"(QT_COMPILER_VERSION_{version_type} {operator} {version})"
+_version_comparison_operators = {
+    "equals": "STREQUAL",
+    "greaterThan": "STRGREATER",
+    "lessThan": "STRLESS",
+}
 
-    # TODO: Possibly fix for other compilers.
-    pattern = r"(equals|greaterThan|lessThan)\(QT_GCC_([A-Z]+)_VERSION,[ ]*([0-9]+)\)"
-    condition = re.sub(pattern, gcc_version_handler, condition)
+_generic_version_comparison_operators = {
+    "equals": "EQUAL",
+    "greaterThan": "GREATER",
+    "lessThan": "LESS",
+}
 
-    def windows_sdk_version_handler(match_obj: Match):
-        operator = match_obj.group(1)
-        if operator == "equals":
-            operator = "STREQUAL"
-        elif operator == "greaterThan":
-            operator = "STRGREATER"
-        elif operator == "lessThan":
-            operator = "STRLESS"
 
-        version = match_obj.group(2)
-        return f"(QT_WINDOWS_SDK_VERSION {operator} {version})"
+def _gcc_version_handler(match_obj: Match) -> str:
+    operator = _version_comparison_operators[match_obj.group(1)]
+    version_type = match_obj.group(2)
+    version = match_obj.group(3)
+    return f"(QT_COMPILER_VERSION_{version_type} {operator} {version})"
 
-    pattern = r"(equals|greaterThan|lessThan)\(WINDOWS_SDK_VERSION,[ ]*([0-9]+)\)"
-    condition = re.sub(pattern, windows_sdk_version_handler, condition)
 
+def _windows_sdk_version_handler(match_obj: Match) -> str:
+    operator = _version_comparison_operators[match_obj.group(1)]
+    version = match_obj.group(2)
+    return f"(QT_WINDOWS_SDK_VERSION {operator} {version})"
+
+
+def _generic_version_handler(match_obj: Match) -> str:
+    operator = _generic_version_comparison_operators[match_obj.group(1)]
+    variable = match_obj.group(2)
+    version = match_obj.group(3)
+    return f"({variable} {operator} {version})"
+
+
+# Rewrite rules applied by map_condition, in order. Each rule sees the
+# output of the previous ones, so the order matters.
+_ConditionRules = List[Tuple[Pattern, Union[str, Callable[[Match], str]]]]
+
+_condition_rules_before_if: _ConditionRules = [
+    # Some hardcoded cases that are too bothersome to generalize.
+    (
+        re.compile(r"qtConfig\(opengles\.\)"),
+        r"(QT_FEATURE_opengles2 OR QT_FEATURE_opengles3 OR QT_FEATURE_opengles31 OR QT_FEATURE_opengles32)",
+    ),
+    (
+        re.compile(r"qtConfig\(opengl\(es1\|es2\)\?\)"),
+        r"(QT_FEATURE_opengl OR QT_FEATURE_opengles2 OR QT_FEATURE_opengles3)",
+    ),
+    (re.compile(r"qtConfig\(opengl\.\*\)"), r"QT_FEATURE_opengl"),
+    (re.compile(r"^win\*$"), r"win"),
+    (re.compile(r"^no-png$"), r"NOT QT_FEATURE_png"),
+    (re.compile(r"contains\(CONFIG, static\)"), r"NOT QT_BUILD_SHARED_LIBS"),
+    (re.compile(r"contains\(QT_CONFIG,\w*shared\)"), r"QT_BUILD_SHARED_LIBS"),
+    (re.compile(r"CONFIG\(osx\)"), r"MACOS"),
+    # TODO: Possibly fix for other compilers.
+    (
+        re.compile(r"(equals|greaterThan|lessThan)\(QT_GCC_([A-Z]+)_VERSION,[ ]*([0-9]+)\)"),
+        _gcc_version_handler,
+    ),
+    (
+        re.compile(r"(equals|greaterThan|lessThan)\(WINDOWS_SDK_VERSION,[ ]*([0-9]+)\)"),
+        _windows_sdk_version_handler,
+    ),
     # Generic lessThan|equals|lessThan()
+    (
+        re.compile(r"(equals|greaterThan|lessThan)\(([^,]+?),[ ]*([0-9]+)\)"),
+        _generic_version_handler,
+    ),
+]
+
+_condition_rules_after_if: _ConditionRules = [
+    (re.compile(r"\bisEmpty\s*\((.*?)\)"), r"\1_ISEMPTY"),
+    (
+        re.compile(r"\bcontains\s*\(\s*(?:QT_)?CONFIG\s*,\s*c\+\+(\d+)\)"),
+        r"cxx_std_\1 IN_LIST CMAKE_CXX_COMPILE_FEATURES",
+    ),
+    (re.compile(r'\bcontains\s*\((.*?),\s*"?(.*?)"?\)'), r"\1___contains___\2"),
+    (re.compile(r'\bequals\s*\((.*?),\s*"?(.*?)"?\)'), r"\1___equals___\2"),
+    (re.compile(r'\bisEqual\s*\((.*?),\s*"?(.*?)"?\)'), r"\1___equals___\2"),
+    (re.compile(r"\s*==\s*"), "___STREQUAL___"),
+    (re.compile(r"\bexists\s*\((.*?)\)"), r"EXISTS \1"),
+]
+
+# checking mkspec, predating gcc scope in qmake, will then be replaced by platform_mapping in helper.py
+_condition_mkspec_replacements = [
+    ("*-g++*", "GCC"),
+    ("*g++*", "GCC"),
+    ("aix-g++*", "AIX"),
+    ("*-icc*", "ICC"),
+    ("*-clang*", "CLANG"),
+    ("*-llvm", "CLANG"),
+    ("win32-*", "WIN32"),
+]
+
+_condition_build_type_pattern = re.compile(r"CONFIG\((debug|release),debug\|release\)")
+
+_condition_operator_replacements = [
+    ("*", "_x_"),
+    (".$$", "__ss_"),
+    ("$$", "_ss_"),
+    ("!", "NOT "),
+    ("&&", " AND "),
+    ("|", " OR "),
+]
+
+_condition_rules_final: _ConditionRules = [
+    # new conditions added by the android multi arch qmake build
+    (re.compile(r"(^| )x86((?=[^\w])|$)"), "TEST_architecture_arch STREQUAL i386"),
+    (re.compile(r"(^| )x86_64"), " TEST_architecture_arch STREQUAL x86_64"),
+    (re.compile(r"(^| )arm64-v8a"), "TEST_architecture_arch STREQUAL arm64"),
+    (re.compile(r"(^| )armeabi-v7a"), "TEST_architecture_arch STREQUAL arm"),
+    # some defines replacements
+    (re.compile(r"DEFINES___contains___QT_NO_CURSOR"), r"(NOT QT_FEATURE_cursor)"),
+    (re.compile(r"DEFINES___contains___QT_NO_TRANSLATION"), r"(NOT QT_FEATURE_translation)"),
+    (re.compile(r"styles___contains___fusion"), r"QT_FEATURE_style_fusion"),
+    (re.compile(r"CONFIG___contains___largefile"), r"QT_FEATURE_largefile"),
+]
 
-    def generic_version_handler(match_obj: Match):
-        operator = match_obj.group(1)
-        if operator == "equals":
-            operator = "EQUAL"
-        elif operator == "greaterThan":
-            operator = "GREATER"
-        elif operator == "lessThan":
-            operator = "LESS"
+_condition_feature_pattern = re.compile(r"(qtConfig|qtHaveModule)\(([a-zA-Z0-9_-]+)\)")
 
-        variable = match_obj.group(2)
-        version = match_obj.group(3)
-        return f"({variable} {operator} {version})"
 
-    pattern = r"(equals|greaterThan|lessThan)\(([^,]+?),[ ]*([0-9]+)\)"
-    condition = re.sub(pattern, generic_version_handler, condition)
+def _apply_condition_rules(condition: str, rules: _ConditionRules) -> str:
+    for pattern, replacement in rules:
+        condition = pattern.sub(replacement, condition)
+    return condition
+
+
+@lru_cache(maxsize=None)
+def map_condition(condition: str) -> str:
+    condition = _apply_condition_rules(condition, _condition_rules_before_if)
 
     # Handle if(...) conditions.
     condition = unwrap_if(condition)
 
-    condition = re.sub(r"\bisEmpty\s*\((.*?)\)", r"\1_ISEMPTY", condition)
-    condition = re.sub(
-        r"\bcontains\s*\(\s*(?:QT_)?CONFIG\s*,\s*c\+\+(\d+)\)",
-        r"cxx_std_\1 IN_LIST CMAKE_CXX_COMPILE_FEATURES",
-        condition,
-    )
-    condition = re.sub(r'\bcontains\s*\((.*?),\s*"?(.*?)"?\)', r"\1___contains___\2", condition)
-    condition = re.sub(r'\bequals\s*\((.*?),\s*"?(.*?)"?\)', r"\1___equals___\2", condition)
-    condition = re.sub(r'\bisEqual\s*\((.*?),\s*"?(.*?)"?\)', r"\1___equals___\2", condition)
-    condition = re.sub(r"\s*==\s*", "___STREQUAL___", condition)
-    condition = re.sub(r"\bexists\s*\((.*?)\)", r"EXISTS \1", condition)
-
-    # checking mkspec, predating gcc scope in qmake, will then be replaced by platform_mapping in helper.py
-    condition = condition.replace("*-g++*", "GCC")
-    condition = condition.replace("*g++*", "GCC")
-    condition = condition.replace("aix-g++*", "AIX")
-    condition = condition.replace("*-icc*", "ICC")
-    condition = condition.replace("*-clang*", "CLANG")
-    condition = condition.replace("*-llvm", "CLANG")
-    condition = condition.replace("win32-*", "WIN32")
-
-    pattern = r"CONFIG\((debug|release),debug\|release\)"
-    match_result = re.match(pattern, condition)
+    condition = _apply_condition_rules(condition, _condition_rules_after_if)
+
+    for old, new in _condition_mkspec_replacements:
+        condition = condition.replace(old, new)
+
+    match_result = _condition_build_type_pattern.match(condition)
     if match_result:
         build_type = match_result.group(1)
         if build_type == "debug":
             build_type = "Debug"
         elif build_type == "release":
             build_type = "Release"
-        condition = re.sub(pattern, f"(CMAKE_BUILD_TYPE STREQUAL {build_type})", condition)
-
-    condition = condition.replace("*", "_x_")
-    condition = condition.replace(".$$", "__ss_")
-    condition = condition.replace("$$", "_ss_")
+        condition = _condition_build_type_pattern.sub(
+            f"(CMAKE_BUILD_TYPE STREQUAL {build_type})", condition
+        )
 
-    condition = condition.replace("!", "NOT ")
-    condition = condition.replace("&&", " AND ")
-    condition = condition.replace("|", " OR ")
+    for old, new in _condition_operator_replacements:
+        condition = condition.replace(old, new)
 
-    # new conditions added by the android multi arch qmake build
-    condition = re.sub(r"(^| )x86((?=[^\w])|$)", "TEST_architecture_arch STREQUAL i386", condition)
-    condition = re.sub(r"(^| )x86_64", " TEST_architecture_arch STREQUAL x86_64", condition)
-    condition = re.sub(r"(^| )arm64-v8a", "TEST_architecture_arch STREQUAL arm64", condition)
-    condition = re.sub(r"(^| )armeabi-v7a", "TEST_architecture_arch STREQUAL arm", condition)
-
-    # some defines replacements
-    condition = re.sub(r"DEFINES___contains___QT_NO_CURSOR", r"(NOT QT_FEATURE_cursor)", condition)
-    condition = re.sub(
-        r"DEFINES___contains___QT_NO_TRANSLATION", r"(NOT QT_FEATURE_translation)", condition
-    )
-    condition = re.sub(r"styles___contains___fusion", r"QT_FEATURE_style_fusion", condition)
-    condition = re.sub(r"CONFIG___contains___largefile", r"QT_FEATURE_largefile", condition)
+    condition = _apply_condition_rules(condition, _condition_rules_final)
 
     condition = condition.replace("cross_compile", "CMAKE_CROSSCOMPILING")
 
@@ -1598,7 +1738,7 @@ def map_condition(condition: str) -> str:
     for part in condition.split():
         # some features contain e.g. linux, that should not be
         # turned upper case
-        feature = re.match(r"(qtConfig|qtHaveModule)\(([a-zA-Z0-9_-]+)\)", part)
+        feature = _condition_feature_pattern.match(part)
         if feature:
             if feature.group(1) == "qtHaveModule":
                 part = f"TARGET {map_qt_library(feature.group(2))}"
@@ -2286,8 +2426,19 @@ def map_to_cmake_condition(condition: str = "") -> str:
 resource_file_expansion_counter = 0
 
 
-def expand_resource_glob(cm_fh: IO[str], expression: str) -> str:
+def expand_resource_glob(
+    cm_fh: IO[str], expression: str, expanded_globs: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Writes a file(GLOB) call for expression and returns the variable
+    holding the expanded file list. If expanded_globs is given, it is
+    used to reuse the variable of an identical expression that was
+    already expanded into the same cm_fh.
+    """
     global resource_file_expansion_counter
+    if expanded_globs is not None and expression in expanded_globs:
+        return expanded_globs[expression]
+
     r = expression.replace('"', "")
 
     cm_fh.write(
@@ -2303,6 +2454,8 @@ def expand_resource_glob(cm_fh: IO[str], expression: str) -> str:
 
     expanded_var = f"${{resource_glob_{resource_file_expansion_counter}}}"
     resource_file_expansion_counter += 1
+    if expanded_globs is not None:
+        expanded_globs[expression] = expanded_var
     return expanded_var
 
 
@@ -2316,6 +2469,11 @@ def write_resources(cm_fh: IO[str], target: str, scope: Scope, indent: int = 0,
     qrc_output = ""
     if resources:
         standalone_files: List[str] = []
+        # Resource calls and globs already written for this scope, to
+        # avoid emitting identical ones more than once.
+        written_resource_calls: Set[str] = set()
+        expanded_globs: Dict[str, str] = {}
+
         for r in resources:
             skip_qtquick_compiler = r in qtquickcompiler_skipped
             retain_qtquick_compiler = r in qtquickcompiler_retained
@@ -2323,7 +2481,7 @@ def write_resources(cm_fh: IO[str], target: str, scope: Scope, indent: int = 0,
                 if "${CMAKE_CURRENT_BINARY_DIR}" in r:
                     cm_fh.write(f"#### Ignored generated resource: {r}")
                     continue
-                qrc_output += process_qrc_file(
+                resource_call = process_qrc_file(
                     target,
                     scope,
                     r,
@@ -2333,13 +2491,18 @@ def write_resources(cm_fh: IO[str], target: str, scope: Scope, indent: int = 0,
                     retain_qtquick_compiler,
                     is_example,
                 )
+                if resource_call not in written_resource_calls:
+                    written_resource_calls.add(resource_call)
+                    qrc_output += resource_call
             else:
                 immediate_files = {f: "" for f in scope.get_files(f"{r}.files")}
                 if immediate_files:
                     immediate_files_filtered = []
                     for f in immediate_files:
                         if "*" in f:
-                            immediate_files_filtered.append(expand_resource_glob(cm_fh, f))
+                            immediate_files_filtered.append(
+                                expand_resource_glob(cm_fh, f, expanded_globs)
+                            )
                         else:
                             immediate_files_filtered.append(f)
                     immediate_files = {f: "" for f in immediate_files_filtered}
@@ -2369,7 +2532,7 @@ def write_resources(cm_fh: IO[str], target: str, scope: Scope, indent: int = 0,
                     )
                 else:
                     if "*" in r:
-                        standalone_files.append(expand_resource_glob(cm_fh, r))
+                        standalone_files.append(expand_resource_glob(cm_fh, r, expanded_globs))
                     else:
                         # stadalone source file properties need to be set as they
                         # are parsed.
@@ -2700,33 +2863,34 @@ def handle_source_subtractions(scopes: List[Scope]):
       condition that takes all the other conditions into account.
     """
 
-    def remove_file_from_operation(
-        scope: Scope, ops_key: str, file: str, op_type: Type[Operation]
-    ) -> bool:
+    def remove_files_from_operation(
+        scope: Scope, ops_key: str, files: Set[str], op_type: Type[Operation]
+    ) -> Set[str]:
         """
-        Remove a source file from an operation in a scope.
-        Example: remove foo.cpp from any operations that have
+        Remove source files from operations in a scope.
+        Example: remove foo.cpp and bar.cpp from any operations that have
                  ops_key="SOURCES" in "scope", where the operation is of
                  type "op_type".
 
         The implementation is very rudimentary and might not work in
         all cases.
 
-        Returns True if a file was found and removed in any operation.
+        Returns the set of files that were found and removed in any
+        operation.
         """
-        file_removed = False
+        files_removed: Set[str] = set()
+        if not files:
+            return files_removed
         ops = scope._operations.get(ops_key, list())
         for op in ops:
             if not isinstance(op, op_type):
                 continue
-            if file in op._value:
-                op._value.remove(file)
-                file_removed = True
+            files_removed |= op.remove_values(files)
         for include_child_scope in scope._included_children:
-            file_removed = file_removed or remove_file_from_operation(
-                include_child_scope, ops_key, file, op_type
+            files_removed |= remove_files_from_operation(
+                include_child_scope, ops_key, files, op_type
             )
-        return file_removed
+        return files_removed
 
     def join_all_conditions(set_of_alternatives: Set[str]):
         final_str = ""
@@ -2742,6 +2906,7 @@ def handle_source_subtractions(scopes: List[Scope]):
 
     for scope in scopes:
         sources = scope.get_files("SOURCES")
+        subtracted_files: Set[str] = set()
         for file in sources:
             # Find subtractions.
             if file.startswith("-"):
@@ -2753,24 +2918,43 @@ def handle_source_subtractions(scopes: List[Scope]):
                 subtractions = modified_sources[file_without_minus].get("subtractions", set())
                 assert isinstance(subtractions, set)
 
-                # Add the condition to the set of conditions and remove
-                # the file subtraction from the processed scope, which
-                # will be later re-added in a new scope.
+                # Add the condition to the set of conditions. The file
+                # subtraction is removed from the processed scope below,
+                # and will be later re-added in a new scope.
                 if scope.condition:
                     assert scope.total_condition
                     subtractions.add(scope.total_condition)
-                remove_file_from_operation(scope, "SOURCES", file_without_minus, RemoveOperation)
                 if subtractions:
                     modified_sources[file_without_minus]["subtractions"] = subtractions
+                subtracted_files.add(file_without_minus)
 
-                # In case if the source is also listed in a
-                # NO_PCH_SOURCES operation, remove it from there as
-                # well, and add it back later.
-                no_pch_source_removed = remove_file_from_operation(
-                    scope, "NO_PCH_SOURCES", file_without_minus, AddOperation
-                )
-                if no_pch_source_removed:
-                    modified_sources[file_without_minus]["add_to_no_pch_sources"] = True
+        if not subtracted_files:
+            continue
+
+        remove_files_from_operation(scope, "SOURCES", subtracted_files, RemoveOperation)
+
+        # In case if the source is also listed in a
+        # NO_PCH_SOURCES operation, remove it from there as
+        # well, and add it back later.
+        no_pch_sources_removed = remove_files_from_operation(
+            scope, "NO_PCH_SOURCES", subtracted_files, AddOperation
+        )
+        for file in no_pch_sources_removed:
+            modified_sources[file]["add_to_no_pch_sources"] = True
+
+    if not modified_sources:
+        return
+
+    # Index which scopes add each of the modified sources, so that the
+    # SOURCES of every scope are only evaluated once.
+    scopes_adding_source: Dict[str, List[Scope]] = {}
+    for scope in scopes:
+        sources_in_scope = modified_sources.keys() & set(scope.get_files("SOURCES"))
+        for modified_source in sources_in_scope:
+            scopes_adding_source.setdefault(modified_source, []).append(scope)
+        # Remove the source files from any addition operations that
+        # mention them.
+        remove_files_from_operation(scope, "SOURCES", sources_in_scope, AddOperation)
 
     for modified_source in modified_sources:
         additions = modified_sources[modified_source].get("additions", set())
@@ -2783,14 +2967,9 @@ def handle_source_subtractions(scopes: List[Scope]):
             "add_to_no_pch_sources", False
         )
 
-        for scope in scopes:
-            sources = scope.get_files("SOURCES")
-            if modified_source in sources:
-                # Remove the source file from any addition operations
-                # that mention it.
-                remove_file_from_operation(scope, "SOURCES", modified_source, AddOperation)
-                if scope.total_condition:
-                    additions.add(scope.total_condition)
+        for scope in scopes_adding_source.get(modified_source, []):
+            if scope.total_condition:
+                additions.add(scope.total_condition)
 
         # Construct a condition that takes into account all addition
         # and subtraction conditions.
@@ -0,0 +1,632 @@
+#!/usr/bin/env python3
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the plugins of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+
+"""
+Benchmarks for the pro2cmake pipeline.
+
+Times the individual stages of a conversion (qmake parsing, scope tree
+construction, operation evaluation, source subtraction handling, full
+CMakeLists generation, condition simplification and special case
+merging) on synthetic projects of configurable size, as well as on the
+.pro files in tests/data. Peak memory of each benchmark is measured
+with tracemalloc.
+
+To execute: python3 pro2cmake_benchmark.py [--scale N] [--repeat N]
+
+Results can be stored with --save-baseline <file.json> and later runs
+compared against them with --baseline <file.json>; regressions larger
+than --threshold percent are reported and make the script exit with 1.
+"""
+
+import contextlib
+import gc
+import io
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import tracemalloc
+
+from argparse import ArgumentParser
+from timeit import default_timer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from condition_simplifier import simplify_condition
+from condition_simplifier_cache import set_condition_simplified_cache_enabled
+from pro2cmake import (
+    Scope,
+    cmakeify_scope,
+    do_include,
+    flatten_scopes,
+    handle_source_subtractions,
+    map_condition,
+    recursive_evaluate_scope,
+)
+from qmake_parser import QmakeParser
+from special_case_helper import SpecialCaseHandler, check_if_git_in_path, remove_special_cases
+
+_script_dir_path = os.path.dirname(os.path.abspath(__file__))
+_tests_data_path = os.path.join(_script_dir_path, "tests", "data")
+_default_source_dir_path = os.path.dirname(os.path.dirname(_script_dir_path))
+
+# A benchmark is a pair of callables: the setup creates the (untimed)
+# state that the timed run callable then works on.
+BenchmarkSetup = Callable[[], Any]
+BenchmarkRun = Callable[[Any], Any]
+
+_conditions = [
+    "win32",
+    "unix",
+    "macos",
+    "linux",
+    "android",
+    "qtConfig(opengl)",
+    "qtConfig(vulkan)",
+    "!qtConfig(dlopen)",
+    "contains(QT_CONFIG, shared)",
+    "qtHaveModule(network)",
+    "unix:!darwin",
+    "win32-msvc*",
+    "equals(QT_ARCH, x86_64)",
+    "linux:!android",
+    "qtConfig(icu)|qtConfig(iconv)",
+]
+
+
+def _parse_commandline():
+    parser = ArgumentParser(description="Benchmark the stages of the pro2cmake conversion.")
+    parser.add_argument(
+        "--scale",
+        dest="scale",
+        type=int,
+        default=1,
+        help="Multiplier for the size of the synthetic projects.",
+    )
+    parser.add_argument(
+        "--repeat", dest="repeat", type=int, default=5, help="How often each benchmark is run."
+    )
+    parser.add_argument(
+        "--filter",
+        dest="filter",
+        type=str,
+        default="",
+        help="Only run benchmarks whose name contains the given text.",
+    )
+    parser.add_argument(
+        "--source-dir",
+        dest="source_dir",
+        type=str,
+        default=_default_source_dir_path,
+        help="Source tree from which the conditions for the map_condition benchmarks are "
+        "harvested. Pass an empty string to skip these benchmarks.",
+    )
+    parser.add_argument(
+        "--scope-memory",
+        dest="scope_memory",
+        action="store_true",
+        help="Instead of running the benchmarks, load all projects of --source-dir at once "
+        "and report the memory used per scope.",
+    )
+    parser.add_argument(
+        "--list", dest="list", action="store_true", help="List benchmark names and exit."
+    )
+    parser.add_argument(
+        "--no-memory",
+        dest="no_memory",
+        action="store_true",
+        help="Skip the (slower) peak memory measurement.",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        dest="save_baseline",
+        type=str,
+        help="Store the results as a baseline in the given JSON file.",
+    )
+    parser.add_argument(
+        "--baseline",
+        dest="baseline",
+        type=str,
+        help="Compare the results with a previously stored baseline JSON file.",
+    )
+    parser.add_argument(
+        "--threshold",
+        dest="threshold",
+        type=float,
+        default=10.0,
+        help="Slowdown (in percent) compared to the baseline that counts as a regression.",
+    )
+    return parser.parse_args()
+
+
+def generate_scopes_project(scope_count: int, sources_per_scope: int = 3) -> str:
+    """Returns a .pro file with scope_count sibling scopes."""
+    lines = ["TARGET = scopes", "TEMPLATE = lib", "SOURCES += main.cpp", ""]
+    for i in range(scope_count):
+        condition = _conditions[i % len(_conditions)]
+        lines.append(f"{condition} {{")
+        for j in range(sources_per_scope):
+            lines.append(f"    SOURCES += scope_{i}_{j}.cpp")
+        lines.append(f"    DEFINES += SCOPE_{i}")
+        lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_conditions_project(condition_count: int) -> str:
+    """Returns a .pro file with condition_count nested and else'd conditions."""
+    lines = ["TARGET = conditions", "TEMPLATE = lib", "SOURCES += main.cpp", ""]
+    for i in range(condition_count):
+        first = _conditions[i % len(_conditions)]
+        second = _conditions[(i * 7 + 3) % len(_conditions)]
+        lines.append(f"{first} {{")
+        lines.append(f"    {second} {{")
+        lines.append(f"        SOURCES += cond_{i}_a.cpp")
+        lines.append("    } else {")
+        lines.append(f"        SOURCES += cond_{i}_b.cpp")
+        lines.append("    }")
+        lines.append("} else {")
+        lines.append(f"    HEADERS += cond_{i}.h")
+        lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_sources_project(source_count: int, subtraction_count: int = 0) -> str:
+    """
+    Returns a .pro file with long SOURCES and HEADERS lists, and
+    subtraction_count conditional removals of some of those sources.
+    """
+    sources = " \\\n    ".join(f"src/file_{i}.cpp" for i in range(source_count))
+    headers = " \\\n    ".join(f"src/file_{i}.h" for i in range(source_count))
+    lines = [
+        "TARGET = sources",
+        "TEMPLATE = lib",
+        f"SOURCES += \\\n    {sources}",
+        f"HEADERS += \\\n    {headers}",
+        "",
+    ]
+    step = max(source_count // max(subtraction_count, 1), 1)
+    for i in range(subtraction_count):
+        condition = _conditions[i % len(_conditions)]
+        lines.append(f"{condition}: SOURCES -= src/file_{(i * step) % source_count}.cpp")
+    return "\n".join(lines) + "\n"
+
+
+def generate_includes_project(base_dir: str, include_depth: int, sources_per_file: int = 5) -> str:
+    """
+    Writes a chain of include_depth nested .pri files into base_dir and
+    returns a .pro file that includes the first of them.
+    """
+    for i in range(include_depth):
+        lines = [f"SOURCES += $$PWD/include_{i}_{j}.cpp" for j in range(sources_per_file)]
+        lines.append(f"{_conditions[i % len(_conditions)]}: DEFINES += INCLUDE_{i}")
+        if i + 1 < include_depth:
+            lines.append(f"include(level_{i + 1}/level_{i + 1}.pri)")
+        level_dir = os.path.join(base_dir, *(f"level_{k}" for k in range(i + 1)))
+        os.makedirs(level_dir, exist_ok=True)
+        with open(os.path.join(level_dir, f"level_{i}.pri"), "w") as pri_fh:
+            pri_fh.write("\n".join(lines) + "\n")
+
+    lines = ["TARGET = includes", "TEMPLATE = lib", "SOURCES += main.cpp"]
+    if include_depth:
+        lines.append("include(level_0/level_0.pri)")
+    return "\n".join(lines) + "\n"
+
+
+def generate_special_case_files(line_count: int) -> Tuple[str, str, str]:
+    """
+    Returns the (previous clean, original with special cases, newly
+    generated) contents of a CMakeLists.txt with line_count sources.
+    """
+    sources = [f"    file_{i}.cpp" for i in range(line_count)]
+    header = "qt_add_module(Bench\n    SOURCES\n"
+    clean = header + "\n".join(sources) + "\n)\n"
+    original_sources = list(sources)
+    for i in range(0, line_count, 50):
+        original_sources[i] += " # special case"
+    original = header + "\n".join(original_sources) + "\n)\n"
+    original += "# special case begin\nset(FOO ON)\n# special case end\n"
+    generated = header + "\n".join(sources + ["    new_file.cpp"]) + "\n)\n"
+    return clean, original, generated
+
+
+@contextlib.contextmanager
+def _quiet():
+    # pro2cmake is quite chatty, keep the benchmark output readable.
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def _parse(parser: QmakeParser, pro_file: str):
+    with _quiet():
+        return parser.parseFile(pro_file)
+
+
+def _build_scope(pro_file: str, parse_result) -> Scope:
+    result, content = parse_result
+    with _quiet():
+        scope = Scope.FromDict(
+            None, pro_file, result.asDict().get("statements"), project_file_content=content
+        )
+        do_include(scope)
+    return scope
+
+
+def _evaluate(scope: Scope) -> List[Scope]:
+    recursive_evaluate_scope(scope)
+    scopes = flatten_scopes(scope)
+    for s in scopes:
+        s.get_files("SOURCES")
+        s.get_files("HEADERS")
+    return scopes
+
+
+def _convert(scope: Scope) -> str:
+    cm_fh = io.StringIO()
+    with _quiet():
+        cmakeify_scope(scope, cm_fh)
+    return cm_fh.getvalue()
+
+
+def project_benchmarks(name: str, pro_file: str) -> Dict[str, Tuple[BenchmarkSetup, BenchmarkRun]]:
+    """Returns the per-stage benchmarks for a single project file."""
+    parser = QmakeParser()
+    parse_result = _parse(parser, pro_file)
+
+    def fresh_scope() -> Scope:
+        return _build_scope(pro_file, parse_result)
+
+    def evaluated_scopes() -> List[Scope]:
+        scope = fresh_scope()
+        recursive_evaluate_scope(scope)
+        return flatten_scopes(scope)
+
+    return {
+        f"{name}/parse": (lambda: parser, lambda p: _parse(p, pro_file)),
+        f"{name}/scope": (lambda: parse_result, lambda r: _build_scope(pro_file, r)),
+        f"{name}/evaluate": (fresh_scope, _evaluate),
+        f"{name}/subtractions": (evaluated_scopes, handle_source_subtractions),
+        f"{name}/convert": (fresh_scope, _convert),
+    }
+
+
+def condition_benchmarks(condition_count: int) -> Dict[str, Tuple[BenchmarkSetup, BenchmarkRun]]:
+    conditions = []
+    for i in range(condition_count):
+        first = _conditions[i % len(_conditions)].upper().replace("!", "NOT ")
+        second = _conditions[(i * 7 + 3) % len(_conditions)].upper().replace("!", "NOT ")
+        conditions.append(f"(FEATURE_{i} OR WIN32) AND NOT ({first}_X) AND ({second}_Y OR APPLE)")
+
+    def simplify_all(conditions: List[str]) -> None:
+        # Measure the simplifier itself, not the lookup in its cache.
+        set_condition_simplified_cache_enabled(False)
+        try:
+            for condition in conditions:
+                simplify_condition(condition)
+        finally:
+            set_condition_simplified_cache_enabled(True)
+
+    return {"simplify_condition": (lambda: conditions, simplify_all)}
+
+
+def harvest_conditions(source_dir: str) -> List[str]:
+    """Collects all scope conditions of the .pro and .pri files below source_dir."""
+
+    def collect(statements, conditions: List[str]) -> None:
+        for statement in statements or []:
+            if isinstance(statement, list):
+                continue
+            condition = statement.get("condition", None)
+            if condition:
+                conditions.append(condition)
+                collect(statement.get("statements"), conditions)
+                collect(statement.get("else_statements"), conditions)
+
+    parser = QmakeParser(debug=False)
+    conditions: List[str] = []
+    for root, dirs, files in os.walk(source_dir):
+        # Skip the test data of the conversion scripts.
+        dirs[:] = [d for d in sorted(dirs) if os.path.join(root, d) != _script_dir_path]
+        for file_name in sorted(files):
+            if not file_name.endswith((".pro", ".pri")):
+                continue
+            try:
+                parse_result, _ = _parse(parser, os.path.join(root, file_name))
+            except Exception:
+                continue
+            collect(parse_result.asDict().get("statements"), conditions)
+    return conditions
+
+
+def map_condition_benchmarks(source_dir: str) -> Dict[str, Tuple[BenchmarkSetup, BenchmarkRun]]:
+    harvested: List[List[str]] = []
+
+    def conditions() -> List[str]:
+        # Harvesting takes a while, do it only when the benchmark runs.
+        if not harvested:
+            harvested.append(harvest_conditions(source_dir))
+        return harvested[0]
+
+    def map_all_uncached(conditions: List[str]) -> None:
+        map_condition.cache_clear()
+        for condition in conditions:
+            map_condition(condition)
+
+    def map_all_cached(conditions: List[str]) -> None:
+        for condition in conditions:
+            map_condition(condition)
+
+    return {
+        "map_condition/uncached": (conditions, map_all_uncached),
+        "map_condition/cached": (conditions, map_all_cached),
+    }
+
+
+def count_scopes(scope: Scope) -> int:
+    return (
+        1
+        + sum(count_scopes(c) for c in scope._children)
+        + sum(count_scopes(c) for c in scope._included_children)
+    )
+
+
+def scope_memory_report(source_dir: str) -> None:
+    """
+    Loads the scope trees of all .pro files below source_dir at the same
+    time and reports the memory they need, before and after freezing.
+    """
+    pro_files = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs[:] = [d for d in sorted(dirs) if os.path.join(root, d) != _script_dir_path]
+        pro_files += [os.path.join(root, f) for f in sorted(files) if f.endswith(".pro")]
+
+    # Parse up front, only the scope trees themselves should be measured.
+    parser = QmakeParser(debug=False)
+    parse_results = []
+    for pro_file in pro_files:
+        try:
+            parse_results.append((pro_file, _parse(parser, pro_file)))
+        except Exception:
+            continue
+
+    gc.collect()
+    tracemalloc.start()
+    start_memory = tracemalloc.get_traced_memory()[0]
+
+    scopes: List[Scope] = []
+    for pro_file, parse_result in parse_results:
+        try:
+            scopes.append(_build_scope(pro_file, parse_result))
+        except Exception:
+            continue
+    del parse_results
+
+    scope_count = sum(count_scopes(scope) for scope in scopes)
+
+    def report(label: str) -> None:
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - start_memory
+        print(f"{label:<10}{used / 1024:>12.1f} KiB{used / scope_count:>12.1f} bytes/scope")
+
+    print(f"Loaded {len(scopes)} projects with {scope_count} scopes from {source_dir}")
+    report("Loaded")
+    for scope in scopes:
+        scope.freeze()
+    report("Frozen")
+    tracemalloc.stop()
+
+
+def special_case_benchmarks(
+    work_dir: str, line_count: int
+) -> Dict[str, Tuple[BenchmarkSetup, BenchmarkRun]]:
+    clean, original, generated = generate_special_case_files(line_count)
+    benchmarks: Dict[str, Tuple[BenchmarkSetup, BenchmarkRun]] = {
+        "special_case/remove": (lambda: original, remove_special_cases)
+    }
+
+    if not check_if_git_in_path():
+        return benchmarks
+
+    merge_dir = os.path.join(work_dir, "special_case")
+    os.makedirs(merge_dir, exist_ok=True)
+
+    def setup() -> SpecialCaseHandler:
+        for file_name, content in (
+            (".prev_CMakeLists.txt", clean),
+            ("CMakeLists.txt", original),
+            ("CMakeLists.gen.txt", generated),
+        ):
+            with open(os.path.join(merge_dir, file_name), "w") as fh:
+                fh.write(content)
+        return SpecialCaseHandler(
+            os.path.join(merge_dir, "CMakeLists.txt"),
+            os.path.join(merge_dir, "CMakeLists.gen.txt"),
+            merge_dir,
+        )
+
+    def merge(handler: SpecialCaseHandler) -> None:
+        with _quiet():
+            handler.apply_git_merge_magic(handler.prev_file_path)
+
+    benchmarks["special_case/merge"] = (setup, merge)
+    return benchmarks
+
+
+def collect_benchmarks(
+    work_dir: str, scale: int, source_dir: str
+) -> Dict[str, Tuple[BenchmarkSetup, BenchmarkRun]]:
+    # The projects need a .qmake.conf above them to find the repository
+    # root; each one lives in its own sub-directory so that none of them
+    # is treated as the top-level repository project.
+    with open(os.path.join(work_dir, ".qmake.conf"), "w") as fh:
+        fh.write("\n")
+
+    project_dirs = {
+        name: os.path.join(work_dir, name)
+        for name in ("scopes", "conditions", "sources", "includes")
+    }
+    for project_dir in project_dirs.values():
+        os.makedirs(project_dir, exist_ok=True)
+
+    projects = {
+        "scopes": generate_scopes_project(25 * scale),
+        "conditions": generate_conditions_project(10 * scale),
+        "sources": generate_sources_project(1000 * scale, 20 * scale),
+        "includes": generate_includes_project(project_dirs["includes"], 10 * scale),
+    }
+
+    benchmarks: Dict[str, Tuple[BenchmarkSetup, BenchmarkRun]] = {}
+    for name, content in projects.items():
+        pro_file = os.path.join(project_dirs[name], f"{name}.pro")
+        with open(pro_file, "w") as fh:
+            fh.write(content)
+        benchmarks.update(project_benchmarks(f"synthetic/{name}", pro_file))
+
+    for file_name in sorted(os.listdir(_tests_data_path)):
+        if file_name.endswith(".pro"):
+            name = f"data/{os.path.splitext(file_name)[0]}"
+            pro_file = os.path.join(_tests_data_path, file_name)
+            benchmarks.update(project_benchmarks(name, pro_file))
+
+    benchmarks.update(condition_benchmarks(5 * scale))
+    if source_dir:
+        benchmarks.update(map_condition_benchmarks(source_dir))
+    benchmarks.update(special_case_benchmarks(work_dir, 2000 * scale))
+    return benchmarks
+
+
+def measure(
+    setup: BenchmarkSetup, run: BenchmarkRun, repeat: int, with_memory: bool = True
+) -> Dict[str, float]:
+    # Warm up: fills the condition simplifier cache and the lru_caches of
+    # pro2cmake, as any conversion of more than one project would.
+    run(setup())
+
+    timings = []
+    for _ in range(repeat):
+        state = setup()
+        start = default_timer()
+        run(state)
+        timings.append(default_timer() - start)
+
+    result = {"min": min(timings), "median": statistics.median(timings)}
+    if with_memory:
+        state = setup()
+        tracemalloc.start()
+        try:
+            run(state)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["peak_memory"] = peak
+    return result
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float
+) -> List[str]:
+    """Returns the names of the benchmarks that regressed by more than threshold percent."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]["median"]
+        new = result["median"]
+        if old > 0 and (new - old) * 100 / old > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def print_results(
+    results: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Dict[str, float]]] = None
+) -> None:
+    print(f"{'Benchmark':<40} {'min (ms)':>10} {'median (ms)':>12} {'peak (KiB)':>11}", end="")
+    print(f" {'vs. baseline':>13}" if baseline else "")
+    for name, result in results.items():
+        peak = result.get("peak_memory")
+        peak_str = f"{peak / 1024:>11.1f}" if peak is not None else f"{'-':>11}"
+        line = (
+            f"{name:<40} {result['min'] * 1000:>10.2f} {result['median'] * 1000:>12.2f} {peak_str}"
+        )
+        if baseline and name in baseline and baseline[name]["median"] > 0:
+            change = (result["median"] - baseline[name]["median"]) * 100 / baseline[name]["median"]
+            line += f" {change:>+12.1f}%"
+        print(line)
+
+
+def main() -> None:
+    args = _parse_commandline()
+
+    if args.scope_memory:
+        scope_memory_report(os.path.abspath(args.source_dir))
+        return
+
+    # Conversion writes some files (e.g. .cmake.conf) into the current
+    # directory, so run everything from within a temporary one.
+    backup_current_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="pro2cmake_benchmark_")
+    os.chdir(work_dir)
+    try:
+        benchmarks = collect_benchmarks(work_dir, args.scale, args.source_dir)
+        names = [name for name in benchmarks if args.filter in name]
+        if args.list:
+            print("\n".join(names))
+            return
+
+        results: Dict[str, Dict[str, float]] = {}
+        for name in names:
+            setup, run = benchmarks[name]
+            results[name] = measure(setup, run, args.repeat, not args.no_memory)
+    finally:
+        os.chdir(backup_current_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r") as fh:
+            baseline = json.load(fh)["results"]
+
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as fh:
+            json.dump({"scale": args.scale, "results": results}, fh, indent=4)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if baseline:
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions of more than {args.threshold}%:")
+            for name in regressions:
+                print(f"    {name}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
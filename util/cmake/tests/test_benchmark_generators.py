@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the plugins of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+
+import os
+
+from pro2cmake import Scope, do_include, flatten_scopes
+from pro2cmake_benchmark import (
+    generate_conditions_project,
+    generate_includes_project,
+    generate_scopes_project,
+    generate_sources_project,
+)
+from qmake_parser import parseProFile
+
+
+def _load(path: str) -> Scope:
+    result, content = parseProFile(path)
+    scope = Scope.FromDict(None, path, result.asDict().get('statements'),
+                           project_file_content=content)
+    do_include(scope)
+    return scope
+
+
+def _write(path: str, content: str) -> str:
+    with open(path, 'w') as fh:
+        fh.write(content)
+    return path
+
+
+def test_scopes_project(tmpdir):
+    scope = _load(_write(str(tmpdir.join('scopes.pro')), generate_scopes_project(7)))
+    assert len(scope.children) == 7
+    assert len(scope.children[3].get_files('SOURCES')) == 3
+
+
+def test_conditions_project(tmpdir):
+    scope = _load(_write(str(tmpdir.join('conditions.pro')), generate_conditions_project(4)))
+    # Each condition has an else branch, and a nested condition with an else branch.
+    assert len(scope.children) == 8
+    assert len(flatten_scopes(scope)) == 1 + 8 + 8
+
+
+def test_sources_project(tmpdir):
+    content = generate_sources_project(100, 5)
+    scope = _load(_write(str(tmpdir.join('sources.pro')), content))
+    assert len(scope.get_files('SOURCES')) == 100
+    assert len(scope.get_files('HEADERS')) == 100
+    assert len(scope.children) == 5
+
+
+def test_includes_project(tmpdir):
+    base_dir = str(tmpdir)
+    scope = _load(_write(os.path.join(base_dir, 'includes.pro'),
+                         generate_includes_project(base_dir, 3, sources_per_file=2)))
+    assert len(scope.get_files('SOURCES')) == 1 + 3 * 2
@@ -55,3 +55,18 @@ def test_remove_operation():
 
     result = op.process(['foo', 'bar'], ['foo', 'bar'], lambda x: x)
     assert ['foo', '-buz'] == result
+
+
+def test_uniqueadd_operation_with_duplicates():
+    op = UniqueAddOperation(['bar', 'buz', 'bar', 'baz'])
+
+    result = op.process(['foo', 'bar', 'foo'], ['foo', 'bar', 'foo'], lambda x: x)
+    assert ['foo', 'bar', 'foo', 'buz', 'baz'] == result
+
+
+def test_remove_values():
+    op = AddOperation(['foo', 'bar', 'buz', 'bar'])
+
+    removed = op.remove_values({'bar', 'baz'})
+    assert {'bar'} == removed
+    assert ['foo', 'buz'] == op._value
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the plugins of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+
+
+import io
+
+from pro2cmake import expand_resource_glob, parse_qrc_file
+
+
+def test_parse_qrc_file_is_cached(tmpdir):
+    qrc = tmpdir.join('res.qrc')
+    qrc.write('<RCC>\n'
+              '  <qresource prefix="images">\n'
+              '    <file alias="a.png">data/a.png</file>\n'
+              '    <file>data/b.png</file>\n'
+              '  </qresource>\n'
+              '  <qresource lang="de"><file>c.txt</file></qresource>\n'
+              '</RCC>\n')
+
+    resources = parse_qrc_file(str(qrc))
+    assert len(resources) == 2
+    assert resources[0].prefix == '/images'
+    assert resources[0].files == [('data/a.png', 'a.png'), ('data/b.png', '')]
+    assert resources[1].lang == 'de'
+    assert resources[1].prefix == '/'
+
+    assert parse_qrc_file(str(qrc)) is resources
+
+
+def test_expand_resource_glob_reuses_identical_expressions():
+    cm_fh = io.StringIO()
+    expanded_globs = {}
+    first = expand_resource_glob(cm_fh, 'images/*.png', expanded_globs)
+    second = expand_resource_glob(cm_fh, 'images/*.png', expanded_globs)
+    third = expand_resource_glob(cm_fh, 'icons/*.png', expanded_globs)
+
+    assert first == second
+    assert first != third
+    assert cm_fh.getvalue().count('file(GLOB') == 2
@@ -27,7 +27,7 @@
 ##
 #############################################################################
 
-from pro2cmake import Scope, SetOperation, merge_scopes, recursive_evaluate_scope
+from pro2cmake import AddOperation, Scope, SetOperation, merge_scopes, recursive_evaluate_scope
 
 import pytest
 import typing
@@ -344,3 +344,21 @@ def test_recursive_expansion():
     assert scope._expand_value('$$B/Source.cpp') == ['Foo/Bar/Source.cpp']
     assert scope._expand_value('$$B') == ['Foo/Bar']
 
+
+def test_frozen_scope():
+    scope = _new_scope(SOURCES='foo.cpp')
+    child = _new_scope(parent_scope=scope, condition='QT_FEATURE_bar', SOURCES='bar.cpp')
+    scope._append_operation('HEADERS', AddOperation(['foo.h']))
+
+    scope.freeze()
+
+    assert scope.frozen and child.frozen
+    assert scope.get('SOURCES') == ['foo.cpp']
+    assert scope.get('HEADERS') == ['foo.h']
+    assert child.get('SOURCES') == ['bar.cpp']
+    with pytest.raises(AssertionError):
+        scope._append_operation('SOURCES', AddOperation(['baz.cpp']))
+    with pytest.raises(AssertionError):
+        _new_scope(parent_scope=scope, condition='QT_FEATURE_baz')
+    with pytest.raises(AssertionError):
+        scope._operations['SOURCES'][0].remove_values({'foo.cpp'})
@@ -35,15 +35,17 @@ The former should normally be all you need to access.
 See individual classes for further detail.
 """
 
-from xml.dom import minidom
-from weakref import WeakValueDictionary as CacheDict
+import hashlib
+import json
 import os
 
-from ldml import Error, Node, XmlScanner, Supplement, LocaleScanner
+from ldml import Error, XmlScanner, Supplement, LocaleScanner, CompactNode, backends
+from localetools import LruCache
 from qlocalexml import Locale
 
 class CldrReader (object):
-    def __init__(self, root, grumble = lambda msg: None, whitter = lambda msg: None):
+    def __init__(self, root, grumble = lambda msg: None, whitter = lambda msg: None,
+                 backend = 'minidom', snapshot = None):
         """Set up a reader object for reading CLDR data.
 
         Single parameter, root, is the file-system path to the root of
@@ -55,8 +57,11 @@ class CldrReader (object):
         suitable callable.  The default is a no-op that ignores its
         single argument.  Optional third argument is similar, used for
         less interesting output; pass sys.stderr.write for it for
-        verbose output."""
-        self.root = CldrAccess(root)
+        verbose output.  Optional fourth argument, backend, selects the
+        XML library used to parse CLDR's files; optional fifth argument,
+        snapshot, names a snapshot of the CLDR data to use in place of
+        parsing its files; see CldrAccess for both."""
+        self.root = CldrAccess(root, backend, snapshot)
         self.whitter, self.grumble = whitter, grumble
 
     def likelySubTags(self):
@@ -96,51 +101,110 @@ class CldrReader (object):
             # more out.
             pass # self.__wrapped(self.whitter, 'Skipping likelySubtags (for unknown codes): ', skips)
 
-    def readLocales(self, calendars = ('gregorian',)):
-        locales = tuple(self.__allLocales(calendars))
+    def readLocales(self, calendars = ('gregorian',), jobs = 1):
+        """Read the data for all locales.
+
+        Returns a mapping from (language, script, country, variant)
+        keys, using IDs for the first three, to Locale objects.
+        Optional first argument, calendars, names the calendars whose
+        month names are wanted.  Optional second argument, jobs, is
+        the number of processes among which to share out the work:
+        the default, 1, does it all in this process; None uses one
+        process per CPU.  The result, and the messages passed to
+        grumble and whitter, are the same (and in the same order)
+        regardless of jobs."""
+        if jobs == 1:
+            locales = tuple(self.__allLocales(calendars))
+        else:
+            locales = tuple(self.__poolLocales(calendars, jobs))
         return dict(((k.language_id, k.script_id, k.country_id, k.variant_code),
                      k) for k in locales)
 
-    def __allLocales(self, calendars):
-        def skip(locale, reason):
-            return 'Skipping defaultContent locale "{}" ({})\n'.format(locale, reason)
+    def readLocale(self, locale, calendars = ('gregorian',), isDefault = False):
+        """Read the data for one locale.
+
+        First argument, locale, is the name of a locale; optional
+        second argument is as for readLocales().  Pass isDefault a
+        true value if the locale is one of CLDR's default content
+        locales (in which case it may lack a file of its own);
+        otherwise, it should be named by a file in common/main/.
+        Returns a Locale object or, if the locale is to be skipped,
+        None; in the latter case, a reason may be passed to grumble or
+        whitter."""
+        if isDefault:
+            def skip(reason):
+                return 'Skipping defaultContent locale "{}" ({})\n'.format(locale, reason)
 
-        for locale in self.root.defaultContentLocales:
             try:
                 language, script, country, variant = self.__splitLocale(locale)
             except ValueError:
-                self.whitter(skip(locale, 'only language tag'))
-                continue
+                self.whitter(skip('only language tag'))
+                return None
 
             if not (script or country):
-                self.grumble(skip(locale, 'second tag is neither script nor territory'))
-                continue
+                self.grumble(skip('second tag is neither script nor territory'))
+                return None
 
             if not (language and country):
-                continue
+                return None
 
             try:
-                yield self.__getLocaleData(self.root.locale(locale), calendars,
-                                           language, script, country, variant)
+                return self.__getLocaleData(self.root.locale(locale), calendars,
+                                            language, script, country, variant)
             except Error as e:
-                self.grumble(skip(locale, e.message))
+                self.grumble(skip(e.message))
+                return None
 
+        try:
+            chain = self.root.locale(locale)
+            language, script, country, variant = chain.tagCodes()
+            assert language
+            # TODO: this skip should probably be based on likely
+            # sub-tags, instead of empty country: if locale has a
+            # likely-subtag expansion, that's what QLocale uses,
+            # and we'll be saving its data for the expanded locale
+            # anyway, so don't need to record it for itself.
+            # See also QLocaleXmlReader.loadLocaleMap's grumble.
+            if not country:
+                return None
+            return self.__getLocaleData(chain, calendars, language, script, country, variant)
+        except Error as e:
+            self.grumble('Skipping file locale "{}" ({})\n'.format(locale, e.message))
+            return None
+
+    def __localeTasks(self):
+        """Yields (isDefault, locale) pairs, to pass to readLocale()."""
+        for locale in self.root.defaultContentLocales:
+            yield True, locale
         for locale in self.root.fileLocales:
-            try:
-                chain = self.root.locale(locale)
-                language, script, country, variant = chain.tagCodes()
-                assert language
-                # TODO: this skip should probably be based on likely
-                # sub-tags, instead of empty country: if locale has a
-                # likely-subtag expansion, that's what QLocale uses,
-                # and we'll be saving its data for the expanded locale
-                # anyway, so don't need to record it for itself.
-                # See also QLocaleXmlReader.loadLocaleMap's grumble.
-                if not country:
-                    continue
-                yield self.__getLocaleData(chain, calendars, language, script, country, variant)
-            except Error as e:
-                self.grumble('Skipping file locale "{}" ({})\n'.format(locale, e.message))
+            yield False, locale
+
+    def __allLocales(self, calendars):
+        for isDefault, locale in self.__localeTasks():
+            data = self.readLocale(locale, calendars, isDefault)
+            if data is not None:
+                yield data
+
+    def __poolLocales(self, calendars, jobs):
+        import multiprocessing
+        tasks = tuple(self.__localeTasks())
+        # Fill shared caches before forking, so each worker inherits them:
+        self.root.preload()
+        pool = multiprocessing.Pool(jobs, _startLocaleWorker, (self, calendars))
+        try:
+            # Each worker returns its messages, which we pass on in
+            # task order, to match the serial run:
+            for data, messages in pool.imap(_readWorkerLocale, tasks, 8):
+                for isGrumble, message in messages:
+                    (self.grumble if isGrumble else self.whitter)(message)
+                if data is not None:
+                    yield data
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
 
     import textwrap
     @staticmethod
@@ -235,31 +299,130 @@ class CldrReader (object):
 
         return locale
 
-# Note: various caches assume this class is a singleton, so the
-# "default" value for a parameter no caller should pass can serve as
-# the cache. If a process were to instantiate this class with distinct
-# roots, each cache would be filled by the first to need it !
+# Worker-process side of CldrReader.readLocales(jobs != 1); these must
+# be module-level functions, for multiprocessing to find them:
+def _startLocaleWorker(reader, calendars):
+    global _localeWorker
+    messages = []
+    reader.grumble = lambda msg: messages.append((True, msg))
+    reader.whitter = lambda msg: messages.append((False, msg))
+    _localeWorker = reader, calendars, messages
+
+def _readWorkerLocale(task):
+    reader, calendars, messages = _localeWorker
+    del messages[:]
+    isDefault, locale = task
+    return reader.readLocale(locale, calendars, isDefault), tuple(messages)
+
+class CldrCache (object):
+    """Caches of the data CldrAccess reads from one CLDR tree.
+
+    There is one of these for each CLDR tree, read in each way (with
+    each XML backend, or from each snapshot); see forRoot().  All
+    CldrAccess objects for the same tree, read the same way, share it;
+    those for distinct trees don't.  When CldrReader.readLocales()
+    shares its work among worker processes, it fills the caches before
+    starting them, so that each inherits what it needs; each worker's
+    subsequent additions (and counts) are its own.
+
+    Members:
+      xml -- LruCache of parsed XML files, keyed by path
+      chains -- LruCache of the chains of files, each file followed
+                by those from which it inherits, of locales, keyed by
+                locale name
+      tables -- dict mapping names to data digested from the DTD,
+                supplemental files and root locale; each is computed
+                once, when first needed, so need not be bounded
+    """
+    def __init__(self, files = 16, chains = 8):
+        """Set up empty caches.
+
+        Optional arguments are the limits on how many parsed files and
+        locale chains to hold.  The defaults let recently used parent
+        locales' files be reused without holding the whole tree's
+        parsed files in memory, which would cost far more than
+        re-parsing a few of them."""
+        self.xml, self.chains, self.tables = LruCache(files), LruCache(chains), {}
+
+    def table(self, name, kind = dict):
+        """The named entry in tables, initially an empty kind()."""
+        try:
+            return self.tables[name]
+        except KeyError:
+            self.tables[name] = table = kind()
+            return table
+
+    def stats(self):
+        """Maps 'xml' and 'chains' to the stats() of each LruCache."""
+        return dict(xml = self.xml.stats(), chains = self.chains.stats())
+
+    @classmethod
+    def forRoot(cls, root, backend, snapshot = None, instances = {},
+                realPath = os.path.realpath):
+        """The instance for the given root, backend and snapshot.
+
+        Creates it when first asked for."""
+        key = realPath(root), backend, snapshot and realPath(snapshot)
+        try:
+            return instances[key]
+        except KeyError:
+            instances[key] = cache = cls()
+            return cache
+
 class CldrAccess (object):
-    def __init__(self, root):
+    def __init__(self, root, backend = 'minidom', snapshot = None):
         """Set up a master object for accessing CLDR data.
 
-        Single parameter, root, is the file-system path to the root of
+        First parameter, root, is the file-system path to the root of
         the unpacked CLDR archive; its common/ sub-directory should
-        contain dtd/, main/ and supplemental/ sub-directories."""
+        contain dtd/, main/ and supplemental/ sub-directories.
+
+        Optional second parameter, backend, names the XML library to
+        use for parsing files: it must be a key of ldml.backends.  The
+        default, 'minidom', is the long-standing choice; 'etree' is
+        faster and uses far less memory.
+
+        Optional third parameter, snapshot, is the path of a snapshot
+        file, written by cldrsnapshot.py, of the data under root.  If
+        given, data is loaded from it instead of parsing XML (so the
+        backend is ignored).  Raises Error if the snapshot can't be
+        read or is out of date with respect to the files under root.
+
+        Data read is cached in a CldrCache, shared with all other
+        instances for the same root, backend and snapshot; see the
+        cache property."""
         self.root = root
+        if snapshot:
+            from cldrsnapshot import CldrSnapshot
+            self.__snapshot, self.__Node = CldrSnapshot(snapshot, root), CompactNode
+            self.__cache = CldrCache.forRoot(root, None, snapshot)
+            self.__cache.tables['cldrVersion'] = self.__snapshot.table('cldrVersion')
+            return
+
+        self.__snapshot = None
+        try:
+            self.__Node = backends[backend]
+        except KeyError:
+            raise Error('Unknown XML backend: {}'.format(backend))
+        self.__cache = CldrCache.forRoot(root, backend)
+
+    @property
+    def cache(self):
+        """The CldrCache in which this object keeps data it has read."""
+        return self.__cache
 
     def xml(self, *path):
         """Load a single XML file and return its root element as an XmlScanner.
 
         The path is interpreted relative to self.root"""
-        return XmlScanner(Node(self.__xml(path)))
+        return XmlScanner(self.__Node(self.__xml(path)))
 
     def supplement(self, name):
         """Loads supplemental data as a Supplement object.
 
         The name should be that of a file in common/supplemental/, without path.
         """
-        return Supplement(Node(self.__xml(('common', 'supplemental', name))))
+        return Supplement(self.__Node(self.__xml(('common', 'supplemental', name))))
 
     def locale(self, name):
         """Loads all data for a locale as a LocaleScanner object.
@@ -269,7 +432,8 @@ class CldrAccess (object):
         LocaleScanner object packages this file along with all those
         from which it inherits; its methods know how to handle that
         inheritance, where relevant."""
-        return LocaleScanner(name, self.__localeRoots(name), self.__rootLocale)
+        return LocaleScanner(name, self.__localeRoots(name), self.__rootLocale,
+                             self.__cache.table('rootSearches'))
 
     @property
     def fileLocales(self, joinPath = os.path.join, listDirectory = os.listdir,
@@ -286,6 +450,11 @@ class CldrAccess (object):
     @property
     def defaultContentLocales(self):
         """Generator for the default content locales."""
+        if self.__snapshot is not None:
+            for locale in self.__snapshot.table('defaultContent'):
+                yield locale
+            return
+
         for name, attrs in self.supplement('supplementalMetadata.xml').find('metadata/defaultContent'):
             try:
                 locales = attrs['locales']
@@ -296,6 +465,11 @@ class CldrAccess (object):
                     yield locale
 
     def likelySubTags(self):
+        if self.__snapshot is not None:
+            for pair in self.__snapshot.table('likelySubtags'):
+                yield pair
+            return
+
         for ignore, attrs in self.supplement('likelySubtags.xml').find('likelySubtags'):
             yield attrs['from'], attrs['to']
 
@@ -395,11 +569,10 @@ class CldrAccess (object):
      </windowsZones>
  </supplementalData>
 """
-        zones = self.supplement('windowsZones.xml')
         enum = self.__enumMap('country')
         badZones, unLands, defaults, windows = set(), set(), {}, {}
 
-        for name, attrs in zones.find('windowsZones/mapTimezones'):
+        for name, attrs in self.__windowsZones():
             if name != 'mapZone':
                 continue
 
@@ -438,44 +611,85 @@ class CldrAccess (object):
 
     @property
     def cldrVersion(self):
-        # Evaluate so as to ensure __cldrVersion is set:
+        # Evaluate so as to ensure the version has been read:
         self.__unDistinguishedAttributes
-        return self.__cldrVersion
+        return self.__cache.tables['cldrVersion']
+
+    def snapshotTables(self):
+        """The digested supplemental data saved in a snapshot.
+
+        Returns a mapping from names to the data on which this object's
+        methods draw, other than the files of locale data; see
+        cldrsnapshot.py, which saves these in a snapshot."""
+        return dict(cldrVersion = self.cldrVersion,
+                    ldmlDtd = dict(self.__unDistinguishedAttributes),
+                    defaultContent = tuple(self.defaultContentLocales),
+                    likelySubtags = tuple(self.likelySubTags()),
+                    parentLocales = dict(self.__parentLocales),
+                    numberingSystems = dict(self.__numberSystems),
+                    weekData = dict(self.__weekData),
+                    currencyData = dict(self.__currencyData),
+                    windowsZones = tuple(self.__windowsZones()))
+
+    def preload(self):
+        """Fill the caches that reading any locale's data needs.
+
+        These are otherwise filled as they are first needed.  Filling
+        them before forking worker processes lets each worker inherit
+        them, instead of each repeating the work."""
+        self.__unDistinguishedAttributes, self.__rootLocale, self.__parentLocales
+        self.__numberSystems, self.__weekData, self.__currencyData
+        self.__enumMap('language')
 
     # Implementation details
-    def __xml(self, path, cache = CacheDict(), read = minidom.parse, joinPath = os.path.join):
+    def __xml(self, path, joinPath = os.path.join):
+        cache = self.__cache.xml
         try:
             doc = cache[path]
         except KeyError:
-            cache[path] = doc = read(joinPath(self.root, *path)).documentElement
+            doc = None if self.__snapshot is None else self.__snapshot.tree(path)
+            if doc is None:
+                doc = self.__Node.parse(joinPath(self.root, *path))
+            cache[path] = doc
         return doc
 
+    def __fromSnapshot(self, name, cache):
+        """Fill a cache from the snapshot, if any; return True if filled."""
+        if self.__snapshot is None:
+            return False
+        cache.update(self.__snapshot.table(name))
+        return True
+
     def __open(self, path, joinPath=os.path.join):
         return open(joinPath(self.root, *path))
 
     @property
-    def __rootLocale(self, cache = []):
+    def __rootLocale(self):
+        cache = self.__cache.table('rootLocale', list)
         if not cache:
             cache.append(self.xml('common', 'main', 'root.xml'))
         return cache[0]
 
     @property
-    def __supplementalData(self, cache = []):
+    def __supplementalData(self):
+        cache = self.__cache.table('supplementalData', list)
         if not cache:
             cache.append(self.supplement('supplementalData.xml'))
         return cache[0]
 
     @property
-    def __numberSystems(self, cache = {}, joinPath=os.path.join):
-        if not cache:
+    def __numberSystems(self):
+        cache = self.__cache.table('numberingSystems')
+        if not cache and not self.__fromSnapshot('numberingSystems', cache):
             for ignore, attrs in self.supplement('numberingSystems.xml').find('numberingSystems'):
                 cache[attrs['id']] = attrs
             assert cache
         return cache
 
     @property
-    def __weekData(self, cache = {}):
-        if not cache:
+    def __weekData(self):
+        cache = self.__cache.table('weekData')
+        if not cache and not self.__fromSnapshot('weekData', cache):
             firstDay, weStart, weEnd = self.__getWeekData()
             # Massage those into an easily-consulted form:
             # World defaults given for code '001':
@@ -496,52 +710,112 @@ class CldrAccess (object):
         gives the day on which the week starts, the second gives the
         day on which the week-end starts, the third gives the last day
         of the week-end."""
-        source = self.__supplementalData
+        weekData = self.__supplementalIndex['weekData']
         for key in ('firstDay', 'weekendStart', 'weekendEnd'):
-            result = {}
-            for ignore, attrs in source.find('weekData/' + key):
-                assert ignore == key
-                day = attrs['day']
-                assert day in ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'), day
-                if 'alt' in attrs:
-                    continue
-                for loc in attrs.get('territories', '').split():
-                    result[loc] = day
-            yield result
+            yield weekData[key]
+
+    def __windowsZones(self):
+        """Yields (tag, attrs) pairs for the children of <mapTimezones>."""
+        if self.__snapshot is not None:
+            rows = self.__snapshot.table('windowsZones')
+        else:
+            rows = self.supplement('windowsZones.xml').find('windowsZones/mapTimezones')
+        for row in rows:
+            yield row
 
     @property
-    def __currencyData(self, cache = {}):
-        if not cache:
-            source = self.__supplementalData
-            for elt in source.findNodes('currencyData/region'):
+    def __currencyData(self):
+        cache = self.__cache.table('currencyData')
+        if not cache and not self.__fromSnapshot('currencyData', cache):
+            index = self.__supplementalIndex
+            fractions = index['fractions']
+            for country, currencies in index['regions']:
                 iso, digits, rounding = '', 2, 1
-                try:
-                    country = elt.dom.attributes['iso3166'].nodeValue
-                except KeyError:
-                    continue
-                for child in elt.findAllChildren('currency'):
+                for attrs in currencies:
                     try:
-                        if child.dom.attributes['tender'].nodeValue == 'false':
+                        if attrs['tender'] == 'false':
                             continue
                     except KeyError:
                         pass
                     try:
-                        child.dom.attributes['to'] # Is set if this element has gone out of date.
+                        attrs['to'] # Is set if this element has gone out of date.
                     except KeyError:
-                        iso = child.dom.attributes['iso4217'].nodeValue
+                        iso = attrs['iso4217']
                         break
                 if iso:
-                    for tag, data in source.find(
-                        'currencyData/fractions/info[iso4217={}]'.format(iso)):
-                        digits = data['digits']
-                        rounding = data['rounding']
+                    digits, rounding = fractions.get(iso, (digits, rounding))
                 cache[country] = iso, digits, rounding
             assert cache
 
         return cache
 
     @property
-    def __unDistinguishedAttributes(self, cache = {}, joinPath = os.path.join):
+    def __supplementalIndex(self):
+        """Keyed indices of the parts of supplementalData.xml we use.
+
+        Built in a single pass over the file, so that each later
+        look-up is a dictionary access rather than an XPath search.
+        This is a mapping with keys:
+
+          fractions -- maps ISO 4217 currency codes to (digits,
+                       rounding) pairs; a later entry for the same
+                       code overrides an earlier one
+          regions -- a list of (iso3166, currencies) pairs, one per
+                     currencyData/region with an iso3166 attribute, in
+                     document order; currencies is a list of the
+                     attribute mappings of its <currency> children
+          weekData -- maps each of firstDay, weekendStart and
+                      weekendEnd to a mapping from territory codes to
+                      day names, skipping alt entries
+          parentLocales -- maps each locale to its parent's name
+
+        Holds no data (and is not needed) when a snapshot is used."""
+        cache = self.__cache.table('supplementalIndex')
+        if not cache:
+            fractions, regions, parents = {}, [], {}
+            weekData = dict((key, {}) for key in ('firstDay', 'weekendStart', 'weekendEnd'))
+            for top in self.__supplementalData.root.children():
+                tag = top.tag
+                if tag == 'currencyData':
+                    for elt in top.children():
+                        if elt.tag == 'fractions':
+                            for info in elt.findAllChildren('info'):
+                                attrs = info.attributes
+                                fractions[attrs['iso4217']] = attrs['digits'], attrs['rounding']
+                        elif elt.tag == 'region':
+                            try:
+                                country = elt.attributes['iso3166']
+                            except KeyError:
+                                continue
+                            regions.append((country, [child.attributes for child in
+                                                      elt.findAllChildren('currency')]))
+                elif tag == 'weekData':
+                    for elt in top.children():
+                        try:
+                            result = weekData[elt.tag]
+                        except KeyError:
+                            continue
+                        attrs = elt.attributes
+                        day = attrs['day']
+                        assert day in ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun'), day
+                        if 'alt' in attrs:
+                            continue
+                        for loc in attrs.get('territories', '').split():
+                            result[loc] = day
+                elif tag == 'parentLocales':
+                    for elt in top.children():
+                        attrs = elt.attributes
+                        if attrs:
+                            parent = attrs.get('parent', '')
+                            for child in attrs['locales'].split():
+                                parents[child] = parent
+
+            cache.update(fractions = fractions, regions = regions,
+                         weekData = weekData, parentLocales = parents)
+        return cache
+
+    @property
+    def __unDistinguishedAttributes(self):
         """Mapping from tag names to lists of attributes.
 
         LDML defines some attributes as 'distinguishing': if a node
@@ -549,61 +823,128 @@ class CldrAccess (object):
         XPath, a search on that XPath should exclude the node's
         children.
 
-        This property is a mapping from tag names to tuples of
+        This property is a mapping from tag names to frozensets of
         attribute names that *aren't* distinguishing for that tag.
         Its value is cached (so its costly computation isonly done
         once) and there's a side-effect of populating its cache: it
-        sets self.__cldrVersion to the value found in ldml.dtd, during
-        parsing."""
+        records, as the cache's cldrVersion table, the value found in
+        ldml.dtd, during parsing."""
+        cache = self.__cache.table('ldmlDtd')
         if not cache:
-            cache.update(self.__scanLdmlDtd())
+            if self.__fromSnapshot('ldmlDtd', cache):
+                # Older snapshots hold tuples:
+                for tag, attrs in cache.items():
+                    cache[tag] = frozenset(attrs)
+            else:
+                cache.update(self.__readLdmlDtd())
             assert cache
 
         return cache
 
-    def __scanLdmlDtd(self, joinPath = os.path.join):
-        """Scan the LDML DTD, record CLDR version
+    # Directory in which to save what __readLdmlDtd() learns from each
+    # version of ldml.dtd; None to not save it.  Defaults to one in the
+    # user's cache directory (not in the source tree):
+    dtdCacheDirectory = os.path.join(os.environ.get('XDG_CACHE_HOME')
+                                     or os.environ.get('LOCALAPPDATA')
+                                     or os.path.join(os.path.expanduser('~'), '.cache'),
+                                     'qt-locale-database')
+
+    def __readLdmlDtd(self, joinPath = os.path.join, isDirectory = os.path.isdir,
+                      makeDirectories = os.makedirs, rename = os.rename, getPid = os.getpid,
+                      isFile = os.path.isfile, removeFile = os.remove):
+        """Mapping from tag names to frozensets of non-distinguishing attributes.
+
+        The mapping, along with the CLDR version (recorded in the
+        cache's cldrVersion table), is read from a file in
+        dtdCacheDirectory, named for the SHA-1 digest of ldml.dtd, if
+        there is one; otherwise, it's found by __scanLdmlDtd() and
+        saved to such a file, for use by later runs.  Failure to save
+        it (including when ldml.dtd doesn't say which CLDR version it
+        is) is ignored, leaving no partial file behind."""
+        with self.__open(('common', 'dtd', 'ldml.dtd')) as dtd:
+            text = dtd.read()
+        folder = self.dtdCacheDirectory
+        if folder is None:
+            return dict((tag, frozenset(attrs))
+                        for tag, attrs in self.__scanLdmlDtd(text.splitlines(True)))
+
+        path = joinPath(folder, 'ldml-dtd-{}.json'.format(hashlib.sha1(text).hexdigest()))
+        try:
+            with open(path) as fd:
+                saved = json.load(fd)
+            self.__cache.tables['cldrVersion'] = str(saved['cldrVersion'])
+            return dict((str(tag), frozenset(str(a) for a in attrs))
+                        for tag, attrs in saved['attributes'].items())
+        except (IOError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+        table = dict((tag, frozenset(attrs))
+                     for tag, attrs in self.__scanLdmlDtd(text.splitlines(True)))
+        try:
+            saved = dict(cldrVersion = self.__cache.tables['cldrVersion'],
+                         attributes = dict((tag, sorted(attrs))
+                                           for tag, attrs in table.items()))
+            if not isDirectory(folder):
+                makeDirectories(folder)
+            # Write to a temporary file and rename, so that no reader
+            # ever sees a partial file:
+            temp = '{}.{}.tmp'.format(path, getPid())
+            try:
+                with open(temp, 'w') as fd:
+                    json.dump(saved, fd, indent = 1, sort_keys = True,
+                              separators = (',', ': '))
+                rename(temp, path)
+            except:
+                if isFile(temp):
+                    removeFile(temp)
+                raise
+        except (IOError, OSError, KeyError):
+            pass
+        return table
+
+    def __scanLdmlDtd(self, lines):
+        """Scan the lines of the LDML DTD, record CLDR version
 
         Yields (tag, attrs) pairs: on elements with a given tag,
         attributes named in its attrs (a tuple) may be ignored in an
         XPath search; other attributes are distinguished attributes,
         in the terminology of LDML's locale-inheritance rules.
 
-        Sets self.__cldrVersion as a side-effect, since this
-        information is found in the same file."""
-        with self.__open(('common', 'dtd', 'ldml.dtd')) as dtd:
-            tag, ignored, last = None, None, None
-
-            for line in dtd:
-                if line.startswith('<!ELEMENT '):
-                    if ignored:
-                        assert tag
-                        yield tag, tuple(ignored)
-                    tag, ignored, last = line.split()[1], [], None
-                    continue
+        Records the cache's cldrVersion table as a side-effect, since
+        this information is found in the same file."""
+        tag, ignored, last = None, None, None
 
-                if line.startswith('<!ATTLIST '):
-                    assert tag is not None
-                    parts = line.split()
-                    assert parts[1] == tag
-                    last = parts[2]
-                    if parts[1:5] == ['version', 'cldrVersion', 'CDATA', '#FIXED']:
-                        # parts[5] is the version, in quotes, although the final > might be stuck on its end:
-                        self.__cldrVersion = parts[5].split('"')[1]
-                    continue
+        for line in lines:
+            if line.startswith('<!ELEMENT '):
+                if ignored:
+                    assert tag
+                    yield tag, tuple(ignored)
+                tag, ignored, last = line.split()[1], [], None
+                continue
 
-                # <!ELEMENT...>s can also be @METADATA, but not @VALUE:
-                if '<!--@VALUE-->' in line or (last and '<!--@METADATA-->' in line):
-                    assert last is not None
-                    assert ignored is not None
-                    assert tag is not None
-                    ignored.append(last)
-                    last = None # No attribute is both value and metadata
+            if line.startswith('<!ATTLIST '):
+                assert tag is not None
+                parts = line.split()
+                assert parts[1] == tag
+                last = parts[2]
+                if parts[1:5] == ['version', 'cldrVersion', 'CDATA', '#FIXED']:
+                    # parts[5] is the version, in quotes, although the final > might be stuck on its end:
+                    self.__cache.tables['cldrVersion'] = parts[5].split('"')[1]
+                continue
+
+            # <!ELEMENT...>s can also be @METADATA, but not @VALUE:
+            if '<!--@VALUE-->' in line or (last and '<!--@METADATA-->' in line):
+                assert last is not None
+                assert ignored is not None
+                assert tag is not None
+                ignored.append(last)
+                last = None # No attribute is both value and metadata
 
-            if tag and ignored:
-                yield tag, tuple(ignored)
+        if tag and ignored:
+            yield tag, tuple(ignored)
 
-    def __enumMap(self, key, cache = {}):
+    def __enumMap(self, key):
+        cache = self.__cache.table('enumMap')
         if not cache:
             cache['variant'] = {'': (0, 'This should never be seen outside ldml.py')}
             # They're not actually lists: mappings from numeric value
@@ -626,10 +967,11 @@ class CldrAccess (object):
 
         return cache[key]
 
-    def __codeMap(self, key, cache = {},
+    def __codeMap(self, key,
                   # Maps our name for it to CLDR's name:
                   naming = {'language': 'languages', 'script': 'scripts',
                             'country': 'territories', 'variant': 'variants'}):
+        cache = self.__cache.table('codeMap')
         if not cache:
             root = self.xml('common', 'main', 'en.xml').root.findUniqueChild('localeDisplayNames')
             for dst, src in naming.items():
@@ -651,37 +993,40 @@ class CldrAccess (object):
         in node's children (skipping any with an alt attribute, if
         their type has been seen previously)."""
         seen = set()
-        for elt in node.dom.childNodes:
+        for elt in node.children():
+            attrs = elt.attributes
             try:
-                key, value = elt.attributes['type'].nodeValue, elt.childNodes[0].wholeText
-            except (KeyError, ValueError, TypeError):
+                key, value = attrs['type'], elt.text
+            except KeyError:
                 pass
             else:
-                if key not in seen or not elt.attributes.has_key('alt'):
+                if key not in seen or 'alt' not in attrs:
                     yield key, value
                     seen.add(key)
 
     # CLDR uses inheritance between locales to save repetition:
-    def __parentLocale(self, name, cache = {}):
+    @property
+    def __parentLocales(self):
         # see http://www.unicode.org/reports/tr35/#Parent_Locales
-        if not cache:
-            for tag, attrs in self.__supplementalData.find('parentLocales'):
-                parent = attrs.get('parent', '')
-                for child in attrs['locales'].split():
-                    cache[child] = parent
+        cache = self.__cache.table('parentLocales')
+        if not cache and not self.__fromSnapshot('parentLocales', cache):
+            cache.update(self.__supplementalIndex['parentLocales'])
             assert cache
 
-        return cache[name]
+        return cache
+
+    def __parentLocale(self, name):
+        return self.__parentLocales[name]
 
     def __localeAsDoc(self, name, aliasFor = None,
                       joinPath = os.path.join, exists = os.path.isfile):
         path = ('common', 'main', name + '.xml')
         if exists(joinPath(self.root, *path)):
             elt = self.__xml(path)
-            for child in Node(elt).findAllChildren('alias'):
+            for child in self.__Node(elt).findAllChildren('alias'):
                 try:
-                    alias = child.dom.attributes['source'].nodeValue
-                except (KeyError, AttributeError):
+                    alias = child.attributes['source']
+                except KeyError:
                     pass
                 else:
                     return self.__localeAsDoc(alias, aliasFor or name)
@@ -696,7 +1041,7 @@ class CldrAccess (object):
         while name and name != 'root':
             doc = self.__localeAsDoc(name)
             if doc is not None:
-                yield Node(doc, self.__unDistinguishedAttributes)
+                yield self.__Node(doc, self.__unDistinguishedAttributes)
 
             try:
                 name = self.__parentLocale(name)
@@ -706,13 +1051,13 @@ class CldrAccess (object):
                 except ValueError: # No tail to discard: we're done
                     break
 
-    class __Seq (list): pass # No weakref for tuple and list, but list sub-class is ok.
-    def __localeRoots(self, name, cache = CacheDict()):
+    def __localeRoots(self, name):
+        cache = self.__cache.chains
         try:
             chain = cache[name]
         except KeyError:
-            cache[name] = chain = self.__Seq(self.__scanLocaleRoots(name))
+            cache[name] = chain = tuple(self.__scanLocaleRoots(name))
         return chain
 
 # Unpolute the namespace: we don't need to export these.
-del minidom, CacheDict, os
+del os
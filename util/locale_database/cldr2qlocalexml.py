@@ -59,12 +59,17 @@ import sys
 
 from localetools import Error
 from cldr import CldrReader
+from ldml import backends
 from qlocalexml import QLocaleXmlWriter
 from enumdata import language_list, script_list, country_list
 
 def usage(name, err, message = ''):
-    err.write("""Usage: {} path/to/cldr/common/main [out-file.xml]
-""".format(name)) # TODO: expand command-line, improve help message
+    err.write("""Usage: {} [--backend {}] [--jobs N] [--snapshot FILE] path/to/cldr/common/main [out-file.xml]
+Options:
+  --backend   XML library to use for parsing (default: minidom)
+  --jobs      number of processes to read locales; 0 for one per CPU (default: 1)
+  --snapshot  load CLDR data from this snapshot (see cldrsnapshot.py), not XML
+""".format(name, '|'.join(sorted(backends)))) # TODO: expand command-line, improve help message
     if message:
         err.write('\n' + message + '\n')
 
@@ -74,6 +79,30 @@ def main(args, out, err):
 
     # TODO: make argument parsing more sophisticated
     name = args.pop(0)
+    backend, jobs, snapshot = 'minidom', 1, None
+    while args and args[0] in ('--backend', '--jobs', '--snapshot'):
+        option = args.pop(0)
+        value = args.pop(0) if args else None
+        if option == '--snapshot':
+            if not value or not os.path.isfile(value):
+                usage(name, err, 'No such snapshot file: {}'.format(value))
+                return 1
+            snapshot = value
+        elif option == '--backend':
+            if value not in backends:
+                usage(name, err, 'Unknown XML backend: {}'.format(value))
+                return 1
+            backend = value
+        else:
+            try:
+                jobs = int(value)
+            except (TypeError, ValueError):
+                jobs = -1
+            if jobs < 0:
+                usage(name, err, 'Job count must be a non-negative integer, not {}'.format(value))
+                return 1
+            jobs = jobs or None # Zero means one per CPU
+
     if not args:
         usage(name, err, 'Where is your CLDR data tree ?')
         return 1
@@ -107,13 +136,17 @@ def main(args, out, err):
         sys.setdefaultencoding('UTF-8')
 
     # TODO - command line options to tune choice of grumble and whitter:
-    reader = CldrReader(root, err.write, err.write)
+    try:
+        reader = CldrReader(root, err.write, err.write, backend, snapshot)
+    except Error as e:
+        usage(name, err, e.message)
+        return 1
     writer = QLocaleXmlWriter(emit.write)
 
     writer.version(reader.root.cldrVersion)
     writer.enumData(language_list, script_list, country_list)
     writer.likelySubTags(reader.likelySubTags())
-    writer.locales(reader.readLocales(calendars), calendars)
+    writer.locales(reader.readLocales(calendars, jobs), calendars)
 
     writer.close()
     return 0
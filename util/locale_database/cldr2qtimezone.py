@@ -41,7 +41,7 @@ import re
 import datetime
 import textwrap
 
-from localetools import unicode2hex, wrap_list, Error, SourceFileEditor
+from localetools import wrap_hex, Error, SourceFileEditor
 from cldr import CldrAccess
 
 ### Data that may need updates in response to new entries in the CLDR file ###
@@ -244,7 +244,7 @@ utcIdList = (
 
 class ByteArrayData:
     def __init__(self):
-        self.data = []
+        self.data = bytearray()
         self.hash = {}
 
     def append(self, s):
@@ -252,17 +252,16 @@ class ByteArrayData:
         if s in self.hash:
             return self.hash[s]
 
-        lst = unicode2hex(s)
         index = len(self.data)
         if index > 0xffff:
             raise Error('Index ({}) outside the uint16 range !'.format(index))
         self.hash[s] = index
-        self.data += lst
+        self.data += s.encode('ascii') # IANA and Windows IDs are plain ASCII
         return index
 
     def write(self, out, name):
         out('\nstatic const char {}[] = {{\n'.format(name))
-        out(wrap_list(self.data))
+        out(wrap_hex(self.data))
         out('\n};\n')
 
 class ZoneIdWriter (SourceFileEditor):
@@ -325,7 +324,8 @@ class ZoneIdWriter (SourceFileEditor):
         return windowsIdData, ianaIdData
 
 def usage(err, name, message=''):
-    err.write("""Usage: {} path/to/cldr/core/common path/to/qtbase
+    err.write("""Usage: {} [--snapshot FILE] path/to/cldr/core/common path/to/qtbase
+Option --snapshot loads CLDR data from the given snapshot (see cldrsnapshot.py).
 """.format(name)) # TODO: more interesting message
     if message:
         err.write('\n' + message + '\n')
@@ -339,6 +339,14 @@ def main(args, out, err):
     checkout. Updates QTimeZone's private data about Windows time-zone
     IDs."""
     name = args.pop(0)
+    snapshot = None
+    if args and args[0] == '--snapshot':
+        args.pop(0)
+        snapshot = args.pop(0) if args else None
+        if not snapshot or not os.path.isfile(snapshot):
+            usage(err, name, 'No such snapshot file: {}'.format(snapshot))
+            return 1
+
     if len(args) != 2:
         usage(err, name, "Expected two arguments")
         return 1
@@ -359,7 +367,7 @@ def main(args, out, err):
         return 1
 
     try:
-        version, defaults, winIds = CldrAccess(cldrPath).readWindowsTimeZones(
+        version, defaults, winIds = CldrAccess(cldrPath, snapshot = snapshot).readWindowsTimeZones(
             dict((name, ind) for ind, name in enumerate((x[0] for x in windowsIdList), 1)))
     except IOError as e:
         usage(err, name,
@@ -385,8 +393,10 @@ def main(args, out, err):
         err.write('\nError in Windows ID data: ' + e.message + '\n')
         return 1
 
-    writer.close()
-    out.write('Data generation completed, please check the new file at ' + dataFilePath + '\n')
+    if writer.close():
+        out.write('Data generation completed, please check the new file at ' + dataFilePath + '\n')
+    else:
+        out.write('Data generation completed, no change to ' + dataFilePath + '\n')
     return 0
 
 if __name__ == '__main__':
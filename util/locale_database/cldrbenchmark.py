@@ -0,0 +1,185 @@
+#!/usr/bin/env python2
+# coding=utf8
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the test suite of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+"""Benchmark the XML backends used to read CLDR data
+
+Performs the full work of cldr2qlocalexml.py (discarding its output)
+with each XML backend in turn and reports the time taken and the peak
+resident memory of each.  Each run is done in a fresh child process,
+so that its peak memory use is not hidden by an earlier run's and no
+run benefits from caches filled by another.
+
+Pass the root of an unpacked CLDR core.zip (as for cldr2qlocalexml.py)
+as the last command-line argument.  Options:
+
+  --backend NAME  only benchmark this backend (may be repeated)
+  --repeat N      run each backend N times, reporting the fastest
+  --jobs N        number of processes reading locales; 0 for one per
+                  CPU (default 1); peak RSS is then only the main
+                  process's
+  --snapshot FILE also benchmark loading from this snapshot of the
+                  CLDR tree (see cldrsnapshot.py)
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from ldml import backends
+
+class NullWriter (object):
+    """Stand-in for an output file: counts, but discards, output."""
+    def __init__(self):
+        self.size = 0
+
+    def write(self, text):
+        self.size += len(text)
+
+def runOnce(root, backend, jobs = 1, snapshot = None,
+            calendars = ('gregorian', 'persian', 'islamic')):
+    """Perform the work of cldr2qlocalexml.py using the given backend.
+
+    If snapshot is given, it is used in place of the backend.
+
+    Returns a triple: the time taken (in seconds), the peak resident
+    memory of this process (in kilobytes) and the number of locales
+    written."""
+    from cldr import CldrReader
+    from qlocalexml import QLocaleXmlWriter
+    from enumdata import language_list, script_list, country_list
+
+    start = time.time()
+    reader = CldrReader(root, backend = backend, snapshot = snapshot)
+    sink = NullWriter()
+    writer = QLocaleXmlWriter(sink.write)
+    writer.version(reader.root.cldrVersion)
+    writer.enumData(language_list, script_list, country_list)
+    writer.likelySubTags(reader.likelySubTags())
+    locales = reader.readLocales(calendars, jobs or None)
+    writer.locales(locales, calendars)
+    writer.close()
+    return (time.time() - start,
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            len(locales))
+
+def measure(root, backend, jobs, snapshot = None):
+    """Run runOnce() in a child process and return its results."""
+    child = subprocess.Popen([sys.executable, os.path.abspath(__file__),
+                              '--child', backend, str(jobs), root]
+                             + ([snapshot] if snapshot else []),
+                             stdout = subprocess.PIPE)
+    output = child.communicate()[0]
+    if child.returncode:
+        raise RuntimeError('Benchmark of {} backend failed'.format(backend))
+    seconds, memory, count = output.split()
+    return float(seconds), int(memory), int(count)
+
+def usage(err, name, message = ''):
+    err.write("""Usage: {} [--backend {}]... [--repeat N] [--jobs N] [--snapshot FILE] path/to/cldr
+""".format(name, '|'.join(sorted(backends))))
+    if message:
+        err.write('\n' + message + '\n')
+
+def main(args, out, err):
+    name = args.pop(0)
+    if args and args[0] == '--child':
+        # As for cldr2qlocalexml.py, to let the writer mix str and unicode:
+        reload(sys)
+        sys.setdefaultencoding('UTF-8')
+        seconds, memory, count = runOnce(args[3], args[1], int(args[2]),
+                                         args[4] if len(args) > 4 else None)
+        out.write('{:.3f} {} {}\n'.format(seconds, memory, count))
+        return 0
+
+    chosen, repeat, jobs, snapshot = [], 1, 1, None
+    while len(args) > 1 and args[0] in ('--backend', '--repeat', '--jobs', '--snapshot'):
+        option, value = args.pop(0), args.pop(0)
+        if option == '--snapshot':
+            if not os.path.isfile(value):
+                usage(err, name, 'No such snapshot file: ' + value)
+                return 1
+            snapshot = value
+        elif option == '--repeat':
+            try:
+                repeat = int(value)
+            except ValueError:
+                repeat = 0
+            if repeat < 1:
+                usage(err, name, 'Repeat count must be a positive integer, not ' + value)
+                return 1
+        elif option == '--jobs':
+            try:
+                jobs = int(value)
+            except ValueError:
+                jobs = -1
+            if jobs < 0:
+                usage(err, name, 'Job count must be a non-negative integer, not ' + value)
+                return 1
+        elif value in backends:
+            chosen.append(value)
+        else:
+            usage(err, name, 'Unknown XML backend: ' + value)
+            return 1
+
+    if len(args) != 1:
+        usage(err, name, 'I expect exactly one CLDR root directory')
+        return 1
+    root = args[0]
+    if not os.path.exists(os.path.join(root, 'common', 'main', 'root.xml')):
+        usage(err, name, 'Found no common/main/root.xml under ' + root)
+        return 1
+
+    results = []
+    # Measure the long-standing minidom first, for comparison with the rest:
+    tests = [(backend, backend, None) for backend in
+             chosen or sorted(backends, key = lambda k: (k != 'minidom', k))]
+    if snapshot:
+        tests.append(('snapshot', 'compact', snapshot))
+    for label, backend, source in tests:
+        runs = [measure(root, backend, jobs, source) for i in range(repeat)]
+        seconds = min(run[0] for run in runs)
+        memory = min(run[1] for run in runs)
+        results.append((label, seconds, memory, runs[0][2]))
+
+    out.write('{:<10} {:>10} {:>14} {:>8}\n'.format('backend', 'time (s)',
+                                                    'peak RSS (MB)', 'locales'))
+    for backend, seconds, memory, count in results:
+        out.write('{:<10} {:>10.2f} {:>14.1f} {:>8}\n'.format(
+                backend, seconds, memory / 1024., count))
+    if len(results) > 1:
+        first = results[0]
+        for backend, seconds, memory, count in results[1:]:
+            out.write('{} / {}: {:.2f} x time, {:.2f} x memory\n'.format(
+                    backend, first[0], seconds / first[1], memory / float(first[2])))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv, sys.stdout, sys.stderr))
@@ -0,0 +1,221 @@
+#!/usr/bin/env python2
+# coding=utf8
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the test suite of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+"""Pre-compile CLDR data to a snapshot, for faster repeated reading
+
+Every run of cldr2qlocalexml.py or cldr2qtimezone.py parses the XML of
+the whole CLDR tree, scans ldml.dtd and digests the supplemental data.
+When iterating on changes to enumdata.py or the generators, against
+the same CLDR version, that work is the same every time.  Run this
+script once, passing the root of the CLDR tree and the name of a file
+to create:
+
+  ./cldrsnapshot.py path/to/cldr cldr.snapshot
+
+then pass --snapshot cldr.snapshot to cldr2qlocalexml.py or
+cldr2qtimezone.py to have them load from the snapshot instead.
+
+The snapshot holds each XML file that CldrAccess reads as a compact
+tree (see ldml.CompactNode), saved with marshal so that each loads
+quickly, when first needed; and the tables CldrAccess digests from
+the supplemental data and the DTD (see CldrAccess.snapshotTables()),
+which are loaded at once.  It also records the size, modification time
+and SHA-1 digest of each source file; when a snapshot is loaded, it is
+checked against the source tree and refused if any file has changed,
+or if files have been added to or removed from common/main/.  A file
+whose modification time has changed is only considered changed if its
+digest differs.  The format is specific to the python version used.
+"""
+
+import hashlib
+import marshal
+import os
+import struct
+
+from localetools import Error
+from ldml import CompactNode
+
+class CldrSnapshot (object):
+    """Read access to a snapshot file."""
+    def __init__(self, path, root):
+        """Load the snapshot in file path, of the CLDR tree at root.
+
+        Raises Error if the file isn't a snapshot, was written by an
+        incompatible python version or is out of date."""
+        try:
+            with open(path, 'rb') as fd:
+                if fd.read(len(self.__magic)) != self.__magic:
+                    raise Error('Not a CLDR snapshot (or from an old version): ' + path)
+                size, = struct.unpack('<Q', fd.read(8))
+                header = marshal.loads(fd.read(size))
+        except (IOError, struct.error, EOFError, ValueError, TypeError) as e:
+            raise Error('Failed to read CLDR snapshot {}: {}'.format(path, e))
+
+        if header['marshal'] != marshal.version:
+            raise Error('CLDR snapshot {} was written by a different python version'.format(path))
+        self.path, self.root = path, root
+        self.__start = len(self.__magic) + 8 + size
+        self.__files, self.__tables = header['files'], header['tables']
+        self.__check(header['stamps'], header['main'])
+
+    def tree(self, path):
+        """Load the file at path, relative to root, as a CompactNode.Tree.
+
+        The path is a tuple of the names of the directories leading
+        to the file and of the file itself.  Returns None if the file
+        isn't in the snapshot."""
+        try:
+            offset, size = self.__files[path]
+        except KeyError:
+            return None
+        with open(self.path, 'rb') as fd:
+            fd.seek(self.__start + offset)
+            return CompactNode.Tree(marshal.loads(fd.read(size)))
+
+    def table(self, name):
+        """One of the tables returned by CldrAccess.snapshotTables()."""
+        return self.__tables[name]
+
+    @classmethod
+    def write(cls, path, root):
+        """Write a snapshot of the CLDR tree at root to file path.
+
+        Returns the number of XML files included."""
+        from cldr import CldrAccess # Imports this module.
+        joinPath = os.path.join
+
+        main = cls.__mainFiles(root)
+        paths = ([('common', 'main', name) for name in main]
+                 + [('common', 'supplemental', name) for name in cls.__supplements])
+        stamps = dict((p, cls.__stamp(joinPath(root, *p))) for p in paths + [cls.__dtd])
+
+        blobs, files, offset = [], {}, 0
+        for p in paths:
+            blob = marshal.dumps(CompactNode.parse(joinPath(root, *p)).root)
+            files[p] = offset, len(blob)
+            offset += len(blob)
+            blobs.append(blob)
+
+        header = marshal.dumps(dict(
+                marshal = marshal.version, files = files, stamps = stamps, main = main,
+                tables = CldrAccess(root, 'compact').snapshotTables()))
+
+        # Write to a temporary file and rename it, so that a failure
+        # part way through leaves any prior snapshot intact:
+        temp = path + '.tmp'
+        with open(temp, 'wb') as fd:
+            fd.write(cls.__magic)
+            fd.write(struct.pack('<Q', len(header)))
+            fd.write(header)
+            for blob in blobs:
+                fd.write(blob)
+        os.rename(temp, path)
+        return len(paths)
+
+    # Implementation details
+    __magic = 'Qt CLDR snapshot, format 1\n'
+    __dtd = ('common', 'dtd', 'ldml.dtd')
+    __supplements = ('supplementalData.xml', 'supplementalMetadata.xml', 'likelySubtags.xml',
+                     'numberingSystems.xml', 'windowsZones.xml')
+
+    @staticmethod
+    def __mainFiles(root):
+        return tuple(sorted(name for name in os.listdir(os.path.join(root, 'common', 'main'))
+                            if name.endswith('.xml')))
+
+    @staticmethod
+    def __digest(filename):
+        with open(filename, 'rb') as fd:
+            return hashlib.sha1(fd.read()).hexdigest()
+
+    @classmethod
+    def __stamp(cls, filename):
+        stat = os.stat(filename)
+        return stat.st_size, stat.st_mtime, cls.__digest(filename)
+
+    def __check(self, stamps, main):
+        def stale(why):
+            return Error('CLDR snapshot {} is out of date ({}); '
+                         'please regenerate it with cldrsnapshot.py'.format(self.path, why))
+
+        try:
+            if self.__mainFiles(self.root) != main:
+                raise stale('files have been added to or removed from common/main/')
+        except OSError as e:
+            raise stale(e)
+
+        for path, (size, mtime, digest) in stamps.items():
+            filename = os.path.join(self.root, *path)
+            try:
+                stat = os.stat(filename)
+                if stat.st_size != size or (stat.st_mtime != mtime
+                                            and self.__digest(filename) != digest):
+                    raise stale('{} has changed'.format('/'.join(path)))
+            except (OSError, IOError) as e:
+                raise stale(e)
+
+def usage(err, name, message = ''):
+    err.write("""Usage: {} path/to/cldr path/to/snapshot
+""".format(name))
+    if message:
+        err.write('\n' + message + '\n')
+
+def main(args, out, err):
+    """Writes a snapshot of a CLDR tree.
+
+    Takes sys.argv, sys.stdout, sys.stderr (or equivalents) as
+    arguments. Expects two command-line options: the root of the
+    unpacked CLDR data-file tree and the name of the snapshot file to
+    write."""
+    name = args.pop(0)
+    if len(args) != 2:
+        usage(err, name, 'Expected two arguments')
+        return 1
+
+    root, path = args
+    if not os.path.exists(os.path.join(root, 'common', 'main', 'root.xml')):
+        usage(err, name, 'First argument is the root of the CLDR tree: '
+              'found no common/main/root.xml under ' + root)
+        return 1
+
+    try:
+        count = CldrSnapshot.write(path, root)
+    except (IOError, OSError) as e:
+        err.write('Failed to write snapshot: {}\n'.format(e))
+        return 1
+    except Error as e:
+        err.write('Failed to read CLDR data: {}\n'.format(e.message))
+        return 1
+
+    out.write('Wrote snapshot of {} files to {}\n'.format(count, path))
+    return 0
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main(sys.argv, sys.stdout, sys.stderr))
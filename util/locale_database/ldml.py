@@ -28,21 +28,31 @@
 """Parsing the Locale Data Markup Language
 
 It's an XML format, so the raw parsing of XML is, of course, delegated
-to xml.dom.minidom; but it has its own specific schemata and some
-funky rules for combining data from various files (inheritance between
-locales). The use of it we're interested in is extraction of CLDR's
-data, so some of the material here is specific to CLDR; see cldr.py
-for how it is mainly used.
-
-Provides various classes to wrap xml.dom's objects, specifically those
-returned by minidom.parse() and their child-nodes:
-  Node -- wraps any node in the DOM tree
+to a standard XML library: either xml.dom.minidom or (more compactly
+and quickly) xml.etree's iterparse(); but it has its own specific
+schemata and some funky rules for combining data from various files
+(inheritance between locales). The use of it we're interested in is
+extraction of CLDR's data, so some of the material here is specific
+to CLDR; see cldr.py for how it is mainly used.
+
+Provides various classes to wrap the XML library's objects,
+specifically the root elements of parsed files and their children:
+  Node -- wraps any element in a tree parsed by xml.dom.minidom
+  EtreeNode -- wraps any element in a tree parsed by xml.etree
+  CompactNode -- wraps any element of a tree of plain tuples
   XmlScanner -- wraps the root element of a stand-alone XML file
   Supplement -- specializes XmlScanner for supplemental data files
   LocaleScanner -- wraps a locale's inheritance-chain of file roots
 
-See individual classes for further detail.
+The backends dictionary maps the name of each XML library (as used by
+the --backend option of cldr2qlocalexml.py) to the class that wraps
+its elements; the 'compact' backend parses with xml.etree, then
+converts to plain tuples, as saved by cldrsnapshot.py.  See individual
+classes for further detail.
 """
+from xml.dom import minidom
+from xml.etree import cElementTree
+
 from localetools import Error
 from dateconverter import convert_date
 
@@ -51,7 +61,9 @@ class Node (object):
 
     Provides various ways to select chldren of a node. Selected child
     nodes are returned wrapped as Node objects.  A Node exposes the
-    raw DOM node it wraps via its .dom attribute."""
+    raw DOM node it wraps via its .dom attribute; but its tag,
+    attributes and text properties are the portable way to access its
+    content, as they also work for the other backends' wrappers."""
 
     def __init__(self, elt, dullAttrs = None, draft = 0):
         """Wraps a DOM node for ease of access.
@@ -59,7 +71,7 @@ class Node (object):
         First argument, elt, is the DOM node to wrap.
 
         Optional second argument, dullAttrs, should either be None or
-        map each LDML tag name to a list of the names of
+        map each LDML tag name to a frozenset of the names of
         non-distinguishing attributes for nodes with the given tag
         name. If None is given, no distinguishing attribute checks are
         performed.
@@ -68,12 +80,62 @@ class Node (object):
         this class's creation of child nodes; it is the maximum draft
         score of any ancestor of the new node.)"""
         self.dom, self.__dull = elt, dullAttrs
+        self.draft = max(draft, self.draftScore(self._attributeOf(elt, 'draft')))
+
+    @staticmethod
+    def parse(path):
+        """Parse an XML file, returning its root element."""
+        return minidom.parse(path).documentElement
+
+    @property
+    def tag(self):
+        return self._tagOf(self.dom)
+
+    @property
+    def attributes(self):
+        """Mapping from attribute names to values; do not modify."""
+        return self._attributesOf(self.dom)
+
+    @property
+    def text(self):
+        """The text at the start of this node's content.
+
+        This is None if the node has no content or its content starts
+        with a child element."""
+        return self._textOf(self.dom)
+
+    @property
+    def hasContent(self):
+        """True precisely if this node has any child nodes, including text."""
+        return self._hasContent(self.dom)
+
+    def children(self):
+        """All child elements, regardless of tag and attributes."""
+        for child in self._elementsOf(self.dom):
+            yield self.__class__(child, self.__dull, self.draft)
+
+    def __childIndex(self):
+        """Map from tag to a list of (child, attrs, distinct) triples.
+
+        Each child with the given tag is included, as a Node, along
+        with a mapping from its attributes' names to their values and
+        a frozenset of the names of its distinguishing attributes.  The
+        index is built when first needed and kept for the lifetime of
+        this Node, so each child's wrapper (and its draft score) is
+        only computed once, however many searches we do."""
         try:
-            attr = elt.attributes['draft'].nodeValue
-        except KeyError:
-            self.draft = draft
-        else:
-            self.draft = max(draft, self.draftScore(attr))
+            return self.__index
+        except AttributeError:
+            pass
+
+        index, dull, plain = {}, self.__dull, frozenset()
+        for elt in self._elementsOf(self.dom):
+            tag, attrs = self._tagOf(elt), self._attributesOf(elt)
+            distinct = plain if dull is None else frozenset(attrs).difference(dull.get(tag, ()))
+            index.setdefault(tag, []).append((self.__class__(elt, dull, self.draft), attrs, distinct))
+
+        self.__index = index
+        return index
 
     def findAllChildren(self, tag, wanted = None, allDull = False):
         """All children that do have the given tag and attributes.
@@ -91,31 +153,20 @@ class Node (object):
 
         if self.__dull is None:
             allDull = True
-        dull = () if allDull else self.__dull[tag]
-
-        for child in self.dom.childNodes:
-            if child.nodeType != child.ELEMENT_NODE:
-                continue
-            if child.nodeName != tag:
-                continue
 
+        for child, attrs, distinct in self.__childIndex().get(tag, ()):
             if wanted:
-                try:
-                    if any(child.attributes[k].nodeValue != v
-                           for k, v in wanted.items()):
-                        continue
-                except KeyError: # Some wanted attribute is missing
+                # A missing wanted attribute gets None, which never matches:
+                if any(attrs.get(k) != v for k, v in wanted.items()):
                     continue
 
-                if not (allDull or all(k in dull or k in wanted
-                                       for k in child.attributes.keys())):
+                if not (allDull or all(k in wanted for k in distinct)):
                     continue
 
-            elif not (allDull or all(k in dull
-                                     for k in child.attributes.keys())):
+            elif distinct and not allDull:
                 continue
 
-            yield Node(child, self.__dull, self.draft)
+            yield child
 
     def findUniqueChild(self, tag):
         """Returns the single child with the given nodeName.
@@ -154,6 +205,163 @@ class Node (object):
     __draftScores = dict(true = 4, unconfirmed = 3, provisional = 2,
                          contributed = 1, approved = 0, false = 0)
 
+    # Access to the wrapped objects, over-ridden by EtreeNode:
+    @staticmethod
+    def _elementsOf(elt):
+        return (child for child in elt.childNodes if child.nodeType == child.ELEMENT_NODE)
+
+    @staticmethod
+    def _tagOf(elt):
+        return elt.nodeName
+
+    @staticmethod
+    def _attributesOf(elt):
+        return dict(elt.attributes.items())
+
+    @staticmethod
+    def _attributeOf(elt, name): # None if absent
+        attr = elt.getAttributeNode(name)
+        return None if attr is None else attr.value
+
+    @staticmethod
+    def _textOf(elt):
+        text = elt.firstChild
+        if text is None or text.nodeType != text.TEXT_NODE:
+            return None
+        return text.wholeText
+
+    @staticmethod
+    def _hasContent(elt):
+        return bool(elt.childNodes)
+
+class EtreeNode (Node):
+    """Wrapper for an element of an xml.etree tree.
+
+    Behaves exactly as Node, but the tree it wraps takes much less
+    memory and time to build than minidom's.  Its .dom attribute is
+    the raw xml.etree element.  The wrapped tree omits comments and
+    the text between elements, which LDML does not use.
+
+    The constructor also accepts, in place of an element, the
+    ElementTree returned by parse(): the root element's wrapper keeps
+    a reference to that, since ElementTree objects (unlike elements)
+    can be held in caches that only hold weak references."""
+
+    def __init__(self, elt, dullAttrs = None, draft = 0):
+        if isinstance(elt, cElementTree.ElementTree):
+            self.tree, elt = elt, elt.getroot()
+        super(EtreeNode, self).__init__(elt, dullAttrs, draft)
+
+    @staticmethod
+    def parse(path, intern = intern):
+        """Parse an XML file, returning an ElementTree.
+
+        Uses iterparse(), so as to trim each element as soon as it is
+        complete: tag and attribute names and values are interned
+        (they are highly repetitive) and the text after each element,
+        which is only white-space and comments in LDML, is dropped."""
+        names = {}
+        def share(text):
+            # intern() only accepts byte-strings; non-ASCII is unicode.
+            try:
+                return names[text]
+            except KeyError:
+                names[text] = text = intern(text) if isinstance(text, str) else text
+                return text
+
+        parser = cElementTree.iterparse(path)
+        for event, elt in parser:
+            elt.tag, elt.tail = share(elt.tag), None
+            if elt.attrib:
+                elt.attrib = dict((share(k), share(v)) for k, v in elt.attrib.items())
+        return cElementTree.ElementTree(parser.root)
+
+    # Access to the wrapped objects:
+    @staticmethod
+    def _elementsOf(elt):
+        return iter(elt)
+
+    @staticmethod
+    def _tagOf(elt):
+        return elt.tag
+
+    @staticmethod
+    def _attributesOf(elt):
+        return elt.attrib
+
+    @staticmethod
+    def _attributeOf(elt, name):
+        return elt.get(name)
+
+    @staticmethod
+    def _textOf(elt):
+        return elt.text
+
+    @staticmethod
+    def _hasContent(elt):
+        return len(elt) > 0 or elt.text is not None
+
+class CompactNode (Node):
+    """Wrapper for an element of a compact tree.
+
+    Each element of a compact tree is a tuple (tag, attrs, text,
+    children) of its tag, a dict mapping attribute names to values,
+    its text (or None) and a tuple of its child elements.  These are
+    plain data, that marshal can save and load quickly, which is how
+    cldrsnapshot.py uses them.  Otherwise, this behaves exactly as
+    Node; its .dom attribute is the raw tuple.
+
+    The constructor also accepts, in place of an element, a Tree
+    object, as returned by parse(); see EtreeNode for why."""
+
+    class Tree (object):
+        """Weak-referenceable holder for the root of a compact tree."""
+        __slots__ = ('root', '__weakref__')
+        def __init__(self, root):
+            self.root = root
+
+    def __init__(self, elt, dullAttrs = None, draft = 0):
+        if isinstance(elt, self.Tree):
+            self.tree, elt = elt, elt.root
+        super(CompactNode, self).__init__(elt, dullAttrs, draft)
+
+    @classmethod
+    def parse(cls, path):
+        """Parse an XML file, returning a Tree."""
+        return cls.Tree(cls.compact(EtreeNode.parse(path).getroot()))
+
+    @classmethod
+    def compact(cls, elt):
+        """Convert an xml.etree element to a compact tree."""
+        return (elt.tag, dict(elt.attrib), elt.text, tuple(cls.compact(e) for e in elt))
+
+    # Access to the wrapped objects:
+    @staticmethod
+    def _elementsOf(elt):
+        return elt[3]
+
+    @staticmethod
+    def _tagOf(elt):
+        return elt[0]
+
+    @staticmethod
+    def _attributesOf(elt):
+        return elt[1]
+
+    @staticmethod
+    def _attributeOf(elt, name):
+        return elt[1].get(name)
+
+    @staticmethod
+    def _textOf(elt):
+        return elt[2]
+
+    @staticmethod
+    def _hasContent(elt):
+        return len(elt[3]) > 0 or elt[2] is not None
+
+backends = { 'minidom': Node, 'etree': EtreeNode, 'compact': CompactNode }
+
 def _parseXPath(selector):
     # Split "tag[attr=val][...]" into tag-name and attribute mapping
     attrs = selector.split('[')
@@ -166,6 +374,21 @@ def _parseXPath(selector):
         attrs = (('type', x[0]) if len(x) == 1 else x for x in attrs)
     return name, dict(attrs)
 
+def _compileXPath(xpath, cache = {}):
+    """Compile an XPath to a tuple of (selector, tag, attrs) triples.
+
+    The xpath may be given either as a string or as a tuple of its
+    selectors.  Each selector is parsed by _parseXPath() to get tag
+    and attrs.  Results are cached, as the same few XPaths are
+    searched for in every locale; callers must not modify attrs."""
+    try:
+        return cache[xpath]
+    except KeyError:
+        pass
+    selectors = xpath.split('/') if isinstance(xpath, basestring) else xpath
+    cache[xpath] = path = tuple((s,) + _parseXPath(s) for s in selectors)
+    return path
+
 def _iterateEach(iters):
     # Flatten a two-layer iterator.
     for it in iters:
@@ -183,8 +406,7 @@ class XmlScanner (object):
 
         Ignores any excess attributes."""
         elts = (self.root,)
-        for selector in xpath.split('/'):
-            tag, attrs = _parseXPath(selector)
+        for selector, tag, attrs in _compileXPath(xpath):
             elts = tuple(_iterateEach(e.findAllChildren(tag, attrs) for e in elts))
             if not elts:
                 break
@@ -193,16 +415,22 @@ class XmlScanner (object):
 class Supplement (XmlScanner):
     def find(self, xpath):
         elts = self.findNodes(xpath)
-        for elt in _iterateEach(e.dom.childNodes if e.dom.childNodes else (e.dom,)
+        for elt in _iterateEach(e.children() if e.hasContent else (e,)
                                 for e in elts):
             if elt.attributes:
-                yield (elt.nodeName,
-                       dict((k, v if isinstance(v, basestring) else v.nodeValue)
-                            for k, v in elt.attributes.items()))
+                yield elt.tag, dict(elt.attributes)
 
 class LocaleScanner (object):
-    def __init__(self, name, nodes, root):
+    def __init__(self, name, nodes, root, rootCache = None):
+        """Set up to search a locale's data.
+
+        Takes the locale's name, the nodes of its file and those from
+        which it inherits and the XmlScanner for the root locale.
+        Optional rootCache is a dict in which to cache searches of the
+        root locale; it should be shared by all locales with the same
+        root.  If omitted, this scanner uses its own."""
         self.name, self.nodes, self.base = name, nodes, root
+        self.__rootCache = {} if rootCache is None else rootCache
 
     def find(self, xpath, default = None, draft = None):
         """XPath search for the content of an element.
@@ -214,11 +442,10 @@ class LocaleScanner (object):
         higher draft scores are ignored."""
         try:
             for elt in self.__find(xpath):
-                try:
-                    if draft is None or elt.draft <= draft:
-                        return elt.dom.firstChild.nodeValue
-                except (AttributeError, KeyError):
-                    pass
+                if draft is None or elt.draft <= draft:
+                    text = elt.text
+                    if text is not None:
+                        return text
         except Error as e:
             if default is None:
                 raise
@@ -237,8 +464,8 @@ class LocaleScanner (object):
         root = self.nodes[0]
         for alias in root.findAllChildren('alias', allDull=True):
             try:
-                source = alias.dom.attributes['source'].nodeValue
-            except (KeyError, AttributeError):
+                source = alias.attributes['source']
+            except KeyError:
                 pass
             else:
                 raise Error('Alias to {}'.format(source))
@@ -247,8 +474,8 @@ class LocaleScanner (object):
         for code in ('language', 'script', 'territory', 'variant'):
             for node in ids.findAllChildren(code, allDull=True):
                 try:
-                    yield node.dom.attributes['type'].nodeValue
-                except (KeyError, AttributeError):
+                    yield node.attributes['type']
+                except KeyError:
                     pass
                 else:
                     break # only want one value for each code
@@ -416,11 +643,10 @@ class LocaleScanner (object):
         ) # Used for month and day names
 
     def __find(self, xpath):
-        retries = [ xpath.split('/') ]
+        retries = [ _compileXPath(xpath) ]
         while retries:
-            tags, elts, roots = retries.pop(), self.nodes, (self.base.root,)
-            for selector in tags:
-                tag, attrs = _parseXPath(selector)
+            path, elts = retries.pop(), self.nodes
+            for selector, tag, attrs in path:
                 elts = tuple(_iterateEach(e.findAllChildren(tag, attrs) for e in elts))
                 if not elts:
                     break
@@ -432,34 +658,59 @@ class LocaleScanner (object):
 
             # Process roots separately: otherwise the alias-processing
             # is excessive.
-            for i, selector in enumerate(tags):
-                tag, attrs = _parseXPath(selector)
-
-                for alias in tuple(_iterateEach(r.findAllChildren('alias', allDull=True)
-                                                for r in roots)):
-                    if alias.dom.attributes['source'].nodeValue == 'locale':
-                        replace = alias.dom.attributes['path'].nodeValue.split('/')
-                        retries.append(self.__xpathJoin(tags[:i], replace, tags[i:]))
-
-                roots = tuple(_iterateEach(r.findAllChildren(tag, attrs) for r in roots))
-                if not roots:
-                    if retries: # Let outer loop fall back on an alias path:
-                        break
-                    sought = '/'.join(tags)
-                    if sought != xpath:
-                        sought += ' (for {})'.format(xpath)
-                    raise Error('All lack child {} for {} in {}'.format(
-                            selector, sought, self.name))
-
-            else: # Found matching elements
+            rewrites, roots, selector = self.__findInRoot(path)
+            retries.extend(rewrites)
+            if roots:
                 for elt in roots:
                     yield elt
-
-        sought = '/'.join(tags)
+            elif not retries: # Else let outer loop fall back on an alias path.
+                sought = '/'.join(s[0] for s in path)
+                if sought != xpath:
+                    sought += ' (for {})'.format(xpath)
+                raise Error('All lack child {} for {} in {}'.format(
+                        selector, sought, self.name))
+
+        sought = '/'.join(s[0] for s in path)
         if sought != xpath:
             sought += ' (for {})'.format(xpath)
         raise Error('No {} in {}'.format(sought, self.name))
 
+    def __findInRoot(self, path):
+        """Search for a compiled XPath in the root locale.
+
+        Returns a triple (rewrites, roots, selector): rewrites is a
+        tuple of compiled XPaths to try next, due to aliases met on
+        the way; roots is a tuple of the nodes found or, if the search
+        failed, None; in which case, selector is the selector that
+        found nothing.  The root locale is shared by all locales, so
+        results are cached, in the root's cache."""
+        # Compiled paths hold dicts, so aren't hashable; but each is
+        # determined by its tuple of selectors:
+        cache, key = self.__rootCache, tuple(step[0] for step in path)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        rewrites, roots = [], (self.base.root,)
+        tags = [step[0] for step in path]
+        for i, (selector, tag, attrs) in enumerate(path):
+            for alias in tuple(_iterateEach(r.findAllChildren('alias', allDull=True)
+                                            for r in roots)):
+                if alias.attributes['source'] == 'locale':
+                    replace = alias.attributes['path'].split('/')
+                    rewrites.append(_compileXPath(tuple(
+                                self.__xpathJoin(tags[:i], replace, tags[i:]))))
+
+            roots = tuple(_iterateEach(r.findAllChildren(tag, attrs) for r in roots))
+            if not roots:
+                break
+        else:
+            selector = None
+
+        cache[key] = result = tuple(rewrites), roots or None, selector
+        return result
+
     def __findUnit(self, keySuffix, quantify, fallback=''):
         # The displayName for a quantified unit in en.xml is kByte
         # (even for unitLength[narrow]) instead of kB (etc.), so
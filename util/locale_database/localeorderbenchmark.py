@@ -0,0 +1,130 @@
+#!/usr/bin/env python2
+# coding=utf8
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the test suite of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+"""Check that qlocalexml2cpp.py's locale ordering scales linearly
+
+Times the stages of qlocalexml2cpp.py whose cost depends on the
+number of locales, but not on their contents: sorting the locales
+(see qlocalexml2cpp.localeSortKey()) and computing the index of each
+language's first locale (see QLocaleXmlReader.languageIndices()).
+The locales of a QLocaleXML file (as written by cldr2qlocalexml.py)
+are multiplied up, by giving copies of each a different country, to
+synthesize locale sets several times as big as CLDR's.  For each
+scale, the time per locale is reported: it should stay roughly
+constant as the scale grows.
+
+Pass the QLocaleXML file as the last command-line argument.  Options:
+
+  --scale N   multiply the locales by N (may be repeated; default:
+              1, 2, 5 and 10)
+  --repeat N  time each scale N times, reporting the fastest
+"""
+
+import random
+import time
+
+from qlocalexml import QLocaleXmlReader
+from qlocalexml2cpp import localeSortKey
+
+def scaledKeys(keys, countries, scale, seed = 1):
+    """Synthesize scale times as many locale keys as in keys.
+
+    The given keys are included; each other key copies one of them,
+    with its country replaced by one of countries, avoiding
+    duplicates as far as possible."""
+    rand = random.Random(seed)
+    seen, result = set(keys), list(keys)
+    for i in range(len(keys) * (scale - 1)):
+        language, script, country = keys[i % len(keys)]
+        for attempt in range(10):
+            key = language, script, rand.choice(countries)
+            if key not in seen:
+                break
+        seen.add(key)
+        result.append(key)
+    rand.shuffle(result)
+    return result
+
+def timeStages(reader, keys, defaults):
+    """Time sorting keys and computing language indices from them.
+
+    Returns the times, in seconds, taken by the two stages."""
+    start = time.time()
+    ordered = sorted(keys, key = localeSortKey(defaults))
+    middle = time.time()
+    for pair in reader.languageIndices(tuple(k[0] for k in ordered)):
+        pass
+    return middle - start, time.time() - middle
+
+def usage(err, name, message = ''):
+    err.write("""Usage: {} [--scale N]... [--repeat N] path/to/qlocale.xml
+""".format(name))
+    if message:
+        err.write('\n' + message + '\n')
+
+def main(args, out, err):
+    name = args.pop(0)
+    scales, repeat = [], 1
+    while len(args) > 1 and args[0] in ('--scale', '--repeat'):
+        option, value = args.pop(0), args.pop(0)
+        try:
+            number = int(value)
+        except ValueError:
+            number = 0
+        if number < 1:
+            usage(err, name, 'Expected a positive integer for {}, not {}'.format(option, value))
+            return 1
+        if option == '--scale':
+            scales.append(number)
+        else:
+            repeat = number
+
+    if len(args) != 1:
+        usage(err, name, 'I expect exactly one QLocaleXML file')
+        return 1
+
+    reader = QLocaleXmlReader(args[0])
+    keys = [key for key, locale in reader.loadLocaleMap(('gregorian',))]
+    defaults = tuple(reader.defaultMap())
+    countries = sorted(k for k in reader.countries if k)
+
+    out.write('{:>6} {:>8} {:>10} {:>10} {:>14}\n'.format(
+            'scale', 'locales', 'sort (s)', 'index (s)', 'per locale (us)'))
+    for scale in scales or (1, 2, 5, 10):
+        scaled = scaledKeys(keys, countries, scale)
+        times = [timeStages(reader, scaled, defaults) for i in range(repeat)]
+        sort = min(t[0] for t in times)
+        index = min(t[1] for t in times)
+        out.write('{:>6} {:>8} {:>10.4f} {:>10.4f} {:>14.2f}\n'.format(
+                scale, len(scaled), sort, index, (sort + index) * 1e6 / len(scaled)))
+    return 0
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main(sys.argv, sys.stdout, sys.stderr))
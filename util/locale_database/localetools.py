@@ -28,17 +28,23 @@
 """Utilities shared among the CLDR extraction tools.
 
 Functions:
-  unicode2hex() -- converts unicode text to UCS-2 in hex form.
-  wrap_list() -- map list to comma-separated string, 20 entries per line.
+  unicode2utf16() -- converts unicode text to an array of UTF-16 code units.
+  wrap_hex() -- format numbers as comma-separated hex, 20 entries per line.
 
 Classes:
   Error -- A shared error class.
+  LruCache -- a mapping of bounded size, forgetting least recently used entries.
   Transcriber -- edit a file by writing a temporary file, then renaming.
   SourceFileEditor -- adds standard prelude and tail handling to Transcriber.
 """
 
 import os
+import re
+import sys
 import tempfile
+from array import array
+from collections import OrderedDict
+from itertools import izip_longest
 
 class Error (StandardError):
     __upinit = StandardError.__init__
@@ -48,27 +54,75 @@ class Error (StandardError):
     def __str__(self):
         return self.message
 
-def unicode2hex(s):
-    lst = []
-    for x in s:
-        v = ord(x)
-        if v > 0xFFFF:
-            # make a surrogate pair
-            # copied from qchar.h
-            high = (v >> 10) + 0xd7c0
-            low = (v % 0x400 + 0xdc00)
-            lst.append(hex(high))
-            lst.append(hex(low))
-        else:
-            lst.append(hex(v))
-    return lst
-
-def wrap_list(lst):
-    def split(lst, size):
-        while lst:
-            head, lst = lst[:size], lst[size:]
-            yield head
-    return ",\n".join(", ".join(x) for x in split(lst, 20))
+def unicode2utf16(s, codec = 'utf-16-le' if sys.byteorder == 'little' else 'utf-16-be'):
+    """UTF-16 code units of s, as an array('H').
+
+    Code points outside the BMP are represented by surrogate pairs."""
+    units = array('H')
+    units.fromstring(s.encode(codec))
+    return units
+
+def wrap_hex(units, size = 20):
+    """Comma-separated hex forms of the numbers in units, size to a line."""
+    line = ', '.join(('0x%x',) * size)
+    lines = [line % tuple(units[i:i + size]) for i in range(0, len(units) - size + 1, size)]
+    tail = len(units) % size
+    if tail:
+        lines.append(', '.join(('0x%x',) * tail) % tuple(units[-tail:]))
+    return ",\n".join(lines)
+
+class LruCache (object):
+    """Mapping that holds at most a given number of entries.
+
+    When adding an entry would take it over its limit, the entry least
+    recently looked up (or added) is discarded.  Counts the look-ups
+    that find an entry (hits), those that don't (misses) and the
+    entries discarded (evictions); see stats().  Entries are held by
+    strong references, so stay until evicted or cleared."""
+    def __init__(self, limit = None):
+        """Set up an empty cache.
+
+        Optional argument, limit, is the most entries to hold; if None
+        (the default), there is no limit."""
+        assert limit is None or limit > 0, limit
+        self.limit = limit
+        self.hits = self.misses = self.evictions = 0
+        self.__data = OrderedDict()
+
+    def __getitem__(self, key):
+        try:
+            value = self.__data.pop(key)
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        self.__data[key] = value # Now most recently used.
+        return value
+
+    def __setitem__(self, key, value):
+        data = self.__data
+        data.pop(key, None)
+        data[key] = value
+        if self.limit is not None and len(data) > self.limit:
+            data.popitem(last = False)
+            self.evictions += 1
+
+    def __contains__(self, key): # Doesn't count as a look-up.
+        return key in self.__data
+
+    def __len__(self):
+        return len(self.__data)
+
+    def clear(self):
+        self.__data.clear()
+
+    def stats(self):
+        """Returns a mapping from names to counts, as a summary.
+
+        The keys are size (number of entries held), limit, hits,
+        misses and evictions."""
+        return dict(size = len(self.__data), limit = self.limit, hits = self.hits,
+                    misses = self.misses, evictions = self.evictions)
 
 class Transcriber (object):
     """Helper class to facilitate rewriting source files.
@@ -80,32 +134,74 @@ class Transcriber (object):
     reader.readline() or iterate reader to read the original.
 
     Callers should call close() on success or cleanup() on failure (to
-    clear away the temporary file).
+    clear away the temporary file).  When several files are to be
+    replaced together, or not at all, pass replace = False to close()
+    on each; then call replace() on all of them if all succeeded,
+    else cleanup() on each.
+
+    If the new version matches the original, the original is left
+    untouched (so its modification time doesn't change and it doesn't
+    trigger needless rebuilds); close() and replace() return True
+    precisely if the file was changed.  Lines for which volatile()
+    returns true are ignored in this comparison; derived classes can
+    over-ride it to skip, for example, a date stamp.  The path to the
+    file is exposed as member path.
     """
     def __init__(self, path, temp):
         # Open the old file
         self.reader = open(path)
         # Create a temp file to write the new data into
         temp, tempPath = tempfile.mkstemp(os.path.split(path)[1], dir = temp)
+        self.path = path
         self.__names = path, tempPath
         self.writer = os.fdopen(temp, "w")
 
-    def close(self):
+    def close(self, replace = True):
         self.reader.close()
         self.writer.close()
         self.reader = self.writer = None
+        if replace:
+            return self.replace()
+
+    def replace(self):
         source, temp = self.__names
-        os.remove(source)
-        os.rename(temp, source)
+        if self.__sameContent(source, temp):
+            os.remove(temp)
+            self.__names = ()
+            return False
+        try:
+            os.rename(temp, source) # Atomic, on POSIX
+        except OSError: # MS-Windows won't rename over an existing file
+            os.remove(source)
+            os.rename(temp, source)
+        # Only forget temp once it's gone, so cleanup() can remove it if not:
+        self.__names = ()
+        return True
 
     def cleanup(self):
         if self.__names:
-            self.reader.close()
-            self.writer.close()
+            if self.reader is not None:
+                self.reader.close()
+                self.writer.close()
             # Remove temp-file:
             os.remove(self.__names[1])
             self.__names = ()
 
+    @staticmethod
+    def volatile(line):
+        """True if line is to be ignored when comparing versions."""
+        return False
+
+    def __sameContent(self, source, temp):
+        volatile = self.volatile
+        try:
+            with open(source) as old, open(temp) as new:
+                return all(a == b for a, b in izip_longest(
+                        (line for line in old if not volatile(line)),
+                        (line for line in new if not volatile(line))))
+        except IOError:
+            return False
+
 class SourceFileEditor (Transcriber):
     """Transcriber with transcription of code around a gnerated block.
 
@@ -124,7 +220,9 @@ class SourceFileEditor (Transcriber):
     content in between.
 
     Callers should call close() on success or cleanup() on failure (to
-    clear away the temporary file); see Transcriber.
+    clear away the temporary file); see Transcriber.  The "generated
+    on" date in the banner at the start of the generated block is
+    ignored when checking whether the file has changed.
     """
     __upinit = Transcriber.__init__
     def __init__(self, path, temp):
@@ -138,9 +236,13 @@ class SourceFileEditor (Transcriber):
         self.__copyPrelude()
 
     __upclose = Transcriber.close
-    def close(self):
+    def close(self, replace = True):
         self.__copyTail()
-        self.__upclose()
+        return self.__upclose(replace)
+
+    @staticmethod
+    def volatile(line, banner = re.compile(r'\s*This part of the file was generated on ').match):
+        return banner(line) is not None
 
     # Implementation details:
     GENERATED_BLOCK_START = '// GENERATED PART STARTS HERE'
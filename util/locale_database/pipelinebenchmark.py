@@ -0,0 +1,229 @@
+#!/usr/bin/env python2
+# coding=utf8
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the test suite of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+"""Benchmark the stages of the locale data pipeline, offline
+
+Times the stages of turning CLDR data into QLocale's C++ data, as
+done by cldr2qlocalexml.py and qlocalexml2cpp.py, and reports the peak
+resident memory reached by the end of each.  The stages are:
+
+  read   -- CldrReader.readLocales(): reading all locales from CLDR
+  write  -- QLocaleXmlWriter.locales(): saving them as QLocaleXML
+  load   -- QLocaleXmlReader.loadLocaleMap(): loading that back in
+  data   -- LocaleDataWriter.localeData(): generating locale_data and
+            its string tables (to a scratch file; no source is changed)
+
+Unless --cldr is given, the CLDR data used is a synthetic tree made by
+synthcldr.py, in a temporary directory, so no CLDR download is needed.
+Each run is done in a fresh child process, so that no run benefits
+from caches filled by another and each reports its own peak memory.
+Options:
+
+  --cldr DIR         use the CLDR tree under DIR instead of a synthetic one
+  --backend NAME     XML backend for reading CLDR (default: etree)
+  --repeat N         do N runs, reporting the fastest time of each stage
+  --languages N      }
+  --territories N    }
+  --depth N          } shape of the synthetic tree; see synthcldr.py
+  --alias-density F  }
+  --calendars LIST   }
+  --seed N           }
+"""
+
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from ldml import backends
+
+stageNames = ('read', 'write', 'load', 'data')
+
+def peakMemory():
+    """Peak resident memory of this process so far, in kilobytes."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def runOnce(root, backend, calendars, scratch):
+    """Run each stage once, on the CLDR tree at root.
+
+    Uses directory scratch for the files written along the way,
+    including CldrAccess's cache of what it learns from ldml.dtd, so
+    that no run benefits from an earlier one's.  Returns a list of
+    (seconds, peak memory in kilobytes) pairs, one per stage, and the
+    number of locales."""
+    from cldr import CldrReader, CldrAccess
+    from qlocalexml import QLocaleXmlReader, QLocaleXmlWriter
+    from qlocalexml2cpp import LocaleDataWriter, localeSortKey
+    from localetools import SourceFileEditor
+    from enumdata import language_list, script_list, country_list
+
+    results = []
+    def record(start):
+        results.append((time.time() - start, peakMemory()))
+
+    CldrAccess.dtdCacheDirectory = os.path.join(scratch, 'dtd')
+    start = time.time()
+    reader = CldrReader(root, backend = backend)
+    locales = reader.readLocales(calendars)
+    record(start)
+
+    xml = os.path.join(scratch, 'locale.xml')
+    with open(xml, 'w') as fd:
+        writer = QLocaleXmlWriter(fd.write)
+        writer.version(reader.root.cldrVersion)
+        writer.enumData(language_list, script_list, country_list)
+        writer.likelySubTags(reader.likelySubTags())
+        start = time.time()
+        writer.locales(locales, calendars)
+        writer.close()
+        record(start)
+    del reader, locales, writer
+
+    start = time.time()
+    reader = QLocaleXmlReader(xml)
+    localeMap = dict(reader.loadLocaleMap(calendars))
+    record(start)
+
+    source = os.path.join(scratch, 'qlocale_data_p.h')
+    with open(source, 'w') as fd:
+        fd.write('{}\n{}\n'.format(SourceFileEditor.GENERATED_BLOCK_START,
+                                   SourceFileEditor.GENERATED_BLOCK_END))
+    start = time.time()
+    writer = LocaleDataWriter(source, scratch, reader.cldrVersion)
+    try:
+        writer.localeData(localeMap,
+                          sorted(localeMap, key = localeSortKey(reader.defaultMap())))
+    finally:
+        writer.cleanup()
+    record(start)
+    return results, len(localeMap)
+
+def measure(root, backend, calendars):
+    """Run runOnce() in a child process and return its results."""
+    scratch = tempfile.mkdtemp(prefix = 'pipelinebenchmark-')
+    try:
+        child = subprocess.Popen([sys.executable, os.path.abspath(__file__), '--child',
+                                  backend, ','.join(calendars), scratch, root],
+                                 stdout = subprocess.PIPE)
+        output = child.communicate()[0]
+    finally:
+        shutil.rmtree(scratch)
+    if child.returncode:
+        raise RuntimeError('Benchmark run failed')
+    words = output.split()
+    count = int(words.pop())
+    return [(float(words[i]), int(words[i + 1])) for i in range(0, len(words), 2)], count
+
+def usage(err, name, message = ''):
+    err.write("""Usage: {} [--cldr DIR] [--backend {}] [--repeat N] [synthcldr.py options]
+""".format(name, '|'.join(sorted(backends))))
+    if message:
+        err.write('\n' + message + '\n')
+
+def main(args, out, err):
+    name = args.pop(0)
+    if args and args[0] == '--child':
+        # As for cldr2qlocalexml.py, to let the writer mix str and unicode:
+        reload(sys)
+        sys.setdefaultencoding('UTF-8')
+        backend, calendars, scratch, root = args[1:]
+        results, count = runOnce(root, backend, tuple(calendars.split(',')), scratch)
+        out.write(''.join('{:.3f} {}\n'.format(*pair) for pair in results))
+        out.write('{}\n'.format(count))
+        return 0
+
+    from synthcldr import SyntheticCldr
+    shape = {'--languages': ('languages', int), '--territories': ('territories', int),
+             '--depth': ('depth', int), '--alias-density': ('aliasDensity', float),
+             '--calendars': ('calendars', lambda x: tuple(x.split(','))),
+             '--seed': ('seed', int)}
+    root, backend, repeat, kw = None, 'etree', 1, {}
+    while len(args) > 1 and args[0] in ('--cldr', '--backend', '--repeat') + tuple(shape):
+        option, value = args.pop(0), args.pop(0)
+        if option == '--cldr':
+            if not os.path.exists(os.path.join(value, 'common', 'main', 'root.xml')):
+                usage(err, name, 'Found no common/main/root.xml under ' + value)
+                return 1
+            root = value
+        elif option == '--backend':
+            if value not in backends:
+                usage(err, name, 'Unknown XML backend: ' + value)
+                return 1
+            backend = value
+        elif option == '--repeat':
+            try:
+                repeat = int(value)
+            except ValueError:
+                repeat = 0
+            if repeat < 1:
+                usage(err, name, 'Repeat count must be a positive integer, not ' + value)
+                return 1
+        else:
+            key, parse = shape[option]
+            try:
+                kw[key] = parse(value)
+            except ValueError as e:
+                usage(err, name, '{}: {}'.format(option, e))
+                return 1
+
+    if args:
+        usage(err, name, 'Unexpected arguments: ' + ' '.join(args))
+        return 1
+    if root is not None and set(kw) - set(['calendars']):
+        usage(err, name, 'Only --calendars, of the synthetic tree options, applies with --cldr')
+        return 1
+
+    synthetic = SyntheticCldr(**kw)
+    calendars = synthetic.calendars
+    temporary = None
+    try:
+        if root is None:
+            root = temporary = tempfile.mkdtemp(prefix = 'synthcldr-')
+            start = time.time()
+            files = synthetic.write(root)
+            out.write('Generated {} locale files in {:.2f} s\n'.format(files, time.time() - start))
+
+        runs = [measure(root, backend, calendars) for i in range(repeat)]
+    finally:
+        if temporary is not None:
+            shutil.rmtree(temporary)
+
+    out.write('{} locales, {} backend\n'.format(runs[0][1], backend))
+    out.write('{:<6} {:>10} {:>14}\n'.format('stage', 'time (s)', 'peak RSS (MB)'))
+    for i, stage in enumerate(stageNames):
+        out.write('{:<6} {:>10.3f} {:>14.1f}\n'.format(
+                stage, min(run[0][i][0] for run in runs),
+                min(run[0][i][1] for run in runs) / 1024.))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv, sys.stdout, sys.stderr))
@@ -37,6 +37,7 @@ Support:
   Spacer -- provides control over indentation of the output.
 """
 from __future__ import print_function
+from collections import Counter
 from xml.sax.saxutils import escape
 
 from localetools import Error
@@ -116,13 +117,38 @@ def convertFormat(format):
     return result
 
 class QLocaleXmlReader (object):
+    """Reads a QLocaleXML file, as written by QLocaleXmlWriter.
+
+    The file is streamed, rather than loaded as a whole: the
+    constructor reads everything but the locales in one pass, and
+    each call to loadLocaleMap() reads the locales in another.
+    Each element is discarded once digested, so memory use doesn't
+    grow with the size of the file.
+    """
     def __init__(self, filename):
-        self.root = self.__parse(filename)
+        self.__filename = filename
         # Lists of (id, name, code) triples:
-        languages = tuple(self.__loadMap('language'))
-        scripts = tuple(self.__loadMap('script'))
-        countries = tuple(self.__loadMap('country'))
-        self.__likely = tuple(self.__likelySubtagsMap())
+        lists = {'language': [], 'script': [], 'country': []}
+        likely, version = [], None
+
+        def triplet(element, keys=('language', 'script', 'country')):
+            return tuple(self.__childText(element, key) for key in keys)
+
+        for group, elt in self.__eachElt(('version', 'likelySubtags')
+                                         + tuple(k + 'List' for k in lists)):
+            if elt.tag == 'version':
+                version = self.__text(elt)
+            elif elt.tag == 'likelySubtag':
+                likely.append((triplet(self.__childElt(elt, 'from')),
+                               triplet(self.__childElt(elt, 'to'))))
+            elif group == elt.tag + 'List':
+                kid = self.__childText
+                lists[elt.tag].append((int(kid(elt, 'id')), kid(elt, 'name'), kid(elt, 'code')))
+        if version is None:
+            raise Error('No version child found')
+
+        languages, scripts, countries = (tuple(lists[k]) for k in ('language', 'script', 'country'))
+        self.__likely = tuple(likely)
         # Mappings {ID: (name, code)}
         self.languages = dict((v[0], v[1:]) for v in languages)
         self.scripts = dict((v[0], v[1:]) for v in scripts)
@@ -133,13 +159,17 @@ class QLocaleXmlReader (object):
         self.__landByName = dict((v[1], (v[0], v[2])) for v in countries)
         # Other properties:
         self.dupes = set(v[1] for v in languages) & set(v[1] for v in countries)
-        self.cldrVersion = self.__firstChildText(self.root, "version")
+        self.cldrVersion = version
 
     def loadLocaleMap(self, calendars, grumble = lambda text: None):
-        kid = self.__firstChildText
         likely = dict(self.__likely)
-        for elt in self.__eachEltInGroup(self.root, 'localeList', 'locale'):
-            locale = Locale.fromXmlData(lambda k: kid(elt, k), calendars)
+        for group, elt in self.__eachElt(('localeList',)):
+            if elt.tag != 'locale':
+                continue
+            # Map each child's name to its text, in one pass; where a
+            # name is repeated, the first is used:
+            fields = dict((kid.tag, self.__text(kid)) for kid in reversed(list(elt)))
+            locale = Locale.fromXmlData(lambda k: self.__lookup(fields, k), calendars)
             language = self.__langByName[locale.language][0]
             script = self.__textByName[locale.script][0]
             country = self.__landByName[locale.country][0]
@@ -165,9 +195,15 @@ class QLocaleXmlReader (object):
             yield (language, script, country), locale
 
     def languageIndices(self, locales):
-        index = 0
+        """Index of each language's first locale in locale_data.
+
+        Takes a sequence with a language ID per locale; yields, for
+        each language, in order of ID, a pair of the index in
+        locale_data of its first locale (0 if it has none) and its
+        name."""
+        counts, index = Counter(locales), 0
         for key, value in self.languages.iteritems():
-            i, count = 0, locales.count(key)
+            i, count = 0, counts[key]
             if count > 0:
                 i = index
                 index += count
@@ -183,12 +219,11 @@ class QLocaleXmlReader (object):
         def ids(t):
             return tuple(x[0] for x in t)
 
-        for i, pair in enumerate(self.__likely, 1):
+        for pair in self.__likely:
             have = self.__fromNames(pair[0])
             give = self.__fromNames(pair[1])
             yield ('_'.join(tag(have)), ids(have),
-                   '_'.join(tag(give)), ids(give),
-                   i == len(self.__likely))
+                   '_'.join(tag(give)), ids(give))
 
     def defaultMap(self):
         """Map language and script to their default country by ID.
@@ -204,66 +239,58 @@ class QLocaleXmlReader (object):
                        self.__landByName[give[2]][0])
 
     # Implementation details:
-    def __loadMap(self, category):
-        kid = self.__firstChildText
-        for element in self.__eachEltInGroup(self.root, category + 'List', category):
-            yield int(kid(element, 'id')), kid(element, 'name'), kid(element, 'code')
-
-    def __likelySubtagsMap(self):
-        def triplet(element, keys=('language', 'script', 'country'), kid = self.__firstChildText):
-            return tuple(kid(element, key) for key in keys)
-
-        kid = self.__firstChildElt
-        for elt in self.__eachEltInGroup(self.root, 'likelySubtags', 'likelySubtag'):
-            yield triplet(kid(elt, "from")), triplet(kid(elt, "to"))
-
     def __fromNames(self, names):
         return self.__langByName[names[0]], self.__textByName[names[1]], self.__landByName[names[2]]
 
-    # DOM access:
-    from xml.dom import minidom
-    @staticmethod
-    def __parse(filename, read = minidom.parse):
-        return read(filename).documentElement
+    # XML access:
+    def __eachElt(self, groups):
+        """Stream the file's elements in the given groups.
+
+        Yields (group, element) for each child of the document element
+        whose tag is in groups, with group equal to the document
+        element's tag, and for each child of such an element, with
+        group equal to its parent's tag.  Children are yielded before
+        their parents.  Each element yielded is cleared, to save
+        memory, when the next is requested; so callers must digest
+        each before moving on."""
+        from xml.etree.cElementTree import iterparse
+        stack = []
+        for event, elt in iterparse(self.__filename, ('start', 'end')):
+            if event == 'start':
+                stack.append(elt)
+                continue
+
+            stack.pop()
+            depth = len(stack)
+            if depth == 1 and elt.tag in groups:
+                yield stack[0].tag, elt
+            elif depth == 2 and stack[1].tag in groups:
+                yield stack[1].tag, elt
+            if depth in (1, 2): # Discard, now it's been digested:
+                elt.clear()
+                del stack[-1][:]
 
     @staticmethod
-    def __isNodeNamed(elt, name, TYPE=minidom.Node.ELEMENT_NODE):
-        return elt.nodeType == TYPE and elt.nodeName == name
-    del minidom
+    def __text(elt):
+        return elt.text or ''
 
     @staticmethod
-    def __eltWords(elt):
-        child = elt.firstChild
-        while child:
-            if child.nodeType == elt.TEXT_NODE:
-                yield child.nodeValue
-            child = child.nextSibling
-
-    @classmethod
-    def __firstChildElt(cls, parent, name):
-        child = parent.firstChild
-        while child:
-            if cls.__isNodeNamed(child, name):
-                return child
-            child = child.nextSibling
-
-        raise Error('No {} child found'.format(name))
+    def __childElt(parent, name):
+        child = parent.find(name)
+        if child is None:
+            raise Error('No {} child found'.format(name))
+        return child
 
     @classmethod
-    def __firstChildText(cls, elt, key):
-        return ' '.join(cls.__eltWords(cls.__firstChildElt(elt, key)))
+    def __childText(cls, elt, key):
+        return cls.__text(cls.__childElt(elt, key))
 
-    @classmethod
-    def __eachEltInGroup(cls, parent, group, key):
+    @staticmethod
+    def __lookup(fields, key):
         try:
-            element = cls.__firstChildElt(parent, group).firstChild
-        except Error:
-            element = None
-
-        while element:
-            if cls.__isNodeNamed(element, key):
-                yield element
-            element = element.nextSibling
+            return fields[key]
+        except KeyError:
+            raise Error('No {} child found'.format(key))
 
 
 class Spacer (object):
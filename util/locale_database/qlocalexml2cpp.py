@@ -35,45 +35,235 @@ the root of the qtbase check-out as second parameter.
 
 import os
 import datetime
+import json
+import traceback
+from array import array
+from bisect import bisect_left
+from functools import cmp_to_key
 
 from qlocalexml import QLocaleXmlReader
 from xml.dom import minidom
-from localetools import unicode2hex, wrap_list, Error, Transcriber, SourceFileEditor
+from localetools import unicode2utf16, wrap_hex, Error, Transcriber, SourceFileEditor
+
+def localeSortKey(defaults):
+    """Sort key for the (language, script, country) ID triples of locales.
+
+    Argument defaults maps (language, script) ID pairs to the ID of
+    the default country for that language and script, as yielded by
+    QLocaleXmlReader.defaultMap().  Locales are sorted first by
+    language.  Within a language, the default locale of a key's own
+    (language, script) comes before the other key; failing that, keys
+    with the same script are ordered by country; failing that, the
+    default locale of the other key's (language, script) comes first;
+    otherwise keys are ordered by script.
+
+    This is the order in which the locale_data table has always been
+    written and in which QLocale's linear search of it, from the first
+    entry for a language, finds locales.  It is not a consistent
+    ordering when a language has locales in several scripts (e.g.
+    Serbian: Cyrl_RS, Latn_BA, Latn_ME, Latn_RS, Cyrl_BA), so the
+    result then depends on the order of the keys sorted: to reproduce
+    the existing table, sort the keys of the mapping returned by
+    QLocaleXmlReader.loadLocaleMap() in the order the mapping yields
+    them.  Changing that would change which locale QLocale finds for
+    a partial locale ID, so needs regenerated data and tests of its
+    own.
+    """
+    defaults = dict(defaults)
+
+    def compare(key1, key2):
+        if key1 == key2:
+            return 0
+
+        if key1[0] != key2[0]: # First sort by language:
+            return key1[0] - key2[0]
+
+        country = defaults.get(key1[:2])
+        if country is not None:
+            if key1[2] == country:
+                return -1
+            if key2[2] == country:
+                return 1
+
+        if key1[1] == key2[1]:
+            return key1[2] - key2[2]
+
+        country = defaults.get(key2[:2])
+        if country is not None:
+            if key2[2] == country:
+                return 1
+            if key1[2] == country:
+                return -1
+
+        return key1[1] - key2[1]
+    return cmp_to_key(compare)
+
+def localeParents(keys, defaults):
+    """Choose a parent for each locale, for delta-encoding its data.
+
+    Takes the locale keys, in the order they are written (see
+    localeSortKey()) and the mapping from (language, script) ID pairs
+    to default countries, as yielded by QLocaleXmlReader.defaultMap().
+    The first locale of each language has no parent; the default
+    locale of each (language, script) has that first locale as parent;
+    each other locale has the default for its language and script, if
+    there is one, else the first locale of its language.  As no parent
+    has a parent other than the first of its language, there are no
+    cycles.  Returns a list, of the position in keys of the parent of
+    the locale at each position; or None for no parent."""
+    defaults = dict(defaults)
+    position, first = {}, {}
+    for i, key in enumerate(keys):
+        position[key] = i
+        first.setdefault(key[0], i)
+
+    parents = []
+    for i, (language, script, country) in enumerate(keys):
+        head = first[language]
+        if i == head:
+            parents.append(None)
+            continue
+        parent = position.get((language, script, defaults.get((language, script))))
+        if parent is None or parent == i:
+            parent = head
+        parents.append(parent)
+    return parents
+
+class LocaleDelta (object):
+    """Delta-encoded form of the rows of the locale_data table.
+
+    Most locales differ from some other locale, of the same language,
+    in only a few of the fields of their row.  This form records, for
+    each locale, the position of a parent locale (see localeParents())
+    and the fields in which its row differs from its parent's; a
+    locale with no parent is recorded as it differs from a row of
+    zeros.  Its tables, as written by write(), are:
+
+      locale_data_parent -- position of each locale's parent, or
+                            0xffff for none
+      locale_data_override_index -- where each locale's overrides
+                                    start, with a final entry for the
+                                    end of the last locale's
+      locale_data_override_field -- which field each override replaces
+      locale_data_override_value -- the value it gives the field
+
+    Each row is treated as a sequence of 85 numbers: its 3 IDs, 37
+    range starts and 37 range sizes, the three characters of its
+    currency's ISO code and its five small numeric fields.  QLocale
+    itself still uses the flat rows; this form is, for now, generated
+    so that its size can be compared and its correctness checked (see
+    verify()).
+    """
+    # sizeof(QLocaleData): IDs, range starts and sizes, currency ISO
+    # code, then five bit-fields sharing a quint16:
+    rowBytes = 2 * 3 + 2 * 37 + 37 + 3 + 2
+    # Each override: a quint8 field and a quint16 value:
+    overrideBytes = 1 + 2
+
+    def __init__(self, names, rows, parents):
+        """Encode rows, with parents as returned by localeParents().
+
+        Where a locale's row has no fewer differences from its parent's
+        than from a row of zeros, it is encoded as having no parent.
+        The rows are the numeric sequences described above, one per
+        locale, in the same order as names, which are used in comments
+        and messages."""
+        self.names, self.rows, self.parents = names, rows, list(parents)
+        self.overrides = []
+        for i, row in enumerate(rows):
+            changes = self.__changes(row, (0,) * len(row))
+            parent = self.parents[i]
+            if parent is not None:
+                relative = self.__changes(row, rows[parent])
+                # Only use the parent if that saves something:
+                if len(relative) < len(changes):
+                    changes = relative
+                else:
+                    self.parents[i] = None
+            self.overrides.append(changes)
 
-def compareLocaleKeys(key1, key2):
-    if key1 == key2:
-        return 0
-
-    if key1[0] != key2[0]: # First sort by language:
-        return key1[0] - key2[0]
-
-    defaults = compareLocaleKeys.default_map
-    # maps {(language, script): country} by ID
-    try:
-        country = defaults[key1[:2]]
-    except KeyError:
-        pass
-    else:
-        if key1[2] == country:
-            return -1
-        if key2[2] == country:
-            return 1
+    @staticmethod
+    def __changes(row, base):
+        return tuple((field, value) for field, (value, was) in enumerate(zip(row, base))
+                     if value != was)
 
-    if key1[1] == key2[1]:
-        return key1[2] - key2[2]
+    def rebuild(self, i, cache = None):
+        """Reconstruct the row at position i from the delta form alone.
 
-    try:
-        country = defaults[key2[:2]]
-    except KeyError:
-        pass
-    else:
-        if key2[2] == country:
-            return 1
-        if key1[2] == country:
-            return -1
+        Optional cache maps positions to rows already rebuilt."""
+        if cache is None:
+            cache = {}
+        try:
+            return cache[i]
+        except KeyError:
+            pass
+        parent = self.parents[i]
+        if parent is None:
+            row = [0] * len(self.rows[i])
+        else:
+            cache[i] = None # Guard against cycles.
+            row = self.rebuild(parent, cache)
+            if row is None:
+                raise Error('Cycle in parents of locale {}'.format(self.names[i]))
+            row = list(row)
+        for field, value in self.overrides[i]:
+            row[field] = value
+        cache[i] = row = tuple(row)
+        return row
+
+    def verify(self):
+        """Check every row can be rebuilt from the delta form.
+
+        Also checks that every value fits the tables written by
+        write().  Raises Error if any check fails."""
+        cache = {}
+        for i, row in enumerate(self.rows):
+            if self.rebuild(i, cache) != tuple(row):
+                raise Error('Delta form of locale {} fails to reproduce its data'.format(
+                        self.names[i]))
+            if any(value > 0xffff or value < 0 for field, value in self.overrides[i]):
+                raise Error('Delta form of locale {} has a value out of range'.format(
+                        self.names[i]))
+        if len(self.rows) >= 0xffff or self.count() > 0xffff:
+            raise Error('Delta form has too many locales or overrides for quint16 indices')
+
+    def count(self):
+        """Total number of overrides."""
+        return sum(len(fields) for fields in self.overrides)
+
+    def sizes(self):
+        """Size in bytes of the flat and delta forms, as a pair.
+
+        The flat size includes locale_data's trailing row of zeros."""
+        size = len(self.rows)
+        return ((size + 1) * self.rowBytes,
+                2 * size + 2 * (size + 1) + self.overrideBytes * self.count())
+
+    def write(self, out):
+        size = len(self.rows)
+        out('static const quint16 locale_data_parent[] = {\n')
+        for name, parent in zip(self.names, self.parents):
+            out('{:6d}, // {}{}\n'.format(0xffff if parent is None else parent, name,
+                                          '' if parent is None else
+                                          ' -> ' + self.names[parent]))
+        out('};\n\n')
 
-    return key1[1] - key2[1]
+        out('static const quint16 locale_data_override_index[] = {\n')
+        start = 0
+        for name, fields in zip(self.names, self.overrides):
+            out('{:6d}, // {}\n'.format(start, name))
+            start += len(fields)
+        out('{:6d}  // end\n'.format(start))
+        out('};\n\n')
 
+        fields = [field for row in self.overrides for field, value in row]
+        values = [value for row in self.overrides for field, value in row]
+        out('static const quint8 locale_data_override_field[] = {\n')
+        out(wrap_hex(fields or [0]))
+        out('\n};\n\n')
+        out('static const quint16 locale_data_override_value[] = {\n')
+        out(wrap_hex(values or [0]))
+        out('\n};\n')
 
 class StringDataToken:
     def __init__(self, index, length, bits):
@@ -85,43 +275,109 @@ class StringDataToken:
         self.index = index
         self.length = length
 
+class SubstringIndex:
+    """Searchable copy of a growing array('H') of code units.
+
+    Holds the units' bytes in a bytearray, so that finding where a
+    given array of units first occurs among them is done by the
+    bytes-level find, rather than by a loop in python.
+    """
+    def __init__(self):
+        self.__text = bytearray()
+
+    def extend(self, units):
+        self.__text += units.tostring()
+
+    def find(self, units):
+        """Index at which units first occur; or -1 if they don't."""
+        text, sought = self.__text, units.tostring()
+        index = text.find(sought)
+        while index > 0 and index % 2: # Straddles code units; not a real match.
+            index = text.find(sought, index + 1)
+        return index // 2
+
 class StringData:
-    def __init__(self, name):
-        self.data = []
+    def __init__(self, name, pack = False):
+        """Set up an empty table, with the given C++ name.
+
+        If pack is true, strings appended are only collected (and the
+        tokens returned for them are place-holders) until pack() is
+        called, after which append() returns real tokens."""
+        self.data = array('H')
         self.hash = {}
         self.name = name
-        self.text = '' # Used in quick-search for matches in data
+        self.baseline = None # Size without pack(), once packed
+        self.__index = SubstringIndex()
+        self.__pending = [] if pack else None
+        self.__resetCounts()
 
     def append(self, s, bits = 8):
+        self.appends += 1
         try:
             token = self.hash[s]
+            self.hits += 1
         except KeyError:
-            token = self.__store(s, bits)
+            if self.__pending is None:
+                token = self.__store(s, bits)
+            else:
+                token = StringDataToken(0, len(unicode2utf16(s)), bits)
+                self.__pending.append(s)
             self.hash[s] = token
+        self.requested += token.length
+        spare = (1 << bits) - 1 - token.length
+        if self.lengthHeadroom is None or spare < self.lengthHeadroom:
+            self.lengthHeadroom, self.tightest = spare, [token.length, bits]
         return token
 
+    def pack(self):
+        """Lay out all strings collected so far as compactly as we can.
+
+        Strings appended one at a time can only reuse data already in
+        the table, or overlap its end.  Knowing all the strings in
+        advance, we can instead look for a short superstring of them
+        all: strings that appear within others are dropped, then the
+        pairs with the longest overlap are greedily merged, so that
+        each string follows one whose end matches its start.  This is
+        the classic greedy approximation to the shortest common
+        superstring; it does not promise an optimal table, only
+        (usually) a better one.  Records, as self.baseline, the size
+        the table would have had without packing, for comparison."""
+        strings, self.__pending = self.__pending, None
+        self.hash = {}
+        self.__resetCounts() # Strings are appended again, to get real tokens.
+        plain = StringData(self.name)
+        for s in strings:
+            plain.append(s, 16)
+        self.baseline = len(plain.data)
+
+        for piece in self.__superstring([tuple(unicode2utf16(s)) for s in strings if s]):
+            piece = array('H', piece)
+            self.__index.extend(piece)
+            self.data += piece
+
+    def __resetCounts(self):
+        """Clear the counts of appends, reported by stats()."""
+        self.appends = self.hits = self.requested = 0
+        # Least spare room in the length of any string, and for which (length, bits):
+        self.lengthHeadroom = self.tightest = None
+
     def __store(self, s, bits):
         """Add string s to known data.
 
-        Seeks to avoid duplication, where possible.
-        For example, short-forms may be prefixes of long-forms.
+        Seeks to avoid duplication, where possible.  For example,
+        short-forms may be prefixes of long-forms.  If s doesn't
+        appear in the data, but a prefix of it matches the end of the
+        data, only the rest of s is added.
         """
         if not s:
             return StringDataToken(0, 0, bits)
-        ucs2 = unicode2hex(s)
-        try:
-            index = self.text.index(s) - 1
-            matched = 0
-            while matched < len(ucs2):
-                index, matched = self.data.index(ucs2[0], index + 1), 1
-                if index + len(ucs2) >= len(self.data):
-                    raise ValueError # not found after all !
-                while matched < len(ucs2) and self.data[index + matched] == ucs2[matched]:
-                    matched += 1
-        except ValueError:
-            index = len(self.data)
-            self.data += ucs2
-            self.text += s
+        ucs2 = unicode2utf16(s)
+        index = self.__index.find(ucs2)
+        if index < 0:
+            overlap = self.__tailOverlap(ucs2)
+            index = len(self.data) - overlap
+            self.__index.extend(ucs2[overlap:])
+            self.data += ucs2[overlap:]
 
         assert index >= 0
         try:
@@ -130,13 +386,136 @@ class StringData:
             e.args += (self.name, s)
             raise
 
+    def __tailOverlap(self, ucs2):
+        """Length of the longest proper prefix of ucs2 that ends the data."""
+        # Knuth-Morris-Pratt failure function of ucs2:
+        fail = [0] * len(ucs2)
+        matched = 0
+        for i in range(1, len(ucs2)):
+            while matched and ucs2[i] != ucs2[matched]:
+                matched = fail[matched - 1]
+            if ucs2[i] == ucs2[matched]:
+                matched += 1
+            fail[i] = matched
+
+        # Match ucs2 against the tail of data; ucs2 isn't in data, so
+        # matched never reaches its full length.
+        matched = 0
+        for unit in self.data[-(len(ucs2) - 1):] if len(ucs2) > 1 else ():
+            while matched and unit != ucs2[matched]:
+                matched = fail[matched - 1]
+            if unit == ucs2[matched]:
+                matched += 1
+        return matched
+
+    @staticmethod
+    def __superstring(strings):
+        """Pieces whose concatenation contains every entry in strings.
+
+        Each entry in strings is a tuple of code units; each piece
+        returned is a list of code units.  See pack() for details."""
+        # Longest first, so we can drop each that appears in one we've kept:
+        seen, kept, index = set(), [], SubstringIndex()
+        for units in sorted(strings, key = len, reverse = True):
+            if units not in seen:
+                seen.add(units)
+                if index.find(array('H', units)) < 0:
+                    kept.append(units)
+                    index.extend(array('H', units + (0,))) # No string contains 0
+        del seen, index
+        # Restore original order, so that results are stable:
+        order = dict((units, i) for i, units in reversed(tuple(enumerate(strings))))
+        kept.sort(key = order.get)
+
+        # Rolling hashes of each proper prefix and suffix of each string:
+        modulus, base = (1 << 61) - 1, 1000003
+        prefixes, suffixes = {}, []
+        for i, units in enumerate(kept):
+            digits = [unit + 1 for unit in units]
+            value = 0
+            for k, digit in enumerate(digits[:-1], 1):
+                value = (value * base + digit) % modulus
+                prefixes.setdefault((k, value), []).append(i)
+            value, scale, tails = 0, 1, [None]
+            for digit in reversed(digits[1:]):
+                value = (digit * scale + value) % modulus
+                scale = scale * base % modulus
+                tails.append(value)
+            suffixes.append(tails)
+
+        # Greedily join each string to the one it overlaps most:
+        after, before = [None] * len(kept), [None] * len(kept)
+        head, tail = range(len(kept)), range(len(kept)) # Only valid at ends of chains
+        overlap = [0] * len(kept)
+        for k in range(max(len(units) for units in kept) - 1 if kept else 0, 0, -1):
+            for i, units in enumerate(kept):
+                if after[i] is not None or len(units) <= k:
+                    continue
+                for j in prefixes.get((k, suffixes[i][k]), ()):
+                    if (before[j] is None and head[i] != j
+                        and units[-k:] == kept[j][:k]):
+                        after[i], before[j], overlap[j] = j, i, k
+                        first, last = head[i], tail[j]
+                        tail[first], head[last] = last, first
+                        break
+
+        pieces = []
+        for i in range(len(kept)):
+            if before[i] is None:
+                piece = list(kept[i])
+                while after[i] is not None:
+                    i = after[i]
+                    piece += kept[i][overlap[i]:]
+                pieces.append(piece)
+        return pieces
+
+    def size(self):
+        """Report the size of the table and its headroom.
+
+        Returns a pair: the number of char16_t entries in the table and
+        the fraction of the quint16 index range this uses."""
+        return len(self.data), len(self.data) / float(0xffff)
+
+    def stats(self):
+        """Describe the table's size, reuse of data and limits.
+
+        Returns a mapping, suitable for saving as JSON, with entries:
+
+          entries -- number of char16_t entries in the table
+          bytes -- size of the table, in bytes
+          strings -- number of distinct strings in the table
+          appends -- number of strings appended, including repeats
+          hits -- number of appends of a string already present
+          requested -- total length of all strings appended
+          dedupRatio -- entries / requested: how much of what was
+                        asked for had to be stored
+          indexHeadroom -- how many more entries the table could take
+                           before its quint16 start-indices overflow
+          lengthHeadroom -- the least amount by which any string's
+                            length falls short of the limit its
+                            StringDataToken's bit-width imposes
+          tightest -- the length and bit-width of that string
+          baseline -- size the table would have had unpacked, if packed
+
+        Entries that don't apply (e.g. if no string was appended) are
+        None."""
+        size = len(self.data)
+        return dict(entries = size, bytes = size * self.data.itemsize,
+                    strings = len(self.hash), appends = self.appends,
+                    hits = self.hits, requested = self.requested,
+                    dedupRatio = (round(size / float(self.requested), 4)
+                                  if self.requested else None),
+                    indexHeadroom = 0xffff - size,
+                    lengthHeadroom = self.lengthHeadroom,
+                    tightest = self.tightest, baseline = self.baseline)
+
     def write(self, fd):
         if len(self.data) > 0xffff:
             raise ValueError('Data is too big ({}) for quint16 index to its end!'
                              .format(len(self.data)),
                              self.name)
         fd.write("\nstatic const char16_t {}[] = {{\n".format(self.name))
-        fd.write(wrap_list(self.data))
+        fd.write(wrap_hex(self.data))
         fd.write("\n};\n")
 
 def currencyIsoCodeData(s):
@@ -164,11 +543,23 @@ class LocaleSourceEditor (SourceFileEditor):
 
 class LocaleDataWriter (LocaleSourceEditor):
     def likelySubtags(self, likely):
+        """Write the likely_subtags table, sorted for binary search.
+
+        Entries are sorted by the IDs of the locale each maps from;
+        where several map from the same locale, they keep their order,
+        so that the first is the one found, as by a linear search.
+        Raises Error if a binary search fails to find any entry."""
+        likely = sorted(likely, key = lambda entry: entry[1])
+        keys = [have for had, have, got, give in likely]
+        for i, key in enumerate(keys):
+            if keys[bisect_left(keys, key)] != key:
+                raise Error('Binary search of likely_subtags fails to find {}'.format(likely[i][0]))
+
         self.writer.write('static const QLocaleId likely_subtags[] = {\n')
-        for had, have, got, give, last in likely:
+        for i, (had, have, got, give) in enumerate(likely, 1):
             self.writer.write('    {{ {:3d}, {:3d}, {:3d} }}'.format(*have))
             self.writer.write(', {{ {:3d}, {:3d}, {:3d} }}'.format(*give))
-            self.writer.write(' ' if last else ',')
+            self.writer.write(' ' if i == len(likely) else ',')
             self.writer.write(' // {} -> {}\n'.format(had, got))
         self.writer.write('};\n\n')
 
@@ -179,19 +570,72 @@ class LocaleDataWriter (LocaleSourceEditor):
         self.writer.write('     0 // trailing 0\n')
         self.writer.write('};\n\n')
 
-    def localeData(self, locales, names):
-        list_pattern_part_data = StringData('list_pattern_part_data')
-        single_character_data = StringData('single_character_data')
-        date_format_data = StringData('date_format_data')
-        time_format_data = StringData('time_format_data')
-        days_data = StringData('days_data')
-        am_data = StringData('am_data')
-        pm_data = StringData('pm_data')
-        byte_unit_data = StringData('byte_unit_data')
-        currency_symbol_data = StringData('currency_symbol_data')
-        currency_display_name_data = StringData('currency_display_name_data')
-        currency_format_data = StringData('currency_format_data')
-        endonyms_data = StringData('endonyms_data')
+    delta = None # Set by localeData(), if asked for delta form.
+    def localeData(self, locales, names, pack = False, parents = None):
+        """Write the locale_data table and the string tables it uses.
+
+        If pack is true, see StringData.pack(); all strings are first
+        collected, then packed, before the table is written.  If
+        parents is not None, it should be as returned by
+        localeParents(); the rows are then also delta-encoded, as
+        self.delta, a verified LocaleDelta.  Returns the string
+        tables."""
+        list_pattern_part_data = StringData('list_pattern_part_data', pack)
+        single_character_data = StringData('single_character_data', pack)
+        date_format_data = StringData('date_format_data', pack)
+        time_format_data = StringData('time_format_data', pack)
+        days_data = StringData('days_data', pack)
+        am_data = StringData('am_data', pack)
+        pm_data = StringData('pm_data', pack)
+        byte_unit_data = StringData('byte_unit_data', pack)
+        currency_symbol_data = StringData('currency_symbol_data', pack)
+        currency_display_name_data = StringData('currency_display_name_data', pack)
+        currency_format_data = StringData('currency_format_data', pack)
+        endonyms_data = StringData('endonyms_data', pack)
+        tables = (list_pattern_part_data, single_character_data,
+                  date_format_data, time_format_data, days_data,
+                  byte_unit_data, am_data, pm_data, currency_symbol_data,
+                  currency_display_name_data, currency_format_data,
+                  endonyms_data)
+
+        def stringRanges(locale): # Sequence of StringDataToken:
+            ranges = (tuple(list_pattern_part_data.append(p) for p in # 5 entries:
+                            (locale.listPatternPartStart, locale.listPatternPartMiddle,
+                             locale.listPatternPartEnd, locale.listPatternPartTwo,
+                             locale.listDelim)) +
+                      tuple(single_character_data.append(p) for p in # 11 entries
+                            (locale.decimal, locale.group, locale.percent, locale.zero,
+                             locale.minus, locale.plus, locale.exp,
+                             locale.quotationStart, locale.quotationEnd,
+                             locale.alternateQuotationStart, locale.alternateQuotationEnd)) +
+                      tuple (date_format_data.append(f) for f in # 2 entries:
+                             (locale.longDateFormat, locale.shortDateFormat)) +
+                      tuple(time_format_data.append(f) for f in # 2 entries:
+                            (locale.longTimeFormat, locale.shortTimeFormat)) +
+                      tuple(days_data.append(d) for d in # 6 entries:
+                            (locale.standaloneLongDays, locale.longDays,
+                             locale.standaloneShortDays, locale.shortDays,
+                             locale.standaloneNarrowDays, locale.narrowDays)) +
+                      (am_data.append(locale.am), pm_data.append(locale.pm)) + # 2 entries
+                      tuple(byte_unit_data.append(b) for b in # 3 entries:
+                            (locale.byte_unit,
+                             locale.byte_si_quantified,
+                             locale.byte_iec_quantified)) +
+                      (currency_symbol_data.append(locale.currencySymbol),
+                       currency_display_name_data.append(locale.currencyDisplayName),
+                       currency_format_data.append(locale.currencyFormat),
+                       currency_format_data.append(locale.currencyNegativeFormat),
+                       endonyms_data.append(locale.languageEndonym),
+                       endonyms_data.append(locale.countryEndonym)) # 6 entries
+                      ) # Total: 37 entries
+            assert len(ranges) == 37
+            return ranges
+
+        if pack:
+            for key in names:
+                stringRanges(locales[key])
+            for data in tables:
+                data.pack()
 
         # Locale data
         self.writer.write('static const QLocaleData locale_data[] = {\n')
@@ -278,52 +722,24 @@ class LocaleDataWriter (LocaleSourceEditor):
             # Day of week and week-end
             ',{:6d}' * 3,
             ' }}')).format
+        rows = []
         for key in names:
             locale = locales[key]
-            # Sequence of StringDataToken:
-            ranges = (tuple(list_pattern_part_data.append(p) for p in # 5 entries:
-                            (locale.listPatternPartStart, locale.listPatternPartMiddle,
-                             locale.listPatternPartEnd, locale.listPatternPartTwo,
-                             locale.listDelim)) +
-                      tuple(single_character_data.append(p) for p in # 11 entries
-                            (locale.decimal, locale.group, locale.percent, locale.zero,
-                             locale.minus, locale.plus, locale.exp,
-                             locale.quotationStart, locale.quotationEnd,
-                             locale.alternateQuotationStart, locale.alternateQuotationEnd)) +
-                      tuple (date_format_data.append(f) for f in # 2 entries:
-                             (locale.longDateFormat, locale.shortDateFormat)) +
-                      tuple(time_format_data.append(f) for f in # 2 entries:
-                            (locale.longTimeFormat, locale.shortTimeFormat)) +
-                      tuple(days_data.append(d) for d in # 6 entries:
-                            (locale.standaloneLongDays, locale.longDays,
-                             locale.standaloneShortDays, locale.shortDays,
-                             locale.standaloneNarrowDays, locale.narrowDays)) +
-                      (am_data.append(locale.am), pm_data.append(locale.pm)) + # 2 entries
-                      tuple(byte_unit_data.append(b) for b in # 3 entries:
-                            (locale.byte_unit,
-                             locale.byte_si_quantified,
-                             locale.byte_iec_quantified)) +
-                      (currency_symbol_data.append(locale.currencySymbol),
-                       currency_display_name_data.append(locale.currencyDisplayName),
-                       currency_format_data.append(locale.currencyFormat),
-                       currency_format_data.append(locale.currencyNegativeFormat),
-                       endonyms_data.append(locale.languageEndonym),
-                       endonyms_data.append(locale.countryEndonym)) # 6 entries
-                      ) # Total: 37 entries
-            assert len(ranges) == 37
+            ranges = stringRanges(locale)
+            head = key + tuple(r.index for r in ranges) + tuple(r.length for r in ranges)
+            tail = (locale.currencyDigits,
+                    locale.currencyRounding, # unused (QTBUG-81343)
+                    locale.firstDayOfWeek,
+                    locale.weekendStart,
+                    locale.weekendEnd)
 
             self.writer.write(formatLine(*(
-                        key +
-                        tuple(r.index for r in ranges) +
-                        tuple(r.length for r in ranges) +
-                        (currencyIsoCodeData(locale.currencyIsoCode),
-                         locale.currencyDigits,
-                         locale.currencyRounding, # unused (QTBUG-81343)
-                         locale.firstDayOfWeek,
-                         locale.weekendStart,
-                         locale.weekendEnd) ))
+                        head + (currencyIsoCodeData(locale.currencyIsoCode),) + tail))
                               + ', // {}/{}/{}\n'.format(
                     locale.language, locale.script, locale.country))
+            if parents is not None:
+                iso = tuple(ord(c) for c in locale.currencyIsoCode) or (0, 0, 0)
+                rows.append(head + iso + tail)
         self.writer.write(formatLine(*( # All zeros, matching the format:
                     (0,) * 3 + (0,) * 37 * 2
                     + (currencyIsoCodeData(0),)
@@ -333,13 +749,17 @@ class LocaleDataWriter (LocaleSourceEditor):
         self.writer.write('};\n')
 
         # StringData tables:
-        for data in (list_pattern_part_data, single_character_data,
-                     date_format_data, time_format_data, days_data,
-                     byte_unit_data, am_data, pm_data, currency_symbol_data,
-                     currency_display_name_data, currency_format_data,
-                     endonyms_data):
+        for data in tables:
             data.write(self.writer)
 
+        if parents is not None:
+            self.delta = LocaleDelta(['{}/{}/{}'.format(locales[key].language,
+                                                        locales[key].script,
+                                                        locales[key].country)
+                                      for key in names], rows, parents)
+            self.delta.verify()
+        return tables
+
     @staticmethod
     def __writeNameData(out, book, form):
         out('static const char {}_name_list[] =\n'.format(form))
@@ -370,6 +790,24 @@ class LocaleDataWriter (LocaleSourceEditor):
             out('"{}" // {}\n'.format(code, value[0]))
         out(';\n\n')
 
+        # Enum values, sorted by code, for binary search of the list:
+        padded = dict((key, value[1] + '\0' * max(width - len(value[1]), 0))
+                      for key, value in book.items())
+        order = sorted(book, key = lambda k: (padded[k], k))
+        codes, linear = [padded[k] for k in order], {}
+        for key, value in book.items():
+            # Where codes are duplicated, a linear search finds the first:
+            expected = linear.setdefault(padded[key], key)
+            found = order[bisect_left(codes, padded[key])]
+            if found != expected:
+                raise Error('Binary search for {} code "{}" finds {}, not {}'.format(
+                        form, value[1], book[found][0], book[expected][0]))
+
+        out('static const quint16 {}_code_order[] = {{\n'.format(form))
+        for key in order:
+            out('{:6d}, // {}\n'.format(key, book[key][0]))
+        out('};\n\n')
+
     def languageNames(self, languages):
         self.__writeNameData(self.writer.write, languages, 'language')
 
@@ -396,8 +834,24 @@ class CalendarDataWriter (LocaleSourceEditor):
         '      {{'
         + ','.join(('{:6d}',) * 3 + ('{:5d}',) * 6 + ('{:3d}',) * 6)
         + ' }},').format
-    def write(self, calendar, locales, names):
-        months_data = StringData('months_data')
+    def write(self, calendar, locales, names, pack = False):
+        months_data = StringData('months_data', pack)
+        def monthRanges(locale): # Sequence of StringDataToken:
+            try:
+                # Twelve long month names can add up to more than 256 (e.g. kde_TZ: 264)
+                return (tuple(months_data.append(m[calendar], 16) for m in
+                              (locale.standaloneLongMonths, locale.longMonths)) +
+                        tuple(months_data.append(m[calendar]) for m in
+                              (locale.standaloneShortMonths, locale.shortMonths,
+                               locale.standaloneNarrowMonths, locale.narrowMonths)))
+            except ValueError as e:
+                e.args += (locale.language, locale.script, locale.country, stem)
+                raise
+
+        if pack:
+            for key in names:
+                monthRanges(locales[key])
+            months_data.pack()
 
         self.writer.write('static const QCalendarLocale locale_data[] = {\n')
         self.writer.write(
@@ -418,18 +872,7 @@ class CalendarDataWriter (LocaleSourceEditor):
             '\n')
         for key in names:
             locale = locales[key]
-            # Sequence of StringDataToken:
-            try:
-                # Twelve long month names can add up to more than 256 (e.g. kde_TZ: 264)
-                ranges = (tuple(months_data.append(m[calendar], 16) for m in
-                                (locale.standaloneLongMonths, locale.longMonths)) +
-                          tuple(months_data.append(m[calendar]) for m in
-                                (locale.standaloneShortMonths, locale.shortMonths,
-                                 locale.standaloneNarrowMonths, locale.narrowMonths)))
-            except ValueError as e:
-                e.args += (locale.language, locale.script, locale.country, stem)
-                raise
-
+            ranges = monthRanges(locale)
             self.writer.write(
                 self.formatCalendar(*(
                         key +
@@ -440,6 +883,7 @@ class CalendarDataWriter (LocaleSourceEditor):
                           + '// trailing zeros\n')
         self.writer.write('};\n')
         months_data.write(self.writer)
+        return months_data
 
 class LocaleHeaderWriter (SourceFileEditor):
     __upinit = SourceFileEditor.__init__
@@ -486,50 +930,223 @@ class LocaleHeaderWriter (SourceFileEditor):
                                  for pair in sorted(alias.items()))
             + ',\n\n        Last{} = {}\n    }};\n'.format(name, member))
 
-def usage(name, err, message = ''):
-    err.write("""Usage: {} path/to/qlocale.xml root/of/qtbase
-""".format(name)) # TODO: elaborate
-    if message:
-        err.write('\n' + message + '\n')
+def reportSizes(out, tables):
+    """Report how close each StringData table is to the quint16 limit."""
+    out.write('String table sizes (char16_t entries, of at most {}):\n'.format(0xffff))
+    for name, data in tables:
+        size, fraction = data.size()
+        out.write('  {:<44} {:6d} ({:5.1f}%)'.format(name, size, fraction * 100))
+        if data.baseline is not None: # Packed: compare with unpacked.
+            out.write(' packed, from {} ({:+.1f}%)'.format(
+                    data.baseline, (size - data.baseline) * 100. / (data.baseline or 1)))
+        out.write('\n')
+
+def sizeReport(tables, version, count):
+    """Machine-readable report on the string tables.
+
+    Takes the (label, StringData) pairs of all tables, the CLDR
+    version and the number of locales; returns a mapping, suitable for
+    saving as JSON, that maps each label to the table's stats()."""
+    return dict(format = 1, cldrVersion = version, locales = count,
+                tables = dict((name, data.stats()) for name, data in tables))
+
+def reportChanges(out, old, new):
+    """Describe how a sizeReport() differs from an earlier one.
+
+    Reports each number that has changed in the stats of each table,
+    along with any tables added or removed.  Returns True if anything
+    has changed."""
+    changed = False
+    if old.get('format') != new['format']:
+        out.write('Previous size report is in an unknown format; not compared\n')
+        return True
+    for key in ('cldrVersion', 'locales'):
+        if old.get(key) != new[key]:
+            out.write('{}: {} -> {}\n'.format(key, old.get(key), new[key]))
+            changed = True
+
+    before, after = old.get('tables', {}), new['tables']
+    for name in sorted(set(before) | set(after)):
+        if name not in after:
+            out.write('  {}: removed\n'.format(name))
+        elif name not in before:
+            out.write('  {}: added, {} entries\n'.format(name, after[name]['entries']))
+        else:
+            was, now = before[name], after[name]
+            diffs = []
+            for key in sorted(now):
+                if now[key] != was.get(key):
+                    if isinstance(now[key], (int, float)) and isinstance(was.get(key), (int, float)):
+                        delta = now[key] - was[key]
+                        diffs.append('{} {} -> {} ({})'.format(
+                                key, was[key], now[key],
+                                '{:+.4f}'.format(delta) if isinstance(delta, float)
+                                else '{:+d}'.format(delta)))
+                    else:
+                        diffs.append('{} {} -> {}'.format(key, was.get(key), now[key]))
+            if not diffs:
+                continue
+            out.write('  {}: {}\n'.format(name, '; '.join(diffs)))
+        changed = True
 
-def main(args, out, err):
-    # TODO: Make calendars a command-line parameter
-    # map { CLDR name: Qt file name }
-    calendars = {'gregorian': 'roman', 'persian': 'jalali', 'islamic': 'hijri',} # 'hebrew': 'hebrew',
+    if not changed:
+        out.write('No change in table sizes since the previous report\n')
+    return changed
 
-    name = args.pop(0)
-    if len(args) != 2:
-        usage(name, err, 'I expect two arguments')
-        return 1
+def saveDelta(out, err, path, writers):
+    """Save the delta-encoded locale data to file path.
 
-    qlocalexml = args.pop(0)
-    qtsrcdir = args.pop(0)
+    The LocaleDelta is taken from whichever of writers wrote the locale
+    data.  Reports how its size compares with that of the flat rows.
+    Returns True on success."""
+    delta, = [writer.delta for writer in writers if isinstance(writer, LocaleDataWriter)]
+    try:
+        with open(path, 'w') as fd:
+            fd.write('// Delta-encoded locale_data, generated by qlocalexml2cpp.py --delta;\n'
+                     '// see LocaleDelta in that script for the format.\n\n')
+            delta.write(fd.write)
+    except IOError as e:
+        err.write('Failed to write delta-encoded locale data {}: {}\n'.format(path, e))
+        return False
 
-    if not (os.path.isdir(qtsrcdir)
-            and all(os.path.isfile(os.path.join(qtsrcdir, 'src', 'corelib', 'text', leaf))
-                    for leaf in ('qlocale_data_p.h', 'qlocale.h', 'qlocale.qdoc'))):
-        usage(name, err, 'Missing expected files under qtbase source root ' + qtsrcdir)
-        return 1
+    flat, sparse = delta.sizes()
+    out.write('locale_data: {} bytes flat, {} bytes delta-encoded ({:+.1f}%), '
+              'with {} overrides for {} locales\n'.format(
+            flat, sparse, (sparse - flat) * 100. / flat, delta.count(), len(delta.rows)))
+    return True
 
-    reader = QLocaleXmlReader(qlocalexml)
-    locale_map = dict(reader.loadLocaleMap(calendars, err.write))
+def saveReport(out, err, path, report):
+    """Save report as JSON in file path, comparing with what it held.
 
-    locale_keys = locale_map.keys()
-    compareLocaleKeys.default_map = dict(reader.defaultMap())
-    locale_keys.sort(compareLocaleKeys)
+    Returns 0 on success, else 1."""
+    try:
+        with open(path) as fd:
+            previous = json.load(fd)
+    except IOError:
+        previous = None
+    except ValueError:
+        err.write('Ignoring unreadable previous size report in {}\n'.format(path))
+        previous = None
 
     try:
-        writer = LocaleDataWriter(os.path.join(qtsrcdir,  'src', 'corelib', 'text',
-                                               'qlocale_data_p.h'),
-                                  qtsrcdir, reader.cldrVersion)
+        with open(path, 'w') as fd:
+            json.dump(report, fd, indent = 1, sort_keys = True, separators = (',', ': '))
+            fd.write('\n')
     except IOError as e:
-        err.write('Failed to open files to transcribe locale data: ' + (e.message or e.args[1]))
+        err.write('Failed to write size report {}: {}\n'.format(path, e))
         return 1
 
-    try:
+    if previous is not None:
+        out.write('Changes since previous size report:\n')
+        reportChanges(out, previous, report)
+    return 0
+
+class Generator (object):
+    """Writes each output file from one shared load of qLocaleXML data.
+
+    Each output file is written, to a temporary file, by its own task,
+    so that the tasks can be run in parallel; see results().  None of
+    the temporary files should replace its original until all tasks
+    have succeeded; see main().
+    """
+    def __init__(self, qtsrcdir, reader, locales, keys, calendars, pack, delta = False):
+        """Prepare to generate output files.
+
+        Takes the root of the qtbase check-out, the QLocaleXmlReader
+        for the data, the mapping from locale keys to Locale objects
+        loaded by the reader and the locale keys in the order in which
+        to write them, the mapping from CLDR to Qt names of calendars
+        and whether to pack string tables (see StringData.pack()).  If
+        optional delta is true, the writer of the locale data also
+        delta-encodes its rows (see LocaleDelta)."""
+        self.qtsrcdir, self.reader, self.pack, self.delta = qtsrcdir, reader, pack, delta
+        self.locales, self.keys, self.calendars = locales, keys, calendars
+
+    def tasks(self):
+        return ('data',) + tuple(self.calendars) + ('header', 'qdoc')
+
+    def run(self, task):
+        """Perform one task.
+
+        Returns a triple (writer, tables, message).  On success, writer
+        is closed but has yet to replace its original, tables is a
+        sequence of (label, StringData) pairs for reportSizes() and
+        message is None.  On failure, of any kind, writer is None, its
+        temporary file has been removed and message says what went
+        wrong; so no task's failure prevents the others' writers from
+        being returned, to be replaced or cleaned up."""
+        if task in self.calendars:
+            label, start, fill = (task + ' locale data',
+                                  self.__startCalendarData, self.__calendarData)
+        else:
+            label, start, fill = {
+                'data': ('locale data', self.__startLocaleData, self.__localeData),
+                'header': ('qlocale.h', self.__startLocaleHeader, self.__localeHeader),
+                'qdoc': ('qlocale.qdoc', self.__startLocaleDoc, self.__localeDoc)}[task]
+
+        try:
+            writer = start(task)
+        except IOError as e:
+            return None, (), 'Failed to open files to transcribe {}: {}\n'.format(
+                label, e.message or e.args[1])
+        except Exception:
+            return None, (), '\nError opening files for {}:\n{}'.format(
+                label, traceback.format_exc())
+
+        try:
+            tables = fill(writer, task)
+            writer.close(False)
+        except Error as e:
+            writer.cleanup()
+            return None, (), '\nError updating {}: {}\n'.format(label, e.message)
+        except Exception:
+            writer.cleanup()
+            return None, (), '\nError updating {}:\n{}'.format(label, traceback.format_exc())
+        except:
+            writer.cleanup()
+            raise
+        return writer, tables, None
+
+    def results(self, jobs = 1):
+        """Iterate the results of run() for each task, in order.
+
+        If jobs is not 1, the tasks are shared among that many worker
+        processes, or one per CPU if jobs is None."""
+        tasks = self.tasks()
+        if jobs == 1:
+            return (self.run(task) for task in tasks)
+        return self.__poolResults(tasks, jobs)
+
+    # Implementation details
+    def __poolResults(self, tasks, jobs):
+        import multiprocessing
+        pool = multiprocessing.Pool(min(jobs or multiprocessing.cpu_count(), len(tasks)),
+                                    _startGenerator, (self,))
+        try:
+            for result in pool.imap(_runGeneratorTask, tasks):
+                yield result
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    def __path(self, *tail):
+        return os.path.join(self.qtsrcdir, 'src', 'corelib', *tail)
+
+    def __startLocaleData(self, task):
+        return LocaleDataWriter(self.__path('text', 'qlocale_data_p.h'),
+                                self.qtsrcdir, self.reader.cldrVersion)
+
+    def __localeData(self, writer, task):
+        reader = self.reader
         writer.likelySubtags(reader.likelyMap())
-        writer.localeIndex(reader.languageIndices(tuple(k[0] for k in locale_map)))
-        writer.localeData(locale_map, locale_keys)
+        writer.localeIndex(reader.languageIndices(tuple(k[0] for k in self.locales)))
+        tables = [('qlocale_data_p.h ' + data.name, data)
+                  for data in writer.localeData(
+                self.locales, self.keys, self.pack,
+                localeParents(self.keys, reader.defaultMap()) if self.delta else None)]
         writer.writer.write('\n')
         writer.languageNames(reader.languages)
         writer.scriptNames(reader.scripts)
@@ -538,73 +1155,151 @@ def main(args, out, err):
         writer.languageCodes(reader.languages)
         writer.scriptCodes(reader.scripts)
         writer.countryCodes(reader.countries)
-    except Error as e:
-        writer.cleanup()
-        err.write('\nError updating locale data: ' + e.message + '\n')
-        return 1
+        return tables
 
-    writer.close()
+    def __startCalendarData(self, calendar):
+        return CalendarDataWriter(
+            self.__path('time', 'q{}calendar_data_p.h'.format(self.calendars[calendar])),
+            self.qtsrcdir, self.reader.cldrVersion)
 
-    # Generate calendar data
-    for calendar, stem in calendars.items():
-        try:
-            writer = CalendarDataWriter(os.path.join(qtsrcdir, 'src', 'corelib', 'time',
-                                                     'q{}calendar_data_p.h'.format(stem)),
-                                        qtsrcdir, reader.cldrVersion)
-        except IOError as e:
-            err.write('Failed to open files to transcribe ' + calendar
-                             + ' data ' + (e.message or e.args[1]))
-            return 1
+    def __calendarData(self, writer, calendar):
+        stem = self.calendars[calendar]
+        return (('q{}calendar_data_p.h months_data'.format(stem),
+                 writer.write(calendar, self.locales, self.keys, self.pack)),)
 
-        try:
-            writer.write(calendar, locale_map, locale_keys)
-        except Error as e:
-            writer.cleanup()
-            err.write('\nError updating ' + calendar + ' locale data: ' + e.message + '\n')
-            return 1
-
-        writer.close()
+    def __startLocaleHeader(self, task):
+        return LocaleHeaderWriter(self.__path('text', 'qlocale.h'),
+                                  self.qtsrcdir, self.reader.dupes)
 
-    # qlocale.h
-    try:
-        writer = LocaleHeaderWriter(os.path.join(qtsrcdir, 'src', 'corelib', 'text', 'qlocale.h'),
-                                    qtsrcdir, reader.dupes)
-    except IOError as e:
-        err.write('Failed to open files to transcribe qlocale.h: ' + (e.message or e.args[1]))
-        return 1
-
-    try:
+    def __localeHeader(self, writer, task):
+        reader = self.reader
         writer.languages(reader.languages)
         writer.scripts(reader.scripts)
         writer.countries(reader.countries)
-    except Error as e:
-        writer.cleanup()
-        err.write('\nError updating qlocale.h: ' + e.message + '\n')
+        return ()
+
+    def __startLocaleDoc(self, task):
+        return Transcriber(self.__path('text', 'qlocale.qdoc'), self.qtsrcdir)
+
+    def __localeDoc(self, writer, task):
+        DOCSTRING = "    QLocale's data is based on Common Locale Data Repository "
+        for line in writer.reader:
+            if DOCSTRING in line:
+                writer.writer.write(DOCSTRING + 'v' + self.reader.cldrVersion + '.\n')
+            else:
+                writer.writer.write(line)
+        return ()
+
+# Pool workers need module-level functions; each worker process gets
+# its own copy of the Generator (inherited, when forked, with all the
+# data it has already loaded).
+def _startGenerator(generator):
+    global _generator
+    _generator = generator
+
+def _runGeneratorTask(task):
+    return _generator.run(task)
+
+def usage(name, err, message = ''):
+    err.write("""Usage: {} [--pack] [--jobs N] [--delta FILE] [--report FILE] path/to/qlocale.xml root/of/qtbase
+Options:
+  --pack    collect all the strings for each string table before laying
+            the table out, to make the tables smaller; this takes longer
+  --jobs    number of processes generating output files, in parallel;
+            0 for one per CPU (default: 1)
+  --delta   also write the rows of locale_data, delta-encoded relative
+            to a parent locale (see LocaleDelta), to this file and
+            report how its size compares; QLocale does not yet use it
+  --report  save a JSON report on the sizes of the string tables, their
+            reuse of data and how close they are to their limits (see
+            StringData.stats()) to this file; if it already holds such
+            a report, from a previous run, report what has changed
+
+No file is modified unless all are successfully generated.
+""".format(name)) # TODO: elaborate
+    if message:
+        err.write('\n' + message + '\n')
+
+def main(args, out, err):
+    # TODO: Make calendars a command-line parameter
+    # map { CLDR name: Qt file name }
+    calendars = {'gregorian': 'roman', 'persian': 'jalali', 'islamic': 'hijri',} # 'hebrew': 'hebrew',
+
+    name = args.pop(0)
+    pack, jobs, report, delta = False, 1, None, None
+    while args and args[0] in ('--pack', '--jobs', '--report', '--delta'):
+        option = args.pop(0)
+        if option == '--pack':
+            pack = True
+            continue
+        value = args.pop(0) if args else None
+        if option in ('--report', '--delta'):
+            if value is None:
+                usage(name, err, 'The {} option needs a file name'.format(option))
+                return 1
+            if option == '--report':
+                report = value
+            else:
+                delta = value
+            continue
+        try:
+            jobs = int(value)
+        except (TypeError, ValueError):
+            jobs = -1
+        if jobs < 0:
+            usage(name, err, 'Job count must be a non-negative integer, not {}'.format(value))
+            return 1
+        jobs = jobs or None # Zero means one per CPU
+
+    if len(args) != 2:
+        usage(name, err, 'I expect two arguments')
         return 1
 
-    writer.close()
+    qlocalexml = args.pop(0)
+    qtsrcdir = args.pop(0)
 
-    # qlocale.qdoc
-    try:
-        writer = Transcriber(os.path.join(qtsrcdir, 'src', 'corelib', 'text', 'qlocale.qdoc'),
-                             qtsrcdir)
-    except IOError as e:
-        err.write('Failed to open files to transcribe qlocale.qdoc: ' + (e.message or e.args[1]))
+    if not (os.path.isdir(qtsrcdir)
+            and all(os.path.isfile(os.path.join(qtsrcdir, 'src', 'corelib', 'text', leaf))
+                    for leaf in ('qlocale_data_p.h', 'qlocale.h', 'qlocale.qdoc'))):
+        usage(name, err, 'Missing expected files under qtbase source root ' + qtsrcdir)
         return 1
 
-    DOCSTRING = "    QLocale's data is based on Common Locale Data Repository "
+    reader = QLocaleXmlReader(qlocalexml)
+    locale_map = dict(reader.loadLocaleMap(calendars, err.write))
+
+    locale_keys = sorted(locale_map, key = localeSortKey(reader.defaultMap()))
+
+    generator = Generator(qtsrcdir, reader, locale_map, locale_keys, calendars, pack,
+                          delta is not None)
+    writers, tables, failed = [], [], False
     try:
-        for line in writer.reader:
-            if DOCSTRING in line:
-                writer.writer.write(DOCSTRING + 'v' + reader.cldrVersion + '.\n')
+        for writer, sizes, message in generator.results(jobs):
+            if message is None:
+                writers.append(writer)
+                tables += sizes
             else:
-                writer.writer.write(line)
-    except Error as e:
-        writer.cleanup()
-        err.write('\nError updating qlocale.qdoc: ' + e.message + '\n')
+                err.write(message)
+                failed = True
+    except:
+        for writer in writers:
+            writer.cleanup()
+        raise
+
+    if failed or (delta and not saveDelta(out, err, delta, writers)):
+        for writer in writers:
+            writer.cleanup()
         return 1
 
-    writer.close()
+    # Only replace the originals once all have been generated:
+    changed = [writer.path for writer in writers if writer.replace()]
+    if changed:
+        out.write('Updated:\n' + ''.join('  {}\n'.format(path) for path in changed))
+    else:
+        out.write('No files changed\n')
+    reportSizes(out, tables)
+    if report:
+        return saveReport(out, err, report,
+                          sizeReport(tables, reader.cldrVersion, len(locale_keys)))
     return 0
 
 if __name__ == "__main__":
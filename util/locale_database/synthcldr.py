@@ -0,0 +1,623 @@
+#!/usr/bin/env python2
+# coding=utf8
+#############################################################################
+##
+## Copyright (C) 2020 The Qt Company Ltd.
+## Contact: https://www.qt.io/licensing/
+##
+## This file is part of the test suite of the Qt Toolkit.
+##
+## $QT_BEGIN_LICENSE:GPL-EXCEPT$
+## Commercial License Usage
+## Licensees holding valid commercial Qt licenses may use this file in
+## accordance with the commercial license agreement provided with the
+## Software or, alternatively, in accordance with the terms contained in
+## a written agreement between you and The Qt Company. For licensing terms
+## and conditions see https://www.qt.io/terms-conditions. For further
+## information use the contact form at https://www.qt.io/contact-us.
+##
+## GNU General Public License Usage
+## Alternatively, this file may be used under the terms of the GNU
+## General Public License version 3 as published by the Free Software
+## Foundation with exceptions as appearing in the file LICENSE.GPL3-EXCEPT
+## included in the packaging of this file. Please review the following
+## information to ensure the GNU General Public License requirements will
+## be met: https://www.gnu.org/licenses/gpl-3.0.html.
+##
+## $QT_END_LICENSE$
+##
+#############################################################################
+"""Generate a synthetic CLDR tree
+
+Writes a tree of files shaped like the parts of an unpacked CLDR
+core.zip that cldr.py reads: common/dtd/ldml.dtd, common/main/*.xml
+and the supplemental data files.  The content is made up, but uses
+real language, script and country codes from enumdata.py, so the tree
+can be fed through cldr2qlocalexml.py, qlocalexml2cpp.py and
+cldr2qtimezone.py without access to a real CLDR release.
+
+The shape of the data can be tuned: the number of languages and of
+territories per language, the depth of locale inheritance chains, the
+density of aliases in root.xml and the calendars for which data is
+provided.  Output is deterministic for a given seed.
+
+See SyntheticCldr for details and main() for command-line use.
+"""
+
+import io
+import os
+import random
+from xml.sax.saxutils import escape, quoteattr
+
+from enumdata import language_list, script_list, country_list
+from cldr2qtimezone import windowsIdList
+
+class Element (object):
+    """Minimal XML element, just enough to write the files we need."""
+    def __init__(self, tag, attrs = (), children = (), text = None):
+        self.tag, self.attrs, self.text = tag, tuple(attrs), text
+        self.children = list(children)
+
+    def add(self, *children):
+        self.children.extend(children)
+        return self
+
+    def write(self, out, indent = ''):
+        attrs = ''.join(u' {}={}'.format(k, quoteattr(v)) for k, v in self.attrs)
+        if self.text is not None:
+            out(u'{}<{}{}>{}</{}>\n'.format(indent, self.tag, attrs, escape(self.text), self.tag))
+        elif self.children:
+            out(u'{}<{}{}>\n'.format(indent, self.tag, attrs))
+            for child in self.children:
+                child.write(out, indent + '\t')
+            out(u'{}</{}>\n'.format(indent, self.tag))
+        else:
+            out(u'{}<{}{}/>\n'.format(indent, self.tag, attrs))
+
+def _alias(path):
+    return Element('alias', (('source', 'locale'), ('path', path)))
+
+class SyntheticCldr (object):
+    """Generator for a synthetic CLDR tree.
+
+    Construct with the shape parameters, then call write(root) to
+    create the tree under the directory root.  All parameters are
+    optional:
+
+      languages -- number of languages with locale files
+      territories -- number of territories (so locales) per language
+      depth -- length of the inheritance chain of the last of each
+          language's locales, not counting root; chains of more than
+          two files are made via parentLocales entries
+      aliasDensity -- probability, from 0 to 1, that a part of root.xml
+          that can be expressed as an alias to another part is one,
+          with locales then also leaving that part out
+      calendars -- calendar names for which month names are provided
+      seed -- seed for the pseudo-random choices
+    """
+    def __init__(self, languages = 40, territories = 3, depth = 2, aliasDensity = 0.5,
+                 calendars = ('gregorian', 'persian', 'islamic'), seed = 1):
+        self.languageCount, self.territoryCount = languages, territories
+        self.depth, self.aliasDensity = max(1, depth), aliasDensity
+        self.calendars = tuple(calendars)
+        if 'gregorian' not in self.calendars:
+            self.calendars = ('gregorian',) + self.calendars
+        self.seed = seed
+
+    cldrVersion = '36.1'
+
+    def write(self, root):
+        """Write the synthetic CLDR tree under directory root.
+
+        Returns the number of locale files written to common/main/."""
+        self.__random = random.Random(self.seed)
+        self.__plan()
+
+        main = os.path.join(root, 'common', 'main')
+        supplemental = os.path.join(root, 'common', 'supplemental')
+        dtd = os.path.join(root, 'common', 'dtd')
+        for path in (main, supplemental, dtd):
+            if not os.path.isdir(path):
+                os.makedirs(path)
+
+        with io.open(os.path.join(dtd, 'ldml.dtd'), 'w', encoding='utf-8') as fd:
+            fd.write(self.__dtd())
+
+        self.__save(os.path.join(main, 'root.xml'), self.__rootLocale())
+        self.__save(os.path.join(main, 'en.xml'), self.__english())
+        for name, doc in self.__localeFiles():
+            self.__save(os.path.join(main, name + '.xml'), doc)
+
+        for name, doc in (('supplementalData.xml', self.__supplementalData()),
+                          ('supplementalMetadata.xml', self.__supplementalMetadata()),
+                          ('likelySubtags.xml', self.__likelySubtags()),
+                          ('numberingSystems.xml', self.__numberingSystems()),
+                          ('windowsZones.xml', self.__windowsZones())):
+            self.__save(os.path.join(supplemental, name), doc, 'supplementalData')
+
+        return len(self.__files) + 2
+
+    # Implementation details
+    __days = ('sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat')
+    __widths = ('wide', 'abbreviated', 'narrow')
+    __contexts = ('format', 'stand-alone')
+    # Numbering systems, by zero digit; all have consecutive digits:
+    __systems = (('latn', u'0'), ('arab', u'٠'), ('deva', u'०'),
+                 ('beng', u'০'), ('thai', u'๐'))
+    __syllables = (u'ka', u'lo', u'mi', u'su', u'ra', u'te', u'no', u'vi', u'da', u'pe',
+                   u'za', u'ch\xe9', u'\xf1o', u'gu', u'h\xe4', u'bo', u'y\xfc', u'ne',
+                   u'sha', u'tri', u'ša', u'łu')
+    # Tags, with the attributes (other than draft, alt and references)
+    # that shall be marked @VALUE in the DTD:
+    __tags = ('ldml', 'identity', 'version', 'generation', 'language', 'script',
+              'territory', 'variant', 'alias', 'localeDisplayNames', 'languages',
+              'scripts', 'territories', 'variants', 'delimiters', 'quotationStart',
+              'quotationEnd', 'alternateQuotationStart', 'alternateQuotationEnd',
+              'dates', 'calendars', 'calendar', 'months', 'monthContext', 'monthWidth',
+              'month', 'days', 'dayContext', 'dayWidth', 'day', 'dayPeriods',
+              'dayPeriodContext', 'dayPeriodWidth', 'dayPeriod', 'dateFormats',
+              'dateFormatLength', 'dateFormat', 'timeFormats', 'timeFormatLength',
+              'timeFormat', 'pattern', 'numbers', 'defaultNumberingSystem', 'symbols',
+              'decimal', 'group', 'list', 'percentSign', 'plusSign', 'minusSign',
+              'exponential', 'currencyFormats', 'currencyFormatLength',
+              'currencyFormat', 'currencies', 'currency', 'displayName', 'symbol',
+              'listPatterns', 'listPattern', 'listPatternPart', 'units', 'unitLength',
+              'unit', 'unitPattern')
+    __values = {'pattern': ('numbers',), 'version': ('number',), 'generation': ('date',)}
+
+    def __choice(self, seq):
+        return self.__random.choice(seq)
+
+    def __chance(self, probability):
+        return self.__random.random() < probability
+
+    def __word(self, low = 2, high = 4):
+        text = u''.join(self.__choice(self.__syllables)
+                        for i in range(self.__random.randint(low, high)))
+        return text[0].upper() + text[1:]
+
+    def __plan(self):
+        """Decide on locales, their inheritance and their properties."""
+        choose = self.__random.sample
+        languages = sorted(v[1] for k, v in language_list.items()
+                           if len(v[1]) == 2 and v[1].islower() and v[1] != 'en')
+        countries = sorted(v[1] for k, v in country_list.items()
+                           if len(v[1]) == 2 and v[1].isupper() and v[1] != 'ZZ')
+        scripts = sorted(v[1] for k, v in script_list.items()
+                         if len(v[1]) == 4 and v[1] != 'Zzzz')
+        self.__countries = countries
+
+        languages = ['en'] + choose(languages, min(self.languageCount, len(languages)) - 1)
+        self.__languages = languages
+        # Map locale name to (language, script, territory) and parent:
+        self.__files, self.__parents, self.__defaultContent = {}, {}, []
+        self.__likely, self.__numberSystem = [], {}
+        for language in languages:
+            script = self.__choice(scripts)
+            lands = choose(countries, min(self.territoryCount, len(countries)))
+            system = self.__choice(self.__systems)[0] if self.__chance(0.3) else 'latn'
+            self.__numberSystem[language] = system
+            self.__likely.append((language, '{}_{}_{}'.format(language, script, lands[0])))
+
+            if language != 'en': # en.xml is special, see __english()
+                self.__files[language] = (language, '', '')
+            stem = language
+            if self.depth > 2:
+                stem = language + '_' + script
+                self.__files[stem] = (language, script, '')
+                self.__likely.append(('und_' + script, '{}_{}_{}'.format(language, script, lands[0])))
+
+            previous = None
+            for index, land in enumerate(lands):
+                name = stem + '_' + land
+                if index == 0:
+                    # First territory is the default content of its
+                    # stem; about half of them have no file.
+                    self.__defaultContent.append(name)
+                    if self.__chance(0.5):
+                        continue
+                self.__files[name] = (language, script if self.depth > 2 else '', land)
+                if self.depth > 1 and previous and index < self.depth - 1:
+                    # Lengthen the chain via parentLocales:
+                    self.__parents[name] = previous
+                previous = name
+        self.__rootAliases = dict((key, self.__chance(self.aliasDensity)) for key in (
+                [('months', cal) for cal in self.calendars if cal != 'gregorian']
+                + [('monthContext', w) for w in self.__widths]
+                + [('dayContext', w) for w in self.__widths]
+                + [('symbols', s[0]) for s in self.__systems if s[0] != 'latn']))
+
+    def __save(self, path, doc, docType = 'ldml'):
+        with io.open(path, 'w', encoding='utf-8') as fd:
+            fd.write(u'<?xml version="1.0" encoding="UTF-8" ?>\n')
+            fd.write(u'<!DOCTYPE {} SYSTEM "../../common/dtd/{}.dtd">\n'.format(docType, docType))
+            doc.write(fd.write)
+
+    def __dtd(self):
+        lines = []
+        for tag in self.__tags:
+            lines.append(u'<!ELEMENT {} ANY >'.format(tag))
+            if tag == 'version':
+                lines.append(u'<!ATTLIST version cldrVersion CDATA #FIXED "{}" >'.format(
+                        self.cldrVersion))
+            for attr in ('type', 'numberSystem', 'count', 'source', 'path', 'alt'):
+                lines.append(u'<!ATTLIST {} {} NMTOKEN #IMPLIED >'.format(tag, attr))
+            for attr in self.__values.get(tag, ()):
+                lines.append(u'<!ATTLIST {} {} CDATA #IMPLIED >'.format(tag, attr))
+                lines.append(u'    <!--@VALUE-->')
+            for attr in ('draft', 'references'):
+                lines.append(u'<!ATTLIST {} {} CDATA #IMPLIED >'.format(tag, attr))
+                lines.append(u'    <!--@METADATA-->')
+            lines.append(u'')
+        return u'\n'.join(lines) + u'\n'
+
+    @staticmethod
+    def __identity(language, script = '', territory = ''):
+        ids = Element('identity').add(Element('version', (('number', '$Revision: 1 $'),)),
+                                      Element('language', (('type', language),)))
+        if script:
+            ids.add(Element('script', (('type', script),)))
+        if territory:
+            ids.add(Element('territory', (('type', territory),)))
+        return ids
+
+    def __names(self, count, low = 2, high = 4):
+        return [self.__word(low, high) for i in range(count)]
+
+    def __calendar(self, cal, months, days, periods, isRoot):
+        """Build a <calendar> element.
+
+        Parameter months is a list of twelve names, days a list of
+        seven; periods is (am, pm) or None.  In root, aliases may
+        replace some of the content."""
+        aliased = self.__rootAliases if isRoot else {}
+        calendar = Element('calendar', (('type', cal),))
+        if cal != 'gregorian' and aliased.get(('months', cal)):
+            calendar.add(Element('months').add(
+                    _alias("../../calendar[@type='gregorian']/months")))
+        else:
+            calendar.add(self.__nameContexts('month', months, aliased))
+        if cal != 'gregorian':
+            return calendar
+
+        calendar.add(self.__nameContexts('day', days, aliased))
+        if periods:
+            width = Element('dayPeriodWidth', (('type', 'wide'),))
+            for key, text in zip(('am', 'pm'), periods):
+                attrs = [('type', key)]
+                if not isRoot and self.__chance(0.2):
+                    attrs.append(('draft', self.__choice(('unconfirmed', 'provisional'))))
+                width.add(Element('dayPeriod', attrs, text=text))
+                if self.__chance(0.2):
+                    width.add(Element('dayPeriod', [('type', key), ('alt', 'variant')],
+                                      text=text.lower()))
+            calendar.add(Element('dayPeriods').add(
+                    Element('dayPeriodContext', (('type', 'format'),)).add(width)))
+
+        for kind, patterns in (('date', self.__datePatterns), ('time', self.__timePatterns)):
+            formats = Element(kind + 'Formats')
+            for length in ('full', 'long', 'medium', 'short'):
+                if isRoot or self.__chance(0.7):
+                    formats.add(Element(kind + 'FormatLength', (('type', length),)).add(
+                            Element(kind + 'Format').add(Element(
+                                    'pattern', text=self.__choice(patterns[length])))))
+            if formats.children:
+                calendar.add(formats)
+        return calendar
+
+    __datePatterns = {
+        'full': (u"EEEE, d MMMM y", u"EEEE d 'de' MMMM 'de' y", u"y MMMM d, EEEE",
+                 u"EEEE, MMMM d, y", u"EEEE, d. MMMM y"),
+        'long': (u"d MMMM y", u"MMMM d, y", u"y MMMM d"),
+        'medium': (u"d MMM y", u"MMM d, y", u"y-MM-dd"),
+        'short': (u"dd/MM/y", u"M/d/yy", u"y-MM-dd", u"dd.MM.yy", u"d/M/yy"),
+        }
+    __timePatterns = {
+        'full': (u"HH:mm:ss zzzz", u"h:mm:ss a zzzz", u"H:mm:ss (zzzz)", u"HH.mm.ss zzzz"),
+        'long': (u"HH:mm:ss z", u"h:mm:ss a z"),
+        'medium': (u"HH:mm:ss", u"h:mm:ss a"),
+        'short': (u"HH:mm", u"h:mm a", u"H:mm", u"a h:mm"),
+        }
+
+    def __nameContexts(self, kind, names, aliased):
+        """Month or day names, as <months> or <days> element"""
+        keys = (range(1, 13) if kind == 'month' else self.__days)
+        top = Element(kind + 's')
+        for context in self.__contexts:
+            ctx = Element(kind + 'Context', (('type', context),))
+            for width in self.__widths:
+                elt = Element(kind + 'Width', (('type', width),))
+                if context == 'stand-alone' and aliased.get((kind + 'Context', width)):
+                    elt.add(_alias("../../{}Context[@type='format']/{}Width[@type='{}']".format(
+                                kind, kind, width)))
+                else:
+                    for key, name in zip(keys, names):
+                        if width == 'abbreviated':
+                            name = name[:3]
+                        elif width == 'narrow':
+                            name = name[:1]
+                        elt.add(Element(kind, (('type', str(key)),), text=name))
+                ctx.add(elt)
+            top.add(ctx)
+        return top
+
+    def __numbers(self, system, isRoot):
+        numbers = Element('numbers')
+        if isRoot or self.__chance(0.8):
+            numbers.add(Element('defaultNumberingSystem', text=system))
+            if self.__chance(0.2):
+                numbers.add(Element('defaultNumberingSystem', (('alt', 'native'),), text='latn'))
+
+        systems = [s[0] for s in self.__systems] if isRoot else [system]
+        for name in systems:
+            symbols = Element('symbols', (('numberSystem', name),))
+            if isRoot and self.__rootAliases.get(('symbols', name)):
+                symbols.add(_alias("../symbols[@numberSystem='latn']"))
+                numbers.add(symbols)
+                continue
+            decimal, group = ((u'.', u',') if isRoot or self.__chance(0.5)
+                              else (u',', self.__choice((u'.', u'\xa0', u'’'))))
+            for tag, text in (('decimal', decimal), ('group', group), ('list', u';'),
+                              ('percentSign', u'%'), ('plusSign', u'+'),
+                              ('minusSign', self.__choice((u'-', u'−'))),
+                              ('exponential', self.__choice((u'E', u'e', u'\xd710^')))):
+                if isRoot or tag in ('decimal', 'group') or self.__chance(0.5):
+                    symbols.add(Element(tag, text=text))
+            numbers.add(symbols)
+
+        patterns = (u'\xa4#,##0.00', u'#,##0.00\xa0\xa4', u'\xa4#,##0.00;(\xa4#,##0.00)',
+                    u'\xa4\xa0#,##0.00;\xa4-#,##0.00', u'#,##0.00\xa0\xa4;-#,##0.00\xa0\xa4')
+        for attrs in (((('numberSystem', system),),) if isRoot or self.__chance(0.7) else ()) + (
+                ((),) if isRoot else ()):
+            numbers.add(Element('currencyFormats', attrs).add(
+                    Element('currencyFormatLength').add(
+                        Element('currencyFormat', (('type', 'accounting'),)).add(
+                            Element('pattern', text=self.__choice(patterns))))))
+        return numbers
+
+    def __units(self, isRoot):
+        units = Element('units')
+        for size in ('long', 'short', 'narrow'):
+            length = Element('unitLength', (('type', size),))
+            if size == 'long':
+                if isRoot or self.__chance(0.5):
+                    length.add(Element('unit', (('type', 'digital-byte'),)).add(
+                            Element('displayName', text=self.__word(1, 2).lower())))
+            elif isRoot or self.__chance(0.5):
+                byte = u'B' if isRoot or self.__chance(0.6) else self.__word(1, 1)[0]
+                for q in ('kilo', 'mega', 'giga', 'tera'):
+                    unit = Element('unit', (('type', 'digital-{}byte'.format(q)),))
+                    short = (q[0] if q == 'kilo' else q[0].upper()) + byte
+                    if self.__chance(0.5):
+                        unit.add(Element('displayName', text=short))
+                    for count in ('one', 'other'):
+                        unit.add(Element('unitPattern', (('count', count),),
+                                         text=u'{0} ' + short))
+                    length.add(unit)
+            if length.children:
+                units.add(length)
+        return units
+
+    def __localeData(self, name, language, script, territory, isRoot = False):
+        """The data in a locale file, without identity"""
+        chance = (lambda p: True) if isRoot else self.__chance
+        data = []
+        if not isRoot:
+            displayNames = Element('localeDisplayNames')
+            languages = Element('languages')
+            if chance(0.9):
+                endonym = self.__endonyms.setdefault(language, self.__word())
+                languages.add(Element('language', (('type', language),), text=endonym))
+                if territory and chance(0.3):
+                    languages.add(Element('language', (('type', language + '_' + territory),),
+                                          text=endonym + u' ' + self.__word(1, 2)))
+            if languages.children:
+                displayNames.add(languages)
+            if territory and chance(0.9):
+                displayNames.add(Element('territories').add(
+                        Element('territory', (('type', territory),), text=self.__word(2, 5))))
+            if displayNames.children:
+                data.append(displayNames)
+
+        if chance(0.6):
+            quotes = self.__choice(((u'“', u'”', u'‘', u'’'),
+                                    (u'\xab', u'\xbb', u'„', u'“'),
+                                    (u'「', u'」', u'『', u'』')))
+            delimiters = Element('delimiters')
+            for tag, text in zip(('quotationStart', 'quotationEnd',
+                                  'alternateQuotationStart', 'alternateQuotationEnd'), quotes):
+                delimiters.add(Element(tag, text=text))
+            data.append(delimiters)
+
+        if chance(0.7):
+            months = self.__months.setdefault(language, self.__names(12))
+            days = self.__weekDays.setdefault(language, self.__names(7, 2, 3))
+            periods = (self.__word(1, 2), self.__word(1, 2)) if chance(0.5) else None
+            calendars = Element('calendars')
+            for cal in self.calendars:
+                if cal == 'gregorian' or isRoot or chance(0.3):
+                    calendars.add(self.__calendar(
+                            cal, months if cal == 'gregorian' else self.__names(12),
+                            days, periods, isRoot))
+            data.append(Element('dates').add(calendars))
+
+        system = 'latn' if isRoot else self.__numberSystem[language]
+        numbers = self.__numbers(system, isRoot)
+        if not isRoot and territory and chance(0.6):
+            iso = self.__currencyOf(territory)
+            currency = Element('currency', (('type', iso),)).add(
+                Element('displayName', text=self.__word(2, 3)),
+                Element('displayName', (('count', 'one'),), text=self.__word(2, 3)),
+                Element('displayName', (('count', 'other'),), text=self.__word(2, 3)),
+                Element('symbol', text=iso[:2] + u'$'))
+            numbers.add(Element('currencies').add(currency))
+        data.append(numbers)
+
+        if chance(0.7):
+            patterns = Element('listPattern')
+            joiner = self.__word(1, 1).lower()
+            for part, text in (('start', u'{0}, {1}'), ('middle', u'{0}, {1}'),
+                               ('end', u'{0} ' + joiner + u' {1}'),
+                               ('2', u'{0} ' + joiner + u' {1}')):
+                patterns.add(Element('listPatternPart', (('type', part),), text=text))
+            data.append(Element('listPatterns').add(
+                    patterns, Element('listPattern', (('type', 'unit'),)).add(
+                        Element('listPatternPart', (('type', '2'),), text=u'{0} {1}'))))
+
+        units = self.__units(isRoot)
+        if units.children:
+            data.append(units)
+        return data
+
+    def __currencyOf(self, territory):
+        return self.__currencies.setdefault(
+            territory, (territory + self.__choice(u'DRLKN')).upper())
+
+    def __rootLocale(self):
+        self.__endonyms, self.__months, self.__weekDays, self.__currencies = {}, {}, {}, {}
+        self.__months['root'] = [u'M{:02d}'.format(i) for i in range(1, 13)]
+        self.__weekDays['root'] = [d.capitalize() for d in self.__days]
+        doc = Element('ldml').add(self.__identity('root'))
+        saved = self.__months, self.__weekDays
+        for elt in self.__localeData('root', 'root', '', '', True):
+            doc.add(elt)
+        return doc
+
+    def __english(self):
+        """en.xml has the names of all codes, used to suggest enum names."""
+        doc = Element('ldml').add(self.__identity('en'))
+        displayNames = Element('localeDisplayNames')
+        for group, tag, table in (('languages', 'language', language_list),
+                                  ('scripts', 'script', script_list),
+                                  ('territories', 'territory', country_list)):
+            names = Element(group)
+            for key, value in sorted(table.items()):
+                if key and value[1].strip():
+                    names.add(Element(tag, (('type', value[1].strip()),), text=value[0]))
+            displayNames.add(names)
+        displayNames.add(Element('variants').add(
+                Element('variant', (('type', 'POSIX'),), text=u'Computer')))
+        doc.add(displayNames)
+        for elt in self.__localeData('en', 'en', '', '')[1:]:
+            doc.add(elt)
+        return doc
+
+    def __localeFiles(self):
+        for name in sorted(self.__files):
+            language, script, territory = self.__files[name]
+            doc = Element('ldml').add(self.__identity(language, script, territory))
+            for elt in self.__localeData(name, language, script, territory):
+                doc.add(elt)
+            yield name, doc
+
+    def __supplementalData(self):
+        doc = Element('supplementalData').add(
+            Element('version', (('number', '$Revision: 1 $'),)))
+
+        fractions = Element('fractions').add(
+            Element('info', (('iso4217', 'DEFAULT'), ('digits', '2'), ('rounding', '0'))))
+        regions = []
+        for land in self.__countries:
+            iso = self.__currencyOf(land)
+            if self.__chance(0.3):
+                fractions.add(Element('info', (('iso4217', iso),
+                                               ('digits', str(self.__choice((0, 2, 3)))),
+                                               ('rounding', str(self.__choice((0, 5)))))))
+            region = Element('region', (('iso3166', land),))
+            if self.__chance(0.3):
+                region.add(Element('currency', (('iso4217', land + 'X'),
+                                                ('from', '1950-01-01'), ('to', '1999-12-31'))))
+            if self.__chance(0.1):
+                region.add(Element('currency', (('iso4217', 'XTS'), ('tender', 'false'))))
+            region.add(Element('currency', (('iso4217', iso), ('from', '2000-01-01'))))
+            regions.append(region)
+        doc.add(Element('currencyData').add(fractions, *regions))
+
+        parents = Element('parentLocales')
+        for child, parent in sorted(self.__parents.items()):
+            parents.add(Element('parentLocale', (('parent', parent), ('locales', child))))
+        parents.add(Element('parentLocale', (('parent', 'root'),
+                                             ('locales', 'az_Arab az_Cyrl'))))
+        doc.add(parents)
+
+        week = Element('weekData').add(
+            Element('minDays', (('count', '1'), ('territories', '001'))))
+        for key, default, others in (('firstDay', 'mon', ('sun', 'sat', 'fri')),
+                                     ('weekendStart', 'sat', ('fri', 'thu')),
+                                     ('weekendEnd', 'sun', ('sat', 'fri'))):
+            week.add(Element(key, (('day', default), ('territories', '001'))))
+            for day in others:
+                lands = [land for land in self.__countries if self.__chance(0.1)]
+                if lands:
+                    week.add(Element(key, (('day', day), ('territories', ' '.join(lands)))))
+            week.add(Element(key, (('day', others[0]), ('territories', 'GB'), ('alt', 'variant'))))
+        doc.add(week)
+        return doc
+
+    def __supplementalMetadata(self):
+        return Element('supplementalData').add(Element('metadata').add(
+                Element('defaultContent', (('locales', ' '.join(sorted(self.__defaultContent))),))))
+
+    def __likelySubtags(self):
+        likely = Element('likelySubtags')
+        for have, give in self.__likely + [('und', 'en_Latn_US'), ('und_ZZ', 'en_Latn_ZZ')]:
+            likely.add(Element('likelySubtag', (('from', have), ('to', give))))
+        return Element('supplementalData').add(likely)
+
+    def __numberingSystems(self):
+        systems = Element('numberingSystems')
+        for name, zero in self.__systems:
+            digits = u''.join(unichr(ord(zero) + i) for i in range(10))
+            systems.add(Element('numberingSystem', (('id', name), ('type', 'numeric'),
+                                                    ('digits', digits))))
+        systems.add(Element('numberingSystem', (('id', 'roman'), ('type', 'algorithmic'),
+                                                ('rules', 'roman-upper'))))
+        return Element('supplementalData').add(systems)
+
+    def __windowsZones(self):
+        zones = Element('mapTimezones', (('otherVersion', '7e11800'), ('typeVersion', '2019c')))
+        for wid, offset in windowsIdList:
+            zones.add(Element('mapZone', (('other', wid), ('territory', '001'),
+                                          ('type', 'Etc/GMT{:+d}'.format(-offset // 3600)))))
+            for land in self.__random.sample(self.__countries, 2):
+                zones.add(Element('mapZone', (('other', wid), ('territory', land),
+                                              ('type', 'Area/{} Area/{}2'.format(land, land)))))
+        return Element('supplementalData').add(Element('windowsZones').add(zones))
+
+def usage(err, name, message = ''):
+    err.write("""Usage: {} [options] path/to/new/cldr/root
+Options:
+  --languages N      number of languages (default 40)
+  --territories N    number of territories per language (default 3)
+  --depth N          locale inheritance depth (default 2)
+  --alias-density F  probability of aliases in root.xml (default 0.5)
+  --calendars LIST   comma-separated calendars (default gregorian,persian,islamic)
+  --seed N           seed for the pseudo-random choices (default 1)
+""".format(name))
+    if message:
+        err.write('\n' + message + '\n')
+
+def main(args, out, err):
+    name = args.pop(0)
+    options = {'--languages': ('languages', int), '--territories': ('territories', int),
+               '--depth': ('depth', int), '--alias-density': ('aliasDensity', float),
+               '--calendars': ('calendars', lambda x: x.split(',')), '--seed': ('seed', int)}
+    kw = {}
+    while len(args) > 1 and args[0] in options:
+        key, parse = options[args.pop(0)]
+        try:
+            kw[key] = parse(args.pop(0))
+        except ValueError as e:
+            usage(err, name, str(e))
+            return 1
+    if len(args) != 1:
+        usage(err, name, 'I expect exactly one CLDR root directory')
+        return 1
+
+    count = SyntheticCldr(**kw).write(args[0])
+    out.write('Wrote {} locale files under {}\n'.format(count, args[0]))
+    return 0
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main(sys.argv, sys.stdout, sys.stderr))